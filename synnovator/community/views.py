@@ -7,12 +7,13 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django.utils.text import slugify
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_POST
 
 from wagtail.models import Page
 
+from synnovator.utils.slugs import add_child_with_unique_slug, slugify_title
+
 from .models import TeamIndexPage, TeamProfilePage, TeamMembership
 
 
@@ -43,23 +44,26 @@ def create_team(request):
             messages.error(request, _("Team name is required."))
             return render(request, 'community/create_team.html')
 
-        # Generate slug
-        slug = slugify(name)
+        # Generate slug the way add_child_with_unique_slug will
+        slug = slugify_title(name, TeamProfilePage._meta.get_field('slug').max_length)
 
-        # Check if slug already exists
-        if TeamProfilePage.objects.filter(slug=slug).exists():
+        # Check if a team already has this name or slug
+        duplicates = TeamProfilePage.objects.filter(title__iexact=name)
+        if slug:
+            duplicates |= TeamProfilePage.objects.filter(slug=slug)
+        if duplicates.exists():
             messages.error(request, _("A team with this name already exists."))
             return render(request, 'community/create_team.html')
 
         # Create the team page
         team_page = TeamProfilePage(
             title=name,
-            slug=slug,
             tagline=tagline,
         )
 
-        # Add as child of team index
-        team_index.add_child(instance=team_page)
+        # Add as child of team index; a concurrent request that slipped past the
+        # check above gets a suffixed slug rather than a duplicate
+        add_child_with_unique_slug(team_index, team_page)
 
         # Publish the page
         revision = team_page.save_revision()
@@ -0,0 +1,164 @@
+"""
+Activity feeds for teams, users and hackathons.
+
+team_detail and user_profile used to build their timelines per request by
+merging submissions and memberships in Python, with a get_leader() query per
+team submission. Events are now appended to ActivityEvent as they happen:
+Submission.save() reports submissions and verifications, the TeamMember and
+registration post_save signals report joins and registrations, and
+apply_advancement() bulk-creates advancement events with its logs.
+
+feed() reads one page of a team's, user's or hackathon's events with a
+single indexed keyset query. Its cursor is the (created_at, id) of the last
+event shown, so paging stays cheap however far back the feed goes.
+"""
+from datetime import datetime
+
+from django.db.models import Q
+
+
+FEED_PAGE_SIZE = 20
+
+
+def _target(submission):
+    if submission.quest_id:
+        return submission.quest.title
+    if submission.hackathon_id:
+        return submission.hackathon.title
+    return 'Unknown'
+
+
+def _submission_actor_id(submission):
+    """The submitter, or for team submissions the team's leader"""
+    if submission.user_id or not submission.team_id:
+        return submission.user_id
+    from synnovator.hackathons.models import TeamMember
+
+    return TeamMember.objects.filter(team_id=submission.team_id, is_leader=True).order_by(
+        'joined_at'
+    ).values_list('user_id', flat=True).first()
+
+
+def record_submission_saved(submission, created, previous_status=None):
+    """Append 'submitted' for new submissions and 'verified' when one becomes verified"""
+    from synnovator.hackathons.models import ActivityEvent
+
+    verbs = []
+    if created:
+        verbs.append('submitted')
+    if submission.verification_status == 'verified' and previous_status != 'verified':
+        verbs.append('verified')
+    if not verbs:
+        return
+
+    actor_id = _submission_actor_id(submission)
+    target = _target(submission)
+    ActivityEvent.objects.bulk_create([
+        ActivityEvent(
+            verb=verb,
+            actor_id=actor_id,
+            team_id=submission.team_id,
+            hackathon_id=submission.hackathon_id,
+            target=target,
+        )
+        for verb in verbs
+    ])
+
+
+def record_member_joined(member):
+    from synnovator.hackathons.models import ActivityEvent
+
+    ActivityEvent.objects.create(
+        verb='joined',
+        actor_id=member.user_id,
+        team_id=member.team_id,
+        hackathon_id=member.team.hackathon_id,
+        target=member.team.name,
+        detail=member.get_role_display(),
+    )
+
+
+def record_registration(registration):
+    """An individual HackathonRegistration"""
+    from synnovator.hackathons.models import ActivityEvent
+
+    ActivityEvent.objects.create(
+        verb='registered',
+        actor_id=registration.user_id,
+        hackathon_id=registration.hackathon_id,
+        target=registration.hackathon.title,
+    )
+
+
+def record_team_registration(registration):
+    """A TeamRegistration, which links a community team profile rather than a Team"""
+    from synnovator.hackathons.models import ActivityEvent
+
+    ActivityEvent.objects.create(
+        verb='registered',
+        hackathon_id=registration.hackathon_id,
+        target=registration.hackathon.title,
+        detail=registration.team_profile.title,
+    )
+
+
+def advancement_events(plan, created_at=None):
+    """Unsaved events for every decision of an AdvancementPlan"""
+    from synnovator.hackathons.models import ActivityEvent
+
+    extra = {'created_at': created_at} if created_at else {}
+    events = []
+    for decision in plan.decisions:
+        if decision.advance:
+            target = plan.next_phase.title if plan.next_phase else 'the next round'
+        else:
+            target = plan.phase.title
+        events.append(ActivityEvent(
+            verb=decision.decision,
+            team_id=decision.team.pk,
+            hackathon_id=plan.phase.hackathon_id,
+            target=target,
+            detail=decision.reason,
+            **extra,
+        ))
+    return events
+
+
+def encode_cursor(event):
+    return f'{event.created_at.isoformat()}_{event.pk}'
+
+
+def decode_cursor(cursor):
+    """(created_at, id) from a cursor string, or None if it is malformed"""
+    try:
+        created_at, pk = cursor.rsplit('_', 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def feed(team=None, actor=None, hackathon=None, cursor=None, limit=FEED_PAGE_SIZE):
+    """
+    One page of events, newest first, for a team, actor or hackathon.
+
+    Returns (events, next_cursor); next_cursor is None on the last page.
+    """
+    from synnovator.hackathons.models import ActivityEvent
+
+    events = ActivityEvent.objects.select_related('actor', 'team')
+    if team is not None:
+        events = events.filter(team=team)
+    if actor is not None:
+        events = events.filter(actor=actor)
+    if hackathon is not None:
+        events = events.filter(hackathon=hackathon)
+
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        created_at, pk = position
+        events = events.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+
+    page = list(events.order_by('-created_at', '-id')[:limit + 1])
+    if len(page) > limit:
+        return page[:limit], encode_cursor(page[limit - 1])
+    return page, None
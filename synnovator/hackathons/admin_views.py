@@ -0,0 +1,73 @@
+"""
+Wagtail admin views for hackathon operations.
+"""
+from django.contrib import messages
+from django.contrib.auth.decorators import permission_required
+from django.http import StreamingHttpResponse
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext as _
+
+from .forms import JudgeScoreImportForm, ResultsExportForm
+from .results_export import FORMATS, filename, stream_export
+from .score_import import ScoreImportError, import_judge_scores, parse_score_file
+
+
+@permission_required('hackathons.add_judgescore', raise_exception=True)
+def import_judge_scores_view(request):
+    """Upload a CSV/JSON score sheet and bulk import it"""
+    errors = []
+    if request.method == 'POST':
+        form = JudgeScoreImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data['file']
+            dry_run = form.cleaned_data['dry_run']
+            try:
+                rows = parse_score_file(upload, name=upload.name)
+            except ScoreImportError as e:
+                form.add_error('file', str(e))
+            else:
+                result = import_judge_scores(rows, dry_run=dry_run)
+                if result.ok:
+                    summary = _('%(created)d scores created, %(updated)d updated, %(teams)d teams recomputed.') % {
+                        'created': result.created,
+                        'updated': result.updated,
+                        'teams': len(result.team_ids),
+                    }
+                    if dry_run:
+                        messages.info(request, _('Validation passed: ') + summary)
+                    else:
+                        messages.success(request, summary)
+                        return redirect('hackathons_import_judge_scores')
+                else:
+                    errors = result.errors
+                    messages.error(request, _('%(count)d invalid rows; nothing was imported.') % {
+                        'count': len(errors),
+                    })
+    else:
+        form = JudgeScoreImportForm()
+
+    return TemplateResponse(request, 'hackathons/admin/import_judge_scores.html', {
+        'form': form,
+        'errors': errors,
+    })
+
+
+@permission_required('hackathons.view_judgescore', raise_exception=True)
+def export_results_view(request):
+    """Stream a hackathon's teams, submissions, scores or criteria as a download"""
+    form = ResultsExportForm(request.GET or None)
+    if form.is_valid():
+        hackathon = form.cleaned_data['hackathon']
+        dataset = form.cleaned_data['dataset']
+        file_format = form.cleaned_data['format']
+        response = StreamingHttpResponse(
+            stream_export(hackathon, dataset, file_format),
+            content_type=FORMATS[file_format][0],
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename(hackathon, dataset, file_format)}"'
+        return response
+
+    return TemplateResponse(request, 'hackathons/admin/export_results.html', {
+        'form': form,
+    })
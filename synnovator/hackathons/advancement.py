@@ -0,0 +1,204 @@
+"""
+Batch phase advancement.
+
+Advancing a round used to mean Phase.check_quest_completion() per team and
+an AdvancementLog plus Notification.create_advancement_notification() per
+decision. plan_advancement() instead loads the hackathon's remaining teams,
+the phase's required quests and every team's verified completions with one
+grouped query, then applies the cutoff in memory. The resulting plan can be
+reviewed as a diff (dry run) before apply_advancement() writes it: one
+UPDATE per decision kind, then bulk-created logs, activity events and leader
+notifications.
+"""
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Value, When
+from django.utils import timezone
+
+from synnovator.hackathons import activity
+
+
+# Teams in these states are out of the competition and never re-evaluated
+INACTIVE_TEAM_STATUSES = ('eliminated', 'disqualified')
+
+
+@dataclass
+class AdvancementDecision:
+    team: object
+    advance: bool
+    score: object
+    completed_quests: int
+    reason: str = ''
+
+    @property
+    def decision(self):
+        return 'advanced' if self.advance else 'eliminated'
+
+
+@dataclass
+class AdvancementPlan:
+    phase: object
+    next_phase: object = None
+    required_quests: int = 0
+    decisions: list = field(default_factory=list)
+    applied: bool = False
+    notifications_sent: int = 0
+
+    @property
+    def advanced(self):
+        return [d for d in self.decisions if d.advance]
+
+    @property
+    def eliminated(self):
+        return [d for d in self.decisions if not d.advance]
+
+    def diff(self):
+        """Human-readable lines describing each team's status change"""
+        lines = []
+        for decision in self.decisions:
+            team = decision.team
+            if decision.advance:
+                lines.append(
+                    f'+ {team.name}: {team.status} -> advanced '
+                    f'(round {team.current_round} -> {team.current_round + 1}, score {decision.score})'
+                )
+            else:
+                lines.append(f'- {team.name}: {team.status} -> eliminated ({decision.reason})')
+        return lines
+
+
+def _competition_ranks(scores):
+    """1224-style ranks for scores sorted in descending order"""
+    ranks = []
+    for index, score in enumerate(scores):
+        ranks.append(ranks[-1] if index and score == scores[index - 1] else index + 1)
+    return ranks
+
+
+def plan_advancement(phase, top_n=None, min_score=None):
+    """
+    Decide which of the hackathon's active teams advance past `phase`.
+
+    A team advances when it completed every active required quest of the
+    phase, its final score is at least `min_score` (if given) and it ranks
+    within `top_n` (if given) among the teams that met the other criteria.
+    Teams tied at the top-N boundary all advance.
+    """
+    from synnovator.hackathons.models import Phase, Submission, Team
+
+    teams = list(
+        Team.objects.filter(hackathon_id=phase.hackathon_id)
+        .exclude(status__in=INACTIVE_TEAM_STATUSES)
+        .only('pk', 'name', 'status', 'current_round', 'final_score')
+        .order_by('-final_score', 'name')
+    )
+    required = list(phase.required_quests.filter(is_active=True).values_list('pk', flat=True))
+    completed = {}
+    if required and teams:
+        completed = dict(
+            Submission.objects.filter(
+                team__in=[team.pk for team in teams],
+                quest_id__in=required,
+                verification_status='verified',
+            )
+            .values_list('team_id')
+            .annotate(quests=Count('quest_id', distinct=True))
+        )
+
+    plan = AdvancementPlan(
+        phase=phase,
+        next_phase=Phase.objects.filter(
+            hackathon_id=phase.hackathon_id, order__gt=phase.order
+        ).order_by('order', 'start_date').first(),
+        required_quests=len(required),
+    )
+
+    candidates = []
+    for team in teams:
+        done = completed.get(team.pk, 0)
+        decision = AdvancementDecision(team=team, advance=False, score=team.final_score, completed_quests=done)
+        if done < len(required):
+            decision.reason = f'Completed {done} of {len(required)} required quests'
+        elif min_score is not None and team.final_score < min_score:
+            decision.reason = f'Score {team.final_score} below threshold {min_score}'
+        else:
+            decision.advance = True
+            candidates.append(decision)
+        plan.decisions.append(decision)
+
+    if top_n is not None:
+        # Teams are already ordered by descending score
+        for decision, rank in zip(candidates, _competition_ranks([d.score for d in candidates])):
+            if rank > top_n:
+                decision.advance = False
+                decision.reason = f'Ranked {rank}, outside top {top_n}'
+    return plan
+
+
+def apply_advancement(plan, decided_by=None, notify=True):
+    """Write a plan: team updates, advancement logs and leader notifications"""
+    from synnovator.hackathons.models import ActivityEvent, AdvancementLog, Team, TeamMember
+    from synnovator.notifications.models import Notification
+    from synnovator.notifications.services import NotificationService
+
+    now = timezone.now()
+    with transaction.atomic():
+        advanced_ids = [d.team.pk for d in plan.advanced]
+        if advanced_ids:
+            Team.objects.filter(pk__in=advanced_ids).update(
+                status='advanced',
+                current_round=F('current_round') + 1,
+                elimination_reason='',
+                updated_at=now,
+            )
+        if plan.eliminated:
+            Team.objects.filter(pk__in=[d.team.pk for d in plan.eliminated]).update(
+                status='eliminated',
+                elimination_reason=Case(
+                    *[When(pk=d.team.pk, then=Value(d.reason)) for d in plan.eliminated],
+                    default=Value(''),
+                ),
+                updated_at=now,
+            )
+
+        logs = AdvancementLog.objects.bulk_create([
+            AdvancementLog(
+                team_id=d.team.pk,
+                from_phase=plan.phase,
+                to_phase=plan.next_phase if d.advance else None,
+                decision=d.decision,
+                decided_by=decided_by,
+                notes=d.reason,
+            )
+            for d in plan.decisions
+        ])
+        ActivityEvent.objects.bulk_create(activity.advancement_events(plan, created_at=now))
+
+        if notify and logs:
+            leaders = {}
+            for member in TeamMember.objects.filter(
+                team_id__in=[d.team.pk for d in plan.decisions], is_leader=True
+            ).select_related('user').order_by('joined_at'):
+                leaders.setdefault(member.team_id, member.user)
+
+            service = NotificationService()
+            notifications = [
+                Notification.build_advancement_notification(d.team, log, leaders[d.team.pk])
+                for d, log in zip(plan.decisions, logs)
+                if d.team.pk in leaders
+                and service.should_notify(leaders[d.team.pk], 'advancement_result')
+            ]
+            Notification.objects.bulk_create(notifications)
+            plan.notifications_sent = len(notifications)
+
+    plan.applied = True
+    return plan
+
+
+def advance_phase(phase, top_n=None, min_score=None, dry_run=False, decided_by=None, notify=True):
+    """Plan the advancement for `phase` and, unless `dry_run`, apply it"""
+    plan = plan_advancement(phase, top_n=top_n, min_score=min_score)
+    if not dry_run:
+        apply_advancement(plan, decided_by=decided_by, notify=notify)
+    return plan
@@ -5,3 +5,7 @@ class HackathonsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'synnovator.hackathons'
     verbose_name = 'Hackathons'
+
+    def ready(self):
+        # Import signals to register them
+        import synnovator.hackathons.signals  # noqa: F401
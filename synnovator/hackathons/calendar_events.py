@@ -0,0 +1,119 @@
+"""
+Precomputed calendar event documents for the calendar events API.
+
+Calendar widgets poll the events endpoint constantly, so each event is
+encoded to JSON once and cached, along with its hackathon's resolved URL.
+Documents are keyed by a global calendar version. The version is bumped
+whenever a HackathonPage or Phase changes (see signals), and it also acts as
+the ETag/Last-Modified source. Unchanged polls are therefore answered with a
+304 without touching phases at all.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+
+CALENDAR_VERSION_KEY = 'hackathons:calendar:version'
+
+CALENDAR_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Responses with more events than this are streamed instead of buffered
+STREAMING_THRESHOLD = 500
+
+
+def get_calendar_version():
+    """Current calendar version as a UNIX timestamp (float)"""
+    return cache.get_or_set(CALENDAR_VERSION_KEY, lambda: timezone.now().timestamp(), None)
+
+
+def bump_calendar_version():
+    """Invalidate every cached calendar document"""
+    # Never move backwards, even if two processes disagree about the clock
+    version = max(timezone.now().timestamp(), get_calendar_version() + 0.001)
+    cache.set(CALENDAR_VERSION_KEY, version, None)
+    return version
+
+
+def calendar_last_modified():
+    """Last-Modified for calendar responses"""
+    return datetime.fromtimestamp(get_calendar_version(), tz=dt_timezone.utc)
+
+
+def calendar_etag(*params):
+    """ETag for a calendar response: calendar version plus the query parameters"""
+    raw = json.dumps([get_calendar_version(), *[str(p or '') for p in params]])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _build_events(hackathon_id):
+    """Encode every phase (optionally of one hackathon) as (start, end, json bytes)"""
+    from synnovator.hackathons.models import HackathonPage, Phase
+
+    phases = Phase.objects.order_by('start_date', 'pk')
+    if hackathon_id:
+        phases = phases.filter(hackathon_id=hackathon_id)
+    phases = list(phases.values(
+        'id', 'title', 'description', 'start_date', 'end_date', 'requirements', 'hackathon_id'
+    ))
+
+    # Resolve each hackathon's URL once rather than once per phase
+    hackathons = {
+        page.pk: (page.title, page.get_url())
+        for page in HackathonPage.objects.filter(pk__in={p['hackathon_id'] for p in phases})
+    }
+
+    events = []
+    for phase in phases:
+        hackathon_title, hackathon_url = hackathons.get(phase['hackathon_id'], ('', None))
+        encoded = json.dumps({
+            'id': f'phase-{phase["id"]}',
+            'title': f'{hackathon_title}: {phase["title"]}',
+            'start': phase['start_date'].isoformat(),
+            'end': phase['end_date'].isoformat(),
+            'description': phase['description'],
+            'url': hackathon_url,
+            'extendedProps': {
+                'hackathon_id': phase['hackathon_id'],
+                'hackathon_title': hackathon_title,
+                'phase_id': phase['id'],
+                'phase_title': phase['title'],
+                'requirements': phase['requirements'],
+            }
+        }, cls=DjangoJSONEncoder).encode()
+        events.append((phase['start_date'], phase['end_date'], encoded))
+    return events
+
+
+def get_calendar_events(hackathon_id=None, start=None, end=None):
+    """
+    Encoded events overlapping [start, end], from the cached document.
+
+    Args:
+        hackathon_id: Limit to one hackathon (cached as its own document)
+        start, end: Aware datetimes bounding the range, or None
+
+    Returns:
+        List of JSON-encoded event bytes, ordered by start date
+    """
+    key = f'hackathons:calendar:{get_calendar_version()}:{hackathon_id or "all"}'
+    events = cache.get(key)
+    if events is None:
+        events = _build_events(hackathon_id)
+        cache.set(key, events, CALENDAR_CACHE_TIMEOUT)
+
+    return [
+        encoded for event_start, event_end, encoded in events
+        if (start is None or event_end >= start) and (end is None or event_start <= end)
+    ]
+
+
+def stream_json_array(encoded_items):
+    """Yield a JSON array chunk by chunk from already-encoded items"""
+    yield b'['
+    for index, encoded in enumerate(encoded_items):
+        yield (b',' if index else b'') + encoded
+    yield b']'
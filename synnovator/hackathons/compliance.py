@@ -0,0 +1,133 @@
+"""
+Set-based competition rule compliance checks.
+
+CompetitionRule.check_compliance() answers for one team and one rule, at up
+to one query each. A sweep over a whole hackathon instead loads each fact the
+automated rule types need (member counts, member roles, teams with a valid
+submission) with a single aggregate query for all teams, evaluates every rule
+in memory and writes the resulting RuleViolation rows in bulk. Run it from the
+check_rule_compliance management command, e.g. on a cron schedule.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Count
+
+from synnovator.hackathons.models import RuleViolation, Submission, Team, TeamMember
+from synnovator.hackathons.models.rules import AUTOMATED_RULE_TYPES, VALID_SUBMISSION_STATUSES
+
+
+VIOLATION_BATCH_SIZE = 500
+
+
+@dataclass
+class ComplianceFailure:
+    team_id: int
+    rule: object
+    message: str
+
+
+@dataclass
+class ComplianceReport:
+    teams_checked: int = 0
+    rules_checked: int = 0
+    failures: list = field(default_factory=list)
+    violations_created: int = 0
+    duplicates_skipped: int = 0
+
+
+def load_team_facts(hackathon, rule_types):
+    """
+    Return {team_id: {'member_count', 'roles', 'has_submission'}} for every
+    team of the hackathon, with one query per fact the rule types need.
+    """
+    member_counts = dict(
+        Team.objects.filter(hackathon=hackathon)
+        .annotate(member_count=Count('membership'))
+        .values_list('pk', 'member_count')
+    )
+
+    roles = defaultdict(set)
+    if 'team_composition' in rule_types:
+        for team_id, role in (
+            TeamMember.objects.filter(team__hackathon=hackathon)
+            .values_list('team_id', 'role')
+            .distinct()
+        ):
+            roles[team_id].add(role)
+
+    submitted = set()
+    if 'submission_format' in rule_types:
+        submitted = set(
+            Submission.objects.filter(
+                team__hackathon=hackathon,
+                verification_status__in=VALID_SUBMISSION_STATUSES,
+            )
+            .values_list('team_id', flat=True)
+            .distinct()
+        )
+
+    return {
+        team_id: {
+            'member_count': count,
+            'roles': roles[team_id],
+            'has_submission': team_id in submitted,
+        }
+        for team_id, count in member_counts.items()
+    }
+
+
+def evaluate_hackathon(hackathon, rules=None):
+    """Evaluate the hackathon's automated rules against all of its teams"""
+    if rules is None:
+        rules = hackathon.rules.filter(rule_type__in=AUTOMATED_RULE_TYPES)
+    rules = [rule for rule in rules if rule.rule_type in AUTOMATED_RULE_TYPES]
+
+    report = ComplianceReport(rules_checked=len(rules))
+    if not rules:
+        return report
+
+    facts = load_team_facts(hackathon, {rule.rule_type for rule in rules})
+    report.teams_checked = len(facts)
+    for team_id, team_facts in facts.items():
+        for rule in rules:
+            is_compliant, message = rule.evaluate(**team_facts)
+            if not is_compliant:
+                report.failures.append(ComplianceFailure(team_id, rule, message))
+    return report
+
+
+def sweep_hackathon(hackathon, dry_run=False):
+    """
+    Evaluate the hackathon's automated rules and record violations.
+
+    A (team, rule) pair that already has a pending violation is not recorded
+    again, so repeated sweeps leave one open violation per problem. With
+    `dry_run` nothing is written; the report still counts what would be.
+    """
+    report = evaluate_hackathon(hackathon)
+    if not report.failures:
+        return report
+
+    pending = set(
+        RuleViolation.objects.filter(rule__hackathon=hackathon, status='pending')
+        .values_list('team_id', 'rule_id')
+    )
+    new_violations = []
+    for failure in report.failures:
+        if (failure.team_id, failure.rule.pk) in pending:
+            report.duplicates_skipped += 1
+            continue
+        new_violations.append(RuleViolation(
+            team_id=failure.team_id,
+            rule=failure.rule,
+            detection_method='automated',
+            description=failure.message,
+        ))
+
+    report.violations_created = len(new_violations)
+    if not dry_run:
+        with transaction.atomic():
+            RuleViolation.objects.bulk_create(new_violations, batch_size=VIOLATION_BATCH_SIZE)
+    return report
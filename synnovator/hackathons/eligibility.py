@@ -0,0 +1,148 @@
+"""
+Batched submission eligibility for HackathonPage.
+
+HackathonPage.can_submit() answers for one participant; the submit page asks
+for the current user and every team they belong to. SubmissionEligibility
+evaluates any number of users and team profiles with a fixed number of
+queries: one approved-registration lookup and one grouped submission count
+per participant kind, plus the cached phase timeline.
+"""
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
+
+
+class SubmissionEligibility:
+    """
+    Evaluate HackathonPage submission rules for many participants at once.
+
+    Usage:
+        eligibility = SubmissionEligibility(hackathon)
+        results = eligibility.for_teams(user_teams)   # {team_id: (allowed, reason)}
+        allowed, reason = eligibility.check(user=request.user)
+    """
+
+    def __init__(self, hackathon, at=None):
+        self.hackathon = hackathon
+        self.at = at
+        self._window = None
+
+    def check(self, user=None, team_profile=None):
+        """Single-participant check with the same semantics as can_submit()"""
+        if team_profile is not None:
+            return self.for_teams([team_profile])[team_profile.pk]
+        if user is not None:
+            return self.for_users([user])[user.pk]
+        return self._evaluate(is_team=False, registered=False, submission_count=0)
+
+    def check_team(self, team):
+        """
+        can_submit() for a hackathons.Team, the target of chunked uploads.
+
+        A Team belongs to one hackathon, which stands in for registration;
+        its Submission rows count towards max_submissions_per_participant.
+        """
+        from synnovator.hackathons.models import Submission
+
+        count = 0
+        if self.hackathon.max_submissions_per_participant > 0:
+            count = Submission.objects.filter(team=team, hackathon=self.hackathon).count()
+        return self._evaluate(
+            is_team=True,
+            registered=team.hackathon_id == self.hackathon.pk,
+            submission_count=count,
+        )
+
+    def for_teams(self, team_profiles):
+        """Return {team_profile_id: (allowed, reason)}"""
+        team_ids = [team.pk for team in team_profiles]
+        if not team_ids or self.hackathon.submission_type == 'individual':
+            return {team_id: self._evaluate(True, False, 0) for team_id in team_ids}
+
+        registered = set()
+        if self.hackathon.require_registration:
+            registered = set(self.hackathon.team_registrations.filter(
+                team_profile_id__in=team_ids,
+                status='approved',
+            ).values_list('team_profile_id', flat=True))
+
+        counts = {}
+        if self.hackathon.max_submissions_per_participant > 0:
+            counts = self._submission_counts('team_profile_id', team_ids)
+
+        return {
+            team_id: self._evaluate(
+                is_team=True,
+                registered=team_id in registered,
+                submission_count=counts.get(team_id, 0),
+            )
+            for team_id in team_ids
+        }
+
+    def for_users(self, users):
+        """Return {user_id: (allowed, reason)} for individual submissions"""
+        user_ids = [user.pk for user in users]
+        if not user_ids or self.hackathon.submission_type == 'team':
+            return {user_id: self._evaluate(False, False, 0) for user_id in user_ids}
+
+        registered = set()
+        if self.hackathon.require_registration:
+            # A user counts as registered through any approved team they belong to
+            registered = set(self.hackathon.team_registrations.filter(
+                team_profile__memberships__user_id__in=user_ids,
+                status='approved',
+            ).values_list('team_profile__memberships__user_id', flat=True))
+
+        counts = {}
+        if self.hackathon.max_submissions_per_participant > 0:
+            counts = self._submission_counts('submitter_id', user_ids)
+
+        return {
+            user_id: self._evaluate(
+                is_team=False,
+                registered=user_id in registered,
+                submission_count=counts.get(user_id, 0),
+            )
+            for user_id in user_ids
+        }
+
+    def _submission_counts(self, field, ids):
+        """One grouped count of live submissions to this hackathon"""
+        from synnovator.hackathons.models import SubmissionPage
+
+        rows = SubmissionPage.objects.live().filter(
+            hackathons=self.hackathon,
+            **{f'{field}__in': ids}
+        ).values(field).annotate(count=Count('pk', distinct=True)).order_by()
+        return {row[field]: row['count'] for row in rows}
+
+    def _submission_window(self):
+        """Phase check result shared by every participant; computed once"""
+        if self._window is None:
+            hackathon = self.hackathon
+            self._window = (True, "")
+            if hackathon.restrict_to_submission_phase and not hackathon.is_submission_open(self.at):
+                if hackathon.allow_late_submission:
+                    self._window = (True, _("Late submission"))
+                else:
+                    self._window = (False, _("Submissions are closed"))
+        return self._window
+
+    def _evaluate(self, is_team, registered, submission_count):
+        hackathon = self.hackathon
+
+        # 1. Submission type check
+        if hackathon.submission_type == 'individual' and is_team:
+            return False, _("This hackathon only accepts individual submissions")
+        if hackathon.submission_type == 'team' and not is_team:
+            return False, _("This hackathon only accepts team submissions")
+
+        # 2. Registration check (if enabled)
+        if hackathon.require_registration and not registered:
+            return False, _("You must register before submitting")
+
+        # 3. Submission count check (if configured > 0)
+        if 0 < hackathon.max_submissions_per_participant <= submission_count:
+            return False, _("Maximum submissions reached")
+
+        # 4. Phase check (if enabled)
+        return self._submission_window()
@@ -0,0 +1,49 @@
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from .models import HackathonPage
+from .results_export import available_formats
+
+
+class JudgeScoreImportForm(forms.Form):
+    """Upload form for bulk judge-score import"""
+
+    file = forms.FileField(
+        label=_("Score file"),
+        help_text=_(
+            "CSV or JSON with submission_id, judge (username), technical_score, "
+            "commercial_score, operational_score and optional overall_score, feedback"
+        )
+    )
+    dry_run = forms.BooleanField(
+        required=False,
+        label=_("Validate only"),
+        help_text=_("Check the file without saving any scores")
+    )
+
+
+class ResultsExportForm(forms.Form):
+    """Choice of hackathon, dataset and file format for a results export"""
+
+    hackathon = forms.ModelChoiceField(
+        queryset=HackathonPage.objects.order_by('title'),
+        label=_("Hackathon")
+    )
+    dataset = forms.ChoiceField(
+        choices=[
+            ('teams', _("Teams")),
+            ('submissions', _("Submissions")),
+            ('scores', _("Judge scores")),
+            ('criteria', _("Scoring criteria")),
+        ],
+        label=_("Data")
+    )
+    format = forms.ChoiceField(
+        label=_("Format")
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Parquet is only offered when pyarrow is installed
+        labels = {'csv': 'CSV', 'jsonl': 'JSON Lines', 'parquet': 'Parquet'}
+        self.fields['format'].choices = [(name, labels[name]) for name in available_formats()]
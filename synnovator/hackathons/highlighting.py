@@ -0,0 +1,138 @@
+"""
+Server-side syntax highlighting for SubmissionPage code blocks.
+
+Code blocks are highlighted with Pygments when their page is published, not
+in the browser or on each render. The highlighted HTML is cached by a hash
+of the language and code, so identical snippets (and unchanged snippets in
+a new revision) are highlighted once.
+
+Snippets over INLINE_HIGHLIGHT_CHARS are highlighted in a background thread
+after the publish commits, and the page's pre-rendered content is refreshed
+when they are done; until then they render as plain text. Snippets over
+MAX_HIGHLIGHT_CHARS are never highlighted.
+"""
+import hashlib
+import logging
+import threading
+
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from pygments import highlight as pygments_highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import TextLexer, get_lexer_by_name
+
+
+logger = logging.getLogger(__name__)
+
+HIGHLIGHT_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+INLINE_HIGHLIGHT_CHARS = 20_000
+MAX_HIGHLIGHT_CHARS = 200_000
+
+# code_block language choices; 'other' stays plain text
+LEXERS = {
+    'python': 'python',
+    'javascript': 'javascript',
+    'typescript': 'typescript',
+    'go': 'go',
+    'rust': 'rust',
+}
+
+_formatter = HtmlFormatter(nowrap=True)
+
+
+def _key(language, code):
+    digest = hashlib.sha256(f'{language}\0{code}'.encode()).hexdigest()
+    return f'hackathons:highlight:{digest}'
+
+
+def highlight(language, code):
+    """Token-classed HTML for `code`, without the surrounding <pre>"""
+    lexer = get_lexer_by_name(LEXERS[language]) if language in LEXERS else TextLexer()
+    return pygments_highlight(code, lexer, _formatter)
+
+
+def render_code(language, code):
+    """
+    Highlighted HTML for a code block, escaped plain text if it is not ready.
+
+    Small snippets missing from the cache (e.g. evicted) are highlighted on the
+    spot; large ones wait for the next publish or highlight_code_blocks.
+    """
+    code = code or ''
+    if len(code) > MAX_HIGHLIGHT_CHARS:
+        return escape(code)
+    key = _key(language, code)
+    html = cache.get(key)
+    if html is None:
+        if len(code) > INLINE_HIGHLIGHT_CHARS:
+            return escape(code)
+        html = highlight(language, code)
+        cache.set(key, html, HIGHLIGHT_CACHE_TIMEOUT)
+    return mark_safe(html)
+
+
+def code_blocks(page):
+    """(language, code) of each code block on the page"""
+    return [
+        (block.value['language'], block.value['code'] or '')
+        for block in page.content
+        if block.block_type == 'code_block'
+    ]
+
+
+def _missing(snippets):
+    """The snippets whose highlighted HTML is not cached, in one round-trip"""
+    keys = {_key(language, code): (language, code) for language, code in snippets}
+    cached = cache.get_many(keys)
+    return [snippet for key, snippet in keys.items() if key not in cached]
+
+
+def _store(snippets):
+    cache.set_many(
+        {_key(language, code): highlight(language, code) for language, code in snippets},
+        HIGHLIGHT_CACHE_TIMEOUT,
+    )
+
+
+def _highlight_in_background(page_id, revision_id, snippets):
+    from synnovator.hackathons import submission_content
+    from synnovator.hackathons.models import SubmissionPage
+
+    try:
+        _store(snippets)
+        page = SubmissionPage.objects.filter(pk=page_id, live_revision_id=revision_id).first()
+        if page is not None:
+            submission_content.prerender(page)
+    except Exception:
+        logger.exception('Background highlighting failed for page %s', page_id)
+    finally:
+        connections.close_all()
+
+
+def start_background(page_id, revision_id, snippets):
+    threading.Thread(
+        target=_highlight_in_background, args=(page_id, revision_id, snippets), daemon=True
+    ).start()
+
+
+def highlight_page(page, background=True):
+    """
+    Highlight the page's code blocks that are not cached yet.
+
+    Large snippets go to a background thread once the current transaction
+    commits, unless `background` is False. Returns how many snippets were
+    highlighted now.
+    """
+    inline, deferred = [], []
+    snippets = [(language, code) for language, code in code_blocks(page) if len(code) <= MAX_HIGHLIGHT_CHARS]
+    for language, code in _missing(snippets):
+        (deferred if background and len(code) > INLINE_HIGHLIGHT_CHARS else inline).append((language, code))
+
+    _store(inline)
+    if deferred:
+        page_id, revision_id = page.pk, page.live_revision_id
+        transaction.on_commit(lambda: start_background(page_id, revision_id, deferred))
+    return len(inline)
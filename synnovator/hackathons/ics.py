@@ -0,0 +1,170 @@
+"""
+iCalendar (.ics) feeds of hackathon phases.
+
+Calendar apps poll subscriptions far more often than people open the site, so
+feeds are assembled from per-hackathon VEVENT fragments. Each fragment is
+rendered once and cached under that hackathon's feed version, which is bumped
+only when the hackathon or one of its phases changes (see signals). A
+global feed therefore re-renders just the hackathons that changed. Strong
+ETags are derived from the cached fragment digests, so a 304 is answered
+without assembling the body.
+"""
+import hashlib
+import uuid
+from datetime import timezone as dt_timezone
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from synnovator.hackathons.calendar_events import get_calendar_version
+
+
+ICS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Feeds larger than this many bytes are streamed instead of buffered
+ICS_STREAMING_THRESHOLD = 256 * 1024
+
+PRODID = '-//Synnovator//Hackathon Phases//EN'
+
+
+def _version_key(hackathon_id):
+    return f'hackathons:ics:version:{hackathon_id}'
+
+
+def bump_hackathon_feed_version(hackathon_id):
+    """Force the hackathon's VEVENT fragment to be re-rendered on next request"""
+    cache.set(_version_key(hackathon_id), uuid.uuid4().hex, None)
+
+
+def escape_text(value):
+    """Escape a TEXT value (RFC 5545 section 3.3.11)"""
+    return (
+        str(value or '')
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line):
+    """Fold a content line at 75 octets without splitting UTF-8 sequences"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return encoded + b'\r\n'
+
+    chunks = []
+    current = b''
+    limit = 75
+    for char in line:
+        char_bytes = char.encode('utf-8')
+        if len(current) + len(char_bytes) > limit:
+            chunks.append(current)
+            current = b''
+            limit = 74  # continuation lines start with a space
+        current += char_bytes
+    chunks.append(current)
+    return b'\r\n '.join(chunks) + b'\r\n'
+
+
+def format_datetime(value):
+    """UTC DATE-TIME form, e.g. 20260301T090000Z"""
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def render_hackathon_events(hackathon, phases, stamp=None):
+    """Render VEVENT blocks for a hackathon's phases"""
+    stamp = format_datetime(stamp or timezone.now())
+    url = hackathon.get_full_url()
+    lines = []
+    for phase in phases:
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:hackathon-phase-{phase.pk}@synnovator',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{format_datetime(phase.start_date)}',
+            f'DTEND:{format_datetime(phase.end_date)}',
+            f'SUMMARY:{escape_text(f"{hackathon.title}: {phase.title}")}',
+        ]
+        if phase.description:
+            lines.append(f'DESCRIPTION:{escape_text(phase.description)}')
+        if url:
+            lines.append(f'URL:{url}')
+        lines.append('END:VEVENT')
+    return b''.join(fold_line(line) for line in lines)
+
+
+def get_feed_fragments(hackathon_ids):
+    """
+    Return [(digest, vevent bytes)] for the given hackathons, in order.
+
+    Versions and fragments are each fetched in one cache round-trip; only
+    hackathons whose feed version changed are re-rendered (with one phase
+    query).
+    """
+    from synnovator.hackathons.models import HackathonPage, Phase
+
+    hackathon_ids = list(hackathon_ids)
+    stored = cache.get_many([_version_key(hid) for hid in hackathon_ids])
+    versions = {hid: stored.get(_version_key(hid)) for hid in hackathon_ids}
+    new_versions = {hid: uuid.uuid4().hex for hid, version in versions.items() if version is None}
+    if new_versions:
+        cache.set_many({_version_key(hid): v for hid, v in new_versions.items()}, None)
+        versions.update(new_versions)
+    keys = {hid: f'hackathons:ics:fragment:{hid}:{versions[hid]}' for hid in hackathon_ids}
+    cached = cache.get_many(keys.values())
+
+    missing = [hid for hid in hackathon_ids if keys[hid] not in cached]
+    if missing:
+        phases_by_hackathon = {}
+        for phase in Phase.objects.filter(hackathon_id__in=missing).order_by('start_date', 'pk'):
+            phases_by_hackathon.setdefault(phase.hackathon_id, []).append(phase)
+
+        rendered = {}
+        for hackathon in HackathonPage.objects.filter(pk__in=missing):
+            body = render_hackathon_events(hackathon, phases_by_hackathon.get(hackathon.pk, []))
+            rendered[keys[hackathon.pk]] = (hashlib.sha256(body).hexdigest(), body)
+        cache.set_many(rendered, ICS_CACHE_TIMEOUT)
+        cached.update(rendered)
+
+    return [cached[keys[hid]] for hid in hackathon_ids if keys[hid] in cached]
+
+
+def get_feed_hackathon_ids():
+    """Live hackathons included in the global feed, cached per calendar version"""
+    from synnovator.hackathons.models import HackathonPage
+
+    key = f'hackathons:ics:ids:{get_calendar_version()}'
+    ids = cache.get(key)
+    if ids is None:
+        ids = list(HackathonPage.objects.live().order_by('pk').values_list('pk', flat=True))
+        cache.set(key, ids, ICS_CACHE_TIMEOUT)
+    return ids
+
+
+def feed_etag(name, fragments):
+    """Strong ETag over the calendar name and the fragment digests"""
+    digest = hashlib.sha256(name.encode())
+    for fragment_digest, _body in fragments:
+        digest.update(fragment_digest.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def feed_size(name, fragments):
+    return sum(len(body) for _digest, body in fragments) + len(name) + 200
+
+
+def stream_feed(name, fragments):
+    """Yield a VCALENDAR document chunk by chunk"""
+    yield b''.join(fold_line(line) for line in [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(name)}',
+    ])
+    for _digest, body in fragments:
+        yield body
+    yield b'END:VCALENDAR\r\n'
@@ -0,0 +1,193 @@
+"""
+Balanced judge assignment.
+
+Without assignments every judge sees every submission, so some submissions
+collect a dozen scores and others none. plan_assignments() gives each of a
+hackathon's submissions `per_submission` judges:
+
+- Judges never review their own submission, or one by a team they belong to.
+- A judge's work counts their assignments plus the scores they already
+  entered, and stays under `max_per_judge` when given.
+- Each submission takes the least-loaded eligible judges, from a heap of
+  (load, turn, judge). Judges with equal load are handed out in turn, so
+  loads differ by at most one unless conflicts or caps get in the way.
+
+Planning loads the submissions, team memberships, assignments and scores with
+four queries and balances in O(n k log j) for n submissions, k judges each
+and j judges, so 20k submissions are planned in well under a second.
+
+Plans are incremental: submissions that already have k judges are left
+alone, so running again after new submissions arrive only assigns those.
+Planning with `release=[judge]` drops that judge's unscored assignments and
+re-assigns just the submissions that lost them. As with advancement, a plan
+is reviewed before apply_assignments() writes it in one transaction.
+"""
+import heapq
+import itertools
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Q
+
+
+DEFAULT_JUDGES_PER_SUBMISSION = 3
+
+# Rejected submissions are not judged
+UNJUDGED_STATUSES = ('rejected',)
+
+
+@dataclass
+class AssignmentPlan:
+    hackathon: object
+    per_submission: int
+    judge_ids: list
+    # (submission_id, judge_id) pairs to create / unscored assignments to delete
+    new: list = field(default_factory=list)
+    released: list = field(default_factory=list)
+    # {judge_id: total load after the plan}
+    loads: dict = field(default_factory=dict)
+    # {submission_id: judges still missing}
+    uncovered: dict = field(default_factory=dict)
+    applied: bool = False
+
+    def summary(self):
+        """Human-readable lines: one per judge, then coverage"""
+        new_by_judge = {}
+        for _submission_id, judge_id in self.new:
+            new_by_judge[judge_id] = new_by_judge.get(judge_id, 0) + 1
+        lines = [
+            f'judge {judge_id}: {self.loads.get(judge_id, 0)} submissions (+{new_by_judge.get(judge_id, 0)})'
+            for judge_id in self.judge_ids
+        ]
+        if self.released:
+            lines.append(f'{len(self.released)} unscored assignments released')
+        if self.uncovered:
+            lines.append(
+                f'{len(self.uncovered)} submissions short of {self.per_submission} judges '
+                f'({sum(self.uncovered.values())} reviews missing)'
+            )
+        return lines
+
+
+def balance(submissions, judge_ids, per_submission, covered, loads, max_per_judge=None):
+    """
+    Pick judges for each submission from the least loaded.
+
+    `submissions` is [(submission_id, frozenset of conflicted judge ids)],
+    `covered` maps submission ids to judges already reviewing them and
+    `loads` maps judge ids to their current load; it is updated in place.
+    Returns (new pairs, {submission_id: judges still missing}).
+    """
+    turn = itertools.count()
+    heap = [(loads.get(judge_id, 0), next(turn), judge_id) for judge_id in judge_ids]
+    heapq.heapify(heap)
+    cap = max_per_judge if max_per_judge is not None else float('inf')
+
+    # Submissions with the fewest eligible judges go first, while everyone has capacity
+    needs = []
+    for submission_id, conflicted in submissions:
+        need = per_submission - len(covered.get(submission_id, ()))
+        if need > 0:
+            needs.append((-len(conflicted), submission_id, conflicted, need))
+    needs.sort()
+
+    new, uncovered = [], {}
+    for _order, submission_id, conflicted, need in needs:
+        taken = covered.get(submission_id, ())
+        picked, passed = [], []
+        while heap and len(picked) < need:
+            entry = heapq.heappop(heap)
+            if entry[0] >= cap:
+                # Least-loaded judge is full, so everyone is
+                passed.append(entry)
+                break
+            if entry[2] in taken or entry[2] in conflicted:
+                passed.append(entry)
+            else:
+                picked.append(entry)
+        for load, _turn, judge_id in picked:
+            new.append((submission_id, judge_id))
+            loads[judge_id] = load + 1
+            heapq.heappush(heap, (load + 1, next(turn), judge_id))
+        for entry in passed:
+            heapq.heappush(heap, entry)
+        if len(picked) < need:
+            uncovered[submission_id] = need - len(picked)
+    return new, uncovered
+
+
+def plan_assignments(hackathon, judges, per_submission=DEFAULT_JUDGES_PER_SUBMISSION, max_per_judge=None,
+                     release=()):
+    """
+    Top up every judged submission of `hackathon` to `per_submission` judges.
+
+    `release` lists judges dropping out: their unscored assignments are
+    released and they get no new ones.
+    """
+    from synnovator.hackathons.models import JudgeAssignment, JudgeScore, Submission, TeamMember
+
+    released_ids = {getattr(judge, 'pk', judge) for judge in release}
+    judge_ids = [
+        judge_id for judge_id in dict.fromkeys(getattr(judge, 'pk', judge) for judge in judges)
+        if judge_id not in released_ids
+    ]
+    plan = AssignmentPlan(hackathon=hackathon, per_submission=per_submission, judge_ids=judge_ids)
+
+    rows = list(
+        Submission.objects.filter(Q(hackathon=hackathon) | Q(team__hackathon=hackathon))
+        .exclude(verification_status__in=UNJUDGED_STATUSES)
+        .order_by('pk')
+        .values_list('pk', 'user_id', 'team_id')
+    )
+    members = {}
+    team_ids = {team_id for _pk, _user_id, team_id in rows if team_id}
+    for team_id, user_id in TeamMember.objects.filter(team_id__in=team_ids).values_list('team_id', 'user_id'):
+        members.setdefault(team_id, set()).add(user_id)
+
+    scored = set(JudgeScore.objects.filter(
+        Q(submission__hackathon=hackathon) | Q(submission__team__hackathon=hackathon)
+    ).values_list('submission_id', 'judge_id'))
+    covered, loads = {}, {}
+    for submission_id, judge_id in itertools.chain(
+        JudgeAssignment.objects.filter(hackathon=hackathon).values_list('submission_id', 'judge_id'), scored
+    ):
+        if judge_id in released_ids and (submission_id, judge_id) not in scored:
+            plan.released.append((submission_id, judge_id))
+            continue
+        if judge_id in covered.setdefault(submission_id, set()):
+            continue
+        covered[submission_id].add(judge_id)
+        loads[judge_id] = loads.get(judge_id, 0) + 1
+
+    submissions = [
+        (pk, frozenset(members.get(team_id, ())) | ({user_id} if user_id else frozenset()))
+        for pk, user_id, team_id in rows
+    ]
+    plan.new, plan.uncovered = balance(
+        submissions, judge_ids, per_submission, covered, loads, max_per_judge=max_per_judge
+    )
+    plan.loads = {judge_id: loads.get(judge_id, 0) for judge_id in judge_ids}
+    return plan
+
+
+def apply_assignments(plan, batch_size=2000):
+    """Delete released assignments and create the new ones in one transaction"""
+    from synnovator.hackathons.models import JudgeAssignment
+
+    with transaction.atomic():
+        for judge_id in {judge_id for _submission_id, judge_id in plan.released}:
+            JudgeAssignment.objects.filter(
+                hackathon=plan.hackathon,
+                judge_id=judge_id,
+                submission_id__in=[s for s, j in plan.released if j == judge_id],
+            ).delete()
+        JudgeAssignment.objects.bulk_create(
+            [
+                JudgeAssignment(hackathon=plan.hackathon, submission_id=submission_id, judge_id=judge_id)
+                for submission_id, judge_id in plan.new
+            ],
+            batch_size=batch_size,
+        )
+    plan.applied = True
+    return plan
+
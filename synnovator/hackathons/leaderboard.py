@@ -0,0 +1,241 @@
+"""
+Incrementally maintained hackathon leaderboard.
+
+JudgeScore writes and submission verification changes are folded into
+LeaderboardEntry as deltas, so the hot path is a constant number of queries
+regardless of how many scores a team already has. rebuild_leaderboard()
+recomputes everything from JudgeScore with one grouped aggregate and is the
+repair path (see the rebuild_leaderboard management command).
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Sum, Window
+from django.db.models.functions import Rank
+
+from synnovator.hackathons.models.leaderboard import SCORE_DIMENSIONS, LeaderboardEntry
+
+
+SCORE_VALUE_FIELDS = tuple(f'{dimension}_score' for dimension in SCORE_DIMENSIONS)
+
+
+def _as_decimal(value):
+    return value if isinstance(value, Decimal) else Decimal(str(value or 0))
+
+
+def _score_values(source):
+    """Read score dimensions from a JudgeScore instance or a values() dict"""
+    if isinstance(source, dict):
+        return {d: _as_decimal(source.get(f'{d}_score')) for d in SCORE_DIMENSIONS}
+    return {d: _as_decimal(getattr(source, f'{d}_score')) for d in SCORE_DIMENSIONS}
+
+
+def _submission_target(submission_id):
+    """Return (team_id, hackathon_id, is_verified) for a submission, or None"""
+    from synnovator.hackathons.models import Submission
+
+    row = Submission.objects.filter(pk=submission_id).values(
+        'team_id', 'team__hackathon_id', 'verification_status'
+    ).first()
+    if not row or not row['team_id']:
+        return None
+    return row['team_id'], row['team__hackathon_id'], row['verification_status'] == 'verified'
+
+
+def apply_delta(team_id, hackathon_id, deltas, count_delta, create=True):
+    """
+    Fold a score delta into a team's leaderboard entry and mirror it onto Team.
+
+    The entry row is locked for the duration of the update so concurrent
+    judges cannot interleave their read-modify-write cycles.
+    """
+    from synnovator.hackathons.models import Team
+
+    with transaction.atomic():
+        entries = LeaderboardEntry.objects.select_for_update()
+        entry = entries.filter(team_id=team_id).first()
+        if entry is None:
+            if not create:
+                return None
+            entry, _created = LeaderboardEntry.objects.get_or_create(
+                team_id=team_id,
+                defaults={'hackathon_id': hackathon_id},
+            )
+            entry = entries.get(pk=entry.pk)
+
+        entry.apply_delta(deltas, count_delta)
+        entry.save()
+        Team.objects.filter(pk=team_id).update(**entry.team_score_fields())
+    return entry
+
+
+def record_judge_score(judge_score, previous=None):
+    """
+    Apply a saved JudgeScore to the leaderboard.
+
+    Args:
+        judge_score: The JudgeScore that was just saved
+        previous: values() dict of the row before the save (None on create)
+    """
+    new_values = _score_values(judge_score)
+
+    if previous and previous['submission_id'] != judge_score.submission_id:
+        record_judge_score_removed(previous)
+        previous = None
+
+    target = _submission_target(judge_score.submission_id)
+    if target is None:
+        return None
+    team_id, hackathon_id, is_verified = target
+    if not is_verified:
+        return None
+
+    if previous:
+        old_values = _score_values(previous)
+        deltas = {d: new_values[d] - old_values[d] for d in SCORE_DIMENSIONS}
+        return apply_delta(team_id, hackathon_id, deltas, 0)
+    return apply_delta(team_id, hackathon_id, new_values, 1)
+
+
+def record_judge_score_removed(judge_score):
+    """Subtract a deleted JudgeScore (instance or values() dict) from the leaderboard"""
+    if isinstance(judge_score, dict):
+        submission_id = judge_score['submission_id']
+    else:
+        submission_id = judge_score.submission_id
+
+    target = _submission_target(submission_id)
+    if target is None:
+        return None
+    team_id, hackathon_id, is_verified = target
+    if not is_verified:
+        return None
+
+    values = _score_values(judge_score)
+    deltas = {d: -values[d] for d in SCORE_DIMENSIONS}
+    return apply_delta(team_id, hackathon_id, deltas, -1, create=False)
+
+
+def record_submission_status_change(submission, was_verified):
+    """
+    Add or remove a submission's judge scores when it enters or leaves 'verified'.
+
+    Costs one aggregate over the submission's own scores, not the team's.
+    """
+    is_verified = submission.verification_status == 'verified'
+    if was_verified == is_verified or not submission.team_id:
+        return None
+
+    totals = submission.judge_scores.aggregate(
+        count=Count('id'),
+        **{f'{d}_sum': Sum(f'{d}_score') for d in SCORE_DIMENSIONS}
+    )
+    if not totals['count']:
+        return None
+
+    sign = 1 if is_verified else -1
+    deltas = {d: sign * _as_decimal(totals[f'{d}_sum']) for d in SCORE_DIMENSIONS}
+    hackathon_id = submission.team.hackathon_id
+    return apply_delta(
+        submission.team_id, hackathon_id, deltas, sign * totals['count'],
+        create=is_verified,
+    )
+
+
+def _aggregate_entries(judge_scores):
+    """Group verified judge scores by team into unsaved LeaderboardEntry objects"""
+    rows = judge_scores.filter(
+        submission__verification_status='verified',
+        submission__team__isnull=False,
+    ).values(
+        'submission__team_id', 'submission__team__hackathon_id'
+    ).annotate(
+        score_count=Count('id'),
+        **{f'{d}_total': Sum(f'{d}_score') for d in SCORE_DIMENSIONS}
+    ).order_by()
+
+    entries = []
+    for row in rows:
+        entry = LeaderboardEntry(
+            team_id=row['submission__team_id'],
+            hackathon_id=row['submission__team__hackathon_id'],
+            score_count=row['score_count'],
+            **{f'{d}_sum': _as_decimal(row[f'{d}_total']) for d in SCORE_DIMENSIONS}
+        )
+        entry.recalculate()
+        entries.append(entry)
+    return entries
+
+
+def _write_entries(entries, stale_entries):
+    """Replace stale entries with freshly aggregated ones and sync Team rows"""
+    from synnovator.hackathons.models import Team
+
+    with transaction.atomic():
+        # Teams that lost all their scores drop back to zero
+        fresh_team_ids = {entry.team_id for entry in entries}
+        emptied_team_ids = set(stale_entries.values_list('team_id', flat=True)) - fresh_team_ids
+        stale_entries.delete()
+        LeaderboardEntry.objects.bulk_create(entries, batch_size=500)
+        teams = [Team(pk=entry.team_id, **entry.team_score_fields()) for entry in entries]
+        teams += [
+            Team(pk=team_id, technical_score=0, commercial_score=0,
+                 operational_score=0, final_score=0)
+            for team_id in emptied_team_ids
+        ]
+        Team.objects.bulk_update(
+            teams,
+            ['technical_score', 'commercial_score', 'operational_score', 'final_score'],
+            batch_size=500,
+        )
+    return entries
+
+
+def rebuild_leaderboard(hackathon):
+    """Recompute every entry for a hackathon from JudgeScore"""
+    from synnovator.hackathons.models import JudgeScore
+
+    entries = _aggregate_entries(
+        JudgeScore.objects.filter(submission__team__hackathon=hackathon)
+    )
+    return _write_entries(entries, LeaderboardEntry.objects.filter(hackathon=hackathon))
+
+
+def rebuild_team_entries(team_ids):
+    """Recompute the entries for a set of teams from JudgeScore"""
+    from synnovator.hackathons.models import JudgeScore
+
+    team_ids = list(team_ids)
+    if not team_ids:
+        return []
+    entries = _aggregate_entries(
+        JudgeScore.objects.filter(submission__team_id__in=team_ids)
+    )
+    return _write_entries(entries, LeaderboardEntry.objects.filter(team_id__in=team_ids))
+
+
+def get_ranked_entries(hackathon, limit=10, offset=0):
+    """
+    Leaderboard rows with competition ranks ("1, 2, 2, 4").
+
+    Reads only LeaderboardEntry; ties share a rank.
+    """
+    return LeaderboardEntry.objects.filter(hackathon=hackathon).select_related(
+        'team'
+    ).annotate(
+        rank=Window(expression=Rank(), order_by=F('final_score').desc())
+    ).order_by('-final_score', 'team_id')[offset:offset + limit]
+
+
+def get_team_rank(team):
+    """Competition rank of a team within its hackathon, or None if unscored"""
+    entry = LeaderboardEntry.objects.filter(team=team).values(
+        'hackathon_id', 'final_score'
+    ).first()
+    if entry is None:
+        return None
+    ahead = LeaderboardEntry.objects.filter(
+        hackathon_id=entry['hackathon_id'],
+        final_score__gt=entry['final_score'],
+    ).count()
+    return ahead + 1
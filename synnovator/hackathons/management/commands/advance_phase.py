@@ -0,0 +1,73 @@
+"""
+Management command to advance or eliminate teams at the end of a phase.
+
+Prints the planned status changes as a diff. Nothing is written unless
+--apply is given, so the dry run is always reviewed first.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand, CommandError
+
+from synnovator.hackathons.advancement import apply_advancement, plan_advancement
+from synnovator.hackathons.models import Phase
+
+
+def _decimal(value):
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise CommandError(f'Invalid score: {value}')
+
+
+class Command(BaseCommand):
+    help = 'Advance teams past a phase by quest completion and score cutoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'phase',
+            type=int,
+            help='ID of the phase being closed',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            help='Advance only the N highest-scoring qualifying teams (ties included)',
+        )
+        parser.add_argument(
+            '--min-score',
+            type=_decimal,
+            help='Advance only teams with at least this final score',
+        )
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='Write the decisions (default is a dry run)',
+        )
+        parser.add_argument(
+            '--no-notify',
+            action='store_true',
+            help='Do not notify team leaders',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            phase = Phase.objects.select_related('hackathon').get(pk=options['phase'])
+        except Phase.DoesNotExist:
+            self.stderr.write(self.style.ERROR(f'Phase {options["phase"]} not found.'))
+            return
+
+        plan = plan_advancement(phase, top_n=options['top'], min_score=options['min_score'])
+        self.stdout.write(f'{phase.hackathon.title} / {phase.title}: {len(plan.decisions)} teams')
+        for line in plan.diff():
+            self.stdout.write(f'  {line}')
+        self.stdout.write(f'{len(plan.advanced)} advance, {len(plan.eliminated)} eliminated')
+
+        if not options['apply']:
+            self.stdout.write(self.style.WARNING('Dry run: re-run with --apply to write these decisions.'))
+            return
+
+        apply_advancement(plan, notify=not options['no_notify'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Advancement applied ({plan.notifications_sent} notifications sent).'
+        ))
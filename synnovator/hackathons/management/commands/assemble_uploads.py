@@ -0,0 +1,26 @@
+"""
+Management command to finish chunked uploads whose assembly was interrupted.
+
+Completed uploads are assembled on a background thread of the web worker
+that accepted them, and gunicorn recycles workers every max_requests
+requests. Uploads whose client keeps polling are restarted by the upload
+status API; this command catches the rest and must be scheduled, e.g. from
+cron every ten minutes:
+
+    */10 * * * * python manage.py assemble_uploads
+
+It assembles uploads left assembling for longer than uploads.ASSEMBLY_TIMEOUT
+in this process, and fails those that stalled MAX_ASSEMBLY_ATTEMPTS times.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.uploads import assemble_pending
+
+
+class Command(BaseCommand):
+    help = 'Assemble completed submission uploads that their web worker did not finish'
+
+    def handle(self, *args, **options):
+        assembled = assemble_pending()
+        self.stdout.write(self.style.SUCCESS(f'Assembled {assembled} uploads.'))
@@ -0,0 +1,102 @@
+"""
+Management command to assign judges to a hackathon's submissions.
+
+Each submission is topped up to --per-submission judges, least-loaded first,
+never to a judge on the submitting team. Re-running only assigns what is
+missing; --release hands a judge's unscored submissions to the others.
+Nothing is written unless --apply is given.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from synnovator.hackathons.judge_assignment import (
+    DEFAULT_JUDGES_PER_SUBMISSION, apply_assignments, plan_assignments
+)
+from synnovator.hackathons.models import HackathonPage
+
+
+class Command(BaseCommand):
+    help = 'Assign judges to submissions, balancing their workload'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'hackathon',
+            type=int,
+            help='ID of the hackathon page',
+        )
+        parser.add_argument(
+            '--judge',
+            action='append',
+            default=[],
+            metavar='USERNAME',
+            help='Judge to assign (repeatable)',
+        )
+        parser.add_argument(
+            '--group',
+            action='append',
+            default=[],
+            help='Assign every member of this user group (repeatable)',
+        )
+        parser.add_argument(
+            '--per-submission',
+            type=int,
+            default=DEFAULT_JUDGES_PER_SUBMISSION,
+            help=f'Judges per submission (default {DEFAULT_JUDGES_PER_SUBMISSION})',
+        )
+        parser.add_argument(
+            '--max-per-judge',
+            type=int,
+            help='Most submissions any judge is given, including ones already scored',
+        )
+        parser.add_argument(
+            '--release',
+            action='append',
+            default=[],
+            metavar='USERNAME',
+            help='Judge dropping out: unscored assignments go to the others (repeatable)',
+        )
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='Write the assignments (default is a dry run)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            hackathon = HackathonPage.objects.get(pk=options['hackathon'])
+        except HackathonPage.DoesNotExist:
+            self.stderr.write(self.style.ERROR(f'Hackathon {options["hackathon"]} not found.'))
+            return
+
+        User = get_user_model()
+        judges = list(User.objects.filter(username__in=options['judge']))
+        missing = set(options['judge']) - {judge.username for judge in judges}
+        if options['group']:
+            judges += User.objects.filter(groups__name__in=options['group'], is_active=True).distinct()
+        release = list(User.objects.filter(username__in=options['release']))
+        missing |= set(options['release']) - {judge.username for judge in release}
+        if missing:
+            raise CommandError(f'Unknown users: {", ".join(sorted(missing))}')
+        if not judges:
+            raise CommandError('No judges given: use --judge or --group.')
+
+        plan = plan_assignments(
+            hackathon,
+            judges,
+            per_submission=options['per_submission'],
+            max_per_judge=options['max_per_judge'],
+            release=release,
+        )
+        self.stdout.write(f'{hackathon.title}: {len(plan.new)} new assignments for {len(plan.judge_ids)} judges')
+        for line in plan.summary():
+            self.stdout.write(f'  {line}')
+
+        if not options['apply']:
+            self.stdout.write(self.style.WARNING('Dry run: re-run with --apply to write these assignments.'))
+            return
+
+        apply_assignments(plan)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(plan.new)} assignments created, {len(plan.released)} released.'
+        ))
@@ -0,0 +1,33 @@
+"""
+Management command to run submission originality checks.
+
+New submissions are checked by a background thread in the web process that
+created them. Run this to check submissions that thread never got to (e.g.
+created by a bulk import or before a restart), or with --all to rebuild the
+signature index from scratch in submission order.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.originality import check_pending
+
+
+class Command(BaseCommand):
+    help = 'Check submissions for near-duplicates with MinHash/LSH'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--submission',
+            type=int,
+            action='append',
+            help='Only check the submission with this ID (repeatable)',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Re-check submissions that were already checked',
+        )
+
+    def handle(self, *args, **options):
+        checked = check_pending(submission_ids=options['submission'], recheck=options['all'])
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} submissions.'))
@@ -0,0 +1,48 @@
+"""
+Management command to check teams against automated competition rules.
+
+Safe to run on a schedule: teams that already have a pending violation for a
+rule are not flagged again.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.compliance import sweep_hackathon
+from synnovator.hackathons.models import HackathonPage
+
+
+class Command(BaseCommand):
+    help = 'Check all teams against automated competition rules and record violations'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hackathon',
+            type=int,
+            help='Only check the hackathon with this page ID',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report violations without recording them',
+        )
+
+    def handle(self, *args, **options):
+        hackathons = HackathonPage.objects.all()
+        if options['hackathon']:
+            hackathons = hackathons.filter(pk=options['hackathon'])
+            if not hackathons.exists():
+                self.stderr.write(self.style.ERROR(
+                    f'Hackathon {options["hackathon"]} not found.'
+                ))
+                return
+
+        verb = 'would be recorded' if options['dry_run'] else 'recorded'
+        for hackathon in hackathons:
+            report = sweep_hackathon(hackathon, dry_run=options['dry_run'])
+            self.stdout.write(
+                f'{hackathon.title}: {report.teams_checked} teams, '
+                f'{report.rules_checked} rules, {report.violations_created} violations {verb}, '
+                f'{report.duplicates_skipped} already pending'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Compliance check complete.'))
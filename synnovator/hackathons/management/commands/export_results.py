@@ -0,0 +1,68 @@
+"""
+Management command to export a hackathon's results.
+
+Streams teams, submissions, judge scores or scoring criteria as CSV, JSON
+Lines or Parquet to a file (or stdout), a chunk of rows at a time.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from synnovator.hackathons.models import HackathonPage
+from synnovator.hackathons.results_export import (
+    DATASETS, EXPORT_CHUNK_SIZE, FORMATS, ExportError, stream_export
+)
+
+
+class Command(BaseCommand):
+    help = "Export a hackathon's teams, submissions, judge scores or scoring criteria"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'hackathon',
+            type=int,
+            help='ID of the hackathon page',
+        )
+        parser.add_argument(
+            'dataset',
+            choices=list(DATASETS),
+            help='What to export',
+        )
+        parser.add_argument(
+            '--format',
+            choices=list(FORMATS),
+            default='csv',
+            help='File format (default csv)',
+        )
+        parser.add_argument(
+            '--output',
+            help='File to write (default stdout; required for parquet)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f'Rows fetched and encoded at a time (default {EXPORT_CHUNK_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            hackathon = HackathonPage.objects.get(pk=options['hackathon'])
+        except HackathonPage.DoesNotExist:
+            raise CommandError(f'Hackathon {options["hackathon"]} not found.')
+        if options['format'] == 'parquet' and not options['output']:
+            raise CommandError('Parquet exports need --output.')
+
+        try:
+            chunks = stream_export(
+                hackathon, options['dataset'], options['format'], chunk_size=options['chunk_size']
+            )
+        except ExportError as e:
+            raise CommandError(str(e))
+
+        if options['output']:
+            with open(options['output'], 'wb') as f:
+                written = sum(f.write(chunk) for chunk in chunks)
+            self.stdout.write(self.style.SUCCESS(f'Wrote {written} bytes to {options["output"]}.'))
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode(), ending='')
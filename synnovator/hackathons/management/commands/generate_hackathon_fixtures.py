@@ -10,13 +10,19 @@ Generates:
 - Quests (25-35): All difficulty levels
 - Submissions (100-150): Mix of verification statuses
 - Prizes (3-5 per hackathon): Monetary + benefits
+
+With --scale it instead bulk-inserts production-sized data (hundreds of
+thousands of users, teams and submissions, judge assignments and scores,
+and TeamProfilePage / SubmissionPage trees) for profiling query plans; see
+synnovator.hackathons.scale_fixtures. --seed makes either mode repeatable.
 """
 
+import argparse
 import random
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.utils.text import slugify
@@ -26,12 +32,25 @@ from wagtail.models import Page
 from synnovator.hackathons.models import (
     HackathonPage, Phase, Prize, Team, TeamMember, Quest, Submission
 )
+from synnovator.hackathons.scale_fixtures import ScaleConfig, ScaleFixtureError, delete_pages, generate
 from synnovator.home.models import HomePage
 
 User = get_user_model()
 fake = Faker()
 
 
+def _bounds(value):
+    """'3' or '2-5' as a (low, high) pair"""
+    low, _, high = value.partition('-')
+    try:
+        bounds = (int(low), int(high or low))
+    except ValueError:
+        bounds = None
+    if bounds is None or not 0 <= bounds[0] <= bounds[1]:
+        raise argparse.ArgumentTypeError(f'invalid range: {value}')
+    return bounds
+
+
 class Command(BaseCommand):
     help = 'Generate realistic mock data for hackathon platform'
 
@@ -41,12 +60,58 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing hackathon data before generating new data',
         )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed, for repeatable data (scale mode defaults to 0)',
+        )
+
+        scale = parser.add_argument_group('scale mode')
+        defaults = ScaleConfig()
+        scale.add_argument(
+            '--scale',
+            action='store_true',
+            help='Bulk-insert production-sized data for load testing',
+        )
+        scale.add_argument('--users', type=int, default=defaults.users, help=f'Participants (default {defaults.users})')
+        scale.add_argument('--hackathons', type=int, default=defaults.hackathons,
+                           help=f'Hackathons (default {defaults.hackathons})')
+        scale.add_argument('--teams', type=int, default=defaults.teams,
+                           help=f'Teams over all hackathons (default {defaults.teams})')
+        scale.add_argument('--hackathon-skew', type=float, default=defaults.hackathon_skew,
+                           help='Zipf exponent spreading teams over hackathons; 0 is even '
+                                f'(default {defaults.hackathon_skew})')
+        scale.add_argument('--team-size', type=_bounds, default=defaults.team_size, metavar='MIN-MAX',
+                           help='Members per team (default 2-5)')
+        scale.add_argument('--submissions-per-team', type=_bounds, default=defaults.submissions_per_team,
+                           metavar='MIN-MAX', help='Submissions per team (default 1-2)')
+        scale.add_argument('--quests', type=int, default=defaults.quests, help=f'Quests (default {defaults.quests})')
+        scale.add_argument('--quest-submissions', type=int, default=defaults.quest_submissions,
+                           help=f'Individual quest submissions (default {defaults.quest_submissions})')
+        scale.add_argument('--judges', type=int, default=defaults.judges, help=f'Judges (default {defaults.judges})')
+        scale.add_argument('--judges-per-submission', type=_bounds, default=defaults.judges_per_submission,
+                           metavar='MIN-MAX', help='Judges assigned per team submission (default 3)')
+        scale.add_argument('--scored-fraction', type=float, default=defaults.scored_fraction,
+                           help=f'Share of assignments with a judge score (default {defaults.scored_fraction})')
+        scale.add_argument('--page-fraction', type=float, default=defaults.page_fraction,
+                           help='Share of teams with a team page and submission page '
+                                f'(default {defaults.page_fraction})')
+        scale.add_argument('--batch-size', type=int, default=defaults.batch_size,
+                           help=f'Rows per bulk insert (default {defaults.batch_size})')
 
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing hackathon data...')
             self.clear_data()
 
+        if options['seed'] is not None:
+            random.seed(options['seed'])
+            fake.seed_instance(options['seed'])
+
+        if options['scale']:
+            self.generate_scale(options)
+            return
+
         self.stdout.write('Generating mock data...')
 
         # Generate data in order of dependencies
@@ -76,8 +141,36 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS('\n✅ Mock data generation complete!'))
 
+    def generate_scale(self, options):
+        """Bulk-insert production-sized data (see synnovator.hackathons.scale_fixtures)."""
+        config = ScaleConfig(
+            seed=options['seed'] or 0,
+            batch_size=options['batch_size'],
+            **{name: options[name] for name in (
+                'users', 'hackathons', 'teams', 'hackathon_skew', 'team_size', 'submissions_per_team',
+                'quests', 'quest_submissions', 'judges', 'judges_per_submission', 'scored_fraction',
+                'page_fraction',
+            )},
+        )
+        self.stdout.write(f'Generating scale data (seed {config.seed})...')
+        started = timezone.now()
+        try:
+            counts = generate(config, progress=lambda message: self.stdout.write(f'  {message}'))
+        except ScaleFixtureError as e:
+            raise CommandError(str(e))
+
+        for label, count in counts.items():
+            self.stdout.write(self.style.SUCCESS(f'✓ Generated {count} {label}'))
+        elapsed = (timezone.now() - started).total_seconds()
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✅ Scale data generation complete in {elapsed:.0f}s! '
+            'Run update_index to make the new pages searchable.'
+        ))
+
     def clear_data(self):
         """Clear all hackathon-related data."""
+        # Team and submission pages written by --scale
+        delete_pages()
         Submission.objects.all().delete()
         TeamMember.objects.all().delete()
         Team.objects.all().delete()
@@ -0,0 +1,43 @@
+"""
+Management command to highlight the code blocks of live submission pages.
+
+Code blocks are highlighted when a SubmissionPage is published. Run this to
+backfill pages published before highlighting existed, or to finish large
+snippets whose background highlighting was lost (e.g. a worker restarted).
+Everything runs in the foreground, and pages that had anything highlighted
+get their pre-rendered content refreshed.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons import highlighting, submission_content
+from synnovator.hackathons.models import SubmissionPage
+
+
+class Command(BaseCommand):
+    help = 'Highlight code blocks of live submission pages that are not cached yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page',
+            type=int,
+            action='append',
+            help='Only process the submission page with this ID (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        pages = SubmissionPage.objects.live()
+        if options['page']:
+            pages = pages.filter(pk__in=options['page'])
+
+        snippets = refreshed = 0
+        for page in pages.iterator():
+            highlighted = highlighting.highlight_page(page, background=False)
+            if highlighted:
+                submission_content.prerender(page)
+                snippets += highlighted
+                refreshed += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Highlighted {snippets} code blocks on {refreshed} pages.'
+        ))
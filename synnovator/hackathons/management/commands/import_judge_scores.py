@@ -0,0 +1,52 @@
+"""
+Management command to bulk import judge scores from a CSV or JSON file.
+
+Rows are upserted on (submission, judge) in one transaction and each affected
+team's leaderboard entry is recomputed once at the end.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from synnovator.hackathons.score_import import (
+    ScoreImportError, import_judge_scores, parse_score_file
+)
+
+
+class Command(BaseCommand):
+    help = 'Bulk import judge scores from a CSV or JSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to a .csv or .json score file')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'json'],
+            help='File format (defaults to the file extension)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the file without writing any scores',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        try:
+            with open(path, encoding='utf-8-sig') as f:
+                rows = parse_score_file(f, options['format'], name=path)
+        except OSError as e:
+            raise CommandError(f'Cannot read {path}: {e}')
+        except ScoreImportError as e:
+            raise CommandError(str(e))
+
+        result = import_judge_scores(rows, dry_run=options['dry_run'])
+
+        if not result.ok:
+            for number, message in result.errors:
+                self.stderr.write(f'  Row {number}: {message}')
+            raise CommandError(f'{len(result.errors)} invalid rows; nothing was imported.')
+
+        prefix = '[DRY RUN] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{result.created} scores created, {result.updated} updated, '
+            f'{len(result.team_ids)} teams recomputed.'
+        ))
@@ -6,12 +6,12 @@ Quest submissions remain in the old Submission model as they serve a different p
 """
 
 from django.core.management.base import BaseCommand
-from django.utils.text import slugify
 
 from synnovator.hackathons.models import (
     Submission, SubmissionPage, SubmissionIndexPage, Team, TeamMember
 )
 from synnovator.community.models import TeamProfilePage
+from synnovator.utils.slugs import allocate_slugs
 
 
 class Command(BaseCommand):
@@ -73,24 +73,13 @@ class Command(BaseCommand):
         skipped = 0
         errors = 0
 
-        for submission in hackathon_submissions:
-            team_profile = team_profile_map.get(submission.team_id)
+        # Generate titles, then allocate all slugs up front with one prefix scan
+        hackathon_submissions = list(hackathon_submissions)
+        titles = [self.get_project_title(submission) for submission in hackathon_submissions]
+        slugs = allocate_slugs(SubmissionPage.objects.all(), titles, max_length=50)
 
-            # Generate a title for the SubmissionPage
-            project_title = f"{submission.team.name} - {submission.hackathon.title}"
-            if submission.description:
-                # Use first line of description if available
-                first_line = submission.description.split('\n')[0].strip()
-                if first_line and len(first_line) < 200:
-                    project_title = first_line
-
-            # Generate slug
-            base_slug = slugify(project_title)[:50]
-            slug = base_slug
-            counter = 1
-            while SubmissionPage.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
+        for submission, project_title, slug in zip(hackathon_submissions, titles, slugs):
+            team_profile = team_profile_map.get(submission.team_id)
 
             # Map verification status
             status_map = {
@@ -199,3 +188,13 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('\n[DRY RUN] No changes were made.'))
         else:
             self.stdout.write(self.style.SUCCESS('\nMigration completed!'))
+
+    def get_project_title(self, submission):
+        """Title for the SubmissionPage: first description line, else team and hackathon"""
+        project_title = f"{submission.team.name} - {submission.hackathon.title}"
+        if submission.description:
+            # Use first line of description if available
+            first_line = submission.description.split('\n')[0].strip()
+            if first_line and len(first_line) < 200:
+                project_title = first_line
+        return project_title
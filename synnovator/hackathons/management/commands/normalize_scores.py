@@ -0,0 +1,44 @@
+"""
+Management command to compute judge-normalized scores and rankings.
+
+Run once judging is complete (or whenever scores change) to refresh
+LeaderboardEntry.normalized_score and normalized_rank.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.models import HackathonPage
+from synnovator.hackathons.scoring import NORMALIZATION_METHODS, normalize_hackathon_scores
+
+
+class Command(BaseCommand):
+    help = 'Normalize judge scores per judge and store weighted rankings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hackathon',
+            type=int,
+            help='Only normalize the hackathon with this page ID',
+        )
+        parser.add_argument(
+            '--method',
+            choices=NORMALIZATION_METHODS,
+            default='zscore',
+            help='Per-judge normalization method (default: zscore)',
+        )
+
+    def handle(self, *args, **options):
+        hackathons = HackathonPage.objects.all()
+        if options['hackathon']:
+            hackathons = hackathons.filter(pk=options['hackathon'])
+            if not hackathons.exists():
+                self.stderr.write(self.style.ERROR(
+                    f'Hackathon {options["hackathon"]} not found.'
+                ))
+                return
+
+        for hackathon in hackathons:
+            result = normalize_hackathon_scores(hackathon, method=options['method'])
+            self.stdout.write(f'{hackathon.title}: {len(result)} teams ranked')
+
+        self.stdout.write(self.style.SUCCESS('Scores normalized.'))
@@ -0,0 +1,19 @@
+"""
+Management command to remove abandoned chunked uploads.
+
+Clients that never finish an upload leave its chunks in storage. Run this
+periodically (e.g. daily from cron) to delete uploads idle for longer than
+uploads.UPLOAD_EXPIRY, together with their stored chunks.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.uploads import purge_stale_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete unfinished submission uploads and their stored chunks'
+
+    def handle(self, *args, **options):
+        purged = purge_stale_uploads()
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} stale uploads.'))
@@ -0,0 +1,38 @@
+"""
+Management command to rebuild the materialized leaderboard from JudgeScore.
+
+Use after data repairs, raw SQL imports, or anything else that bypassed
+JudgeScore.save() and left LeaderboardEntry out of step.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons import leaderboard
+from synnovator.hackathons.models import HackathonPage
+
+
+class Command(BaseCommand):
+    help = 'Rebuild leaderboard entries and team scores from judge scores'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hackathon',
+            type=int,
+            help='Only rebuild the hackathon with this page ID',
+        )
+
+    def handle(self, *args, **options):
+        hackathons = HackathonPage.objects.all()
+        if options['hackathon']:
+            hackathons = hackathons.filter(pk=options['hackathon'])
+            if not hackathons.exists():
+                self.stderr.write(self.style.ERROR(
+                    f'Hackathon {options["hackathon"]} not found.'
+                ))
+                return
+
+        for hackathon in hackathons:
+            entries = leaderboard.rebuild_leaderboard(hackathon)
+            self.stdout.write(f'{hackathon.title}: {len(entries)} teams ranked')
+
+        self.stdout.write(self.style.SUCCESS('Leaderboard rebuilt.'))
@@ -0,0 +1,22 @@
+"""
+Management command to rebuild the normalized tag index.
+
+The index is kept in sync on save; run this after bulk updates that bypass
+save(), such as QuerySet.update() or raw SQL imports.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.models import HackathonPage, Quest
+from synnovator.hackathons.tags import rebuild_tag_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the hackathon and quest tag index from their JSON tags'
+
+    def handle(self, *args, **options):
+        for model in (HackathonPage, Quest):
+            count = rebuild_tag_index(model)
+            self.stdout.write(f'{model._meta.verbose_name_plural}: {count} tags indexed')
+
+        self.stdout.write(self.style.SUCCESS('Tag index rebuilt.'))
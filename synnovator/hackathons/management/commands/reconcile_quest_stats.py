@@ -0,0 +1,37 @@
+"""
+Management command to reconcile denormalized quest statistics.
+
+QuestStats is maintained incrementally as submissions change. Run this after
+bulk edits that bypass Submission.save() (e.g. QuerySet.update()) or to
+backfill quests that predate the counters.
+"""
+
+from django.core.management.base import BaseCommand
+
+from synnovator.hackathons.models import Quest
+from synnovator.hackathons.quest_stats import reconcile_quest_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute quest completion statistics from submissions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--quest',
+            type=int,
+            action='append',
+            help='Only reconcile the quest with this ID (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        quest_ids = options['quest']
+        if quest_ids:
+            missing = set(quest_ids) - set(Quest.objects.filter(pk__in=quest_ids).values_list('pk', flat=True))
+            if missing:
+                self.stderr.write(self.style.ERROR(
+                    f'Quest {", ".join(map(str, sorted(missing)))} not found.'
+                ))
+                return
+
+        fixed = reconcile_quest_stats(quest_ids=quest_ids)
+        self.stdout.write(self.style.SUCCESS(f'Quest statistics reconciled ({fixed} corrected).'))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0011_submission_architecture_redesign'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score_count', models.PositiveIntegerField(default=0, help_text='Number of judge scores included in the sums', verbose_name='Score Count')),
+                ('technical_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Technical Sum')),
+                ('commercial_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Commercial Sum')),
+                ('operational_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Operational Sum')),
+                ('overall_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Overall Sum')),
+                ('technical_score', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='Technical Score')),
+                ('commercial_score', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='Commercial Score')),
+                ('operational_score', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='Operational Score')),
+                ('final_score', models.DecimalField(decimal_places=2, default=0, max_digits=6, verbose_name='Final Score')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('hackathon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='hackathons.hackathonpage', verbose_name='Hackathon')),
+                ('team', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entry', to='hackathons.team', verbose_name='Team')),
+            ],
+            options={
+                'verbose_name': 'Leaderboard Entry',
+                'verbose_name_plural': 'Leaderboard Entries',
+                'ordering': ['-final_score', 'team_id'],
+                'indexes': [models.Index(fields=['hackathon', '-final_score'], name='hackathons__hackath_f4df1b_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0012_add_leaderboard_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leaderboardentry',
+            name='normalized_rank',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Normalized Rank'),
+        ),
+        migrations.AddField(
+            model_name='leaderboardentry',
+            name='normalized_score',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Weighted score after per-judge normalization', max_digits=6, null=True, verbose_name='Normalized Score'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_tag_index(apps, schema_editor):
+    """Index the existing JSON tags of hackathons and quests"""
+    for model_name, entry_name, fk in (
+        ('HackathonPage', 'HackathonTag', 'hackathon_id'),
+        ('Quest', 'QuestTag', 'quest_id'),
+    ):
+        model = apps.get_model('hackathons', model_name)
+        entry_model = apps.get_model('hackathons', entry_name)
+        entries = []
+        for pk, tags in model.objects.values_list('pk', 'tags'):
+            tags = tags if isinstance(tags, list) else []
+            names = {str(tag).strip().lower()[:100] for tag in tags if str(tag).strip()}
+            entries += [entry_model(**{fk: pk, 'name': name}) for name in names]
+        entry_model.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0013_add_leaderboard_normalized_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HackathonTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Normalized (stripped, lower-case) tag', max_length=100, verbose_name='Tag')),
+                ('hackathon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_entries', to='hackathons.hackathonpage', verbose_name='Hackathon')),
+            ],
+            options={
+                'verbose_name': 'Hackathon Tag',
+                'verbose_name_plural': 'Hackathon Tags',
+                'indexes': [models.Index(fields=['name', 'hackathon'], name='hackathons__name_433b63_idx')],
+                'constraints': [models.UniqueConstraint(fields=('hackathon', 'name'), name='unique_hackathon_tag')],
+            },
+        ),
+        migrations.CreateModel(
+            name='QuestTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Normalized (stripped, lower-case) tag', max_length=100, verbose_name='Tag')),
+                ('quest', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_entries', to='hackathons.quest', verbose_name='Quest')),
+            ],
+            options={
+                'verbose_name': 'Quest Tag',
+                'verbose_name_plural': 'Quest Tags',
+                'indexes': [models.Index(fields=['name', 'quest'], name='hackathons__name_4bc5a0_idx')],
+                'constraints': [models.UniqueConstraint(fields=('quest', 'name'), name='unique_quest_tag')],
+            },
+        ),
+        migrations.RunPython(populate_tag_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:38
+
+import django.db.models.deletion
+from decimal import Decimal
+from statistics import median
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_quest_stats(apps, schema_editor):
+    """Count existing quest submissions"""
+    Quest = apps.get_model('hackathons', 'Quest')
+    QuestStats = apps.get_model('hackathons', 'QuestStats')
+    Submission = apps.get_model('hackathons', 'Submission')
+
+    scores = {}
+    for quest_id, score in Submission.objects.filter(
+        quest__isnull=False, verification_status='verified', score__isnull=False
+    ).values_list('quest_id', 'score'):
+        scores.setdefault(quest_id, []).append(score)
+
+    QuestStats.objects.bulk_create([
+        QuestStats(
+            quest_id=quest_id,
+            attempt_count=attempts,
+            verified_count=verified,
+            unique_user_count=users,
+            median_score=Decimal(median(scores[quest_id])).quantize(Decimal('0.01')) if quest_id in scores else None,
+        )
+        for quest_id, attempts, verified, users in Quest.objects.annotate(
+            attempts=Count('submissions'),
+            verified=Count('submissions', filter=Q(submissions__verification_status='verified')),
+            users=Count('submissions__user', distinct=True),
+        ).values_list('pk', 'attempts', 'verified', 'users')
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0014_add_tag_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempt_count', models.PositiveIntegerField(default=0, help_text='Number of submissions', verbose_name='Attempts')),
+                ('verified_count', models.PositiveIntegerField(default=0, help_text='Number of verified submissions', verbose_name='Verified')),
+                ('unique_user_count', models.PositiveIntegerField(default=0, help_text='Number of distinct users who submitted', verbose_name='Unique Users')),
+                ('median_score', models.DecimalField(blank=True, decimal_places=2, help_text='Median score of verified submissions', max_digits=6, null=True, verbose_name='Median Score')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('quest', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='hackathons.quest', verbose_name='Quest')),
+            ],
+            options={
+                'verbose_name': 'Quest Statistics',
+                'verbose_name_plural': 'Quest Statistics',
+                'indexes': [models.Index(fields=['-verified_count'], name='hackathons__verifie_ee2c14_idx')],
+            },
+        ),
+        migrations.RunPython(populate_quest_stats, migrations.RunPython.noop),
+    ]
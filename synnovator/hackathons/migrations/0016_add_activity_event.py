@@ -0,0 +1,116 @@
+# Generated by Django 5.2.10 on 2026-10-17 09:02
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_activity_events(apps, schema_editor):
+    """Replay existing submissions, memberships, registrations and decisions"""
+    ActivityEvent = apps.get_model('hackathons', 'ActivityEvent')
+    AdvancementLog = apps.get_model('hackathons', 'AdvancementLog')
+    HackathonRegistration = apps.get_model('hackathons', 'HackathonRegistration')
+    Submission = apps.get_model('hackathons', 'Submission')
+    TeamMember = apps.get_model('hackathons', 'TeamMember')
+    TeamRegistration = apps.get_model('hackathons', 'TeamRegistration')
+
+    leaders = {}
+    for member in TeamMember.objects.filter(is_leader=True).order_by('-joined_at'):
+        leaders[member.team_id] = member.user_id
+
+    events = []
+    for submission in Submission.objects.select_related('quest', 'hackathon').iterator():
+        if submission.quest_id:
+            target = submission.quest.title
+        elif submission.hackathon_id:
+            target = submission.hackathon.title
+        else:
+            target = 'Unknown'
+        common = dict(
+            actor_id=submission.user_id or leaders.get(submission.team_id),
+            team_id=submission.team_id,
+            hackathon_id=submission.hackathon_id,
+            target=target,
+        )
+        events.append(ActivityEvent(verb='submitted', created_at=submission.submitted_at, **common))
+        if submission.verification_status == 'verified':
+            events.append(ActivityEvent(
+                verb='verified', created_at=submission.verified_at or submission.submitted_at, **common
+            ))
+
+    for member in TeamMember.objects.select_related('team').iterator():
+        events.append(ActivityEvent(
+            verb='joined',
+            actor_id=member.user_id,
+            team_id=member.team_id,
+            hackathon_id=member.team.hackathon_id,
+            target=member.team.name,
+            detail=member.get_role_display(),
+            created_at=member.joined_at,
+        ))
+
+    for registration in HackathonRegistration.objects.select_related('hackathon').iterator():
+        events.append(ActivityEvent(
+            verb='registered',
+            actor_id=registration.user_id,
+            hackathon_id=registration.hackathon_id,
+            target=registration.hackathon.title,
+            created_at=registration.registered_at,
+        ))
+
+    for registration in TeamRegistration.objects.select_related('hackathon', 'team_profile').iterator():
+        events.append(ActivityEvent(
+            verb='registered',
+            hackathon_id=registration.hackathon_id,
+            target=registration.hackathon.title,
+            detail=registration.team_profile.title,
+            created_at=registration.registered_at,
+        ))
+
+    for log in AdvancementLog.objects.select_related('team', 'from_phase', 'to_phase').iterator():
+        if log.decision == 'advanced':
+            target = log.to_phase.title if log.to_phase_id else 'the next round'
+        else:
+            target = log.from_phase.title if log.from_phase_id else ''
+        events.append(ActivityEvent(
+            verb=log.decision,
+            team_id=log.team_id,
+            hackathon_id=log.team.hackathon_id,
+            target=target,
+            detail=log.notes[:255],
+            created_at=log.decided_at,
+        ))
+
+    ActivityEvent.objects.bulk_create(events, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0015_add_quest_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('submitted', 'Submitted'), ('verified', 'Verified'), ('joined', 'Joined Team'), ('registered', 'Registered'), ('advanced', 'Advanced'), ('eliminated', 'Eliminated')], max_length=20, verbose_name='Verb')),
+                ('target', models.CharField(blank=True, help_text='Title of the quest, hackathon or phase at the time of the event', max_length=255, verbose_name='Target')),
+                ('detail', models.CharField(blank=True, help_text='Extra context, e.g. the member role or elimination reason', max_length=255, verbose_name='Detail')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Created At')),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='activity_events', to=settings.AUTH_USER_MODEL, verbose_name='Actor')),
+                ('hackathon', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='activity_events', to='hackathons.hackathonpage', verbose_name='Hackathon')),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='activity_events', to='hackathons.team', verbose_name='Team')),
+            ],
+            options={
+                'verbose_name': 'Activity Event',
+                'verbose_name_plural': 'Activity Events',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['team', '-created_at', '-id'], name='hackathons__team_id_88bcd8_idx'), models.Index(fields=['actor', '-created_at', '-id'], name='hackathons__actor_i_d31190_idx'), models.Index(fields=['hackathon', '-created_at', '-id'], name='hackathons__hackath_7f0102_idx')],
+            },
+        ),
+        migrations.RunPython(populate_activity_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.10 on 2026-10-17 09:38
+
+import django.db.models.deletion
+import synnovator.hackathons.models.upload
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0016_add_activity_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(max_length=255, upload_to=synnovator.hackathons.models.upload.blob_upload_to, verbose_name='File')),
+                ('size', models.PositiveBigIntegerField(verbose_name='Size')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'File Blob',
+                'verbose_name_plural': 'File Blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='submission_file',
+            field=models.FileField(blank=True, help_text='Upload submission file (code, document, etc.)', max_length=255, null=True, upload_to='submissions/%Y/%m/'),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='file_blob',
+            field=models.ForeignKey(blank=True, help_text='Content-addressed file behind submission_file, when uploaded in chunks', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submissions', to='hackathons.fileblob'),
+        ),
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=100, verbose_name='File Name')),
+                ('size', models.PositiveBigIntegerField(help_text='Total size announced by the client, in bytes', verbose_name='Size')),
+                ('expected_sha256', models.CharField(blank=True, help_text='Digest announced by the client, checked on completion', max_length=64, verbose_name='Expected SHA-256')),
+                ('received_bytes', models.PositiveBigIntegerField(default=0, verbose_name='Received Bytes')),
+                ('parts', models.JSONField(blank=True, default=list, verbose_name='Parts')),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('complete', 'Complete'), ('failed', 'Failed')], default='uploading', max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('hackathon', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to='hackathons.hackathonpage', verbose_name='Hackathon')),
+                ('quest', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to='hackathons.quest', verbose_name='Quest')),
+                ('submission', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploads', to='hackathons.submission', verbose_name='Submission')),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to='hackathons.team', verbose_name='Team')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunked_uploads', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('blob', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploads', to='hackathons.fileblob', verbose_name='Blob')),
+            ],
+            options={
+                'verbose_name': 'Chunked Upload',
+                'verbose_name_plural': 'Chunked Uploads',
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='hackathons__status_2d3bdc_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.10 on 2026-10-17 09:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0017_add_chunked_uploads'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionSignature',
+            fields=[
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='hackathons.submission', verbose_name='Submission')),
+                ('signature', models.BinaryField(verbose_name='Signature')),
+                ('shingle_count', models.PositiveIntegerField(default=0, verbose_name='Shingle Count')),
+                ('created_at', models.DateTimeField(auto_now=True, verbose_name='Created At')),
+            ],
+            options={
+                'verbose_name': 'Submission Signature',
+                'verbose_name_plural': 'Submission Signatures',
+            },
+        ),
+        migrations.CreateModel(
+            name='SignatureBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(verbose_name='Band')),
+                ('bucket', models.BigIntegerField(verbose_name='Bucket')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signature_buckets', to='hackathons.submission', verbose_name='Submission')),
+            ],
+            options={
+                'verbose_name': 'Signature Bucket',
+                'verbose_name_plural': 'Signature Buckets',
+                'indexes': [models.Index(fields=['band', 'bucket'], name='hackathons__band_954a85_idx')],
+                'constraints': [models.UniqueConstraint(fields=('submission', 'band'), name='unique_signature_bucket_band')],
+            },
+        ),
+    ]
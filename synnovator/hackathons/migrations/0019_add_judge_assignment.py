@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-17 09:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0018_add_submission_signatures'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JudgeAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('hackathon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='judge_assignments', to='hackathons.hackathonpage', verbose_name='Hackathon')),
+                ('judge', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='judge_assignments', to=settings.AUTH_USER_MODEL, verbose_name='Judge')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='judge_assignments', to='hackathons.submission', verbose_name='Submission')),
+            ],
+            options={
+                'verbose_name': 'Judge Assignment',
+                'verbose_name_plural': 'Judge Assignments',
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['hackathon', 'judge'], name='hackathons__hackath_9fbdb6_idx')],
+                'constraints': [models.UniqueConstraint(fields=('submission', 'judge'), name='unique_judge_assignment')],
+            },
+        ),
+    ]
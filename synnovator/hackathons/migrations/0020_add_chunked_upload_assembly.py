@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-17 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0019_add_judge_assignment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chunkedupload',
+            name='deduplicated',
+            field=models.BooleanField(default=False, help_text="The file's content was already stored", verbose_name='Deduplicated'),
+        ),
+        migrations.AddField(
+            model_name='chunkedupload',
+            name='error',
+            field=models.CharField(blank=True, help_text='Why assembling the file failed', max_length=255, verbose_name='Error'),
+        ),
+        migrations.AddField(
+            model_name='chunkedupload',
+            name='submission_details',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Submission Details'),
+        ),
+        migrations.AlterField(
+            model_name='chunkedupload',
+            name='status',
+            field=models.CharField(choices=[('uploading', 'Uploading'), ('assembling', 'Assembling'), ('complete', 'Complete'), ('failed', 'Failed')], default='uploading', max_length=20, verbose_name='Status'),
+        ),
+    ]
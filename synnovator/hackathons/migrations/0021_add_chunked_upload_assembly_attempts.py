@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hackathons', '0020_add_chunked_upload_assembly'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chunkedupload',
+            name='assembly_attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Times assembling the file was started', verbose_name='Assembly Attempts'),
+        ),
+    ]
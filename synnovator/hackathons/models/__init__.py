@@ -1,28 +1,43 @@
+from .activity import ActivityEvent
 from .advancement import AdvancementLog
 from .hackathon import HackathonIndexPage, HackathonPage, Phase, Prize, QuestIndexPage, TeamRegistration
-from .quest import Quest
+from .leaderboard import LeaderboardEntry
+from .originality import SignatureBucket, SubmissionSignature
+from .quest import Quest, QuestStats
 from .registration import HackathonRegistration
 from .rules import CompetitionRule, RuleViolation
-from .scoring import JudgeScore, ScoreBreakdown
+from .scoring import JudgeAssignment, JudgeScore, ScoreBreakdown
 from .submission import Submission, SubmissionIndexPage, SubmissionPage, SUBMISSION_STATUS_CHOICES
+from .tags import HackathonTag, QuestTag
 from .team import Team, TeamMember
+from .upload import ChunkedUpload, FileBlob
 
 __all__ = [
+    'ActivityEvent',
     'AdvancementLog',
+    'ChunkedUpload',
     'CompetitionRule',
+    'FileBlob',
     'HackathonIndexPage',
     'HackathonPage',
     'HackathonRegistration',
+    'HackathonTag',
+    'JudgeAssignment',
     'JudgeScore',
+    'LeaderboardEntry',
     'Phase',
     'Prize',
     'Quest',
     'QuestIndexPage',
+    'QuestStats',
+    'QuestTag',
     'RuleViolation',
     'ScoreBreakdown',
+    'SignatureBucket',
     'Submission',
     'SubmissionIndexPage',
     'SubmissionPage',
+    'SubmissionSignature',
     'SUBMISSION_STATUS_CHOICES',
     'Team',
     'TeamMember',
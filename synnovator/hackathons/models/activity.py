@@ -0,0 +1,121 @@
+"""
+Append-only activity events behind the team, user and hackathon feeds.
+
+Events are written when something happens (see synnovator.hackathons.activity)
+and never updated, so a feed is one indexed range read in (created_at, id)
+order instead of merging submissions and memberships at request time.
+Titles are copied onto the event so rendering a feed needs no further joins.
+"""
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+ACTIVITY_VERBS = [
+    ('submitted', _('Submitted')),
+    ('verified', _('Verified')),
+    ('joined', _('Joined Team')),
+    ('registered', _('Registered')),
+    ('advanced', _('Advanced')),
+    ('eliminated', _('Eliminated')),
+]
+
+# How an event reads on its team's feed (subject: the actor) and on the actor's profile
+TEAM_ACTIONS = {
+    'submitted': 'submitted to {target}',
+    'verified': 'completed {target}',
+    'joined': 'joined the team as {detail}',
+    'registered': 'registered for {target}',
+    'advanced': 'advanced to {target}',
+    'eliminated': 'was eliminated from {target}',
+}
+USER_ACTIONS = {
+    'submitted': 'Submitted to {target}',
+    'verified': 'Completed {target}',
+    'joined': 'Joined team {team}',
+    'registered': 'Registered for {target}',
+    'advanced': 'Team {team} advanced to {target}',
+    'eliminated': 'Team {team} was eliminated from {target}',
+}
+
+
+class ActivityEvent(models.Model):
+    """One thing that happened, attributed to a user, team and/or hackathon."""
+
+    verb = models.CharField(
+        max_length=20,
+        choices=ACTIVITY_VERBS,
+        verbose_name=_("Verb")
+    )
+
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='activity_events',
+        verbose_name=_("Actor")
+    )
+
+    team = models.ForeignKey(
+        'hackathons.Team',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='activity_events',
+        verbose_name=_("Team")
+    )
+
+    hackathon = models.ForeignKey(
+        'hackathons.HackathonPage',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='activity_events',
+        verbose_name=_("Hackathon")
+    )
+
+    target = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_("Target"),
+        help_text=_("Title of the quest, hackathon or phase at the time of the event")
+    )
+
+    detail = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_("Detail"),
+        help_text=_("Extra context, e.g. the member role or elimination reason")
+    )
+
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Created At")
+    )
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        verbose_name = _("Activity Event")
+        verbose_name_plural = _("Activity Events")
+        indexes = [
+            models.Index(fields=['team', '-created_at', '-id']),
+            models.Index(fields=['actor', '-created_at', '-id']),
+            models.Index(fields=['hackathon', '-created_at', '-id']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_verb_display()}: {self.target} ({self.created_at:%Y-%m-%d})"
+
+    def _format(self, actions):
+        team_name = self.team.name if self.team_id else ''
+        return actions[self.verb].format(target=self.target, detail=self.detail, team=team_name)
+
+    @property
+    def team_action(self):
+        return self._format(TEAM_ACTIONS)
+
+    @property
+    def user_action(self):
+        return self._format(USER_ACTIONS)
@@ -10,6 +10,7 @@ from wagtail import blocks
 from modelcluster.fields import ParentalKey
 
 from synnovator.utils.models import BasePage
+from synnovator.utils.pagination import paginate_queryset
 
 
 class HackathonIndexPage(BasePage):
@@ -87,16 +88,8 @@ class HackathonIndexPage(BasePage):
         verbose_name_plural = "Hackathon Index Pages"
 
     def paginate_queryset(self, queryset, request):
-        """Paginate the queryset."""
-        page_number = request.GET.get("page", 1)
-        paginator = Paginator(queryset, settings.DEFAULT_PER_PAGE)
-        try:
-            page = paginator.page(page_number)
-        except PageNotAnInteger:
-            page = paginator.page(1)
-        except EmptyPage:
-            page = paginator.page(paginator.num_pages)
-        return (paginator, page, page.object_list, page.has_other_pages())
+        """Paginate the queryset by keyset, so deep pages cost as much as the first."""
+        return paginate_queryset(queryset, request)
 
     def get_filtered_hackathons(self):
         """
@@ -112,9 +105,9 @@ class HackathonIndexPage(BasePage):
         if self.filter_mode == 'in_progress':
             hackathons = hackathons.filter(status='in_progress')
         elif self.filter_mode == 'by_tag' and self.filter_tag:
-            # Filter by tag - use icontains for SQLite compatibility
-            # For PostgreSQL in production, consider using tags__contains=[self.filter_tag]
-            hackathons = hackathons.filter(tags__icontains=self.filter_tag)
+            # Exact tag match through the normalized tag index
+            from synnovator.hackathons.tags import filter_by_tags
+            hackathons = filter_by_tags(hackathons, [self.filter_tag])
 
         return hackathons
 
@@ -185,10 +178,31 @@ class QuestIndexPage(BasePage):
         FieldPanel('featured_quest'),
     ]
     
+    # Filter query values used by the quest list template -> Quest field values
+    DIFFICULTY_FILTER_MAP = {
+        'easy': 'beginner',
+        'medium': 'intermediate',
+        'hard': 'advanced',
+    }
+    TYPE_FILTER_MAP = {
+        'coding': 'technical',
+        'design': 'operational',
+        'research': 'commercial',
+        'testing': 'technical',
+        'documentation': 'operational',
+    }
+    
     class Meta:
         verbose_name = "Quest Index Page"
         verbose_name_plural = "Quest Index Pages"
     
+    @staticmethod
+    def _parse_xp(value):
+        try:
+            return int(value) if value else None
+        except ValueError:
+            return None
+    
     def paginate_queryset(self, queryset, request):
         """Paginate the queryset."""
         page_number = request.GET.get("page", 1)
@@ -208,65 +222,56 @@ class QuestIndexPage(BasePage):
         # Import here to avoid circular imports
         from .quest import Quest
         from .submission import Submission
+        from synnovator.hackathons import tags
+        from synnovator.hackathons.quest_catalog import get_catalog, tag_facets
+        from synnovator.hackathons.recommendations import recommend_quests
         
-        # Get all active quests
-        quests = Quest.objects.filter(is_active=True)
-        
-        # Parse and apply filters (same logic as quest_list view)
+        # Parse filters (same logic as quest_list view)
         difficulty_filters = request.GET.getlist('difficulty')
         type_filters = request.GET.getlist('type')
         tag_filters = request.GET.getlist('tags')
+        tag_match = request.GET.get('tag_match', 'all')
+        if tag_match not in tags.TAG_MATCH_MODES:
+            tag_match = 'all'
         xp_min = request.GET.get('xp_min')
         xp_max = request.GET.get('xp_max')
         
-        # Apply filters
-        if difficulty_filters:
-            difficulty_map = {
-                'easy': 'beginner',
-                'medium': 'intermediate',
-                'hard': 'advanced',
-            }
-            model_difficulties = [difficulty_map.get(d, d) for d in difficulty_filters]
-            quests = quests.filter(difficulty__in=model_difficulties)
-        
-        if type_filters:
-            type_map = {
-                'coding': 'technical',
-                'design': 'operational',
-                'research': 'commercial',
-                'testing': 'technical',
-                'documentation': 'operational',
-            }
-            model_types = [type_map.get(t, t) for t in type_filters]
-            quests = quests.filter(quest_type__in=model_types)
-        
-        if tag_filters:
-            for tag in tag_filters:
-                quests = quests.filter(tags__icontains=tag)
-        
-        if xp_min:
-            quests = quests.filter(xp_reward__gte=int(xp_min))
-        
-        if xp_max:
-            quests = quests.filter(xp_reward__lte=int(xp_max))
+        # Answer filters and facet counts from the in-memory quest catalog
+        result = get_catalog(self.locale_id).search(
+            difficulty=[self.DIFFICULTY_FILTER_MAP.get(d, d) for d in difficulty_filters],
+            quest_type=[self.TYPE_FILTER_MAP.get(t, t) for t in type_filters],
+            tags=tag_filters,
+            tag_match=tag_match,
+            xp_min=self._parse_xp(xp_min),
+            xp_max=self._parse_xp(xp_max),
+        )
+        counts = result.facet_counts
+        context['facet_counts'] = {
+            'difficulty': {key: counts['difficulty'].get(value, 0) for key, value in self.DIFFICULTY_FILTER_MAP.items()},
+            'type': {key: counts['quest_type'].get(value, 0) for key, value in self.TYPE_FILTER_MAP.items()},
+        }
+        context['tag_facets'] = tag_facets(counts['tags'])
+        quest_ids = result.ids
         
         # Separate featured quest from regular list
         if self.featured_quest and self.featured_quest.is_active:
             context['featured'] = self.featured_quest
-            quests = quests.exclude(id=self.featured_quest.id)
+            quest_ids = [pk for pk in quest_ids if pk != self.featured_quest.id]
         
-        # Paginate quests
-        paginator, page, _object_list, is_paginated = self.paginate_queryset(quests, request)
+        # Paginate quest ids, then load only the quests on this page
+        paginator, page, _object_list, is_paginated = self.paginate_queryset(quest_ids, request)
         context['paginator'] = paginator
         context['paginator_page'] = page
         context['is_paginated'] = is_paginated
+        quests_by_id = Quest.objects.select_related('stats').in_bulk(page.object_list)
         
         # Add computed fields to quests for template
         quests_with_data = []
-        for quest in page.object_list:
+        for quest in (quests_by_id[pk] for pk in page.object_list if pk in quests_by_id):
             quest.url = f'/hackathons/quests/{quest.slug}/'
             quest.estimated_hours = quest.estimated_time_minutes / 60 if quest.estimated_time_minutes else None
             quest.skills = quest.tags or []
+            quest.completion_rate = quest.get_completion_rate()
             quests_with_data.append(quest)
         context['quests'] = quests_with_data
         
@@ -275,6 +280,7 @@ class QuestIndexPage(BasePage):
             'difficulty': difficulty_filters,
             'type': type_filters,
             'tags': tag_filters,
+            'tag_match': tag_match,
             'xp_min': xp_min,
             'xp_max': xp_max,
         }
@@ -301,34 +307,8 @@ class QuestIndexPage(BasePage):
             user_stats['total_xp'] = total_xp or 0
         context['user_stats'] = user_stats
         
-        # Get recommended quests
-        recommended_quests = []
-        if request.user.is_authenticated:
-            user_skills = request.user.skills or []
-            if user_skills:
-                for skill in user_skills[:3]:
-                    matching = Quest.objects.filter(
-                        is_active=True,
-                        tags__icontains=skill
-                    ).exclude(
-                        submissions__user=request.user,
-                        submissions__verification_status='verified'
-                    )[:2]
-                    recommended_quests.extend(matching)
-            if not recommended_quests:
-                recommended_quests = list(Quest.objects.filter(
-                    is_active=True,
-                    difficulty='beginner'
-                ).exclude(
-                    submissions__user=request.user,
-                    submissions__verification_status='verified'
-                )[:5])
-        else:
-            recommended_quests = list(Quest.objects.filter(
-                is_active=True,
-                difficulty='beginner'
-            )[:5])
-        context['recommended_quests'] = recommended_quests[:5]
+        # Get recommended quests (precomputed skill/tag similarity, cached per user)
+        context['recommended_quests'] = recommend_quests(request.user, locale_id=self.locale_id)
         
         return context
 
@@ -493,14 +473,24 @@ class HackathonPage(Page):
         verbose_name = "Hackathon"
         verbose_name_plural = "Hackathons"
 
-    def get_current_phase(self):
+    # Per-instance memo for phase_timeline; cleared by the Phase signals
+    _phase_timeline = None
+
+    @property
+    def phase_timeline(self):
+        """Cached PhaseTimeline, memoized on the instance"""
+        if self._phase_timeline is None:
+            from synnovator.hackathons.timeline import get_phase_timeline
+            self._phase_timeline = get_phase_timeline(self)
+        return self._phase_timeline
+
+    def get_current_phase(self, at=None):
         """Get current active phase based on datetime"""
-        from django.utils import timezone
-        now = timezone.now()
-        return self.phases.filter(
-            start_date__lte=now,
-            end_date__gte=now
-        ).first()
+        return self.phase_timeline.phase_at(at)
+
+    def get_next_phase(self, at=None):
+        """Get the next phase to start after the given datetime"""
+        return self.phase_timeline.next_phase(at)
 
     def get_leaderboard(self, limit=10):
         """Get top teams ordered by score"""
@@ -553,32 +543,12 @@ class HackathonPage(Page):
 
         Returns:
             tuple: (allowed: bool, reason: str)
+
+        To check many teams or users at once, use
+        synnovator.hackathons.eligibility.SubmissionEligibility directly.
         """
-        # 1. Submission type check
-        if self.submission_type == 'individual' and team_profile:
-            return False, _("This hackathon only accepts individual submissions")
-        if self.submission_type == 'team' and not team_profile:
-            return False, _("This hackathon only accepts team submissions")
-
-        # 2. Registration check (if enabled)
-        if self.require_registration:
-            if not self.is_participant_registered(user, team_profile):
-                return False, _("You must register before submitting")
-
-        # 3. Submission count check (if configured > 0)
-        if self.max_submissions_per_participant > 0:
-            count = self.get_submission_count(user, team_profile)
-            if count >= self.max_submissions_per_participant:
-                return False, _("Maximum submissions reached")
-
-        # 4. Phase check (if enabled)
-        if self.restrict_to_submission_phase:
-            if not self.is_submission_open():
-                if self.allow_late_submission:
-                    return True, _("Late submission")
-                return False, _("Submissions are closed")
-
-        return True, ""
+        from synnovator.hackathons.eligibility import SubmissionEligibility
+        return SubmissionEligibility(self).check(user=user, team_profile=team_profile)
 
     def get_submission_count(self, user=None, team_profile=None):
         """Get submission count for user/team in this hackathon."""
@@ -607,17 +577,9 @@ class HackathonPage(Page):
             ).exists()
         return False
 
-    def is_submission_open(self):
+    def is_submission_open(self, at=None):
         """Check if currently in submission phase."""
-        current_phase = self.get_current_phase()
-        if not current_phase:
-            # If no phases defined, check status
-            return self.status == 'in_progress'
-        # Check if phase type indicates submission is allowed
-        # Common phase types that allow submission
-        submission_phase_keywords = ['submission', 'hacking', 'development', 'building']
-        phase_title_lower = current_phase.title.lower()
-        return any(keyword in phase_title_lower for keyword in submission_phase_keywords)
+        return self.phase_timeline.is_submission_open(self.status, at)
 
 
 class Phase(models.Model):
@@ -0,0 +1,168 @@
+"""
+Materialized hackathon leaderboard.
+Keeps running judge-score sums per team so rankings never aggregate JudgeScore.
+"""
+from decimal import Decimal
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+SCORE_DIMENSIONS = ('technical', 'commercial', 'operational', 'overall')
+
+TWO_PLACES = Decimal('0.01')
+
+
+class LeaderboardEntry(models.Model):
+    """
+    Running judge-score totals for one team.
+
+    Sums and counts cover every JudgeScore on the team's verified submissions.
+    Averages are derived from them on each write and mirrored onto Team, so a
+    score write touches a constant number of rows.
+    """
+
+    hackathon = models.ForeignKey(
+        'hackathons.HackathonPage',
+        on_delete=models.CASCADE,
+        related_name='leaderboard_entries',
+        verbose_name=_("Hackathon")
+    )
+
+    team = models.OneToOneField(
+        'hackathons.Team',
+        on_delete=models.CASCADE,
+        related_name='leaderboard_entry',
+        verbose_name=_("Team")
+    )
+
+    # Running totals
+    score_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Score Count"),
+        help_text=_("Number of judge scores included in the sums")
+    )
+
+    technical_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Technical Sum")
+    )
+
+    commercial_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Commercial Sum")
+    )
+
+    operational_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Operational Sum")
+    )
+
+    overall_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Overall Sum")
+    )
+
+    # Derived averages
+    technical_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Technical Score")
+    )
+
+    commercial_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Commercial Score")
+    )
+
+    operational_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Operational Score")
+    )
+
+    final_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Final Score")
+    )
+
+    # Judge-normalized result (see hackathons.scoring); None until computed
+    normalized_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name=_("Normalized Score"),
+        help_text=_("Weighted score after per-judge normalization")
+    )
+
+    normalized_rank = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("Normalized Rank")
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At")
+    )
+
+    class Meta:
+        ordering = ['-final_score', 'team_id']
+        verbose_name = _("Leaderboard Entry")
+        verbose_name_plural = _("Leaderboard Entries")
+        indexes = [
+            models.Index(fields=['hackathon', '-final_score']),
+        ]
+
+    def __str__(self):
+        return f"{self.team.name}: {self.final_score}"
+
+    def apply_delta(self, deltas, count_delta):
+        """Add per-dimension deltas to the running sums and refresh the averages"""
+        self.score_count += count_delta
+        for dimension in SCORE_DIMENSIONS:
+            field = f'{dimension}_sum'
+            setattr(self, field, getattr(self, field) + deltas.get(dimension, 0))
+        self.recalculate()
+
+    def recalculate(self):
+        """Derive average scores from the running sums"""
+        if self.score_count <= 0:
+            self.score_count = 0
+            for dimension in SCORE_DIMENSIONS:
+                setattr(self, f'{dimension}_sum', Decimal('0'))
+            self.technical_score = self.commercial_score = self.operational_score = Decimal('0')
+            self.final_score = Decimal('0')
+            return
+
+        count = Decimal(self.score_count)
+        self.technical_score = (Decimal(self.technical_sum) / count).quantize(TWO_PLACES)
+        self.commercial_score = (Decimal(self.commercial_sum) / count).quantize(TWO_PLACES)
+        self.operational_score = (Decimal(self.operational_sum) / count).quantize(TWO_PLACES)
+        self.final_score = (
+            (self.technical_score + self.commercial_score + self.operational_score) / 3
+        ).quantize(TWO_PLACES)
+
+    def team_score_fields(self):
+        """Values to mirror onto the Team row"""
+        return {
+            'technical_score': self.technical_score,
+            'commercial_score': self.commercial_score,
+            'operational_score': self.operational_score,
+            'final_score': self.final_score,
+        }
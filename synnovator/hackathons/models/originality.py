@@ -0,0 +1,75 @@
+"""
+MinHash signatures and LSH buckets behind submission originality checks.
+
+Each checked Submission keeps its MinHash signature and one bucket row per
+LSH band (see synnovator.hackathons.originality). Finding the candidates for
+a new submission is an indexed lookup of its band hashes rather than a
+comparison with every earlier submission.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SubmissionSignature(models.Model):
+    """MinHash signature of a submission's text, as packed uint32 values."""
+
+    submission = models.OneToOneField(
+        'hackathons.Submission',
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name='signature',
+        verbose_name=_("Submission")
+    )
+
+    signature = models.BinaryField(
+        verbose_name=_("Signature")
+    )
+
+    shingle_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Shingle Count")
+    )
+
+    created_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Created At")
+    )
+
+    class Meta:
+        verbose_name = _("Submission Signature")
+        verbose_name_plural = _("Submission Signatures")
+
+    def __str__(self):
+        return f"Signature of submission {self.submission_id}"
+
+
+class SignatureBucket(models.Model):
+    """One LSH band of a signature, hashed; equal buckets make candidate pairs."""
+
+    submission = models.ForeignKey(
+        'hackathons.Submission',
+        on_delete=models.CASCADE,
+        related_name='signature_buckets',
+        verbose_name=_("Submission")
+    )
+
+    band = models.PositiveSmallIntegerField(
+        verbose_name=_("Band")
+    )
+
+    bucket = models.BigIntegerField(
+        verbose_name=_("Bucket")
+    )
+
+    class Meta:
+        verbose_name = _("Signature Bucket")
+        verbose_name_plural = _("Signature Buckets")
+        constraints = [
+            models.UniqueConstraint(fields=['submission', 'band'], name='unique_signature_bucket_band'),
+        ]
+        indexes = [
+            models.Index(fields=['band', 'bucket']),
+        ]
+
+    def __str__(self):
+        return f"Band {self.band} of submission {self.submission_id}"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils.translation import gettext_lazy as _
 from wagtail.fields import RichTextField
 from wagtail.snippets.models import register_snippet
 from wagtail.admin.panels import FieldPanel
@@ -98,10 +99,77 @@ class Quest(TranslatableMixin, models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_difficulty_display()})"
 
+    @property
+    def completion_stats(self):
+        """Denormalized submission counters (zeros until the first submission)"""
+        try:
+            return self.stats
+        except QuestStats.DoesNotExist:
+            return QuestStats(quest=self)
+
     def get_completion_rate(self):
         """Calculate percentage of users who completed this quest"""
-        total_attempts = self.submissions.count()
-        if total_attempts == 0:
+        return self.completion_stats.completion_rate
+
+
+class QuestStats(models.Model):
+    """
+    Submission counters for one quest.
+
+    Maintained by synnovator.hackathons.quest_stats as submissions are created,
+    change status or are deleted, so quest pages and lists never count
+    submissions. Order quests with e.g. `order_by('-stats__verified_count')`.
+    """
+
+    quest = models.OneToOneField(
+        Quest,
+        on_delete=models.CASCADE,
+        related_name='stats',
+        verbose_name=_("Quest")
+    )
+
+    attempt_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Attempts"),
+        help_text=_("Number of submissions")
+    )
+
+    verified_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Verified"),
+        help_text=_("Number of verified submissions")
+    )
+
+    unique_user_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Unique Users"),
+        help_text=_("Number of distinct users who submitted")
+    )
+
+    median_score = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name=_("Median Score"),
+        help_text=_("Median score of verified submissions")
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Quest Statistics")
+        verbose_name_plural = _("Quest Statistics")
+        indexes = [
+            models.Index(fields=['-verified_count']),
+        ]
+
+    def __str__(self):
+        return f"{self.quest}: {self.verified_count}/{self.attempt_count}"
+
+    @property
+    def completion_rate(self):
+        """Percentage of submissions that were verified"""
+        if not self.attempt_count:
             return 0
-        completed = self.submissions.filter(verification_status='verified').count()
-        return (completed / total_attempts) * 100
+        return (self.verified_count / self.attempt_count) * 100
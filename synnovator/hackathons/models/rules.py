@@ -9,6 +9,13 @@ from wagtail.snippets.models import register_snippet
 from modelcluster.fields import ParentalKey
 
 
+# Rule types check_compliance() can decide without a reviewer
+AUTOMATED_RULE_TYPES = ('team_size', 'team_composition', 'submission_format')
+
+# Submissions that satisfy a submission_format rule
+VALID_SUBMISSION_STATUSES = ('verified', 'pending')
+
+
 class CompetitionRule(models.Model):
     """
     Defines rules and constraints for hackathon competitions.
@@ -101,11 +108,30 @@ class CompetitionRule(models.Model):
         """
         Check if a team complies with this rule.
         Returns (is_compliant: bool, message: str)
+
+        For sweeping every team of a hackathon use
+        synnovator.hackathons.compliance, which loads the same facts with one
+        query per rule type instead of one per team.
+        """
+        if self.rule_type == 'team_size':
+            return self.evaluate(member_count=team.members.count())
+        elif self.rule_type == 'team_composition':
+            return self.evaluate(roles=set(team.membership.values_list('role', flat=True)))
+        elif self.rule_type == 'submission_format':
+            # Check if team has submitted required files
+            return self.evaluate(has_submission=team.submissions.filter(
+                verification_status__in=VALID_SUBMISSION_STATUSES
+            ).exists())
+        return self.evaluate()
+
+    def evaluate(self, member_count=0, roles=(), has_submission=False):
+        """
+        Apply this rule to pre-loaded team facts.
+        Returns (is_compliant: bool, message: str)
         """
         if self.rule_type == 'team_size':
             min_size = self.rule_definition.get('min_members', 0)
             max_size = self.rule_definition.get('max_members', 999)
-            member_count = team.members.count()
 
             if member_count < min_size:
                 return False, f"Team has {member_count} members, minimum is {min_size}"
@@ -115,19 +141,12 @@ class CompetitionRule(models.Model):
 
         elif self.rule_type == 'team_composition':
             required_roles = self.rule_definition.get('required_roles', [])
-            current_roles = set(team.membership.values_list('role', flat=True))
-
-            missing_roles = set(required_roles) - current_roles
+            missing_roles = [role for role in required_roles if role not in roles]
             if missing_roles:
                 return False, f"Missing required roles: {', '.join(missing_roles)}"
             return True, "Team composition compliant"
 
         elif self.rule_type == 'submission_format':
-            # Check if team has submitted required files
-            has_submission = team.submissions.filter(
-                verification_status__in=['verified', 'pending']
-            ).exists()
-
             if not has_submission:
                 return False, "No valid submission found"
             return True, "Submission format compliant"
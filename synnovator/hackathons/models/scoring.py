@@ -116,15 +116,76 @@ class JudgeScore(models.Model):
 
     def save(self, *args, **kwargs):
         """Calculate overall score if not set"""
+        from synnovator.hackathons import leaderboard
+
         if self.overall_score == 0.0:
             self.overall_score = (
                 self.technical_score + self.commercial_score + self.operational_score
             ) / 3
+
+        previous = None
+        if self.pk:
+            previous = JudgeScore.objects.filter(pk=self.pk).values(
+                'submission_id', *leaderboard.SCORE_VALUE_FIELDS
+            ).first()
         super().save(*args, **kwargs)
 
-        # Update team's aggregated scores
-        if self.submission.team:
-            self.submission.team.update_scores()
+        # Fold the change into the team's leaderboard entry (O(1) per write)
+        leaderboard.record_judge_score(self, previous)
+
+
+@register_snippet
+class JudgeAssignment(models.Model):
+    """
+    A submission a judge is asked to score.
+    Produced by synnovator.hackathons.judge_assignment; done once the judge's JudgeScore exists.
+    """
+
+    hackathon = models.ForeignKey(
+        'hackathons.HackathonPage',
+        on_delete=models.CASCADE,
+        related_name='judge_assignments',
+        verbose_name=_("Hackathon")
+    )
+
+    submission = models.ForeignKey(
+        'hackathons.Submission',
+        on_delete=models.CASCADE,
+        related_name='judge_assignments',
+        verbose_name=_("Submission")
+    )
+
+    judge = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='judge_assignments',
+        verbose_name=_("Judge")
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At")
+    )
+
+    panels = [
+        FieldPanel('hackathon'),
+        FieldPanel('submission'),
+        FieldPanel('judge'),
+    ]
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        verbose_name = _("Judge Assignment")
+        verbose_name_plural = _("Judge Assignments")
+        constraints = [
+            models.UniqueConstraint(fields=['submission', 'judge'], name='unique_judge_assignment'),
+        ]
+        indexes = [
+            models.Index(fields=['hackathon', 'judge']),
+        ]
+
+    def __str__(self):
+        return f"Submission {self.submission_id} assigned to {self.judge_id}"
 
 
 class ScoreBreakdown(models.Model):
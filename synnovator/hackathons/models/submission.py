@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
@@ -12,6 +12,7 @@ from wagtail.documents.blocks import DocumentChooserBlock
 from modelcluster.fields import ParentalKey
 
 from synnovator.utils.models import BasePage
+from synnovator.utils.pagination import paginate_queryset
 
 
 # Status choices for SubmissionPage - defined at module level for reuse
@@ -77,11 +78,21 @@ class Submission(models.Model):
     # Submission content
     submission_file = models.FileField(
         upload_to='submissions/%Y/%m/',
+        max_length=255,
         blank=True,
         null=True,
         help_text="Upload submission file (code, document, etc.)"
     )
 
+    file_blob = models.ForeignKey(
+        'hackathons.FileBlob',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='submissions',
+        help_text="Content-addressed file behind submission_file, when uploaded in chunks"
+    )
+
     submission_url = models.URLField(
         max_length=500,
         blank=True,
@@ -209,6 +220,32 @@ class Submission(models.Model):
         if not self.submission_file and not self.submission_url:
             raise ValidationError("Submission must include a file OR a URL.")
 
+    def save(self, *args, **kwargs):
+        """Keep the leaderboard, quest statistics and activity feed in step with status changes"""
+        from synnovator.hackathons import activity, quest_stats
+
+        previous_status = previous_score = previous_quest_id = previous_user_id = None
+        if self.pk:
+            previous_status, previous_score, previous_quest_id, previous_user_id = (
+                Submission.objects.filter(pk=self.pk).values_list(
+                    'verification_status', 'score', 'quest_id', 'user_id'
+                ).first() or (None, None, None, None)
+            )
+        created = previous_status is None
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            quest_stats.record_submission_saved(
+                self, created, previous_status, previous_score, previous_quest_id, previous_user_id
+            )
+            activity.record_submission_saved(self, created, previous_status)
+
+        if previous_status is not None and previous_status != self.verification_status:
+            from synnovator.hackathons import leaderboard
+            leaderboard.record_submission_status_change(
+                self, was_verified=previous_status == 'verified'
+            )
+
 
 # =============================================================================
 # SubmissionPage - Wagtail Page for Hackathon Project Submissions
@@ -460,6 +497,16 @@ class SubmissionPage(BasePage):
             return self.submitter.get_full_name() or self.submitter.username
         return _("Unknown")
 
+    def get_context(self, request, *args, **kwargs):
+        from synnovator.hackathons import submission_content
+
+        context = super().get_context(request, *args, **kwargs)
+        # Block HTML is cached per live revision instead of rendered per view
+        context['content_html'] = submission_content.get_content_html(
+            self, preview=getattr(request, 'is_preview', False)
+        )
+        return context
+
 
 # =============================================================================
 # SubmissionIndexPage - Listing page for submissions with configurable filters
@@ -548,87 +595,66 @@ class SubmissionIndexPage(BasePage):
         verbose_name_plural = _("Submission Indexes")
 
     def get_context(self, request):
-        context = super().get_context(request)
+        from synnovator.hackathons import submission_facets
 
-        # Start with all live, public submissions
-        submissions = SubmissionPage.objects.live().public().order_by('-first_published_at')
+        context = super().get_context(request)
 
-        available_filters = {}
         applied_filters = {}
+        enabled = set()
 
         # Hackathon filter
         if self.enable_hackathon_filter:
-            from .hackathon import HackathonPage
-            available_filters['hackathons'] = HackathonPage.objects.live()
+            enabled.add('hackathon')
             hackathon_id = request.GET.get('hackathon')
             # Only apply default if no explicit filter param in URL
             if 'hackathon' not in request.GET and self.default_hackathon:
                 hackathon_id = str(self.default_hackathon.id)
-            if hackathon_id:
-                submissions = submissions.filter(hackathons__id=hackathon_id)
+            if hackathon_id and hackathon_id.isdigit():
                 applied_filters['hackathon'] = hackathon_id
 
         # Date range filter
         if self.enable_date_filter:
-            available_filters['date_filter'] = True
-            date_from = request.GET.get('from')
-            date_to = request.GET.get('to')
-            if date_from:
-                submissions = submissions.filter(first_published_at__gte=date_from)
-                applied_filters['from'] = date_from
-            if date_to:
-                submissions = submissions.filter(first_published_at__lte=date_to)
-                applied_filters['to'] = date_to
-
-        # Submitter filter
-        if self.enable_submitter_filter:
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
-            available_filters['submitters'] = User.objects.filter(
-                submission_pages__isnull=False
-            ).distinct()
-            submitter_id = request.GET.get('submitter')
-            if submitter_id:
-                submissions = submissions.filter(submitter_id=submitter_id)
-                applied_filters['submitter'] = submitter_id
-
-        # Team filter
-        if self.enable_team_filter:
-            from synnovator.community.models import TeamProfilePage
-            available_filters['teams'] = TeamProfilePage.objects.live().filter(
-                submissions__isnull=False
-            ).distinct()
-            team_id = request.GET.get('team')
-            if team_id:
-                submissions = submissions.filter(team_profile_id=team_id)
-                applied_filters['team'] = team_id
+            for param in ('from', 'to'):
+                if request.GET.get(param):
+                    applied_filters[param] = request.GET[param]
+
+        # Submitter and team filters
+        for param, is_enabled in (('submitter', self.enable_submitter_filter), ('team', self.enable_team_filter)):
+            if is_enabled:
+                enabled.add(param)
+                value = request.GET.get(param)
+                if value and value.isdigit():
+                    applied_filters[param] = value
 
         # Status filter
         if self.enable_status_filter:
-            available_filters['statuses'] = SUBMISSION_STATUS_CHOICES
+            enabled.add('status')
             status = request.GET.get('status')
             # Only apply default if no explicit filter param in URL
             if 'status' not in request.GET and self.default_status:
                 status = self.default_status
             if status:
-                submissions = submissions.filter(verification_status=status)
                 applied_filters['status'] = status
 
-        # Pagination
-        from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-        page_number = request.GET.get('page', 1)
-        paginator = Paginator(submissions, settings.DEFAULT_PER_PAGE)
-        try:
-            page = paginator.page(page_number)
-        except PageNotAnInteger:
-            page = paginator.page(1)
-        except EmptyPage:
-            page = paginator.page(paginator.num_pages)
+        # Facet values with counts come from the cache; submitters and teams
+        # beyond the most frequent ones are found through the typeahead
+        available_filters = submission_facets.get_facets(applied_filters, enabled)
+        if self.enable_date_filter:
+            available_filters['date_filter'] = True
+
+        submissions = submission_facets.apply_filters(
+            submission_facets.live_submissions(), applied_filters
+        ).order_by('-first_published_at')
+
+        # Keyset pagination: no COUNT(*) or OFFSET scan over the filtered submissions
+        paginator, page, _object_list, is_paginated = paginate_queryset(
+            submissions, request, ordering=('-first_published_at', '-pk')
+        )
 
         context['submissions'] = page.object_list
         context['paginator'] = paginator
         context['paginator_page'] = page
-        context['is_paginated'] = page.has_other_pages()
+        context['is_paginated'] = is_paginated
         context['available_filters'] = available_filters
         context['applied_filters'] = applied_filters
 
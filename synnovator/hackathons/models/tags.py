@@ -0,0 +1,63 @@
+"""
+Normalized tag index for HackathonPage and Quest.
+
+Editors keep working with the JSON `tags` field; these tables mirror it with
+one indexed row per (object, tag) so tag filters are exact-match lookups
+instead of substring scans over JSON. See synnovator.hackathons.tags.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class TagIndexEntry(models.Model):
+    """One normalized tag of one object."""
+
+    name = models.CharField(
+        max_length=100,
+        verbose_name=_("Tag"),
+        help_text=_("Normalized (stripped, lower-case) tag")
+    )
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return self.name
+
+
+class HackathonTag(TagIndexEntry):
+    hackathon = models.ForeignKey(
+        'hackathons.HackathonPage',
+        on_delete=models.CASCADE,
+        related_name='tag_entries',
+        verbose_name=_("Hackathon")
+    )
+
+    class Meta:
+        verbose_name = _("Hackathon Tag")
+        verbose_name_plural = _("Hackathon Tags")
+        constraints = [
+            models.UniqueConstraint(fields=['hackathon', 'name'], name='unique_hackathon_tag'),
+        ]
+        indexes = [
+            models.Index(fields=['name', 'hackathon']),
+        ]
+
+
+class QuestTag(TagIndexEntry):
+    quest = models.ForeignKey(
+        'hackathons.Quest',
+        on_delete=models.CASCADE,
+        related_name='tag_entries',
+        verbose_name=_("Quest")
+    )
+
+    class Meta:
+        verbose_name = _("Quest Tag")
+        verbose_name_plural = _("Quest Tags")
+        constraints = [
+            models.UniqueConstraint(fields=['quest', 'name'], name='unique_quest_tag'),
+        ]
+        indexes = [
+            models.Index(fields=['name', 'quest']),
+        ]
@@ -122,33 +122,13 @@ class Team(models.Model):
         )
 
     def update_scores(self):
-        """Update aggregated scores from judge scores"""
-        from django.db.models import Avg
-
-        # Get all submissions for this team
-        submissions = self.submissions.filter(verification_status='verified')
-
-        # Calculate average scores across all judge scores for all submissions
-        for submission in submissions:
-            judge_scores = submission.judge_scores.all()
-            if judge_scores.exists():
-                avg_scores = judge_scores.aggregate(
-                    tech=Avg('technical_score'),
-                    comm=Avg('commercial_score'),
-                    oper=Avg('operational_score')
-                )
-
-                # Update team scores (average across all submissions)
-                self.technical_score = avg_scores['tech'] or 0.0
-                self.commercial_score = avg_scores['comm'] or 0.0
-                self.operational_score = avg_scores['oper'] or 0.0
-                self.final_score = (
-                    self.technical_score +
-                    self.commercial_score +
-                    self.operational_score
-                ) / 3
-
-        self.save()
+        """Recompute aggregated scores from judge scores (repair path)"""
+        from synnovator.hackathons import leaderboard
+
+        leaderboard.rebuild_team_entries([self.pk])
+        self.refresh_from_db(fields=[
+            'technical_score', 'commercial_score', 'operational_score', 'final_score'
+        ])
 
 
 class TeamMember(models.Model):
@@ -0,0 +1,207 @@
+"""
+Resumable chunked uploads of submission files.
+
+A ChunkedUpload tracks one file arriving in pieces (see
+synnovator.hackathons.uploads); each chunk is stored in the default storage
+as it arrives. When the last byte is in, the chunks are assembled in the
+background into a FileBlob named after the SHA-256 of its content, so
+identical files are stored once however many submissions point at them.
+"""
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+UPLOAD_STATUSES = [
+    ('uploading', _('Uploading')),
+    ('assembling', _('Assembling')),
+    ('complete', _('Complete')),
+    ('failed', _('Failed')),
+]
+
+
+def blob_upload_to(instance, filename):
+    return f'submissions/sha256/{instance.sha256[:2]}/{instance.sha256}/{filename}'
+
+
+class FileBlob(models.Model):
+    """A stored file, unique by content."""
+
+    sha256 = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name=_("SHA-256")
+    )
+
+    file = models.FileField(
+        upload_to=blob_upload_to,
+        max_length=255,
+        verbose_name=_("File")
+    )
+
+    size = models.PositiveBigIntegerField(
+        verbose_name=_("Size")
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At")
+    )
+
+    class Meta:
+        verbose_name = _("File Blob")
+        verbose_name_plural = _("File Blobs")
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes)"
+
+
+class ChunkedUpload(models.Model):
+    """A file upload in progress, and what it will be submitted to."""
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='chunked_uploads',
+        verbose_name=_("User")
+    )
+
+    filename = models.CharField(
+        max_length=100,
+        verbose_name=_("File Name")
+    )
+
+    size = models.PositiveBigIntegerField(
+        verbose_name=_("Size"),
+        help_text=_("Total size announced by the client, in bytes")
+    )
+
+    expected_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name=_("Expected SHA-256"),
+        help_text=_("Digest announced by the client, checked on completion")
+    )
+
+    received_bytes = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name=_("Received Bytes")
+    )
+
+    # [[offset, storage name, size], ...] in offset order
+    parts = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Parts")
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=UPLOAD_STATUSES,
+        default='uploading',
+        verbose_name=_("Status")
+    )
+
+    # Submission target, validated when the upload starts
+    quest = models.ForeignKey(
+        'hackathons.Quest',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='chunked_uploads',
+        verbose_name=_("Quest")
+    )
+
+    hackathon = models.ForeignKey(
+        'hackathons.HackathonPage',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='chunked_uploads',
+        verbose_name=_("Hackathon")
+    )
+
+    team = models.ForeignKey(
+        'hackathons.Team',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='chunked_uploads',
+        verbose_name=_("Team")
+    )
+
+    # description, submission_url and copyright_declaration given on completion
+    submission_details = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Submission Details")
+    )
+
+    error = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_("Error"),
+        help_text=_("Why assembling the file failed")
+    )
+
+    assembly_attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("Assembly Attempts"),
+        help_text=_("Times assembling the file was started")
+    )
+
+    deduplicated = models.BooleanField(
+        default=False,
+        verbose_name=_("Deduplicated"),
+        help_text=_("The file's content was already stored")
+    )
+
+    blob = models.ForeignKey(
+        FileBlob,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='uploads',
+        verbose_name=_("Blob")
+    )
+
+    submission = models.ForeignKey(
+        'hackathons.Submission',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='uploads',
+        verbose_name=_("Submission")
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At")
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At")
+    )
+
+    class Meta:
+        verbose_name = _("Chunked Upload")
+        verbose_name_plural = _("Chunked Uploads")
+        indexes = [
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} ({self.received_bytes}/{self.size})"
+
+    @property
+    def is_complete(self):
+        return self.received_bytes == self.size
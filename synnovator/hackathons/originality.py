@@ -0,0 +1,269 @@
+"""
+Near-duplicate detection for submission originality checks.
+
+A submission's text (its description plus the text of its uploaded file,
+including the source files inside a zip archive) is split into overlapping
+word 5-grams. The set of shingles is summarized by a 128-value MinHash
+signature, computed with numpy in batches of shingles. The fraction of
+positions where two signatures agree estimates the Jaccard similarity of
+their shingle sets.
+
+Signatures are split into 32 bands of 4 rows and each band is hashed into a
+SignatureBucket row. Two submissions sharing any bucket are candidates,
+which a pair with Jaccard similarity s becomes with probability
+1 - (1 - s^4)^32: about 0.99 at s = 0.7 and under 0.1 at s = 0.2. Checking a
+new submission is therefore one indexed bucket lookup plus a comparison with
+its few candidates, not with every submission on record. The index grows
+incrementally: each check stores the new signature and its buckets.
+
+Submissions are compared with earlier ones (lower id) by other submitters, and
+the best matches are written to originality_check_result. Texts with fewer
+than MIN_SHINGLES shingles are indexed but neither compared nor matched:
+"See attached file" from two people is identical, not copied. New submissions are
+checked by a background worker thread once they commit (see signals);
+the check_originality command processes anything left unchecked or rebuilds
+the index.
+"""
+import hashlib
+import logging
+import os
+import queue
+import re
+import threading
+import zipfile
+
+import numpy as np
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from synnovator.hackathons.models import SignatureBucket, Submission, SubmissionSignature
+
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+SHINGLE_SIZE = 5
+
+# Fewer shingles than this (about 24 words) always passes
+MIN_SHINGLES = 20
+
+WARNING_SIMILARITY = 0.5
+FAIL_SIMILARITY = 0.8
+MAX_MATCHES = 10
+
+# Text read from an uploaded file (or all members of an archive)
+MAX_TEXT_BYTES = 2 * 1024 * 1024
+TEXT_EXTENSIONS = {
+    '.txt', '.md', '.rst', '.csv', '.json', '.yaml', '.yml', '.toml', '.html', '.css', '.sql',
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.go', '.rs', '.java', '.kt', '.c', '.h', '.cpp', '.hpp',
+    '.cs', '.rb', '.php', '.swift', '.sh', '.ipynb',
+}
+
+_BATCH = 4096
+_MERSENNE = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed seed: signatures must stay comparable across processes and deploys
+_rng = np.random.default_rng(20240101)
+_A = _rng.integers(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+_TOKEN = re.compile(r'\w+')
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set of lowercased word `size`-grams; a shorter text is one shingle"""
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= size:
+        return {' '.join(tokens)} if tokens else set()
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash(shingle_set):
+    """MinHash signature (NUM_PERM uint32 values) of a non-empty shingle set"""
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), 'little') for s in shingle_set),
+        dtype=np.uint64,
+        count=len(shingle_set),
+    )
+    signature = np.full(NUM_PERM, _MAX_HASH, dtype=np.uint64)
+    for start in range(0, len(hashes), _BATCH):
+        batch = hashes[start:start + _BATCH, None]
+        # Universal hashing (a * x + b) mod p, wrapping in uint64 like a C implementation would
+        permuted = np.bitwise_and((batch * _A + _B) % _MERSENNE, _MAX_HASH)
+        np.minimum(signature, permuted.min(axis=0), out=signature)
+    return signature.astype(np.uint32)
+
+
+def band_buckets(signature):
+    """[(band, bucket)] for a signature; bucket is a signed 64-bit hash of the band's rows"""
+    return [
+        (band, int.from_bytes(
+            hashlib.blake2b(signature[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).digest(),
+            'little', signed=True,
+        ))
+        for band in range(BANDS)
+    ]
+
+
+def similarity(signature, others):
+    """Estimated Jaccard similarity of `signature` with each row of `others`"""
+    return (others == signature).mean(axis=1)
+
+
+def _file_text(field):
+    """Text of an uploaded file, or of the text files inside a zip archive, up to MAX_TEXT_BYTES"""
+    extension = os.path.splitext(field.name)[1].lower()
+    try:
+        with field.open('rb') as f:
+            if extension == '.zip':
+                parts, remaining = [], MAX_TEXT_BYTES
+                with zipfile.ZipFile(f) as archive:
+                    for info in archive.infolist():
+                        if remaining <= 0:
+                            break
+                        if info.is_dir() or os.path.splitext(info.filename)[1].lower() not in TEXT_EXTENSIONS:
+                            continue
+                        with archive.open(info) as member:
+                            data = member.read(remaining)
+                        remaining -= len(data)
+                        parts.append(data.decode('utf-8', errors='ignore'))
+                return '\n'.join(parts)
+            if extension in TEXT_EXTENSIONS:
+                return f.read(MAX_TEXT_BYTES).decode('utf-8', errors='ignore')
+    except (OSError, zipfile.BadZipFile):
+        logger.warning('Could not read %s for originality checking', field.name)
+    return ''
+
+
+def submission_text(submission):
+    parts = [submission.description]
+    if submission.submission_file:
+        parts.append(_file_text(submission.submission_file))
+    return '\n'.join(part for part in parts if part)
+
+
+def _candidates(submission, buckets):
+    """Earlier submissions by other submitters sharing at least one bucket"""
+    matching = Q()
+    for band, bucket in buckets:
+        matching |= Q(band=band, bucket=bucket)
+    candidates = SignatureBucket.objects.filter(matching, submission_id__lt=submission.pk)
+    if submission.user_id:
+        candidates = candidates.exclude(submission__user_id=submission.user_id)
+    if submission.team_id:
+        candidates = candidates.exclude(submission__team_id=submission.team_id)
+    return set(candidates.values_list('submission_id', flat=True))
+
+
+def _status(score):
+    if score >= FAIL_SIMILARITY:
+        return 'fail'
+    if score >= WARNING_SIMILARITY:
+        return 'warning'
+    return 'pass'
+
+
+def check_submission(submission):
+    """
+    Index the submission's signature and record how similar it is to earlier submissions.
+
+    Returns the stored originality_check_result.
+    """
+    shingle_set = shingles(submission_text(submission))
+    result = {
+        'method': 'minhash-lsh',
+        'shingles': len(shingle_set),
+        'similarity': 0.0,
+        'matches': [],
+        'checked_at': timezone.now().isoformat(),
+    }
+
+    with transaction.atomic():
+        SignatureBucket.objects.filter(submission=submission).delete()
+        if shingle_set:
+            signature = minhash(shingle_set)
+            buckets = band_buckets(signature)
+            SubmissionSignature.objects.update_or_create(
+                submission=submission,
+                defaults={'signature': signature.tobytes(), 'shingle_count': len(shingle_set)},
+            )
+            SignatureBucket.objects.bulk_create([
+                SignatureBucket(submission=submission, band=band, bucket=bucket) for band, bucket in buckets
+            ])
+
+            candidate_ids = _candidates(submission, buckets) if len(shingle_set) >= MIN_SHINGLES else ()
+            rows = list(SubmissionSignature.objects.filter(
+                submission_id__in=candidate_ids, shingle_count__gte=MIN_SHINGLES
+            ).values_list('submission_id', 'signature'))
+            if rows:
+                others = np.stack([np.frombuffer(bytes(raw), dtype=np.uint32) for _id, raw in rows])
+                scores = similarity(signature, others)
+                matches = sorted(
+                    ((float(score), submission_id) for (submission_id, _raw), score in zip(rows, scores)
+                     if score >= WARNING_SIMILARITY),
+                    reverse=True,
+                )[:MAX_MATCHES]
+                result['matches'] = [
+                    {'submission': submission_id, 'similarity': round(score, 3)} for score, submission_id in matches
+                ]
+                result['similarity'] = round(float(scores.max()), 3)
+        else:
+            SubmissionSignature.objects.filter(submission=submission).delete()
+
+        status = _status(result['similarity'])
+        # update(): the check is not a change to the submission's review state
+        Submission.objects.filter(pk=submission.pk).update(
+            originality_check_status=status, originality_check_result=result
+        )
+    submission.originality_check_status, submission.originality_check_result = status, result
+    return result
+
+
+def check_pending(submission_ids=None, recheck=False):
+    """Check unchecked submissions (or all with `recheck`) in id order; returns how many"""
+    submissions = Submission.objects.order_by('pk')
+    if submission_ids is not None:
+        submissions = submissions.filter(pk__in=submission_ids)
+    if not recheck:
+        submissions = submissions.filter(originality_check_status='not_checked')
+    checked = 0
+    for submission in submissions.iterator():
+        check_submission(submission)
+        checked += 1
+    return checked
+
+
+# Background worker ------------------------------------------------------------
+
+_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _work():
+    while True:
+        submission_id = _queue.get()
+        try:
+            submission = Submission.objects.filter(pk=submission_id).first()
+            if submission is not None:
+                check_submission(submission)
+        except Exception:
+            logger.exception('Originality check failed for submission %s', submission_id)
+        finally:
+            connections.close_all()
+            _queue.task_done()
+
+
+def enqueue(submission_id):
+    """Check a submission on this process's background worker thread, starting it if needed"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_work, name='originality-checks', daemon=True)
+            _worker.start()
+    _queue.put(submission_id)
@@ -0,0 +1,196 @@
+"""
+In-memory faceted index of the active quest catalog.
+
+The catalog of one locale is loaded with a single query into a QuestCatalog:
+quests in display order, with one bitset (a Python int, bit i = i-th quest)
+per difficulty, quest type and normalized tag, plus prefix/suffix bitsets over
+the XP rewards. Any filter combination is then a handful of AND/OR operations
+and every facet count a popcount, with no queries.
+
+Catalogs are memoized per worker process and shared through the cache, both
+keyed by a catalog version that is bumped whenever a Quest is saved or
+deleted (see signals), so a request costs one cache read while nothing has
+changed.
+"""
+import uuid
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+
+from synnovator.hackathons.tags import normalize_tags
+
+
+QUEST_CATALOG_CACHE_TIMEOUT = 60 * 60 * 24
+
+CATALOG_VERSION_KEY = 'hackathons:quest_catalog:version'
+
+FACETS = ('difficulty', 'quest_type', 'tags')
+
+# {locale_id: (version, QuestCatalog)} for this worker process
+_local_catalogs = {}
+
+
+def _iter_bits(bits):
+    """Positions of the set bits, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+@dataclass
+class CatalogResult:
+    ids: list
+    facet_counts: dict = field(default_factory=dict)
+
+    @property
+    def count(self):
+        return len(self.ids)
+
+
+class QuestCatalog:
+    """Bitset index over quests, in display order."""
+
+    def __init__(self, rows):
+        """`rows` are (pk, difficulty, quest_type, xp_reward, tags) in display order"""
+        self.ids = []
+        self.all_bits = 0
+        self.facets = {name: {} for name in FACETS}
+        xp_pairs = []
+
+        for position, (pk, difficulty, quest_type, xp_reward, tags) in enumerate(rows):
+            bit = 1 << position
+            self.ids.append(pk)
+            self.all_bits |= bit
+            for facet, values in (
+                ('difficulty', [difficulty]),
+                ('quest_type', [quest_type]),
+                ('tags', normalize_tags(tags)),
+            ):
+                index = self.facets[facet]
+                for value in values:
+                    index[value] = index.get(value, 0) | bit
+            xp_pairs.append((xp_reward, bit))
+
+        # _xp_le[i]: quests with the i+1 lowest rewards; _xp_ge[i]: all but the i lowest
+        xp_pairs.sort(key=lambda pair: pair[0])
+        self._xp_values = [xp for xp, _bit in xp_pairs]
+        self._xp_le = []
+        running = 0
+        for _xp, bit in xp_pairs:
+            running |= bit
+            self._xp_le.append(running)
+        self._xp_ge = [self.all_bits ^ (self._xp_le[i - 1] if i else 0) for i in range(len(xp_pairs))]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _xp_mask(self, xp_min=None, xp_max=None):
+        bits = self.all_bits
+        if xp_min is not None:
+            start = bisect_left(self._xp_values, xp_min)
+            bits &= self._xp_ge[start] if start < len(self._xp_ge) else 0
+        if xp_max is not None:
+            stop = bisect_right(self._xp_values, xp_max)
+            bits &= self._xp_le[stop - 1] if stop else 0
+        return bits
+
+    def _any_of(self, facet, values):
+        bits = 0
+        for value in values:
+            bits |= self.facets[facet].get(value, 0)
+        return bits
+
+    def _all_of(self, facet, values):
+        bits = self.all_bits
+        for value in values:
+            bits &= self.facets[facet].get(value, 0)
+        return bits
+
+    def search(self, difficulty=(), quest_type=(), tags=(), tag_match='all', xp_min=None, xp_max=None):
+        """
+        Quests matching every given filter, plus facet counts.
+
+        Values within difficulty and quest_type are OR-ed; tags are AND-ed
+        unless tag_match='any'. Difficulty and type counts are disjunctive
+        (computed with that facet's own filter left out), so they show what
+        ticking another box would add. Tag counts are disjunctive with
+        tag_match='any' and drill-down counts within the results otherwise.
+        """
+        tags = normalize_tags(tags)
+        masks = {
+            'difficulty': self._any_of('difficulty', difficulty) if difficulty else self.all_bits,
+            'quest_type': self._any_of('quest_type', quest_type) if quest_type else self.all_bits,
+            'tags': (
+                self._any_of('tags', tags) if tag_match == 'any' else self._all_of('tags', tags)
+            ) if tags else self.all_bits,
+            'xp': self._xp_mask(xp_min, xp_max),
+        }
+        result_bits = self.all_bits
+        for mask in masks.values():
+            result_bits &= mask
+
+        facet_counts = {}
+        for facet in FACETS:
+            if facet == 'tags' and tag_match != 'any':
+                base = result_bits
+            else:
+                base = self.all_bits
+                for name, mask in masks.items():
+                    if name != facet:
+                        base &= mask
+            facet_counts[facet] = {
+                value: (base & bits).bit_count()
+                for value, bits in self.facets[facet].items()
+            }
+
+        return CatalogResult(
+            ids=[self.ids[position] for position in _iter_bits(result_bits)],
+            facet_counts=facet_counts,
+        )
+
+
+def tag_facets(counts, limit=20):
+    """[{'name', 'count'}] for the non-zero tag counts, most used first"""
+    facets = [{'name': name, 'count': count} for name, count in counts.items() if count]
+    facets.sort(key=lambda facet: (-facet['count'], facet['name']))
+    return facets[:limit]
+
+
+def bump_catalog_version():
+    cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def build_catalog(locale_id=None):
+    """Load the active quests of a locale (or all locales) into a QuestCatalog"""
+    from synnovator.hackathons.models import Quest
+
+    quests = Quest.objects.filter(is_active=True)
+    if locale_id is not None:
+        quests = quests.filter(locale_id=locale_id)
+    return QuestCatalog(
+        quests.order_by('-created_at', '-pk').values_list(
+            'pk', 'difficulty', 'quest_type', 'xp_reward', 'tags'
+        )
+    )
+
+
+def get_catalog(locale_id=None):
+    """The current catalog for a locale: worker memo, then cache, then database"""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(CATALOG_VERSION_KEY, version, None)
+
+    local = _local_catalogs.get(locale_id)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    key = f'hackathons:quest_catalog:{locale_id}:{version}'
+    catalog = cache.get(key)
+    if catalog is None:
+        catalog = build_catalog(locale_id)
+        cache.set(key, catalog, QUEST_CATALOG_CACHE_TIMEOUT)
+    _local_catalogs[locale_id] = (version, catalog)
+    return catalog
@@ -0,0 +1,187 @@
+"""
+Denormalized quest completion statistics.
+
+QuestStats keeps per-quest attempt, verified and unique-user counters plus
+the median verified score. Submission.save() and the Submission post_delete
+signal report changes here; counters move by F() deltas in the same
+transaction as the submission write, and the median is recomputed from the
+quest's verified scores only when the verified set or a verified score
+changes. Submissions moved to another quest or user, and quests whose
+submitter's account is deleted (Submission.user is SET_NULL), are
+reconciled instead. reconcile_quest_stats() rebuilds everything from
+Submission and backs the reconcile_quest_stats command.
+"""
+from collections import defaultdict
+from decimal import Decimal
+from statistics import median
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+
+STATS_FIELDS = ('attempt_count', 'verified_count', 'unique_user_count', 'median_score')
+
+TWO_PLACES = Decimal('0.01')
+
+
+def _verified_scores(quest_ids=None):
+    """{quest_id: [score, ...]} of verified, scored submissions (default: all quests) in one query"""
+    from synnovator.hackathons.models import Submission
+
+    submissions = Submission.objects.filter(
+        quest__isnull=False,
+        verification_status='verified',
+        score__isnull=False,
+    )
+    if quest_ids is not None:
+        submissions = submissions.filter(quest_id__in=quest_ids)
+    scores = defaultdict(list)
+    for quest_id, score in submissions.values_list('quest_id', 'score'):
+        scores[quest_id].append(score)
+    return scores
+
+
+def _median(scores):
+    return Decimal(median(scores)).quantize(TWO_PLACES) if scores else None
+
+
+def _median_score(quest_id):
+    return _median(_verified_scores([quest_id])[quest_id])
+
+
+def _has_other_submission(submission):
+    from synnovator.hackathons.models import Submission
+
+    if not submission.user_id:
+        return True  # team submissions don't count towards unique users
+    return Submission.objects.filter(
+        quest_id=submission.quest_id, user_id=submission.user_id
+    ).exclude(pk=submission.pk).exists()
+
+
+def _apply(quest_id, update_median=False, create=True, **deltas):
+    """
+    Add `deltas` to the quest's counters.
+
+    A quest without a stats row is counted from scratch instead (when
+    `create` is set), which also covers quests that predate the counters.
+    """
+    from synnovator.hackathons.models import QuestStats
+
+    values = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if update_median:
+        values['median_score'] = _median_score(quest_id)
+    if not values:
+        return
+    updated = QuestStats.objects.filter(quest_id=quest_id).update(**values)
+    if not updated and create:
+        reconcile_quest_stats(quest_ids=[quest_id])
+
+
+def record_submission_saved(submission, created, previous_status=None, previous_score=None,
+                            previous_quest_id=None, previous_user_id=None):
+    """Account for a newly saved or updated quest submission"""
+    moved = not created and (
+        previous_quest_id != submission.quest_id or previous_user_id != submission.user_id
+    )
+    if moved:
+        # Both quests' counters change; rare enough to recount them
+        quest_ids = {previous_quest_id, submission.quest_id} - {None}
+        if quest_ids:
+            reconcile_quest_stats(quest_ids=quest_ids)
+        return
+    if not submission.quest_id:
+        return
+    is_verified = submission.verification_status == 'verified'
+
+    with transaction.atomic():
+        if created:
+            _apply(
+                submission.quest_id,
+                update_median=is_verified,
+                attempt_count=1,
+                verified_count=int(is_verified),
+                unique_user_count=0 if _has_other_submission(submission) else 1,
+            )
+            return
+
+        was_verified = previous_status == 'verified'
+        score_changed = previous_score != submission.score
+        if was_verified == is_verified and not (is_verified and score_changed):
+            return
+        _apply(
+            submission.quest_id,
+            update_median=True,
+            verified_count=int(is_verified) - int(was_verified),
+        )
+
+
+def record_submission_deleted(submission):
+    """Account for a deleted quest submission (runs for cascades too)"""
+    if not submission.quest_id:
+        return
+    was_verified = submission.verification_status == 'verified'
+    # Never create rows here: during a quest cascade the stats row may
+    # already be gone while the quest itself is about to be deleted.
+    _apply(
+        submission.quest_id,
+        update_median=was_verified,
+        create=False,
+        attempt_count=-1,
+        verified_count=-int(was_verified),
+        unique_user_count=0 if _has_other_submission(submission) else -1,
+    )
+
+
+def record_user_deleting(user):
+    """Note the quests a user being deleted submitted to; the submissions stay, without their user"""
+    from synnovator.hackathons.models import Submission
+
+    user._quest_stats_quest_ids = set(
+        Submission.objects.filter(user_id=user.pk, quest__isnull=False).values_list('quest_id', flat=True)
+    )
+
+
+def record_user_deleted(user):
+    """Recount the quests noted by record_user_deleting(), now their submissions have no user"""
+    quest_ids = getattr(user, '_quest_stats_quest_ids', None)
+    if quest_ids:
+        reconcile_quest_stats(quest_ids=quest_ids)
+
+
+def reconcile_quest_stats(quest_ids=None):
+    """
+    Recompute QuestStats from Submission for the given quests (default: all).
+
+    Returns the number of quests whose stored counters were wrong or missing.
+    """
+    from synnovator.hackathons.models import Quest, QuestStats
+
+    quests = Quest.objects.all()
+    stats_rows = QuestStats.objects.select_for_update()
+    if quest_ids is not None:
+        quests = quests.filter(pk__in=quest_ids)
+        stats_rows = stats_rows.filter(quest_id__in=quest_ids)
+    counts = quests.annotate(
+        attempts=Count('submissions'),
+        verified=Count('submissions', filter=Q(submissions__verification_status='verified')),
+        users=Count('submissions__user', distinct=True),
+    ).values_list('pk', 'attempts', 'verified', 'users')
+
+    with transaction.atomic():
+        existing = {stats.quest_id: stats for stats in stats_rows}
+        scores = _verified_scores(quest_ids)
+        to_create, to_update = [], []
+        for quest_id, attempts, verified, users in counts:
+            values = dict(zip(STATS_FIELDS, (attempts, verified, users, _median(scores[quest_id]))))
+            stats = existing.get(quest_id)
+            if stats is None:
+                to_create.append(QuestStats(quest_id=quest_id, **values))
+            elif any(getattr(stats, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(stats, field, value)
+                to_update.append(stats)
+
+        QuestStats.objects.bulk_create(to_create, batch_size=500)
+        QuestStats.objects.bulk_update(to_update, STATS_FIELDS, batch_size=500)
+    return len(to_create) + len(to_update)
@@ -0,0 +1,143 @@
+"""
+Personalized quest recommendations.
+
+Quests are scored by cosine similarity between the user's skills and the
+quest's tags, both as binary vectors over the catalog's tag vocabulary. The
+quest-tag matrix is derived once per quest catalog (see quest_catalog), so a
+recommendation is one matrix-vector product with numpy. Quests the user
+already completed are masked out with their per-user completed set.
+
+Top-N lists are cached per user. The key embeds the catalog version, a digest
+of the user's skills and a per-user version that is bumped when one of their
+quest submissions changes (see signals), so a skill edit, a new verification
+or a quest edit all lead to a fresh list.
+"""
+import hashlib
+import uuid
+import weakref
+
+import numpy as np
+from django.core.cache import cache
+
+from synnovator.hackathons.quest_catalog import CATALOG_VERSION_KEY, get_catalog
+from synnovator.hackathons.tags import normalize_tags
+
+
+RECOMMENDATION_CACHE_TIMEOUT = 60 * 60
+
+DEFAULT_LIMIT = 5
+
+# Offered when the user has no skills or none match a quest
+FALLBACK_DIFFICULTY = 'beginner'
+
+# {QuestCatalog: QuestVectors}, dropped along with the catalog
+_vectors_by_catalog = weakref.WeakKeyDictionary()
+
+
+def _unpack_bits(bits, size):
+    """Catalog bitset as a 0/1 uint8 array of length `size`"""
+    packed = np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder='little')[:size]
+
+
+class QuestVectors:
+    """L2-normalized quest x tag matrix over a catalog's tag vocabulary."""
+
+    def __init__(self, catalog):
+        self.ids = np.array(catalog.ids, dtype=np.int64)
+        self.tags = sorted(catalog.facets['tags'])
+        self.tag_index = {tag: column for column, tag in enumerate(self.tags)}
+
+        size = len(catalog.ids)
+        matrix = np.zeros((size, len(self.tags)), dtype=np.float32)
+        for tag, bits in catalog.facets['tags'].items():
+            matrix[:, self.tag_index[tag]] = _unpack_bits(bits, size)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+        self.fallback = _unpack_bits(catalog.facets['difficulty'].get(FALLBACK_DIFFICULTY, 0), size).astype(bool)
+
+    def skill_vector(self, skills):
+        vector = np.zeros(len(self.tags), dtype=np.float32)
+        for skill in normalize_tags(skills):
+            column = self.tag_index.get(skill)
+            if column is not None:
+                vector[column] = 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def rank(self, skills, exclude=(), limit=DEFAULT_LIMIT):
+        """
+        Quest ids by descending similarity to `skills`, skipping `exclude`.
+
+        Ties keep catalog (newest first) order. Falls back to beginner quests
+        when nothing matches.
+        """
+        available = ~np.isin(self.ids, np.fromiter(exclude, dtype=np.int64))
+        scores = self.matrix @ self.skill_vector(skills) if len(self.tags) else np.zeros(len(self.ids))
+        candidates = available & (scores > 0)
+        if not candidates.any():
+            positions = np.flatnonzero(available & self.fallback)[:limit]
+            return self.ids[positions].tolist()
+
+        positions = np.flatnonzero(candidates)
+        order = np.argsort(-scores[positions], kind='stable')[:limit]
+        return self.ids[positions[order]].tolist()
+
+
+def get_quest_vectors(catalog):
+    vectors = _vectors_by_catalog.get(catalog)
+    if vectors is None:
+        vectors = _vectors_by_catalog[catalog] = QuestVectors(catalog)
+    return vectors
+
+
+def _user_version_key(user_id):
+    return f'hackathons:quest_recs:user_version:{user_id}'
+
+
+def bump_user_recommendations(user_id):
+    """Drop a user's cached recommendations (e.g. after a quest verification)"""
+    cache.set(_user_version_key(user_id), uuid.uuid4().hex, None)
+
+
+def _completed_quest_ids(user):
+    from synnovator.hackathons.models import Submission
+
+    return set(
+        Submission.objects.filter(
+            user=user,
+            quest__isnull=False,
+            verification_status='verified',
+        ).values_list('quest_id', flat=True)
+    )
+
+
+def recommend_quest_ids(user, locale_id=None, limit=DEFAULT_LIMIT):
+    """Cached top-N recommended quest ids for `user` (anonymous users get beginner quests)"""
+    vectors = get_quest_vectors(get_catalog(locale_id))
+    if not user.is_authenticated:
+        return vectors.rank([], limit=limit)
+
+    skills = normalize_tags(user.skills)
+    versions = cache.get_many([CATALOG_VERSION_KEY, _user_version_key(user.pk)])
+    skills_digest = hashlib.sha1('\n'.join(sorted(skills)).encode()).hexdigest()[:16]
+    key = ':'.join([
+        'hackathons:quest_recs', str(user.pk), str(locale_id), str(limit),
+        str(versions.get(CATALOG_VERSION_KEY)), str(versions.get(_user_version_key(user.pk))),
+        skills_digest,
+    ])
+    quest_ids = cache.get(key)
+    if quest_ids is None:
+        quest_ids = vectors.rank(skills, exclude=_completed_quest_ids(user), limit=limit)
+        cache.set(key, quest_ids, RECOMMENDATION_CACHE_TIMEOUT)
+    return quest_ids
+
+
+def recommend_quests(user, locale_id=None, limit=DEFAULT_LIMIT):
+    """Recommended Quest objects, best first"""
+    from synnovator.hackathons.models import Quest
+
+    quest_ids = recommend_quest_ids(user, locale_id=locale_id, limit=limit)
+    quests = Quest.objects.in_bulk(quest_ids)
+    return [quests[pk] for pk in quest_ids if pk in quests]
@@ -0,0 +1,270 @@
+"""
+Streaming export of a hackathon's results.
+
+Organizers download a hackathon's teams, submissions, judge scores or scoring
+criteria as CSV, JSON Lines or Parquet. Rows are read with
+values_list().iterator(chunk_size=...), which uses a server-side cursor on
+PostgreSQL, and encoded one chunk at a time. Only the current chunk is held
+in memory however many rows the export has, so the admin view can hand the
+generator to a StreamingHttpResponse and the export_results command can
+write it to a file.
+
+Parquet needs the optional pyarrow package (the "parquet" extra). Each chunk
+becomes one row group, typed from the model fields so that an empty export
+still has a schema.
+"""
+import csv
+import io
+from dataclasses import dataclass
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+from synnovator.hackathons.models import JudgeScore, ScoreBreakdown, Submission, Team
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+PARQUET_UNAVAILABLE = 'Parquet export needs the pyarrow package (install the "parquet" extra).'
+
+
+class ExportError(ValueError):
+    """Raised for an unknown dataset or an unavailable format"""
+
+
+@dataclass(frozen=True)
+class Dataset:
+    model: type
+    # (column name, values_list lookup)
+    columns: tuple
+    hackathon_filter: object
+
+    def queryset(self, hackathon):
+        return (
+            self.model.objects.filter(self.hackathon_filter(hackathon))
+            .order_by('pk')
+            .values_list(*(lookup for _name, lookup in self.columns))
+        )
+
+
+DATASETS = {
+    'teams': Dataset(
+        model=Team,
+        columns=(
+            ('id', 'id'),
+            ('name', 'name'),
+            ('slug', 'slug'),
+            ('status', 'status'),
+            ('current_round', 'current_round'),
+            ('final_score', 'final_score'),
+            ('technical_score', 'technical_score'),
+            ('commercial_score', 'commercial_score'),
+            ('operational_score', 'operational_score'),
+            ('created_at', 'created_at'),
+        ),
+        hackathon_filter=lambda hackathon: Q(hackathon=hackathon),
+    ),
+    'submissions': Dataset(
+        model=Submission,
+        columns=(
+            ('id', 'id'),
+            ('team_id', 'team_id'),
+            ('team', 'team__name'),
+            ('user', 'user__username'),
+            ('quest_id', 'quest_id'),
+            ('attempt_number', 'attempt_number'),
+            ('verification_status', 'verification_status'),
+            ('score', 'score'),
+            ('originality_check_status', 'originality_check_status'),
+            ('submission_url', 'submission_url'),
+            ('submitted_at', 'submitted_at'),
+            ('verified_at', 'verified_at'),
+        ),
+        hackathon_filter=lambda hackathon: Q(hackathon=hackathon) | Q(team__hackathon=hackathon),
+    ),
+    'scores': Dataset(
+        model=JudgeScore,
+        columns=(
+            ('id', 'id'),
+            ('submission_id', 'submission_id'),
+            ('team_id', 'submission__team_id'),
+            ('team', 'submission__team__name'),
+            ('judge', 'judge__username'),
+            ('technical_score', 'technical_score'),
+            ('commercial_score', 'commercial_score'),
+            ('operational_score', 'operational_score'),
+            ('overall_score', 'overall_score'),
+            ('feedback', 'feedback'),
+            ('created_at', 'created_at'),
+            ('updated_at', 'updated_at'),
+        ),
+        hackathon_filter=lambda hackathon: (
+            Q(submission__hackathon=hackathon) | Q(submission__team__hackathon=hackathon)
+        ),
+    ),
+    'criteria': Dataset(
+        model=ScoreBreakdown,
+        columns=(
+            ('id', 'id'),
+            ('category', 'category'),
+            ('criterion_name', 'criterion_name'),
+            ('description', 'description'),
+            ('weight', 'weight'),
+            ('max_points', 'max_points'),
+            ('order', 'order'),
+        ),
+        hackathon_filter=lambda hackathon: Q(hackathon=hackathon),
+    ),
+}
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_formats():
+    return [name for name in FORMATS if name != 'parquet' or parquet_available()]
+
+
+def filename(hackathon, dataset, file_format):
+    return f'{hackathon.slug}-{dataset}.{FORMATS[file_format][1]}'
+
+
+def _chunks(queryset, chunk_size):
+    chunk = []
+    for row in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _stream_csv(dataset, queryset, chunk_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _lookup in dataset.columns])
+    yield buffer.getvalue().encode()
+    for chunk in _chunks(queryset, chunk_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in chunk)
+        yield buffer.getvalue().encode()
+
+
+def _stream_jsonl(dataset, queryset, chunk_size):
+    names = [name for name, _lookup in dataset.columns]
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for chunk in _chunks(queryset, chunk_size):
+        yield ''.join(encoder.encode(dict(zip(names, row))) + '\n' for row in chunk).encode()
+
+
+def _field(model, lookup):
+    """Model field behind a values_list lookup such as 'submission__team__name'"""
+    *relations, name = lookup.split('__')
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.get_field(name)
+    if field.is_relation:
+        field = field.target_field
+    return field
+
+
+def _arrow_type(pa, field):
+    if isinstance(field, models.BooleanField):
+        return pa.bool_()
+    if isinstance(field, (models.AutoField, models.BigAutoField, models.IntegerField)):
+        return pa.int64()
+    if isinstance(field, models.DecimalField):
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if isinstance(field, models.DateTimeField):
+        return pa.timestamp('us', tz='UTC')
+    if isinstance(field, models.DateField):
+        return pa.date32()
+    return pa.string()
+
+
+class _ParquetSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain()"""
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data, self._parts = b''.join(self._parts), []
+        return data
+
+
+def _stream_parquet(dataset, queryset, chunk_size):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (name, _arrow_type(pa, _field(dataset.model, lookup))) for name, lookup in dataset.columns
+    ])
+    sink = _ParquetSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in _chunks(queryset, chunk_size):
+            columns = list(zip(*chunk))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema
+            ))
+            yield sink.drain()
+    yield sink.drain()
+
+
+_WRITERS = {
+    'csv': _stream_csv,
+    'jsonl': _stream_jsonl,
+    'parquet': _stream_parquet,
+}
+
+
+def stream_export(hackathon, dataset, file_format='csv', chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Generator of encoded chunks of one of `hackathon`'s DATASETS.
+
+    Unknown datasets or formats, and Parquet without pyarrow, raise
+    ExportError before anything is yielded.
+    """
+    if dataset not in DATASETS:
+        raise ExportError(f'Unknown dataset: {dataset}')
+    if file_format not in _WRITERS:
+        raise ExportError(f'Unknown format: {file_format}')
+    if file_format == 'parquet' and not parquet_available():
+        raise ExportError(PARQUET_UNAVAILABLE)
+    spec = DATASETS[dataset]
+    return _WRITERS[file_format](spec, spec.queryset(hackathon), chunk_size)
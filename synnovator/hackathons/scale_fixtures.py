@@ -0,0 +1,518 @@
+"""
+Production-scale fixture generation for load testing.
+
+generate_hackathon_fixtures creates a few dozen rows with .create(), which is
+far too slow, and far too small, to show how queries behave on real data.
+generate() writes hundreds of thousands of users, teams, members,
+submissions, judge assignments and scores with bulk_create in batches, plus
+the TeamProfilePage / SubmissionPage trees behind them.
+
+- Everything comes from one random.Random(seed), so a seed always produces
+  the same rows. Usernames and hackathon slugs carry the seed, so several
+  seeds can share a database.
+- Teams are spread over hackathons with Zipf weights 1 / rank ** skew. A
+  skew of 0 splits them evenly; at 1 the first hackathon has the most teams.
+- Team sizes, submissions per team and judges per submission are drawn
+  uniformly from (low, high) ranges. Judges are assigned with the
+  judge_assignment balancer, and a fraction of assignments get a score.
+- Members for each hackathon are drawn without repeats from a seeded
+  permutation of the users, so nobody joins two teams in one hackathon.
+- Django's bulk_create refuses multi-table inheritance, so pages are written
+  in two inserts: the wagtailcore_page rows (with treebeard paths worked out
+  up front) and then the subclass rows.
+
+generate_hackathon_fixtures --clear removes the pages with delete_pages(),
+along with the rows it clears for the regular fixtures.
+
+Bulk inserts skip save() and signals. The leaderboard is rebuilt at the end,
+but search indexes, originality checks, quest stats and cached listings are
+not updated; run update_index and the reconcile commands if a test needs
+them.
+"""
+import itertools
+import math
+import random
+import uuid
+from array import array
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from wagtail.models import Locale, Page
+
+from synnovator.community.models import TeamIndexPage, TeamMembership, TeamProfilePage
+from synnovator.hackathons import judge_assignment, leaderboard
+from synnovator.hackathons.models import (
+    HackathonPage, JudgeAssignment, JudgeScore, Phase, Quest, Submission,
+    SubmissionIndexPage, SubmissionPage, Team, TeamMember,
+)
+from synnovator.home.models import HomePage
+
+
+DEFAULT_PASSWORD = 'password123'
+
+ROLES = ['hacker', 'hipster', 'hustler', 'mentor']
+SKILLS = ['Python', 'JavaScript', 'React', 'Django', 'ML', 'Go', 'Rust', 'UI/UX', 'Figma', 'Marketing', 'Sales']
+HACKATHON_STATUSES = ['registration_open', 'in_progress', 'judging', 'completed']
+TEAM_STATUSES = (['forming', 'ready', 'submitted', 'verified', 'eliminated'], [0.2, 0.2, 0.3, 0.25, 0.05])
+SUBMISSION_STATUSES = (['pending', 'verified', 'rejected'], [0.3, 0.6, 0.1])
+QUEST_TYPES = ['technical', 'commercial', 'operational', 'mixed']
+DIFFICULTIES = ['beginner', 'intermediate', 'advanced', 'expert']
+PHASES = [('Registration', 7), ('Hacking Period', 14), ('Judging', 5), ('Awards Ceremony', 1)]
+WORDS = (
+    'api model data cloud user agent stream cache graph vector search privacy health energy climate '
+    'market payment ledger sensor edge mobile realtime dashboard pipeline inference training latency'
+).split()
+
+
+# Usernames, hackathon and quest slugs start with SLUG_PREFIX and the seed; page
+# slugs are '<hackathon slug>-<team slug>'
+SLUG_PREFIX = 'scale'
+PAGE_SLUG_PATTERN = rf'^{SLUG_PREFIX}[0-9]+-h[0-9]+-'
+
+
+class ScaleFixtureError(ValueError):
+    """Raised when scale fixtures cannot be generated into this database"""
+
+
+@dataclass
+class ScaleConfig:
+    seed: int = 0
+    users: int = 300_000
+    hackathons: int = 20
+    teams: int = 100_000
+    hackathon_skew: float = 1.0
+    team_size: tuple = (2, 5)
+    submissions_per_team: tuple = (1, 2)
+    quests: int = 200
+    quest_submissions: int = 200_000
+    judges: int = 500
+    judges_per_submission: tuple = (3, 3)
+    scored_fraction: float = 0.6
+    # Teams that also get a TeamProfilePage and a SubmissionPage
+    page_fraction: float = 1.0
+    batch_size: int = 5000
+
+    @property
+    def prefix(self):
+        return f'{SLUG_PREFIX}{self.seed}'
+
+
+@dataclass
+class _State:
+    config: ScaleConfig
+    rng: random.Random
+    user_ids: array = field(default_factory=lambda: array('q'))
+    judge_ids: list = field(default_factory=list)
+    quest_ids: list = field(default_factory=list)
+    judge_loads: dict = field(default_factory=dict)
+    counts: dict = field(default_factory=dict)
+
+    def count(self, label, n):
+        self.counts[label] = self.counts.get(label, 0) + n
+
+
+def spread(total, parts, skew):
+    """Split `total` into `parts` counts with weights 1 / rank ** skew, largest first"""
+    if parts <= 0:
+        return []
+    weights = [1 / (rank + 1) ** skew for rank in range(parts)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for i in range(total - sum(counts)):
+        counts[i % parts] += 1
+    return counts
+
+
+class Permutation:
+    """range(n) in a seeded order, as (offset + i * stride) mod n, without materializing it"""
+
+    def __init__(self, rng, n):
+        self.n = n
+        self.position = 0
+        self.offset = rng.randrange(n) if n else 0
+        self.stride = rng.randrange(1, n) if n > 1 else 1
+        while math.gcd(self.stride, max(n, 1)) != 1:
+            self.stride += 1
+
+    def take(self, k):
+        """The next k indexes (fewer once all n have been handed out)"""
+        k = min(k, self.n - self.position)
+        start, self.position = self.position, self.position + k
+        return [(self.offset + i * self.stride) % self.n for i in range(start, start + k)]
+
+
+def _batched(items, size):
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _draw(rng, bounds):
+    low, high = bounds
+    return rng.randint(low, high)
+
+
+def _score(rng):
+    """Bell curve around 75, clipped to 0-100"""
+    return Decimal(str(min(100, max(0, rng.gauss(75, 15))))).quantize(Decimal('0.01'))
+
+
+def _text(rng, words):
+    return ' '.join(rng.choices(WORDS, k=words))
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def bulk_create_pages(parent, pages, batch_size=1000):
+    """
+    Insert unsaved `pages` (all of one Page subclass) as the last children of `parent`.
+
+    Paths continue after the parent's last child, the pages are published
+    without revisions, and the parent's numchild is bumped once.
+    """
+    if not pages:
+        return pages
+    model = type(pages[0])
+    parent.refresh_from_db(fields=['numchild'])
+    last = parent.get_last_child()
+    position = last._get_lastpos_in_path() if last else 0
+    depth = parent.depth + 1
+    now = timezone.now()
+
+    rows = []
+    for page in pages:
+        position += 1
+        page.path = Page._get_path(parent.path, depth, position)
+        page.depth = depth
+        page.numchild = 0
+        page.url_path = f'{parent.url_path}{page.slug}/'
+        page.draft_title = page.title
+        page.locale_id = parent.locale_id
+        page.live = True
+        page.has_unpublished_changes = False
+        page.first_published_at = page.last_published_at = now
+        rows.append(Page(**{
+            f.attname: getattr(page, f.attname) for f in Page._meta.concrete_fields if not f.primary_key
+        }))
+
+    Page.objects.bulk_create(rows, batch_size=batch_size)
+    for page, row in zip(pages, rows):
+        page.id = page.page_ptr_id = row.pk
+        page._state.adding = False
+    # _insert() writes only the subclass table; bulk_create() would refuse the model
+    for batch in _batched(pages, batch_size):
+        model._base_manager._insert(batch, fields=model._meta.local_concrete_fields)
+    Page.objects.filter(pk=parent.pk).update(numchild=F('numchild') + len(pages))
+    parent.numchild += len(pages)
+    return pages
+
+
+def _index_page(model, home, title, slug):
+    page = model.objects.first()
+    if page is None:
+        page = model(title=title, slug=slug)
+        home.add_child(instance=page)
+    return page
+
+
+def delete_pages():
+    """Delete the generated TeamProfilePages and SubmissionPages of every seed; returns how many"""
+    deleted = 0
+    # Submissions first: they point at the team pages
+    for model, index_model in ((SubmissionPage, SubmissionIndexPage), (TeamProfilePage, TeamIndexPage)):
+        for index in index_model.objects.all():
+            pages = model.objects.child_of(index).filter(slug__regex=PAGE_SLUG_PATTERN)
+            deleted += pages.count()
+            pages.delete()
+    return deleted
+
+
+def _create_users(state):
+    config, rng = state.config, state.rng
+    User = get_user_model()
+    password = make_password(DEFAULT_PASSWORD)
+
+    def build(username, is_staff=False):
+        role = rng.choice(ROLES)
+        xp = int(rng.paretovariate(1.5) * 100)
+        return User(
+            username=username,
+            email=f'{username}@example.com',
+            password=password,
+            is_staff=is_staff,
+            preferred_role=role,
+            skills=rng.sample(SKILLS, k=3),
+            xp_points=xp,
+            level=xp // 100 + 1,
+            reputation_score=Decimal(rng.randint(0, 10000)) / 100,
+            profile_completed=True,
+            is_seeking_team=rng.random() < 0.3,
+        )
+
+    for batch in _batched(range(config.users), config.batch_size):
+        users = User.objects.bulk_create([build(f'{config.prefix}-u{i}') for i in batch])
+        state.user_ids.extend(user.pk for user in users)
+    judges = User.objects.bulk_create(
+        [build(f'{config.prefix}-judge{i}', is_staff=True) for i in range(config.judges)],
+        batch_size=config.batch_size,
+    )
+    state.judge_ids = [judge.pk for judge in judges]
+    state.count('users', config.users)
+    state.count('judges', config.judges)
+
+
+def _create_hackathons(state, home):
+    config, rng = state.config, state.rng
+    hackathons = []
+    phases = []
+    base = timezone.now()
+    for i in range(config.hackathons):
+        hackathon = HackathonPage(
+            title=f'Scale Hackathon {config.seed}-{i}',
+            slug=f'{config.prefix}-h{i}',
+            description=f'<p>{_text(rng, 20)}</p>',
+            min_team_size=config.team_size[0],
+            max_team_size=config.team_size[1],
+            status=rng.choice(HACKATHON_STATUSES),
+        )
+        home.add_child(instance=hackathon)
+        hackathons.append(hackathon)
+
+        start = base - timedelta(days=rng.randint(0, 60))
+        for order, (title, days) in enumerate(PHASES):
+            phases.append(Phase(
+                hackathon=hackathon, title=title, start_date=start, end_date=start + timedelta(days=days), order=order
+            ))
+            start += timedelta(days=days)
+    Phase.objects.bulk_create(phases)
+    state.count('hackathons', len(hackathons))
+    state.count('phases', len(phases))
+    return hackathons
+
+
+def _create_quests(state):
+    config, rng = state.config, state.rng
+    locale = Locale.get_default()
+    quests = Quest.objects.bulk_create([
+        Quest(
+            title=f'{_text(rng, 3).title()} {i}',
+            slug=f'{config.prefix}-q{i}',
+            description=f'<p>{_text(rng, 30)}</p>',
+            quest_type=rng.choice(QUEST_TYPES),
+            difficulty=rng.choice(DIFFICULTIES),
+            tags=rng.sample(WORDS, k=3),
+            locale=locale,
+            translation_key=_uuid(rng),
+        )
+        for i in range(config.quests)
+    ], batch_size=config.batch_size)
+    state.quest_ids = [quest.pk for quest in quests]
+    state.count('quests', len(quests))
+
+
+def _submission(rng, **kwargs):
+    status = rng.choices(*SUBMISSION_STATUSES)[0]
+    return Submission(
+        description=_text(rng, 40),
+        verification_status=status,
+        score=_score(rng) if status == 'verified' else None,
+        copyright_declaration=True,
+        file_transfer_confirmed=True,
+        **kwargs,
+    )
+
+
+def _judge(state, hackathon, submissions, members):
+    """Balanced assignments for a batch of submissions, and scores for some of them"""
+    config, rng = state.config, state.rng
+    by_size = {}
+    for submission in submissions:
+        k = min(_draw(rng, config.judges_per_submission), len(state.judge_ids))
+        by_size.setdefault(k, []).append((submission.pk, frozenset(members[submission.team_id])))
+
+    pairs = []
+    for k, batch in sorted(by_size.items()):
+        new, _uncovered = judge_assignment.balance(batch, state.judge_ids, k, {}, state.judge_loads)
+        pairs += new
+    JudgeAssignment.objects.bulk_create([
+        JudgeAssignment(hackathon=hackathon, submission_id=submission_id, judge_id=judge_id)
+        for submission_id, judge_id in pairs
+    ], batch_size=config.batch_size)
+
+    scores = []
+    for submission_id, judge_id in pairs:
+        if rng.random() < config.scored_fraction:
+            technical, commercial, operational = _score(rng), _score(rng), _score(rng)
+            scores.append(JudgeScore(
+                submission_id=submission_id,
+                judge_id=judge_id,
+                technical_score=technical,
+                commercial_score=commercial,
+                operational_score=operational,
+                # Bulk inserts skip JudgeScore.save(), which would average these
+                overall_score=((technical + commercial + operational) / 3).quantize(Decimal('0.01')),
+            ))
+    JudgeScore.objects.bulk_create(scores, batch_size=config.batch_size)
+    state.count('judge assignments', len(pairs))
+    state.count('judge scores', len(scores))
+
+
+def _create_pages(state, hackathon, teams, members, first_submissions, team_index, submission_index):
+    """A TeamProfilePage with memberships and a SubmissionPage for each team"""
+    config, rng = state.config, state.rng
+    team_pages = bulk_create_pages(team_index, [
+        TeamProfilePage(
+            title=team.name,
+            slug=f'{hackathon.slug}-{team.slug}',
+            tagline=team.tagline,
+            max_members=config.team_size[1],
+            translation_key=_uuid(rng),
+        )
+        for team in teams
+    ], batch_size=config.batch_size)
+    memberships = [
+        TeamMembership(team_id=page.pk, user_id=user_id, is_leader=position == 0, sort_order=position,
+                       role=rng.choice(ROLES))
+        for team, page in zip(teams, team_pages)
+        for position, user_id in enumerate(members[team.pk])
+    ]
+    TeamMembership.objects.bulk_create(memberships, batch_size=config.batch_size)
+
+    submission_pages = bulk_create_pages(submission_index, [
+        SubmissionPage(
+            title=f'{team.name} project',
+            slug=f'{hackathon.slug}-{team.slug}',
+            team_profile_id=page.pk,
+            tagline=_text(rng, 8),
+            content=[
+                {'type': 'paragraph', 'value': f'<p>{_text(rng, 60)}</p>', 'id': str(_uuid(rng))},
+                {'type': 'demo_url', 'value': first_submissions[team.pk].submission_url, 'id': str(_uuid(rng))},
+            ],
+            verification_status=first_submissions[team.pk].verification_status.replace('pending', 'submitted'),
+            score=first_submissions[team.pk].score,
+            submitted_at=timezone.now(),
+            translation_key=_uuid(rng),
+        )
+        for team, page in zip(teams, team_pages)
+    ], batch_size=config.batch_size)
+    through = SubmissionPage._meta.get_field('hackathons').remote_field.through
+    source = SubmissionPage._meta.get_field('hackathons').m2m_field_name()
+    target = SubmissionPage._meta.get_field('hackathons').m2m_reverse_field_name()
+    through.objects.bulk_create([
+        through(**{f'{source}_id': page.pk, f'{target}_id': hackathon.pk}) for page in submission_pages
+    ], batch_size=config.batch_size)
+
+    state.count('team pages', len(team_pages))
+    state.count('team memberships', len(memberships))
+    state.count('submission pages', len(submission_pages))
+
+
+def _create_teams(state, hackathon, team_count, team_index, submission_index):
+    config, rng = state.config, state.rng
+    pool = Permutation(rng, len(state.user_ids))
+    for batch in _batched(range(team_count), config.batch_size):
+        with transaction.atomic():
+            teams = Team.objects.bulk_create([
+                Team(
+                    hackathon=hackathon,
+                    name=f'{_text(rng, 2).title()} {hackathon.pk}-{i}',
+                    slug=f'team-{i}',
+                    tagline=_text(rng, 6),
+                    status=rng.choices(*TEAM_STATUSES)[0],
+                    is_seeking_members=rng.random() < 0.2,
+                )
+                for i in batch
+            ])
+
+            members = {
+                team.pk: [state.user_ids[i] for i in pool.take(_draw(rng, config.team_size))] for team in teams
+            }
+            team_members = TeamMember.objects.bulk_create([
+                TeamMember(team=team, user_id=user_id, role=rng.choice(ROLES), is_leader=position == 0)
+                for team in teams
+                for position, user_id in enumerate(members[team.pk])
+            ], batch_size=config.batch_size)
+
+            submissions = Submission.objects.bulk_create([
+                _submission(
+                    rng,
+                    team=team,
+                    hackathon=hackathon,
+                    submission_url=f'https://github.com/{config.prefix}/{hackathon.slug}-{team.slug}',
+                    attempt_number=attempt,
+                )
+                for team in teams
+                for attempt in range(1, _draw(rng, config.submissions_per_team) + 1)
+            ], batch_size=config.batch_size)
+            state.count('teams', len(teams))
+            state.count('team members', len(team_members))
+            state.count('submissions', len(submissions))
+
+            if state.judge_ids:
+                _judge(state, hackathon, submissions, members)
+
+            paged = [team for team in teams if rng.random() < config.page_fraction]
+            if paged:
+                first_submissions = {}
+                for submission in submissions:
+                    first_submissions.setdefault(submission.team_id, submission)
+                _create_pages(state, hackathon, paged, members, first_submissions, team_index, submission_index)
+
+
+def _create_quest_submissions(state):
+    config, rng = state.config, state.rng
+    if not state.quest_ids or not state.user_ids:
+        return
+    for batch in _batched(range(config.quest_submissions), config.batch_size):
+        submissions = Submission.objects.bulk_create([
+            _submission(
+                rng,
+                user_id=rng.choice(state.user_ids),
+                quest_id=rng.choice(state.quest_ids),
+                submission_url=f'https://github.com/{config.prefix}/quest-{i}',
+            )
+            for i in batch
+        ])
+        state.count('submissions', len(submissions))
+
+
+def generate(config, progress=None):
+    """
+    Generate scale fixtures for `config`; returns {label: rows created}.
+
+    `progress` is called with a message after each stage.
+    """
+    User = get_user_model()
+    if User.objects.filter(username__startswith=f'{config.prefix}-').exists():
+        raise ScaleFixtureError(f'Seed {config.seed} has already been generated; use another --seed or --clear.')
+    home = HomePage.objects.first() or Page.objects.filter(depth=2).first()
+    if home is None:
+        raise ScaleFixtureError('No home page found. Please create one first.')
+
+    state = _State(config=config, rng=random.Random(config.seed))
+    report = progress or (lambda message: None)
+
+    _create_users(state)
+    report(f'{config.users} users and {config.judges} judges')
+    hackathons = _create_hackathons(state, home)
+    _create_quests(state)
+    report(f'{len(hackathons)} hackathons and {config.quests} quests')
+
+    team_index = _index_page(TeamIndexPage, home, 'Teams', 'teams')
+    submission_index = _index_page(SubmissionIndexPage, home, 'Submissions', 'submissions')
+    for hackathon, team_count in zip(hackathons, spread(config.teams, len(hackathons), config.hackathon_skew)):
+        _create_teams(state, hackathon, team_count, team_index, submission_index)
+        leaderboard.rebuild_leaderboard(hackathon)
+        report(f'{hackathon.title}: {team_count} teams')
+
+    _create_quest_submissions(state)
+    report(f'{config.quest_submissions} quest submissions')
+    return state.counts
@@ -0,0 +1,211 @@
+"""
+Bulk judge-score import.
+
+Judges hand in spreadsheets; this module parses CSV or JSON exports, validates
+every row up front with a handful of set-based lookups, upserts the JudgeScore
+rows in one transaction and then recomputes each affected team's leaderboard
+entry exactly once. Bulk writes bypass JudgeScore.save(), so the per-row
+leaderboard deltas are deliberately skipped in favour of that single rebuild.
+
+Expected columns: submission_id, judge (username), technical_score,
+commercial_score, operational_score, and optionally overall_score, feedback.
+"""
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from synnovator.hackathons import leaderboard
+from synnovator.hackathons.models import JudgeScore, Submission
+
+
+REQUIRED_COLUMNS = ('submission_id', 'judge', 'technical_score', 'commercial_score', 'operational_score')
+
+SCORE_COLUMNS = ('technical_score', 'commercial_score', 'operational_score', 'overall_score')
+
+MAX_SCORE = Decimal('100')
+
+UPDATE_FIELDS = [*SCORE_COLUMNS, 'feedback', 'updated_at']
+
+
+class ScoreImportError(ValueError):
+    """Raised when an import file cannot be parsed at all"""
+
+
+@dataclass
+class ScoreImportResult:
+    """Outcome of a bulk import; errors are (row number, message) pairs"""
+    created: int = 0
+    updated: int = 0
+    team_ids: set = field(default_factory=set)
+    errors: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def parse_score_file(fileobj, file_format=None, name=''):
+    """
+    Read rows from a CSV or JSON file object.
+
+    The format is taken from file_format, else from the file name extension.
+    JSON may be a list of objects or {"scores": [...]}.
+    """
+    file_format = (file_format or name.rsplit('.', 1)[-1]).lower()
+    content = fileobj.read()
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+
+    if file_format == 'json':
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ScoreImportError(f'Invalid JSON: {e}') from e
+        if isinstance(data, dict):
+            data = data.get('scores', [])
+        if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+            raise ScoreImportError('JSON must be a list of score objects')
+        return data
+
+    if file_format == 'csv':
+        reader = csv.DictReader(io.StringIO(content))
+        missing = set(REQUIRED_COLUMNS) - set(reader.fieldnames or [])
+        if missing:
+            raise ScoreImportError(f'Missing columns: {", ".join(sorted(missing))}')
+        return list(reader)
+
+    raise ScoreImportError(f'Unsupported format: {file_format or "unknown"}')
+
+
+def _parse_score(value):
+    try:
+        score = Decimal(str(value).strip())
+    except (InvalidOperation, ValueError):
+        return None
+    if not score.is_finite() or score < 0 or score > MAX_SCORE:
+        return None
+    return score.quantize(Decimal('0.01'))
+
+
+def _build_scores(rows, result):
+    """Validate rows and turn them into unsaved JudgeScore objects"""
+    User = get_user_model()
+
+    submission_ids = set()
+    usernames = set()
+    for row in rows:
+        try:
+            submission_ids.add(int(row.get('submission_id')))
+        except (TypeError, ValueError):
+            pass
+        usernames.add(str(row.get('judge') or '').strip())
+
+    teams_by_submission = dict(
+        Submission.objects.filter(pk__in=submission_ids).values_list('pk', 'team_id')
+    )
+    judges = dict(
+        User.objects.filter(username__in=usernames).values_list('username', 'pk')
+    )
+
+    scores = {}
+    for number, row in enumerate(rows, start=1):
+        missing = [column for column in REQUIRED_COLUMNS if row.get(column) in (None, '')]
+        if missing:
+            result.errors.append((number, f'Missing {", ".join(missing)}'))
+            continue
+
+        try:
+            submission_id = int(row['submission_id'])
+        except (TypeError, ValueError):
+            result.errors.append((number, f'Invalid submission_id {row["submission_id"]!r}'))
+            continue
+        if submission_id not in teams_by_submission:
+            result.errors.append((number, f'Submission {submission_id} not found'))
+            continue
+
+        username = str(row['judge']).strip()
+        if username not in judges:
+            result.errors.append((number, f'Judge {username!r} not found'))
+            continue
+
+        values = {}
+        for column in SCORE_COLUMNS:
+            if row.get(column) in (None, ''):
+                continue
+            values[column] = _parse_score(row[column])
+            if values[column] is None:
+                result.errors.append((number, f'{column} must be between 0 and {MAX_SCORE}'))
+                break
+        else:
+            if not values.get('overall_score'):
+                # Mirrors JudgeScore.save()
+                values['overall_score'] = (
+                    (values['technical_score'] + values['commercial_score'] + values['operational_score']) / 3
+                ).quantize(Decimal('0.01'))
+
+            key = (submission_id, judges[username])
+            if key in scores:
+                result.errors.append((number, f'Duplicate score for submission {submission_id} by {username}'))
+                continue
+            scores[key] = JudgeScore(
+                submission_id=submission_id,
+                judge_id=judges[username],
+                feedback=row.get('feedback') or '',
+                **values,
+            )
+            if teams_by_submission[submission_id]:
+                result.team_ids.add(teams_by_submission[submission_id])
+
+    return list(scores.values())
+
+
+def import_judge_scores(rows, dry_run=False, batch_size=1000):
+    """
+    Validate and upsert judge scores, then recompute affected teams once.
+
+    Nothing is written if any row fails validation.
+
+    Args:
+        rows: Iterable of dicts (see parse_score_file)
+        dry_run: Validate only
+        batch_size: Rows per INSERT statement
+
+    Returns:
+        ScoreImportResult
+    """
+    rows = list(rows)
+    result = ScoreImportResult()
+    scores = _build_scores(rows, result)
+    if not result.ok or not scores:
+        return result
+
+    submission_ids = {score.submission_id for score in scores}
+    existing = set(
+        JudgeScore.objects.filter(submission_id__in=submission_ids).values_list('submission_id', 'judge_id')
+    )
+    result.updated = sum(1 for score in scores if (score.submission_id, score.judge_id) in existing)
+    result.created = len(scores) - result.updated
+    if dry_run:
+        return result
+
+    now = timezone.now()
+    for score in scores:
+        score.created_at = score.updated_at = now
+
+    with transaction.atomic():
+        JudgeScore.objects.bulk_create(
+            scores,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['submission', 'judge'],
+            update_fields=UPDATE_FIELDS,
+        )
+        leaderboard.rebuild_team_entries(result.team_ids)
+
+    return result
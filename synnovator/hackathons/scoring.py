@@ -0,0 +1,220 @@
+"""
+Judge-score normalization engine.
+
+Raw averages reward teams that happened to draw lenient judges. This module
+loads every verified JudgeScore of a hackathon into NumPy arrays once,
+normalizes each judge's scores per category (z-score or min-max), averages
+them per team, applies the category weights from ScoreBreakdown and ranks
+the result, all in vectorized passes. Results are written back to
+LeaderboardEntry.normalized_score / normalized_rank in bulk.
+
+Normalized values are a snapshot: re-run after scores change (the
+normalize_scores management command does this). The raw running averages
+on LeaderboardEntry and Team are unaffected.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Sum
+
+from synnovator.hackathons import leaderboard
+from synnovator.hackathons.models import JudgeScore, LeaderboardEntry, ScoreBreakdown
+
+
+CATEGORIES = ('technical', 'commercial', 'operational')
+
+NORMALIZATION_METHODS = ('zscore', 'minmax')
+
+# z-scores are reported on a 0-100 scale as 50 + 10z (a "T-score")
+ZSCORE_CENTER = 50.0
+ZSCORE_SPREAD = 10.0
+
+
+@dataclass
+class NormalizedScores:
+    """Per-team output of the engine, aligned by position"""
+    team_ids: np.ndarray
+    category_scores: np.ndarray
+    final_scores: np.ndarray
+    ranks: np.ndarray
+
+    def __len__(self):
+        return len(self.team_ids)
+
+
+def category_weights(hackathon):
+    """
+    Relative weight of each category, from summed ScoreBreakdown weights.
+
+    Categories without criteria keep weight 1; with no criteria at all the
+    categories count equally.
+    """
+    weights = np.ones(len(CATEGORIES))
+    totals = ScoreBreakdown.objects.filter(hackathon=hackathon).values('category').annotate(
+        total=Sum('weight')
+    ).order_by()
+    for row in totals:
+        if row['category'] in CATEGORIES:
+            weights[CATEGORIES.index(row['category'])] = float(row['total'] or 0)
+    if weights.sum() <= 0:
+        weights = np.ones(len(CATEGORIES))
+    return weights / weights.sum()
+
+
+def load_scores(hackathon):
+    """
+    Return (judge_ids, team_ids, scores) arrays for a hackathon's verified scores.
+
+    scores has one column per entry in CATEGORIES.
+    """
+    rows = list(JudgeScore.objects.filter(
+        submission__team__hackathon=hackathon,
+        submission__verification_status='verified',
+    ).values_list(
+        'judge_id', 'submission__team_id', *(f'{c}_score' for c in CATEGORIES)
+    ).order_by())
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, len(CATEGORIES)))
+
+    data = np.array(rows, dtype=np.float64)
+    return data[:, 0].astype(np.int64), data[:, 1].astype(np.int64), data[:, 2:]
+
+
+def _group_sums(index, values, size):
+    """Column-wise sums of values grouped by index"""
+    return np.column_stack([
+        np.bincount(index, weights=values[:, col], minlength=size)
+        for col in range(values.shape[1])
+    ])
+
+
+def normalize_by_judge(judge_index, scores, method='zscore'):
+    """
+    Normalize each judge's scores per category.
+
+    Args:
+        judge_index: Dense judge index (0..n-1) per score row
+        scores: (rows, categories) array of raw scores
+        method: 'zscore' or 'minmax'
+
+    Returns:
+        Array shaped like scores on a 0-100 scale. A judge who gave every
+        team the same mark in a category contributes the neutral midpoint.
+    """
+    if method not in NORMALIZATION_METHODS:
+        raise ValueError(f'Unknown normalization method: {method}')
+    if not len(scores):
+        return scores.copy()
+
+    n_judges = int(judge_index.max()) + 1
+
+    if method == 'zscore':
+        counts = np.bincount(judge_index, minlength=n_judges)[:, None]
+        means = _group_sums(judge_index, scores, n_judges) / counts
+        variances = _group_sums(judge_index, scores ** 2, n_judges) / counts - means ** 2
+        stds = np.sqrt(np.clip(variances, 0, None))
+
+        row_stds = stds[judge_index]
+        z = np.divide(
+            scores - means[judge_index], row_stds,
+            out=np.zeros_like(scores), where=row_stds > 1e-9,
+        )
+        return np.clip(ZSCORE_CENTER + ZSCORE_SPREAD * z, 0, 100)
+
+    order = np.argsort(judge_index, kind='stable')
+    sorted_judges = judge_index[order]
+    starts = np.flatnonzero(np.r_[True, sorted_judges[1:] != sorted_judges[:-1]])
+    group_judges = sorted_judges[starts]
+
+    mins = np.zeros((n_judges, scores.shape[1]))
+    maxs = np.zeros((n_judges, scores.shape[1]))
+    mins[group_judges] = np.minimum.reduceat(scores[order], starts, axis=0)
+    maxs[group_judges] = np.maximum.reduceat(scores[order], starts, axis=0)
+
+    row_mins = mins[judge_index]
+    row_ranges = (maxs - mins)[judge_index]
+    scaled = np.divide(
+        scores - row_mins, row_ranges,
+        out=np.full_like(scores, 0.5), where=row_ranges > 1e-9,
+    )
+    return scaled * 100
+
+
+def competition_ranks(values):
+    """Descending competition ranks ("1, 2, 2, 4") for an array of scores"""
+    order = np.argsort(-values, kind='stable')
+    descending = -values[order]
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[order] = np.searchsorted(descending, descending, side='left') + 1
+    return ranks
+
+
+def compute_normalized_scores(judge_ids, team_ids, scores, weights, method='zscore'):
+    """
+    Vectorized pipeline: per-judge normalization, per-team averages,
+    weighted final score and competition ranks.
+    """
+    if not len(scores):
+        empty = np.empty(0)
+        return NormalizedScores(
+            np.empty(0, dtype=np.int64), np.empty((0, len(CATEGORIES))), empty, np.empty(0, dtype=np.int64)
+        )
+
+    _judges, judge_index = np.unique(judge_ids, return_inverse=True)
+    unique_teams, team_index = np.unique(team_ids, return_inverse=True)
+
+    normalized = normalize_by_judge(judge_index, scores, method)
+
+    counts = np.bincount(team_index, minlength=len(unique_teams))[:, None]
+    category_scores = _group_sums(team_index, normalized, len(unique_teams)) / counts
+    # Round before ranking so ties match the stored two-decimal values
+    final_scores = np.round(category_scores @ weights, 2)
+
+    return NormalizedScores(
+        team_ids=unique_teams,
+        category_scores=category_scores,
+        final_scores=final_scores,
+        ranks=competition_ranks(final_scores),
+    )
+
+
+def normalize_hackathon_scores(hackathon, method='zscore'):
+    """
+    Compute normalized scores for a hackathon and store them on its entries.
+
+    Entries for teams that no longer have verified scores are cleared.
+
+    Returns:
+        NormalizedScores
+    """
+    judge_ids, team_ids, scores = load_scores(hackathon)
+    result = compute_normalized_scores(
+        judge_ids, team_ids, scores, category_weights(hackathon), method
+    )
+
+    with transaction.atomic():
+        entries = {
+            entry.team_id: entry
+            for entry in LeaderboardEntry.objects.select_for_update().filter(hackathon=hackathon)
+        }
+        missing = [int(team_id) for team_id in result.team_ids if int(team_id) not in entries]
+        if missing:
+            # Leaderboard is behind JudgeScore (e.g. bulk SQL load); repair first
+            for entry in leaderboard.rebuild_team_entries(missing):
+                entries[entry.team_id] = LeaderboardEntry.objects.get(pk=entry.pk)
+
+        for entry in entries.values():
+            entry.normalized_score = None
+            entry.normalized_rank = None
+        for team_id, final_score, rank in zip(result.team_ids, result.final_scores, result.ranks):
+            entry = entries[int(team_id)]
+            entry.normalized_score = Decimal(f'{final_score:.2f}')
+            entry.normalized_rank = int(rank)
+
+        LeaderboardEntry.objects.bulk_update(
+            entries.values(), ['normalized_score', 'normalized_rank'], batch_size=1000
+        )
+
+    return result
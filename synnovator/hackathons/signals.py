@@ -0,0 +1,214 @@
+"""
+Signal handlers for hackathon derived data.
+
+Handles:
+- JudgeScore post_delete: Subtracts the score from the materialized leaderboard
+- Phase post_save/post_delete: Invalidates the cached phase timeline
+- page_published: Invalidates the cached phase timeline of a HackathonPage
+- HackathonPage/Phase changes: Bump the calendar and ICS feed versions
+- HackathonPage/Quest post_save: Mirror JSON tags into the tag index
+- Quest post_save/post_delete: Bump the quest catalog version
+- Submission post_save/post_delete: Refresh the submitter's quest recommendations
+- Submission post_delete: Subtract the submission from its quest's statistics
+- User pre_delete/post_delete: Recount the statistics of the quests the user submitted to
+- Submission post_save (created): Queue an originality check once the submission commits
+- User post_save/post_delete: Bump the team formation seeker index version
+- Team/TeamMember/HackathonPage/User changes: Bump the team formation recruiting team index version
+- TeamMember/HackathonRegistration/TeamRegistration post_save: Append activity events
+- SubmissionPage/HackathonPage/TeamProfilePage (un)publish, SubmissionPage delete, User name change:
+  Bump the submission facets version
+- SubmissionPage publish: Highlight code blocks, then pre-render the new live revision's content
+- Image/Document change or delete: Bump the submission content assets version
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from wagtail.documents import get_document_model
+from wagtail.images import get_image_model
+from wagtail.signals import page_published, page_unpublished
+
+from synnovator.community.models import TeamProfilePage
+from synnovator.hackathons import (
+    activity, calendar_events, highlighting, ics, leaderboard, originality, quest_catalog, quest_stats,
+    recommendations, submission_content, submission_facets, tags, team_matching,
+)
+from synnovator.hackathons.models import (
+    HackathonPage, HackathonRegistration, JudgeScore, Phase, Quest, Submission, SubmissionPage, Team, TeamMember,
+    TeamRegistration,
+)
+from synnovator.hackathons.timeline import invalidate_phase_timeline
+
+
+@receiver(post_delete, sender=JudgeScore)
+def remove_judge_score_from_leaderboard(sender, instance, **kwargs):
+    """
+    Subtract a deleted judge score from its team's leaderboard entry.
+
+    Runs for cascades and queryset deletes too, which bypass Model.delete().
+    """
+    leaderboard.record_judge_score_removed(instance)
+
+
+@receiver(post_save, sender=Phase)
+@receiver(post_delete, sender=Phase)
+def invalidate_timeline_on_phase_change(sender, instance, **kwargs):
+    """Drop the cached timeline when a phase is added, edited or removed."""
+    invalidate_phase_timeline(instance.hackathon_id)
+    calendar_events.bump_calendar_version()
+    ics.bump_hackathon_feed_version(instance.hackathon_id)
+    # Also reset the memo on the in-memory parent, if one is attached
+    hackathon = Phase._meta.get_field('hackathon').get_cached_value(instance, None)
+    if hackathon is not None:
+        hackathon._phase_timeline = None
+
+
+@receiver(page_published)
+def invalidate_timeline_on_publish(sender, instance, **kwargs):
+    """Drop the cached timeline when a HackathonPage is published."""
+    if isinstance(instance, HackathonPage):
+        invalidate_phase_timeline(instance.pk)
+        instance._phase_timeline = None
+
+
+@receiver(post_save, sender=HackathonPage)
+@receiver(post_delete, sender=HackathonPage)
+@receiver(page_unpublished, sender=HackathonPage)
+def invalidate_calendar_on_hackathon_change(sender, instance, **kwargs):
+    """Hackathon titles and URLs are baked into calendar events and feeds."""
+    calendar_events.bump_calendar_version()
+    ics.bump_hackathon_feed_version(instance.pk)
+
+
+@receiver(post_save, sender=HackathonPage)
+@receiver(post_save, sender=Quest)
+def sync_tag_index(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep the tag index in step with the JSON tags field.
+
+    Saving a draft revision only writes revision bookkeeping fields, so the
+    index keeps reflecting the live tags until the page is published.
+    """
+    if update_fields is not None and 'tags' not in update_fields:
+        return
+    tags.sync_tags(instance)
+
+
+@receiver(post_save, sender=Quest)
+@receiver(post_delete, sender=Quest)
+def invalidate_quest_catalog(sender, instance, **kwargs):
+    """Any quest change may move it in or out of a catalog facet."""
+    quest_catalog.bump_catalog_version()
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+def invalidate_quest_recommendations(sender, instance, **kwargs):
+    """Completed quests are excluded from the submitter's recommendations."""
+    if instance.quest_id and instance.user_id:
+        recommendations.bump_user_recommendations(instance.user_id)
+
+
+@receiver(post_delete, sender=Submission)
+def remove_submission_from_quest_stats(sender, instance, **kwargs):
+    """Runs for cascades and queryset deletes too, which bypass Model.delete()."""
+    quest_stats.record_submission_deleted(instance)
+
+
+@receiver(pre_delete, sender=get_user_model())
+def note_quests_for_stats(sender, instance, **kwargs):
+    """Submissions outlive their user (SET_NULL), so their quests lose a unique user."""
+    quest_stats.record_user_deleting(instance)
+
+
+@receiver(post_delete, sender=get_user_model())
+def reconcile_quest_stats_for_user(sender, instance, **kwargs):
+    """Runs after the submissions' user has been cleared."""
+    quest_stats.record_user_deleted(instance)
+
+
+@receiver(post_save, sender=Submission)
+def queue_originality_check(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        submission_id = instance.pk
+        transaction.on_commit(lambda: originality.enqueue(submission_id))
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_seeker_index(sender, instance, update_fields=None, **kwargs):
+    """Logins only write last_login, which leaves the index as it is."""
+    if update_fields is not None and not team_matching.INDEXED_USER_FIELDS & set(update_fields):
+        return
+    team_matching.bump_seeker_index_version()
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_save, sender=HackathonPage)
+@receiver(post_save, sender=get_user_model())
+def invalidate_team_index(sender, instance, update_fields=None, **kwargs):
+    """Score updates, draft revisions and logins leave the recruiting team index as it is."""
+    indexed = {
+        Team: team_matching.INDEXED_TEAM_FIELDS,
+        TeamMember: team_matching.INDEXED_MEMBER_FIELDS,
+        HackathonPage: team_matching.INDEXED_HACKATHON_FIELDS,
+    }.get(sender, team_matching.INDEXED_MEMBER_USER_FIELDS)
+    if update_fields is not None and not indexed & set(update_fields):
+        return
+    team_matching.bump_team_index_version()
+
+
+@receiver(post_save, sender=TeamMember)
+def record_member_joined(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        activity.record_member_joined(instance)
+
+
+@receiver(post_save, sender=HackathonRegistration)
+def record_hackathon_registration(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        activity.record_registration(instance)
+
+
+@receiver(post_save, sender=TeamRegistration)
+def record_team_registration(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        activity.record_team_registration(instance)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_delete, sender=SubmissionPage)
+def invalidate_submission_facets(sender, instance, **kwargs):
+    """Facet counts cover live submissions; hackathon and team titles appear in them too."""
+    if isinstance(instance, (SubmissionPage, HackathonPage, TeamProfilePage)):
+        submission_facets.bump_facets_version()
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_submitter_labels(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """Submitter facet labels are user names; a new user has no submissions yet."""
+    if created or raw:
+        return
+    if update_fields is not None and not submission_facets.LABEL_USER_FIELDS & set(update_fields):
+        return
+    submission_facets.bump_facets_version()
+
+
+@receiver(page_published, sender=SubmissionPage)
+def prerender_submission_content(sender, instance, **kwargs):
+    highlighting.highlight_page(instance)
+    submission_content.prerender(instance)
+
+
+@receiver(post_save, sender=get_image_model())
+@receiver(post_save, sender=get_document_model())
+@receiver(post_delete, sender=get_image_model())
+@receiver(post_delete, sender=get_document_model())
+def invalidate_submission_content(sender, instance, created=False, raw=False, **kwargs):
+    """A new upload is not in any rendered content yet; edits and deletes may be."""
+    if not created and not raw:
+        submission_content.bump_assets_version()
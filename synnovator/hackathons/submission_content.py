@@ -0,0 +1,80 @@
+"""
+Pre-rendered SubmissionPage content.
+
+Rendering SubmissionPage.content walks every block on each view, generating
+or looking up image renditions and resolving document URLs as it goes. The
+rendered HTML only changes when a new revision goes live, so it is cached
+per live revision and language (the block template has translated strings)
+and served from the cache on read. Publishing a page renders it for every
+site language up front (see signals), so the first visitor after a publish
+does not pay for it either.
+
+Images and documents can be edited or deleted without publishing the pages
+that show them; that bumps a shared assets version which is part of every
+key, and pages re-render lazily on their next view.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.safestring import mark_safe
+
+
+SUBMISSION_CONTENT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+ASSETS_VERSION_KEY = 'hackathons:submission_content:assets_version'
+
+CONTENT_TEMPLATE = 'hackathons/includes/submission_content.html'
+
+
+def _assets_version():
+    version = cache.get(ASSETS_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(ASSETS_VERSION_KEY, version, None)
+    return version
+
+
+def bump_assets_version():
+    cache.set(ASSETS_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _key(page, language, assets_version):
+    return f'hackathons:submission_content:{page.pk}:{page.live_revision_id}:{language}:{assets_version}'
+
+
+def render_content(page):
+    """Render the page's StreamField blocks in the active language"""
+    return render_to_string(CONTENT_TEMPLATE, {'page': page})
+
+
+def get_content_html(page, preview=False):
+    """
+    Rendered content of a live page, from the cache when possible.
+
+    Previews and pages without a live revision render directly: their
+    content is not that of any revision the key could name.
+    """
+    if preview or not page.live_revision_id:
+        return mark_safe(render_content(page))
+
+    key = _key(page, translation.get_language(), _assets_version())
+    html = cache.get(key)
+    if html is None:
+        html = render_content(page)
+        cache.set(key, html, SUBMISSION_CONTENT_CACHE_TIMEOUT)
+    return mark_safe(html)
+
+
+def prerender(page):
+    """Render the live revision in every site language and store it in one round-trip"""
+    if not page.live_revision_id:
+        return
+    assets_version = _assets_version()
+    rendered = {}
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            rendered[_key(page, language, assets_version)] = render_content(page)
+    cache.set_many(rendered, SUBMISSION_CONTENT_CACHE_TIMEOUT)
@@ -0,0 +1,201 @@
+"""
+Filter facets for the SubmissionIndexPage.
+
+The submission listing used to load every live hackathon, every user with a
+submission page and every team with a submission into its filter dropdowns
+on each render. Facets are now grouped counts over the live submissions
+matching the current filter state (each facet ignores its own filter, so
+its other values stay selectable), cached per filter state. Submitter and
+team facets keep only their most frequent values; the rest are reached
+through search(), which backs the typeahead endpoint.
+
+Cached facets and typeahead results are keyed by a version that is bumped
+whenever a SubmissionPage is published, unpublished or deleted, a
+HackathonPage or TeamProfilePage is (un)published, or a user's name changes
+(see signals).
+"""
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+
+SUBMISSION_FACETS_CACHE_TIMEOUT = 60 * 60
+
+FACETS_VERSION_KEY = 'hackathons:submission_facets:version'
+
+# Filter query parameters, in the order the filters are applied
+FILTER_PARAMS = ('hackathon', 'from', 'to', 'submitter', 'team', 'status')
+
+# Facets with one entry per user or team are cut to the most frequent values
+TOP_FACET_VALUES = 20
+
+# User fields submitter labels and typeahead matches are built from
+LABEL_USER_FIELDS = frozenset({'first_name', 'last_name', 'username'})
+
+TYPEAHEAD_FACETS = ('submitters', 'teams')
+TYPEAHEAD_LIMIT = 10
+
+
+def _version():
+    version = cache.get(FACETS_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(FACETS_VERSION_KEY, version, None)
+    return version
+
+
+def bump_facets_version():
+    cache.set(FACETS_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def live_submissions():
+    from synnovator.hackathons.models import SubmissionPage
+
+    return SubmissionPage.objects.live().public()
+
+
+def apply_filters(submissions, filters, exclude=None):
+    """Restrict `submissions` by a {param: value} filter state, skipping `exclude`"""
+    lookups = {
+        'hackathon': 'hackathons__id',
+        'from': 'first_published_at__gte',
+        'to': 'first_published_at__lte',
+        'submitter': 'submitter_id',
+        'team': 'team_profile_id',
+        'status': 'verification_status',
+    }
+    for param in FILTER_PARAMS:
+        value = filters.get(param)
+        if value and param != exclude:
+            submissions = submissions.filter(**{lookups[param]: value})
+    return submissions
+
+
+def _user_label(first_name, last_name, username):
+    return f'{first_name} {last_name}'.strip() or username
+
+
+def _hackathon_facet(submissions, selected=None):
+    from synnovator.hackathons.models import HackathonPage
+
+    rows = submissions.filter(hackathons__live=True).values('hackathons__id', 'hackathons__title').annotate(
+        count=Count('pk', distinct=True)
+    ).order_by('hackathons__title')
+    entries = [{'id': row['hackathons__id'], 'title': row['hackathons__title'], 'count': row['count']} for row in rows]
+    if selected and str(selected) not in {str(e['id']) for e in entries}:
+        # Keep a selected (or default) hackathon without matches selectable
+        title = HackathonPage.objects.filter(pk=selected).values_list('title', flat=True).first()
+        if title is not None:
+            entries.append({'id': int(selected), 'title': title, 'count': 0})
+    return entries
+
+
+def _status_facet(submissions, choices):
+    counts = dict(submissions.values_list('verification_status').annotate(count=Count('pk')).order_by())
+    return [(value, label, counts.get(value, 0)) for value, label in choices]
+
+
+def _team_rows(submissions):
+    return submissions.filter(team_profile__live=True).values(
+        'team_profile_id', 'team_profile__title'
+    ).annotate(count=Count('pk')).order_by('-count', 'team_profile__title')
+
+
+def _team_entry(row):
+    return {'id': row['team_profile_id'], 'label': row['team_profile__title'], 'count': row['count']}
+
+
+def _submitter_rows(submissions):
+    return submissions.filter(submitter__isnull=False).values(
+        'submitter_id', 'submitter__first_name', 'submitter__last_name', 'submitter__username'
+    ).annotate(count=Count('pk')).order_by('-count', 'submitter__username')
+
+
+def _submitter_entry(row):
+    return {
+        'id': row['submitter_id'],
+        'label': _user_label(row['submitter__first_name'], row['submitter__last_name'], row['submitter__username']),
+        'count': row['count'],
+    }
+
+
+def _top(rows, entry, selected, id_field):
+    """The most frequent values, plus the selected one if it is not among them"""
+    entries = [entry(row) for row in rows[:TOP_FACET_VALUES]]
+    if selected and str(selected) not in {str(e['id']) for e in entries}:
+        row = rows.filter(**{id_field: selected}).first()
+        if row:
+            entries.append(entry(row))
+    return entries
+
+
+def build_facets(filters, enabled):
+    """{facet: values} for the enabled facets under a filter state, counted from the database"""
+    from synnovator.hackathons.models import SUBMISSION_STATUS_CHOICES
+
+    submissions = live_submissions()
+    facets = {}
+    if 'hackathon' in enabled:
+        facets['hackathons'] = _hackathon_facet(
+            apply_filters(submissions, filters, exclude='hackathon'), filters.get('hackathon')
+        )
+    if 'status' in enabled:
+        facets['statuses'] = _status_facet(
+            apply_filters(submissions, filters, exclude='status'), SUBMISSION_STATUS_CHOICES
+        )
+    if 'team' in enabled:
+        facets['teams'] = _top(
+            _team_rows(apply_filters(submissions, filters, exclude='team')),
+            _team_entry, filters.get('team'), 'team_profile_id',
+        )
+    if 'submitter' in enabled:
+        facets['submitters'] = _top(
+            _submitter_rows(apply_filters(submissions, filters, exclude='submitter')),
+            _submitter_entry, filters.get('submitter'), 'submitter_id',
+        )
+    return facets
+
+
+def _digest(*parts):
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_facets(filters, enabled):
+    """Cached build_facets(); one cache read while no submission changes"""
+    state = {param: filters.get(param) or '' for param in FILTER_PARAMS}
+    key = f'hackathons:submission_facets:{_version()}:{_digest(state, sorted(enabled))}'
+    facets = cache.get(key)
+    if facets is None:
+        facets = build_facets(state, enabled)
+        cache.set(key, facets, SUBMISSION_FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def search(facet, query, filters=None, limit=TYPEAHEAD_LIMIT):
+    """Submitters or teams whose name starts with `query`, most submissions first"""
+    if facet not in TYPEAHEAD_FACETS:
+        raise ValueError(f'Unknown facet: {facet}')
+    query = query.strip()
+    filters = {param: (filters or {}).get(param) or '' for param in FILTER_PARAMS}
+    key = f'hackathons:submission_facets:{_version()}:search:{_digest(facet, query.lower(), filters, limit)}'
+    results = cache.get(key)
+    if results is not None:
+        return results
+
+    if facet == 'teams':
+        submissions = apply_filters(live_submissions(), filters, exclude='team')
+        rows = _team_rows(submissions.filter(team_profile__title__istartswith=query))
+        results = [_team_entry(row) for row in rows[:limit]]
+    else:
+        submissions = apply_filters(live_submissions(), filters, exclude='submitter')
+        rows = _submitter_rows(submissions.filter(
+            Q(submitter__username__istartswith=query)
+            | Q(submitter__first_name__istartswith=query)
+            | Q(submitter__last_name__istartswith=query)
+        ))
+        results = [_submitter_entry(row) for row in rows[:limit]]
+    cache.set(key, results, SUBMISSION_FACETS_CACHE_TIMEOUT)
+    return results
@@ -0,0 +1,106 @@
+"""
+Exact-match tag filtering and facet counts backed by the tag index tables.
+
+HackathonPage.tags and Quest.tags stay plain JSON lists for editors. On save
+(see signals) they are mirrored into HackathonTag / QuestTag, one normalized
+row per tag, so filtering is an indexed `name IN (...)` lookup rather than
+`tags__icontains`, which scanned every row and let "ai" match "email".
+"""
+from django.db import transaction
+from django.db.models import Count
+
+
+TAG_MATCH_MODES = ('all', 'any')
+
+
+def normalize_tag(tag):
+    return str(tag).strip().lower()
+
+
+def normalize_tags(tags):
+    """Distinct normalized tags, in first-seen order, with blanks dropped"""
+    if not isinstance(tags, (list, tuple)):
+        return []
+    seen = {}
+    for tag in tags:
+        name = normalize_tag(tag)
+        if name:
+            seen.setdefault(name[:100], None)
+    return list(seen)
+
+
+def _index_for(model):
+    """(tag entry model, foreign key name) for an indexed model"""
+    from synnovator.hackathons.models import HackathonPage, HackathonTag, Quest, QuestTag
+
+    if issubclass(model, HackathonPage):
+        return HackathonTag, 'hackathon'
+    if issubclass(model, Quest):
+        return QuestTag, 'quest'
+    raise TypeError(f'{model.__name__} has no tag index')
+
+
+def sync_tags(instance):
+    """Make the instance's index rows match its JSON tags"""
+    entry_model, fk = _index_for(type(instance))
+    wanted = set(normalize_tags(instance.tags))
+    entries = entry_model.objects.filter(**{fk: instance})
+    existing = set(entries.values_list('name', flat=True))
+
+    with transaction.atomic():
+        if existing - wanted:
+            entries.filter(name__in=existing - wanted).delete()
+        entry_model.objects.bulk_create(
+            [entry_model(**{fk: instance, 'name': name}) for name in wanted - existing],
+            ignore_conflicts=True,
+        )
+
+
+def rebuild_tag_index(model):
+    """Rebuild every index row of `model` from the JSON tags; returns the row count"""
+    entry_model, fk = _index_for(model)
+    entries = [
+        entry_model(**{f'{fk}_id': pk, 'name': name})
+        for pk, tags in model.objects.values_list('pk', 'tags').iterator()
+        for name in normalize_tags(tags)
+    ]
+    with transaction.atomic():
+        entry_model.objects.all().delete()
+        entry_model.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def filter_by_tags(queryset, tags, match='all'):
+    """
+    Restrict `queryset` to objects carrying the given tags.
+
+    match='all' keeps objects having every tag, match='any' objects having at
+    least one. Matching is exact on the normalized tag.
+    """
+    names = normalize_tags(tags)
+    if not names:
+        return queryset
+    if match not in TAG_MATCH_MODES:
+        raise ValueError(f'Unknown tag match mode: {match}')
+
+    entry_model, fk = _index_for(queryset.model)
+    entries = entry_model.objects.filter(name__in=names)
+    if match == 'all' and len(names) > 1:
+        entries = (
+            entries.values(fk)
+            .annotate(matched=Count('name'))
+            .filter(matched=len(names))
+        )
+    return queryset.filter(pk__in=entries.values(fk))
+
+
+def tag_counts(queryset, limit=None):
+    """[{'name', 'count'}] over the objects in `queryset`, most used first"""
+    entry_model, fk = _index_for(queryset.model)
+    counts = (
+        entry_model.objects.filter(**{f'{fk}__in': queryset.values('pk')})
+        .values('name')
+        .annotate(count=Count('pk'))
+        .order_by('-count', 'name')
+    )
+    return list(counts[:limit] if limit else counts)
@@ -0,0 +1,277 @@
+"""
+Team formation matching.
+
+The team formation page used to load every user seeking a team, filter skills
+with OR'd icontains over the skills JSON and rebuild the skill vocabulary by
+scanning every user's skills on each request. SeekerIndex is instead built
+with one query into an inverted index: one bitset (a Python int, bit i = i-th
+seeker) per preferred role and normalized skill, over seekers ordered by XP.
+Role and skill filters are then bitwise operations, the vocabulary is a
+precomputed list, and only the displayed page of users is loaded.
+
+Seekers and recruiting teams are ranked by compatibility(): how much of what
+a team is missing (required roles, skills) the user would bring. Recruiting
+teams get the same treatment as seekers: TeamIndex holds each team's needed
+roles, member skills and leaders, built with two queries, so ranking them for
+a user needs no team rows and only the displayed page of teams is loaded.
+
+Both indexes are memoized per worker process and shared through the cache,
+keyed by versions bumped whenever an indexed User, Team, TeamMember or
+HackathonPage field changes (see signals).
+"""
+import uuid
+
+from django.core.cache import cache
+
+from synnovator.hackathons.quest_catalog import _iter_bits
+from synnovator.hackathons.tags import normalize_tag, normalize_tags
+
+
+INDEX_CACHE_TIMEOUT = 60 * 60 * 24
+
+SEEKER_INDEX_VERSION_KEY = 'hackathons:seeker_index:version'
+
+TEAM_INDEX_VERSION_KEY = 'hackathons:team_index:version'
+
+# User fields the seeker index is built from; saves touching none of them keep it
+INDEXED_USER_FIELDS = frozenset({'is_seeking_team', 'preferred_role', 'skills', 'xp_points'})
+
+# Fields the team index is built from, per model
+INDEXED_TEAM_FIELDS = frozenset({'hackathon', 'is_seeking_members', 'status', 'created_at'})
+INDEXED_MEMBER_FIELDS = frozenset({'team', 'user', 'role', 'is_leader'})
+INDEXED_MEMBER_USER_FIELDS = frozenset({'skills'})
+INDEXED_HACKATHON_FIELDS = frozenset({'required_roles'})
+
+# Compatibility weights: filling a missing required role, bringing new skills
+ROLE_WEIGHT = 60
+SKILL_WEIGHT = 40
+
+# Role of users who are happy to fill whichever role a team is missing
+FLEXIBLE_ROLE = 'any'
+
+# Index name -> (version, index) for this worker process
+_local_indexes = {}
+
+
+def compatibility(role, skills, needed_roles, team_skills):
+    """
+    0-100 fit of a user (`role`, normalized `skills`) for a team.
+
+    Up to ROLE_WEIGHT for filling one of the team's `needed_roles` (half for
+    a flexible user), plus SKILL_WEIGHT scaled by the share of the user's
+    skills that no current member has.
+    """
+    score = 0.0
+    if needed_roles:
+        if role in needed_roles:
+            score += ROLE_WEIGHT
+        elif role == FLEXIBLE_ROLE:
+            score += ROLE_WEIGHT / 2
+    if skills:
+        score += SKILL_WEIGHT * len(set(skills) - set(team_skills)) / len(skills)
+    return round(score, 1)
+
+
+def needed_roles(required_roles, member_roles):
+    """Required roles no member has, in the hackathon's order"""
+    present = set(member_roles)
+    return [role for role in required_roles or [] if role not in present]
+
+
+class SeekerIndex:
+    """Inverted role/skill index over users seeking a team, highest XP first."""
+
+    def __init__(self, rows):
+        """`rows` are (pk, is_seeking_team, preferred_role, skills) ordered by XP descending"""
+        self.ids = []
+        self.roles = []
+        self.skills = []
+        self.all_bits = 0
+        self.role_bits = {}
+        self.skill_bits = {}
+        vocabulary = {}
+
+        for pk, is_seeking, role, skills in rows:
+            if isinstance(skills, list):
+                for skill in skills:
+                    if isinstance(skill, str) and skill.strip():
+                        vocabulary.setdefault(normalize_tag(skill), skill.strip())
+            if not is_seeking:
+                continue
+            bit = 1 << len(self.ids)
+            normalized = normalize_tags(skills)
+            self.ids.append(pk)
+            self.roles.append(role)
+            self.skills.append(frozenset(normalized))
+            self.all_bits |= bit
+            self.role_bits[role] = self.role_bits.get(role, 0) | bit
+            for skill in normalized:
+                self.skill_bits[skill] = self.skill_bits.get(skill, 0) | bit
+
+        # Display form of each skill as first entered, sorted case-insensitively
+        self.vocabulary = [vocabulary[name] for name in sorted(vocabulary)]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, roles=(), skills=()):
+        """Bitset of seekers with any of `roles` and any of `skills` (either may be empty)"""
+        bits = self.all_bits
+        if roles:
+            mask = 0
+            for role in roles:
+                mask |= self.role_bits.get(role, 0)
+            bits &= mask
+        if skills:
+            mask = 0
+            for skill in normalize_tags(list(skills)):
+                mask |= self.skill_bits.get(skill, 0)
+            bits &= mask
+        return bits
+
+    def rank(self, bits, skills=(), team=None, exclude=()):
+        """
+        Seeker ids in `bits`, best match first.
+
+        With a `team` as (needed_roles, team_skills), seekers are ordered by
+        compatibility() with it; otherwise by how many of the wanted `skills`
+        they have. Ties keep the XP order.
+        """
+        wanted = set(normalize_tags(list(skills)))
+        scored = []
+        for position in _iter_bits(bits):
+            pk = self.ids[position]
+            if pk in exclude:
+                continue
+            if team is not None:
+                score = compatibility(self.roles[position], self.skills[position], *team)
+            else:
+                score = len(wanted & self.skills[position])
+            scored.append((-score, position, pk))
+        scored.sort()
+        return [pk for _score, _position, pk in scored]
+
+
+class TeamIndex:
+    """Needed roles, member skills and leaders of recruiting teams, newest first."""
+
+    def __init__(self, teams, members):
+        """
+        `teams` are (pk, hackathon_id, required_roles) ordered newest first,
+        `members` are (team_id, user_id, role, is_leader, skills).
+        """
+        roles = {}
+        skills = {}
+        leaders = {}
+        for team_id, user_id, role, is_leader, member_skills in members:
+            roles.setdefault(team_id, []).append(role)
+            skills.setdefault(team_id, set()).update(normalize_tags(member_skills))
+            if is_leader:
+                leaders.setdefault(team_id, set()).add(user_id)
+
+        self.ids = []
+        self.hackathon_ids = []
+        self.profiles = []
+        self.leaders = []
+        for pk, hackathon_id, required_roles in teams:
+            self.ids.append(pk)
+            self.hackathon_ids.append(hackathon_id)
+            self.profiles.append((
+                needed_roles(required_roles, roles.get(pk, ())), frozenset(skills.get(pk, ()))
+            ))
+            self.leaders.append(frozenset(leaders.get(pk, ())))
+        self.positions = {pk: position for position, pk in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, hackathon_id=None):
+        """Positions of the teams in `hackathon_id` (all teams without one), newest first"""
+        if hackathon_id is None:
+            return list(range(len(self.ids)))
+        return [position for position, team_hackathon in enumerate(self.hackathon_ids)
+                if team_hackathon == hackathon_id]
+
+    def led_team(self, positions, user_id):
+        """(needed_roles, team_skills) of the newest team in `positions` led by `user_id`"""
+        for position in positions:
+            if user_id in self.leaders[position]:
+                return self.profiles[position]
+        return None
+
+    def profile(self, pk):
+        """(needed_roles, team_skills) of team `pk`"""
+        return self.profiles[self.positions[pk]]
+
+    def rank(self, positions, role=None, skills=None):
+        """
+        Team ids at `positions`, by compatibility() with a user's `role` and
+        normalized `skills` when given. Ties keep the newest-first order.
+        """
+        if skills is None:
+            return [self.ids[position] for position in positions]
+        scored = sorted(
+            (-compatibility(role, skills, *self.profiles[position]), position) for position in positions
+        )
+        return [self.ids[position] for _score, position in scored]
+
+
+def bump_seeker_index_version():
+    cache.set(SEEKER_INDEX_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def bump_team_index_version():
+    cache.set(TEAM_INDEX_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def build_seeker_index():
+    """Load seekers and the skill vocabulary into a SeekerIndex with one query"""
+    from django.contrib.auth import get_user_model
+
+    users = get_user_model().objects.exclude(is_seeking_team=False, skills=[])
+    return SeekerIndex(
+        users.order_by('-xp_points', 'pk').values_list('pk', 'is_seeking_team', 'preferred_role', 'skills')
+    )
+
+
+def build_team_index():
+    """Load recruiting teams and their members into a TeamIndex with two queries"""
+    from synnovator.hackathons.models import Team, TeamMember
+
+    recruiting = {'is_seeking_members': True, 'status': 'forming'}
+    teams = Team.objects.filter(**recruiting).order_by('-created_at', 'pk')
+    members = TeamMember.objects.filter(**{f'team__{field}': value for field, value in recruiting.items()})
+    return TeamIndex(
+        teams.values_list('pk', 'hackathon_id', 'hackathon__required_roles'),
+        members.values_list('team_id', 'user_id', 'role', 'is_leader', 'user__skills'),
+    )
+
+
+def _get_index(name, version_key, build):
+    """The current `name` index: worker memo, then cache, then `build()`"""
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(version_key, version, None)
+
+    memo = _local_indexes.get(name)
+    if memo is not None and memo[0] == version:
+        return memo[1]
+
+    key = f'hackathons:{name}:{version}'
+    index = cache.get(key)
+    if index is None:
+        index = build()
+        cache.set(key, index, INDEX_CACHE_TIMEOUT)
+    _local_indexes[name] = (version, index)
+    return index
+
+
+def get_seeker_index():
+    """The current seeker index"""
+    return _get_index('seeker_index', SEEKER_INDEX_VERSION_KEY, build_seeker_index)
+
+
+def get_team_index():
+    """The current recruiting team index"""
+    return _get_index('team_index', TEAM_INDEX_VERSION_KEY, build_team_index)
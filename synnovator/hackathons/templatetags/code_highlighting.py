@@ -0,0 +1,12 @@
+from django import template
+
+from synnovator.hackathons.highlighting import render_code
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def highlighted_code(code_block):
+    """Highlighted HTML of a code_block value, computed at publish time"""
+    return render_code(code_block['language'], code_block['code'])
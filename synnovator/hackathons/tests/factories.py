@@ -11,6 +11,7 @@ from wagtail.models import Page
 from synnovator.hackathons.models import (
     HackathonIndexPage,
     HackathonPage,
+    JudgeScore,
     Phase,
     Prize,
     Quest,
@@ -293,6 +294,19 @@ class VerifiedSubmissionFactory(SubmissionFactory):
     verified_by = factory.SubFactory(UserFactory)
 
 
+class JudgeScoreFactory(DjangoModelFactory):
+    """Factory for JudgeScore on a verified team submission."""
+
+    class Meta:
+        model = JudgeScore
+
+    submission = factory.SubFactory(TeamSubmissionFactory, verification_status="verified")
+    judge = factory.SubFactory(UserFactory)
+    technical_score = 80
+    commercial_score = 70
+    operational_score = 60
+
+
 class SubmissionIndexPageFactory(DjangoModelFactory):
     """Factory for SubmissionIndexPage."""
 
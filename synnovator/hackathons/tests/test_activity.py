@@ -0,0 +1,108 @@
+"""
+Tests for the append-only activity feed.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from synnovator.hackathons import activity
+from synnovator.hackathons.advancement import advance_phase
+from synnovator.hackathons.models import ActivityEvent, HackathonRegistration
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    LeaderTeamMemberFactory,
+    PhaseFactory,
+    QuestFactory,
+    SubmissionFactory,
+    TeamFactory,
+    TeamMemberFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+def _verbs(**kwargs):
+    return [event.verb for event in activity.feed(**kwargs)[0]]
+
+
+@pytest.mark.django_db
+class TestActivityRecording:
+    """Events are appended as things happen."""
+
+    def test_submission_and_verification(self):
+        quest = QuestFactory(title="Build an API")
+        submission = SubmissionFactory(quest=quest)
+
+        submission.verification_status = "verified"
+        submission.save()
+        submission.save()  # re-saving a verified submission adds nothing
+
+        events = activity.feed(actor=submission.user)[0]
+        assert [e.verb for e in events] == ["verified", "submitted"]
+        assert [e.user_action for e in events] == ["Completed Build an API", "Submitted to Build an API"]
+
+    def test_team_submission_is_attributed_to_leader(self):
+        team = TeamFactory()
+        leader = LeaderTeamMemberFactory(team=team).user
+        SubmissionFactory(user=None, team=team)
+
+        event = ActivityEvent.objects.get(verb="submitted")
+        assert (event.actor, event.team) == (leader, team)
+
+    def test_join_and_registration(self):
+        member = TeamMemberFactory(role="hipster")
+        HackathonRegistration.objects.create(hackathon=member.team.hackathon, user=member.user)
+
+        events = activity.feed(actor=member.user)[0]
+        assert [e.user_action for e in events] == [
+            f"Registered for {member.team.hackathon.title}",
+            f"Joined team {member.team.name}",
+        ]
+        assert events[1].team_action == "joined the team as Hipster (Designer/UX)"
+
+    def test_advancement(self):
+        hackathon = HackathonPageFactory()
+        phase = PhaseFactory(hackathon=hackathon, order=1, title="Qualifiers")
+        PhaseFactory(hackathon=hackathon, order=2, title="Finals")
+        winner = TeamFactory(hackathon=hackathon, final_score=Decimal("90"), status="ready")
+        loser = TeamFactory(hackathon=hackathon, final_score=Decimal("10"), status="ready")
+
+        advance_phase(phase, top_n=1, notify=False)
+
+        assert activity.feed(team=winner)[0][0].team_action == "advanced to Finals"
+        assert activity.feed(team=loser)[0][0].team_action == "was eliminated from Qualifiers"
+        assert sorted(_verbs(hackathon=hackathon)) == ["advanced", "eliminated"]
+
+
+@pytest.mark.django_db
+class TestFeedPagination:
+    def test_keyset_pages_cover_every_event_once(self):
+        team = TeamFactory()
+        now = timezone.now()
+        ActivityEvent.objects.bulk_create([
+            # Pairs share a timestamp, so the id breaks ties
+            ActivityEvent(verb="submitted", team=team, target=f"Quest {i}", created_at=now - timedelta(hours=i // 2))
+            for i in range(7)
+        ])
+
+        seen, cursor = [], None
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                events, cursor = activity.feed(team=team, cursor=cursor, limit=3)
+            assert len(queries) == 1
+            seen.extend(events)
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert len({event.pk for event in seen}) == 7
+        assert seen == sorted(seen, key=lambda e: (e.created_at, e.pk), reverse=True)
+
+    def test_malformed_cursor_starts_from_newest(self):
+        user = UserFactory()
+        ActivityEvent.objects.create(verb="registered", actor=user, target="Hack")
+        assert _verbs(actor=user, cursor="nonsense") == ["registered"]
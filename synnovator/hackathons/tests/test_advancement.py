@@ -0,0 +1,137 @@
+"""
+Tests for the batch phase-advancement engine.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.advancement import advance_phase, apply_advancement, plan_advancement
+from synnovator.hackathons.models import AdvancementLog, Team
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    LeaderTeamMemberFactory,
+    PhaseFactory,
+    QuestFactory,
+    SubmissionFactory,
+    TeamFactory,
+)
+from synnovator.notifications.models import Notification
+
+
+def _complete(team, quest):
+    SubmissionFactory(user=None, team=team, quest=quest, verification_status="verified")
+
+
+@pytest.fixture
+def setup(db):
+    hackathon = HackathonPageFactory()
+    phase = PhaseFactory(hackathon=hackathon, order=1)
+    next_phase = PhaseFactory(hackathon=hackathon, order=2)
+    quests = [QuestFactory(), QuestFactory()]
+    phase.required_quests.set(quests)
+
+    teams = {}
+    for name, score in (("Alpha", "90"), ("Beta", "80"), ("Gamma", "80"), ("Delta", "60")):
+        teams[name] = TeamFactory(hackathon=hackathon, name=name, final_score=Decimal(score), status="ready")
+        for quest in quests:
+            _complete(teams[name], quest)
+    teams["Lazy"] = TeamFactory(hackathon=hackathon, name="Lazy", final_score=Decimal("99"), status="ready")
+    _complete(teams["Lazy"], quests[0])
+    TeamFactory(hackathon=hackathon, name="Out", status="eliminated")
+    return phase, next_phase, teams
+
+
+def _decisions(plan):
+    return {d.team.name: d.advance for d in plan.decisions}
+
+
+@pytest.mark.django_db
+class TestPlanAdvancement:
+    """plan_advancement() evaluates every team in a constant number of queries."""
+
+    def test_quest_completion_is_required(self, setup):
+        phase, _next_phase, _teams = setup
+
+        plan = plan_advancement(phase)
+
+        assert _decisions(plan) == {"Lazy": False, "Alpha": True, "Beta": True, "Gamma": True, "Delta": True}
+        assert plan.eliminated[0].reason == "Completed 1 of 2 required quests"
+
+    def test_top_n_keeps_boundary_ties(self, setup):
+        phase, _next_phase, _teams = setup
+
+        plan = plan_advancement(phase, top_n=2)
+
+        assert [d.team.name for d in plan.advanced] == ["Alpha", "Beta", "Gamma"]
+        assert {d.team.name: d.reason for d in plan.eliminated}["Delta"] == "Ranked 4, outside top 2"
+
+    def test_min_score(self, setup):
+        phase, _next_phase, _teams = setup
+        plan = plan_advancement(phase, min_score=Decimal("85"))
+        assert [d.team.name for d in plan.advanced] == ["Alpha"]
+
+    def test_query_count(self, setup):
+        phase, _next_phase, _teams = setup
+
+        with CaptureQueriesContext(connection) as queries:
+            plan_advancement(phase)
+
+        # teams, required quests, completions, next phase
+        assert len(queries) == 4
+
+    def test_diff(self, setup):
+        phase, _next_phase, _teams = setup
+
+        lines = plan_advancement(phase, top_n=1).diff()
+
+        assert "+ Alpha: ready -> advanced (round 1 -> 2, score 90.00)" in lines
+        assert "- Beta: ready -> eliminated (Ranked 2, outside top 1)" in lines
+
+
+@pytest.mark.django_db
+class TestApplyAdvancement:
+    def test_updates_teams_logs_and_notifies(self, setup):
+        phase, next_phase, teams = setup
+        leader = LeaderTeamMemberFactory(team=teams["Alpha"]).user
+        LeaderTeamMemberFactory(team=teams["Delta"])
+
+        plan = apply_advancement(plan_advancement(phase, top_n=3))
+
+        alpha, delta = Team.objects.get(name="Alpha"), Team.objects.get(name="Delta")
+        assert (alpha.status, alpha.current_round) == ("advanced", 2)
+        assert (delta.status, delta.current_round) == ("eliminated", 1)
+        assert delta.elimination_reason == "Ranked 4, outside top 3"
+        assert Team.objects.get(name="Out").status == "eliminated"
+
+        log = AdvancementLog.objects.get(team=alpha)
+        assert (log.from_phase, log.to_phase, log.decision) == (phase, next_phase, "advanced")
+        assert AdvancementLog.objects.count() == 5
+
+        assert plan.notifications_sent == 2
+        notification = Notification.objects.get(recipient=leader)
+        assert notification.metadata == {"team_id": alpha.pk, "advancement_log_id": log.pk, "decision": "advanced"}
+
+    def test_dry_run_writes_nothing(self, setup):
+        phase, _next_phase, _teams = setup
+
+        plan = advance_phase(phase, dry_run=True)
+
+        assert plan.advanced
+        assert not AdvancementLog.objects.exists()
+        assert not Team.objects.filter(status="advanced").exists()
+
+    def test_command_is_dry_run_by_default(self, setup, capsys):
+        phase, _next_phase, _teams = setup
+
+        call_command("advance_phase", phase.pk, top=1)
+        out = capsys.readouterr().out
+        assert "- Beta: ready -> eliminated" in out
+        assert "Dry run" in out
+        assert not AdvancementLog.objects.exists()
+
+        call_command("advance_phase", phase.pk, top=1, apply=True)
+        assert Team.objects.filter(status="advanced").count() == 1
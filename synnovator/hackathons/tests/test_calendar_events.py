@@ -0,0 +1,143 @@
+"""
+Tests for the cached calendar events API.
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from synnovator.hackathons import calendar_events
+from synnovator.hackathons.tests.factories import (
+    ActivePhaseFactory,
+    FuturePhaseFactory,
+    HackathonPageFactory,
+    PastPhaseFactory,
+)
+
+
+URL = reverse("hackathons:calendar_events")
+
+
+def _events(response):
+    return json.loads(b"".join(response.streaming_content) if response.streaming else response.content)
+
+
+@pytest.mark.django_db
+class TestCalendarEventsApi:
+    """The calendar endpoint serves cached documents with validators."""
+
+    def test_lists_phase_events(self, client):
+        hackathon = HackathonPageFactory(title="AI Sprint")
+        phase = ActivePhaseFactory(hackathon=hackathon, title="Hacking")
+
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        events = _events(response)
+        assert events == [{
+            "id": f"phase-{phase.pk}",
+            "title": "AI Sprint: Hacking",
+            "start": phase.start_date.isoformat(),
+            "end": phase.end_date.isoformat(),
+            "description": phase.description,
+            "url": hackathon.url,
+            "extendedProps": {
+                "hackathon_id": hackathon.pk,
+                "hackathon_title": "AI Sprint",
+                "phase_id": phase.pk,
+                "phase_title": "Hacking",
+                "requirements": phase.requirements,
+            },
+        }]
+
+    def test_filters_by_range_and_hackathon(self, client):
+        hackathon, other = HackathonPageFactory(), HackathonPageFactory()
+        active = ActivePhaseFactory(hackathon=hackathon)
+        PastPhaseFactory(hackathon=hackathon)
+        FuturePhaseFactory(hackathon=hackathon)
+        ActivePhaseFactory(hackathon=other)
+
+        now = timezone.now()
+        response = client.get(URL, {
+            "start": (now - timedelta(hours=1)).isoformat(),
+            "end": (now + timedelta(hours=1)).isoformat(),
+            "hackathon_id": hackathon.pk,
+        })
+
+        assert [e["extendedProps"]["phase_id"] for e in _events(response)] == [active.pk]
+
+    def test_accepts_plain_dates(self, client):
+        ActivePhaseFactory()
+        today = timezone.now().date()
+        response = client.get(URL, {"start": str(today - timedelta(days=1)), "end": str(today + timedelta(days=1))})
+        assert len(_events(response)) == 1
+
+    def test_invalid_parameters(self, client):
+        assert client.get(URL, {"start": "yesterday"}).status_code == 400
+        assert client.get(URL, {"hackathon_id": "abc"}).status_code == 400
+
+    def test_conditional_get_returns_304_without_phase_queries(self, client):
+        ActivePhaseFactory()
+        etag = client.get(URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert not any("hackathons_phase" in q["sql"] for q in queries.captured_queries)
+
+    def test_cached_document_skips_phase_queries(self, client):
+        ActivePhaseFactory()
+        client.get(URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(URL)
+
+        assert response.status_code == 200
+        assert not any("hackathons_phase" in q["sql"] for q in queries.captured_queries)
+
+    def test_phase_change_invalidates(self, client):
+        phase = ActivePhaseFactory(title="Before")
+        etag = client.get(URL)["ETag"]
+
+        phase.title = "After"
+        phase.save()
+        response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert _events(response)[0]["extendedProps"]["phase_title"] == "After"
+
+    def test_hackathon_change_invalidates(self, client):
+        phase = ActivePhaseFactory()
+        etag = client.get(URL)["ETag"]
+
+        phase.hackathon.title = "Renamed"
+        phase.hackathon.save_revision().publish()
+
+        response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert _events(response)[0]["title"].startswith("Renamed:")
+
+    def test_large_ranges_are_streamed(self, client, monkeypatch):
+        monkeypatch.setattr(calendar_events, "STREAMING_THRESHOLD", 1)
+        hackathon = HackathonPageFactory()
+        ActivePhaseFactory(hackathon=hackathon)
+        FuturePhaseFactory(hackathon=hackathon)
+
+        response = client.get(URL)
+
+        assert response.streaming
+        assert len(_events(response)) == 2
+
+
+class TestStreamJsonArray:
+    def test_joins_encoded_items(self):
+        assert b"".join(calendar_events.stream_json_array([b"1", b'{"a":2}'])) == b'[1,{"a":2}]'
+        assert b"".join(calendar_events.stream_json_array([])) == b"[]"
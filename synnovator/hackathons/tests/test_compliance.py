@@ -0,0 +1,135 @@
+"""
+Tests for the set-based rule compliance engine.
+"""
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.compliance import evaluate_hackathon, sweep_hackathon
+from synnovator.hackathons.models import CompetitionRule, RuleViolation
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    TeamFactory,
+    TeamMemberFactory,
+    TeamSubmissionFactory,
+)
+
+
+def _rule(hackathon, rule_type, definition=None, **kwargs):
+    return CompetitionRule.objects.create(
+        hackathon=hackathon,
+        rule_type=rule_type,
+        title=rule_type,
+        description="",
+        rule_definition=definition or {},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def ruled_hackathon(db):
+    hackathon = HackathonPageFactory()
+    _rule(hackathon, "team_size", {"min_members": 2, "max_members": 3})
+    _rule(hackathon, "team_composition", {"required_roles": ["hacker", "hustler"]})
+    _rule(hackathon, "submission_format")
+    _rule(hackathon, "conduct")
+    return hackathon
+
+
+def _failures(report):
+    return {(f.team_id, f.rule.rule_type): f.message for f in report.failures}
+
+
+@pytest.mark.django_db
+class TestEvaluateHackathon:
+    """evaluate_hackathon() matches check_compliance() for every team."""
+
+    def test_matches_per_team_checks(self, ruled_hackathon):
+        compliant = TeamFactory(hackathon=ruled_hackathon)
+        TeamMemberFactory(team=compliant, role="hacker")
+        TeamMemberFactory(team=compliant, role="hustler")
+        TeamSubmissionFactory(team=compliant)
+        lonely = TeamFactory(hackathon=ruled_hackathon)
+        TeamMemberFactory(team=lonely, role="hacker")
+        TeamSubmissionFactory(team=lonely, verification_status="rejected")
+        empty = TeamFactory(hackathon=ruled_hackathon)
+
+        report = evaluate_hackathon(ruled_hackathon)
+
+        expected = {}
+        for team in (compliant, lonely, empty):
+            for rule in ruled_hackathon.rules.all():
+                ok, message = rule.check_compliance(team)
+                if not ok:
+                    expected[(team.pk, rule.rule_type)] = message
+        assert _failures(report) == expected
+        assert (lonely.pk, "team_size") in expected
+        assert expected[(lonely.pk, "team_composition")] == "Missing required roles: hustler"
+        assert (empty.pk, "submission_format") in expected
+        assert report.teams_checked == 3
+        assert report.rules_checked == 3
+
+    def test_query_count_is_independent_of_team_count(self, ruled_hackathon):
+        for _ in range(5):
+            TeamMemberFactory(team=TeamFactory(hackathon=ruled_hackathon))
+
+        with CaptureQueriesContext(connection) as queries:
+            evaluate_hackathon(ruled_hackathon)
+
+        # rules, member counts, roles, submissions
+        assert len(queries) == 4
+
+    def test_other_hackathons_are_ignored(self, ruled_hackathon):
+        TeamFactory()
+        assert evaluate_hackathon(ruled_hackathon).teams_checked == 0
+
+
+@pytest.mark.django_db
+class TestSweepHackathon:
+    """sweep_hackathon() records violations in bulk without duplicates."""
+
+    def test_records_automated_violations(self, ruled_hackathon):
+        team = TeamFactory(hackathon=ruled_hackathon)
+
+        report = sweep_hackathon(ruled_hackathon)
+
+        violations = RuleViolation.objects.filter(team=team)
+        assert report.violations_created == 3
+        assert violations.count() == 3
+        assert set(violations.values_list("detection_method", flat=True)) == {"automated"}
+        assert "No valid submission found" in violations.values_list("description", flat=True)
+
+    def test_pending_violations_are_not_duplicated(self, ruled_hackathon):
+        TeamFactory(hackathon=ruled_hackathon)
+        sweep_hackathon(ruled_hackathon)
+
+        report = sweep_hackathon(ruled_hackathon)
+
+        assert report.violations_created == 0
+        assert report.duplicates_skipped == 3
+        assert RuleViolation.objects.count() == 3
+
+    def test_dismissed_violations_are_reopened(self, ruled_hackathon):
+        TeamFactory(hackathon=ruled_hackathon)
+        sweep_hackathon(ruled_hackathon)
+        RuleViolation.objects.update(status="dismissed")
+
+        assert sweep_hackathon(ruled_hackathon).violations_created == 3
+
+    def test_dry_run_writes_nothing(self, ruled_hackathon):
+        TeamFactory(hackathon=ruled_hackathon)
+
+        report = sweep_hackathon(ruled_hackathon, dry_run=True)
+
+        assert report.violations_created == 3
+        assert not RuleViolation.objects.exists()
+
+    def test_command(self, ruled_hackathon, capsys):
+        TeamFactory(hackathon=ruled_hackathon)
+
+        call_command("check_rule_compliance", hackathon=ruled_hackathon.pk)
+
+        assert "3 violations recorded" in capsys.readouterr().out
+        assert RuleViolation.objects.count() == 3
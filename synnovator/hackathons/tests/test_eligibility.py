@@ -0,0 +1,125 @@
+"""
+Tests for batched submission eligibility.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.community.tests.factories import TeamMembershipFactory, TeamProfilePageFactory
+from synnovator.hackathons.eligibility import SubmissionEligibility
+from synnovator.hackathons.models import TeamRegistration
+from synnovator.hackathons.tests.factories import (
+    ActivePhaseFactory,
+    HackathonPageFactory,
+    SubmissionIndexPageFactory,
+    SubmissionPageFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def strict_hackathon(db):
+    return HackathonPageFactory(
+        submission_type="team",
+        require_registration=True,
+        max_submissions_per_participant=1,
+        restrict_to_submission_phase=True,
+        status="in_progress",
+    )
+
+
+def _register(hackathon, team, status="approved"):
+    return TeamRegistration.objects.create(hackathon=hackathon, team_profile=team, status=status)
+
+
+def _submit(hackathon, index, **kwargs):
+    submission = SubmissionPageFactory(parent=index, **kwargs)
+    submission.hackathons.add(hackathon)
+    return submission
+
+
+class TestForTeams:
+    """for_teams() evaluates every team with a fixed number of queries."""
+
+    def test_results_per_team(self, strict_hackathon, wagtail_root):
+        ActivePhaseFactory(hackathon=strict_hackathon, title="Hacking")
+        index = SubmissionIndexPageFactory(parent=wagtail_root)
+        ready, submitted, pending = (TeamProfilePageFactory() for _ in range(3))
+        _register(strict_hackathon, ready)
+        _register(strict_hackathon, submitted)
+        _register(strict_hackathon, pending, status="pending")
+        _submit(strict_hackathon, index, team_profile=submitted, submitter=None)
+
+        results = SubmissionEligibility(strict_hackathon).for_teams([ready, submitted, pending])
+
+        assert results[ready.pk] == (True, "")
+        assert results[submitted.pk][0] is False
+        assert "maximum" in results[submitted.pk][1].lower()
+        assert "register" in results[pending.pk][1].lower()
+
+    def test_matches_can_submit(self, strict_hackathon):
+        teams = [TeamProfilePageFactory() for _ in range(3)]
+        _register(strict_hackathon, teams[0])
+
+        results = SubmissionEligibility(strict_hackathon).for_teams(teams)
+
+        for team in teams:
+            assert results[team.pk] == strict_hackathon.can_submit(team_profile=team)
+
+    def test_query_count_does_not_grow_with_teams(self, strict_hackathon):
+        teams = [TeamProfilePageFactory() for _ in range(8)]
+        for team in teams:
+            _register(strict_hackathon, team)
+        strict_hackathon.get_current_phase()
+
+        with CaptureQueriesContext(connection) as few:
+            SubmissionEligibility(strict_hackathon).for_teams(teams[:2])
+        with CaptureQueriesContext(connection) as many:
+            SubmissionEligibility(strict_hackathon).for_teams(teams)
+
+        assert len(many) == len(few) == 2
+
+    def test_individual_hackathon_needs_no_queries(self, db):
+        hackathon = HackathonPageFactory(submission_type="individual", require_registration=True)
+        team = TeamProfilePageFactory()
+
+        with CaptureQueriesContext(connection) as queries:
+            allowed, reason = SubmissionEligibility(hackathon).for_teams([team])[team.pk]
+
+        assert allowed is False
+        assert "individual" in reason.lower()
+        assert len(queries) == 0
+
+
+class TestForUsers:
+    """for_users() checks registration through team membership."""
+
+    def test_registered_through_team(self, db):
+        hackathon = HackathonPageFactory(
+            submission_type="both", require_registration=True, restrict_to_submission_phase=False
+        )
+        member, outsider = UserFactory(), UserFactory()
+        team = TeamProfilePageFactory()
+        TeamMembershipFactory(team=team, user=member)
+        _register(hackathon, team)
+
+        results = SubmissionEligibility(hackathon).for_users([member, outsider])
+
+        assert results[member.pk] == (True, "")
+        assert results[outsider.pk][0] is False
+
+    def test_late_submission(self, db):
+        hackathon = HackathonPageFactory(
+            submission_type="individual",
+            require_registration=False,
+            restrict_to_submission_phase=True,
+            allow_late_submission=True,
+            status="judging",
+        )
+        user = UserFactory()
+
+        allowed, reason = SubmissionEligibility(hackathon).check(user=user)
+
+        assert allowed is True
+        assert "late" in reason.lower()
@@ -0,0 +1,101 @@
+"""
+Tests for publish-time syntax highlighting of submission code blocks.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management import call_command
+
+from synnovator.hackathons import highlighting
+from synnovator.hackathons.tests.factories import SubmissionIndexPageFactory, SubmissionPageFactory
+
+
+SNIPPET = "def greet(name):\n    return f'<{name}>'\n"
+
+
+@pytest.fixture
+def index(wagtail_root):
+    return SubmissionIndexPageFactory(parent=wagtail_root)
+
+
+def _publish(index, *codes, language="python"):
+    page = SubmissionPageFactory(parent=index, live=False)
+    page.content = [("code_block", {"language": language, "code": code}) for code in codes]
+    page.save_revision().publish()
+    page.refresh_from_db()
+    return page
+
+
+def _content_html(page, rf):
+    request = rf.get("/")
+    request.user = AnonymousUser()
+    return page.get_context(request)["content_html"]
+
+
+@pytest.fixture
+def highlight_calls(monkeypatch):
+    calls = []
+    highlight = highlighting.highlight
+
+    def counting(language, code):
+        calls.append(code)
+        return highlight(language, code)
+
+    monkeypatch.setattr(highlighting, "highlight", counting)
+    return calls
+
+
+@pytest.mark.django_db
+class TestHighlighting:
+    def test_highlighted_at_publish(self, index, rf, highlight_calls):
+        page = _publish(index, SNIPPET)
+        assert highlight_calls == [SNIPPET]
+
+        html = _content_html(page, rf)
+        assert '<span class="k">def</span>' in html
+        assert "&lt;" in html and "<{name}>" not in html
+
+    def test_identical_snippets_highlighted_once(self, index, highlight_calls):
+        _publish(index, SNIPPET, SNIPPET)
+        _publish(index, SNIPPET)
+
+        assert highlight_calls == [SNIPPET]
+
+    def test_other_language_is_plain_text(self):
+        assert highlighting.highlight("other", "a < b\n") == "a &lt; b\n"
+
+    def test_large_snippet_highlighted_in_background(
+        self, index, rf, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        monkeypatch.setattr(highlighting, "INLINE_HIGHLIGHT_CHARS", 10)
+        started = []
+        monkeypatch.setattr(highlighting, "start_background", lambda *args: started.append(args))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            page = _publish(index, SNIPPET)
+
+        # Plain until the background job has run
+        assert '<span class="k">' not in _content_html(page, rf)
+        assert started == [(page.pk, page.live_revision_id, [("python", SNIPPET)])]
+
+        highlighting._highlight_in_background(*started[0])
+        assert '<span class="k">def</span>' in _content_html(page, rf)
+
+    def test_snippet_over_cap_is_never_highlighted(self, index, rf, monkeypatch, highlight_calls):
+        monkeypatch.setattr(highlighting, "MAX_HIGHLIGHT_CHARS", 10)
+
+        page = _publish(index, SNIPPET)
+
+        assert highlight_calls == []
+        assert "def greet(name):" in _content_html(page, rf)
+
+    def test_command_backfills(self, index, monkeypatch, highlight_calls):
+        page = _publish(index, SNIPPET)
+        cache.clear()
+        highlight_calls.clear()
+
+        call_command("highlight_code_blocks", page=[page.pk])
+
+        assert highlight_calls == [SNIPPET]
+        assert cache.get(highlighting._key("python", SNIPPET))
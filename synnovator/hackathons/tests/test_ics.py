@@ -0,0 +1,130 @@
+"""
+Tests for iCalendar phase feeds.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from synnovator.hackathons import ics
+from synnovator.hackathons.tests.factories import (
+    ActivePhaseFactory,
+    FuturePhaseFactory,
+    HackathonPageFactory,
+)
+
+
+def _body(response):
+    return b"".join(response.streaming_content) if response.streaming else response.content
+
+
+class TestFormatting:
+    """RFC 5545 text helpers."""
+
+    def test_escape_text(self):
+        assert ics.escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+    def test_fold_line(self):
+        folded = ics.fold_line("SUMMARY:" + "x" * 100)
+        lines = folded.split(b"\r\n")
+        assert len(lines[0]) == 75
+        assert lines[1].startswith(b" ")
+        assert b"".join(line.lstrip(b" ") for line in lines) == b"SUMMARY:" + b"x" * 100
+
+    def test_fold_line_keeps_utf8_sequences(self):
+        folded = ics.fold_line("SUMMARY:" + "黑客松" * 30)
+        for line in folded.split(b"\r\n"):
+            line.decode("utf-8")
+            assert len(line) <= 75
+
+    def test_format_datetime(self):
+        value = datetime(2026, 3, 1, 9, 30, tzinfo=dt_timezone.utc)
+        assert ics.format_datetime(value) == "20260301T093000Z"
+
+
+@pytest.mark.django_db
+class TestFeeds:
+    """Global and per-hackathon .ics endpoints."""
+
+    def test_hackathon_feed(self, client):
+        hackathon = HackathonPageFactory(title="AI Sprint")
+        phase = ActivePhaseFactory(hackathon=hackathon, title="Hacking", description="Build, ship")
+
+        response = client.get(reverse("hackathons:hackathon_calendar_feed", args=[hackathon.pk]))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        body = _body(response).decode()
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert f"UID:hackathon-phase-{phase.pk}@synnovator" in body
+        assert "SUMMARY:AI Sprint: Hacking" in body
+        assert "DESCRIPTION:Build\\, ship" in body
+        assert f"DTSTART:{ics.format_datetime(phase.start_date)}" in body
+
+    def test_global_feed_includes_all_live_hackathons(self, client):
+        first, second = HackathonPageFactory(), HackathonPageFactory()
+        ActivePhaseFactory(hackathon=first)
+        FuturePhaseFactory(hackathon=second)
+        unpublished = HackathonPageFactory()
+        ActivePhaseFactory(hackathon=unpublished)
+        unpublished.unpublish()
+
+        body = _body(client.get(reverse("hackathons:calendar_feed"))).decode()
+
+        assert body.count("BEGIN:VEVENT") == 2
+
+    def test_unknown_hackathon(self, client, db):
+        response = client.get(reverse("hackathons:hackathon_calendar_feed", args=[999999]))
+        assert response.status_code == 404
+
+    def test_strong_etag_and_304(self, client):
+        hackathon = HackathonPageFactory()
+        ActivePhaseFactory(hackathon=hackathon)
+        url = reverse("hackathons:hackathon_calendar_feed", args=[hackathon.pk])
+
+        etag = client.get(url)["ETag"]
+        assert not etag.startswith("W/")
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+    def test_unchanged_hackathons_are_not_rerendered(self, client):
+        changed, unchanged = HackathonPageFactory(), HackathonPageFactory()
+        phase = ActivePhaseFactory(hackathon=changed)
+        ActivePhaseFactory(hackathon=unchanged)
+        client.get(reverse("hackathons:calendar_feed"))
+
+        phase.title = "Renamed phase"
+        phase.save()
+        with CaptureQueriesContext(connection) as queries:
+            body = _body(client.get(reverse("hackathons:calendar_feed"))).decode()
+
+        assert "Renamed phase" in body
+        phase_queries = [q["sql"] for q in queries.captured_queries if 'FROM "hackathons_phase"' in q["sql"]]
+        assert len(phase_queries) == 1
+        assert f"IN ({unchanged.pk}" not in phase_queries[0]
+
+    def test_phase_change_changes_etag(self, client):
+        hackathon = HackathonPageFactory()
+        phase = ActivePhaseFactory(hackathon=hackathon)
+        url = reverse("hackathons:hackathon_calendar_feed", args=[hackathon.pk])
+        etag = client.get(url)["ETag"]
+
+        phase.delete()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert b"BEGIN:VEVENT" not in _body(response)
+
+    def test_large_feeds_are_streamed(self, client, monkeypatch):
+        monkeypatch.setattr(ics, "ICS_STREAMING_THRESHOLD", 0)
+        ActivePhaseFactory()
+
+        response = client.get(reverse("hackathons:calendar_feed"))
+
+        assert response.streaming
+        assert _body(response).count(b"BEGIN:VEVENT") == 1
@@ -0,0 +1,145 @@
+"""
+Tests for balanced judge assignment.
+"""
+
+import random
+import time
+from collections import Counter
+
+import pytest
+from django.core.management import call_command
+
+from synnovator.hackathons import judge_assignment
+from synnovator.hackathons.judge_assignment import apply_assignments, plan_assignments
+from synnovator.hackathons.models import JudgeAssignment, JudgeScore
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    SubmissionFactory,
+    TeamMemberFactory,
+    TeamSubmissionFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def hackathon(db):
+    return HackathonPageFactory()
+
+
+@pytest.fixture
+def judges(db):
+    return UserFactory.create_batch(4)
+
+
+def _loads(hackathon):
+    return Counter(JudgeAssignment.objects.filter(hackathon=hackathon).values_list("judge_id", flat=True))
+
+
+def _judges_of(submission):
+    return set(submission.judge_assignments.values_list("judge_id", flat=True))
+
+
+@pytest.mark.django_db
+class TestPlanAssignments:
+    def test_every_submission_gets_k_judges_with_balanced_loads(self, hackathon, judges):
+        submissions = SubmissionFactory.create_batch(10, hackathon=hackathon)
+        SubmissionFactory(hackathon=hackathon, verification_status="rejected")
+        SubmissionFactory()  # another hackathon's
+
+        plan = apply_assignments(plan_assignments(hackathon, judges, per_submission=2))
+
+        assert plan.uncovered == {}
+        assert all(len(_judges_of(submission)) == 2 for submission in submissions)
+        loads = _loads(hackathon)
+        assert sum(loads.values()) == 20
+        assert max(loads.values()) - min(loads.values()) <= 1
+
+    def test_team_members_do_not_judge_their_submission(self, hackathon, judges):
+        # Linked to the hackathon through its team only
+        submission = TeamSubmissionFactory(team__hackathon=hackathon, hackathon=None)
+        TeamMemberFactory(team=submission.team, user=judges[0])
+        TeamMemberFactory(team=submission.team, user=judges[1])
+        own = SubmissionFactory(hackathon=hackathon, user=judges[2])
+
+        apply_assignments(plan_assignments(hackathon, judges, per_submission=2))
+
+        assert _judges_of(submission) == {judges[2].pk, judges[3].pk}
+        assert judges[2].pk not in _judges_of(own)
+
+    def test_cap_leaves_submissions_uncovered(self, hackathon, judges):
+        SubmissionFactory.create_batch(5, hackathon=hackathon)
+
+        plan = plan_assignments(hackathon, judges[:2], per_submission=1, max_per_judge=2)
+
+        assert len(plan.new) == 4
+        assert sum(plan.uncovered.values()) == 1
+        assert plan.loads == {judges[0].pk: 2, judges[1].pk: 2}
+
+    def test_rerun_only_fills_gaps(self, hackathon, judges):
+        first = SubmissionFactory(hackathon=hackathon)
+        apply_assignments(plan_assignments(hackathon, judges, per_submission=2))
+        scored = SubmissionFactory(hackathon=hackathon)
+        JudgeScore.objects.create(submission=scored, judge=judges[3])
+        new = SubmissionFactory(hackathon=hackathon)
+
+        plan = apply_assignments(plan_assignments(hackathon, judges, per_submission=2))
+
+        assert {submission_id for submission_id, _judge_id in plan.new} == {scored.pk, new.pk}
+        assert len(_judges_of(first)) == 2
+        assert len(_judges_of(scored)) == 1  # plus the judge who already scored it
+        assert judges[3].pk not in _judges_of(scored)
+
+    def test_release_reassigns_only_unscored_work(self, hackathon, judges):
+        submissions = SubmissionFactory.create_batch(8, hackathon=hackathon)
+        apply_assignments(plan_assignments(hackathon, judges, per_submission=2))
+        leaving = judges[0]
+        assigned = list(JudgeAssignment.objects.filter(judge=leaving).values_list("submission_id", flat=True))
+        JudgeScore.objects.create(submission_id=assigned[0], judge=leaving)
+        before = {submission.pk: _judges_of(submission) for submission in submissions}
+
+        plan = apply_assignments(plan_assignments(hackathon, judges, per_submission=2, release=[leaving]))
+
+        assert sorted(s for s, _j in plan.released) == sorted(assigned[1:])
+        assert {s for s, _j in plan.new} == set(assigned[1:])
+        assert list(JudgeAssignment.objects.filter(judge=leaving).values_list("submission_id", flat=True)) == [
+            assigned[0]
+        ]
+        for submission in submissions:
+            if submission.pk not in assigned[1:]:
+                assert _judges_of(submission) == before[submission.pk]
+            else:
+                assert len(_judges_of(submission)) == 2
+
+    def test_command_is_a_dry_run_without_apply(self, hackathon, judges, capsys):
+        SubmissionFactory.create_batch(3, hackathon=hackathon)
+        usernames = [arg for judge in judges for arg in ("--judge", judge.username)]
+
+        call_command("assign_judges", hackathon.pk, *usernames)
+        assert not JudgeAssignment.objects.exists()
+
+        call_command("assign_judges", hackathon.pk, *usernames, "--apply")
+        assert JudgeAssignment.objects.count() == 9
+        assert "9 assignments created" in capsys.readouterr().out
+
+
+class TestBalance:
+    def test_large_event_is_balanced_quickly(self):
+        rng = random.Random(7)
+        judge_ids = list(range(1, 201))
+        submissions = [
+            (submission_id, frozenset(rng.sample(judge_ids, 2)) if submission_id % 10 == 0 else frozenset())
+            for submission_id in range(20_000)
+        ]
+        loads = {}
+
+        started = time.perf_counter()
+        new, uncovered = judge_assignment.balance(submissions, judge_ids, 3, {}, loads)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 5
+        assert uncovered == {}
+        assert len(new) == 60_000
+        assert len(set(new)) == 60_000
+        assert max(loads.values()) - min(loads.values()) <= 1
+        conflicts = dict(submissions)
+        assert not any(judge_id in conflicts[submission_id] for submission_id, judge_id in new)
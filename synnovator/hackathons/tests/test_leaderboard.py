@@ -0,0 +1,178 @@
+"""
+Tests for the materialized hackathon leaderboard.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from synnovator.hackathons import leaderboard
+from synnovator.hackathons.models import LeaderboardEntry
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    JudgeScoreFactory,
+    TeamFactory,
+    TeamSubmissionFactory,
+)
+
+
+@pytest.fixture
+def team(db):
+    return TeamFactory(hackathon=HackathonPageFactory(), status="submitted")
+
+
+@pytest.fixture
+def verified_submission(team):
+    return TeamSubmissionFactory(team=team, verification_status="verified")
+
+
+class TestIncrementalUpdates:
+    """Score writes are folded into LeaderboardEntry as deltas."""
+
+    def test_score_creates_entry_and_updates_team(self, verified_submission):
+        JudgeScoreFactory(submission=verified_submission)
+        team = verified_submission.team
+        team.refresh_from_db()
+
+        entry = team.leaderboard_entry
+        assert entry.score_count == 1
+        assert entry.final_score == Decimal("70.00")
+        assert team.final_score == Decimal("70.00")
+        assert team.technical_score == Decimal("80.00")
+
+    def test_scores_are_averaged(self, verified_submission):
+        JudgeScoreFactory(submission=verified_submission)
+        JudgeScoreFactory(
+            submission=verified_submission,
+            technical_score=100, commercial_score=90, operational_score=80,
+        )
+        entry = LeaderboardEntry.objects.get(team=verified_submission.team)
+        assert entry.score_count == 2
+        assert entry.technical_score == Decimal("90.00")
+        assert entry.final_score == Decimal("80.00")
+
+    def test_score_update_applies_delta(self, verified_submission):
+        score = JudgeScoreFactory(submission=verified_submission)
+        score.technical_score = 20
+        score.save()
+
+        entry = LeaderboardEntry.objects.get(team=verified_submission.team)
+        assert entry.score_count == 1
+        assert entry.technical_score == Decimal("20.00")
+        assert entry.final_score == Decimal("50.00")
+
+    def test_delete_subtracts_score(self, verified_submission):
+        keep = JudgeScoreFactory(submission=verified_submission)
+        JudgeScoreFactory(submission=verified_submission, technical_score=0)
+        verified_submission.judge_scores.exclude(pk=keep.pk).delete()
+
+        entry = LeaderboardEntry.objects.get(team=verified_submission.team)
+        assert entry.score_count == 1
+        assert entry.technical_score == Decimal("80.00")
+
+    def test_unverified_submission_is_ignored(self, team):
+        submission = TeamSubmissionFactory(team=team, verification_status="pending")
+        JudgeScoreFactory(submission=submission)
+        assert not LeaderboardEntry.objects.filter(team=team).exists()
+
+    def test_verification_toggle_adds_and_removes(self, team):
+        submission = TeamSubmissionFactory(team=team, verification_status="pending")
+        JudgeScoreFactory(submission=submission)
+
+        submission.verification_status = "verified"
+        submission.save()
+        entry = LeaderboardEntry.objects.get(team=team)
+        assert entry.score_count == 1
+        assert entry.final_score == Decimal("70.00")
+
+        submission.verification_status = "rejected"
+        submission.save()
+        entry.refresh_from_db()
+        team.refresh_from_db()
+        assert entry.score_count == 0
+        assert team.final_score == Decimal("0.00")
+
+
+class TestRebuild:
+    """rebuild_leaderboard() recomputes entries from JudgeScore."""
+
+    def test_rebuild_matches_incremental(self, verified_submission):
+        JudgeScoreFactory(submission=verified_submission)
+        JudgeScoreFactory(
+            submission=verified_submission,
+            technical_score=55, commercial_score=65, operational_score=75,
+        )
+        hackathon = verified_submission.team.hackathon
+        incremental = LeaderboardEntry.objects.get(team=verified_submission.team)
+
+        LeaderboardEntry.objects.all().delete()
+        leaderboard.rebuild_leaderboard(hackathon)
+
+        rebuilt = LeaderboardEntry.objects.get(team=verified_submission.team)
+        assert rebuilt.score_count == incremental.score_count
+        assert rebuilt.technical_sum == incremental.technical_sum
+        assert rebuilt.final_score == incremental.final_score
+
+    def test_rebuild_zeroes_teams_without_scores(self, verified_submission):
+        JudgeScoreFactory(submission=verified_submission)
+        team = verified_submission.team
+        type(verified_submission).objects.filter(pk=verified_submission.pk).update(
+            verification_status="rejected"
+        )
+
+        leaderboard.rebuild_leaderboard(team.hackathon)
+        team.refresh_from_db()
+        assert not LeaderboardEntry.objects.filter(team=team).exists()
+        assert team.final_score == Decimal("0.00")
+
+    def test_rebuild_command(self, verified_submission):
+        JudgeScoreFactory(submission=verified_submission)
+        LeaderboardEntry.objects.all().delete()
+
+        call_command("rebuild_leaderboard", hackathon=verified_submission.team.hackathon.pk)
+        assert LeaderboardEntry.objects.filter(team=verified_submission.team).exists()
+
+
+class TestRanking:
+    """Ranks are read from LeaderboardEntry only."""
+
+    def _scored_team(self, hackathon, technical):
+        submission = TeamSubmissionFactory(
+            team=TeamFactory(hackathon=hackathon), verification_status="verified"
+        )
+        JudgeScoreFactory(
+            submission=submission,
+            technical_score=technical, commercial_score=technical, operational_score=technical,
+        )
+        return submission.team
+
+    def test_ties_share_rank(self, db):
+        hackathon = HackathonPageFactory()
+        top = self._scored_team(hackathon, 90)
+        tied_a = self._scored_team(hackathon, 80)
+        tied_b = self._scored_team(hackathon, 80)
+        last = self._scored_team(hackathon, 50)
+
+        ranks = {e.team_id: e.rank for e in leaderboard.get_ranked_entries(hackathon)}
+        assert ranks == {top.pk: 1, tied_a.pk: 2, tied_b.pk: 2, last.pk: 4}
+        assert leaderboard.get_team_rank(tied_b) == 2
+        assert leaderboard.get_team_rank(last) == 4
+
+    def test_unscored_team_has_no_rank(self, team):
+        assert leaderboard.get_team_rank(team) is None
+
+    def test_leaderboard_api(self, client, db):
+        hackathon = HackathonPageFactory()
+        top = self._scored_team(hackathon, 90)
+        self._scored_team(hackathon, 60)
+
+        url = reverse("hackathons:hackathon_leaderboard", args=[hackathon.pk])
+        response = client.get(url, {"limit": 1})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["entries"]) == 1
+        assert data["entries"][0]["team"]["id"] == top.pk
+        assert data["entries"][0]["rank"] == 1
+        assert data["entries"][0]["final_score"] == 90.0
@@ -0,0 +1,126 @@
+"""
+Tests for MinHash/LSH originality checks.
+"""
+
+import io
+import random
+import zipfile
+
+import pytest
+from django.core.files.base import ContentFile
+
+from synnovator.hackathons import originality
+from synnovator.hackathons.models import SignatureBucket, Submission
+from synnovator.hackathons.tests.factories import SubmissionFactory
+
+
+VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+def _text(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _edit(text, every=100):
+    """The same text with one word in `every` replaced"""
+    words = text.split()
+    return " ".join("changed" if i % every == 0 else word for i, word in enumerate(words))
+
+
+def _check(**kwargs):
+    submission = SubmissionFactory(**kwargs)
+    originality.check_submission(submission)
+    submission.refresh_from_db()
+    return submission
+
+
+class TestMinHash:
+    def test_signature_estimates_jaccard(self):
+        first = {f"s{i}" for i in range(0, 1000)}
+        second = {f"s{i}" for i in range(250, 1250)}  # Jaccard 750 / 1250 = 0.6
+
+        estimate = originality.similarity(originality.minhash(first), originality.minhash(second)[None, :])[0]
+
+        assert abs(estimate - 0.6) < 0.12
+
+    def test_shingles(self):
+        assert originality.shingles("A b, c d e f") == {"a b c d e", "b c d e f"}
+        assert originality.shingles("Just three words") == {"just three words"}
+        assert originality.shingles("  ") == set()
+
+
+@pytest.mark.django_db
+class TestOriginalityCheck:
+    def test_near_copy_is_flagged(self):
+        original = _check(description=_text(1))
+        copy = _check(description=_edit(original.description))
+        unrelated = _check(description=_text(2))
+
+        assert original.originality_check_status == "pass"
+        assert copy.originality_check_status == "fail"
+        assert copy.originality_check_result["matches"][0]["submission"] == original.pk
+        assert copy.originality_check_result["similarity"] >= originality.FAIL_SIMILARITY
+        assert unrelated.originality_check_status == "pass"
+        assert unrelated.originality_check_result["matches"] == []
+
+    def test_short_boilerplate_passes(self):
+        first = _check(description="See attached file")
+        second = _check(description="See attached file.")
+        third = _check(description=_text(4, words=originality.MIN_SHINGLES + originality.SHINGLE_SIZE - 2))
+
+        assert second.originality_check_result["shingles"] == 1
+        assert second.originality_check_status == "pass"
+        assert second.originality_check_result["matches"] == []
+        assert first.originality_check_status == third.originality_check_status == "pass"
+        assert _check(description=third.description).originality_check_status == "pass"
+
+    def test_own_resubmission_is_not_flagged(self):
+        first = _check(description=_text(1))
+
+        again = _check(user=first.user, description=first.description)
+
+        assert again.originality_check_status == "pass"
+
+    def test_only_bucket_matches_are_compared(self):
+        for seed in range(10, 30):
+            _check(description=_text(seed))
+        original = _check(description=_text(1))
+        copy = SubmissionFactory(description=original.description)
+
+        signature = originality.minhash(originality.shingles(copy.description))
+        candidates = originality._candidates(copy, originality.band_buckets(signature))
+
+        assert candidates == {original.pk}
+        assert SignatureBucket.objects.filter(submission=original).count() == originality.BANDS
+
+    def test_uploaded_archive_is_read(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        code = _text(3)
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("src/main.py", code)
+            zf.writestr("logo.png", b"\x89PNG")
+
+        original = _check(description="", submission_file=ContentFile(code.encode(), name="main.py"))
+        zipped = _check(description="", submission_file=ContentFile(archive.getvalue(), name="project.zip"))
+
+        assert zipped.originality_check_result["shingles"] == original.originality_check_result["shingles"]
+        assert zipped.originality_check_status == "fail"
+
+    def test_new_submission_is_queued_after_commit(self, monkeypatch, django_capture_on_commit_callbacks):
+        queued = []
+        monkeypatch.setattr(originality, "enqueue", queued.append)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            submission = SubmissionFactory()
+            submission.save()  # updates are not re-checked
+
+        assert queued == [submission.pk]
+
+    def test_check_pending(self):
+        submissions = SubmissionFactory.create_batch(3)
+        originality.check_submission(submissions[0])
+
+        assert originality.check_pending() == 2
+        assert not Submission.objects.filter(originality_check_status="not_checked").exists()
@@ -0,0 +1,111 @@
+"""
+Tests for the faceted quest catalog index.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.quest_catalog import QuestCatalog, get_catalog, tag_facets
+from synnovator.hackathons.tests.factories import QuestFactory, QuestIndexPageFactory
+
+
+ROWS = [
+    (1, "beginner", "technical", 50, ["Python", "api"]),
+    (2, "intermediate", "technical", 100, ["python"]),
+    (3, "beginner", "commercial", 150, ["pitch"]),
+    (4, "advanced", "technical", 200, ["python", "ml"]),
+]
+
+
+class TestQuestCatalog:
+    """Bitset filtering and facet counts."""
+
+    catalog = QuestCatalog(ROWS)
+
+    def test_no_filters_keeps_display_order(self):
+        assert self.catalog.search().ids == [1, 2, 3, 4]
+
+    def test_values_within_a_facet_are_ored(self):
+        assert self.catalog.search(difficulty=["beginner", "advanced"]).ids == [1, 3, 4]
+
+    def test_facets_are_anded(self):
+        result = self.catalog.search(difficulty=["beginner"], quest_type=["technical"])
+        assert result.ids == [1]
+
+    def test_tag_match_modes(self):
+        assert self.catalog.search(tags=["python", "ML"]).ids == [4]
+        assert self.catalog.search(tags=["pitch", "ml"], tag_match="any").ids == [3, 4]
+
+    def test_xp_range(self):
+        assert self.catalog.search(xp_min=100, xp_max=150).ids == [2, 3]
+        assert self.catalog.search(xp_min=201).ids == []
+        assert self.catalog.search(xp_max=49).ids == []
+
+    def test_facet_counts_leave_out_their_own_filter(self):
+        counts = self.catalog.search(difficulty=["beginner"], quest_type=["technical"]).facet_counts
+
+        assert counts["difficulty"] == {"beginner": 1, "intermediate": 1, "advanced": 1}
+        assert counts["quest_type"] == {"technical": 1, "commercial": 1}
+        assert counts["tags"] == {"python": 1, "api": 1, "pitch": 0, "ml": 0}
+
+    def test_tag_facets(self):
+        counts = self.catalog.search().facet_counts["tags"]
+        assert tag_facets(counts, limit=2) == [{"name": "python", "count": 3}, {"name": "api", "count": 1}]
+
+    def test_empty_catalog(self):
+        assert QuestCatalog([]).search(xp_min=1, tags=["x"]).ids == []
+
+
+@pytest.mark.django_db
+class TestGetCatalog:
+    """The catalog is shared until a quest changes."""
+
+    def test_excludes_inactive_quests(self):
+        active = QuestFactory()
+        QuestFactory(is_active=False)
+        assert get_catalog(active.locale_id).ids == [active.pk]
+
+    def test_reused_without_quest_queries(self):
+        quest = QuestFactory()
+        get_catalog(quest.locale_id)
+
+        with CaptureQueriesContext(connection) as queries:
+            get_catalog(quest.locale_id)
+
+        assert len(queries) == 1
+        assert "hackathons_quest" not in queries[0]["sql"]
+
+    def test_quest_save_invalidates(self):
+        quest = QuestFactory(difficulty="beginner")
+        get_catalog(quest.locale_id)
+
+        quest.difficulty = "expert"
+        quest.save()
+
+        assert get_catalog(quest.locale_id).search(difficulty=["expert"]).ids == [quest.pk]
+
+    def test_quest_delete_invalidates(self):
+        quest = QuestFactory()
+        get_catalog(quest.locale_id)
+
+        quest.delete()
+
+        assert get_catalog(quest.locale_id).ids == []
+
+
+@pytest.mark.django_db
+class TestQuestIndexPageFacets:
+    def test_context_includes_facet_counts(self, wagtail_root, rf):
+        index = QuestIndexPageFactory(parent=wagtail_root)
+        QuestFactory(difficulty="beginner", tags=["python"])
+        QuestFactory(difficulty="advanced", tags=["python", "ml"])
+
+        request = rf.get("/", {"difficulty": "easy", "xp_min": "oops"})
+        request.user = AnonymousUser()
+        context = index.get_context(request)
+
+        assert len(context["quests"]) == 1
+        assert context["facet_counts"]["difficulty"] == {"easy": 1, "medium": 0, "hard": 1}
+        assert context["tag_facets"] == [{"name": "python", "count": 1}]
@@ -0,0 +1,157 @@
+"""
+Tests for denormalized quest completion statistics.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.models import Quest, QuestStats, Submission
+from synnovator.hackathons.quest_stats import reconcile_quest_stats
+from synnovator.hackathons.tests.factories import QuestFactory, SubmissionFactory, VerifiedSubmissionFactory
+from synnovator.users.tests.factories import UserFactory
+
+
+def _stats(quest):
+    stats = QuestStats.objects.get(quest=quest)
+    return stats.attempt_count, stats.verified_count, stats.unique_user_count, stats.median_score
+
+
+def _verify(submission, score):
+    submission.verification_status = "verified"
+    submission.score = score
+    submission.save()
+
+
+@pytest.mark.django_db
+class TestQuestStatsMaintenance:
+    """Counters follow submission writes."""
+
+    def test_new_submissions_are_counted(self):
+        quest = QuestFactory()
+        user = UserFactory()
+        SubmissionFactory(quest=quest, user=user)
+        SubmissionFactory(quest=quest, user=user)
+        SubmissionFactory(quest=quest)
+
+        assert _stats(quest) == (3, 0, 2, None)
+
+    def test_verification_updates_verified_and_median(self):
+        quest = QuestFactory()
+        first, second, third = (SubmissionFactory(quest=quest) for _ in range(3))
+
+        _verify(first, Decimal("80"))
+        _verify(second, Decimal("91"))
+        assert _stats(quest) == (3, 2, 3, Decimal("85.50"))
+
+        _verify(third, Decimal("95"))
+        assert _stats(quest)[1:] == (3, 3, Decimal("91.00"))
+
+        second.verification_status = "rejected"
+        second.save()
+        assert _stats(quest)[1:] == (2, 3, Decimal("87.50"))
+
+    def test_score_change_of_verified_submission(self):
+        submission = SubmissionFactory()
+        _verify(submission, Decimal("50"))
+
+        submission.score = Decimal("70")
+        submission.save()
+
+        assert _stats(submission.quest)[3] == Decimal("70.00")
+
+    def test_delete_subtracts(self):
+        quest = QuestFactory()
+        user = UserFactory()
+        kept = SubmissionFactory(quest=quest, user=user)
+        removed = SubmissionFactory(quest=quest, user=user)
+        _verify(removed, Decimal("60"))
+
+        removed.delete()
+
+        assert _stats(quest) == (1, 0, 1, None)
+        kept.delete()
+        assert _stats(quest) == (0, 0, 0, None)
+
+    def test_moving_a_submission_updates_both_quests(self):
+        old_quest, new_quest = QuestFactory(), QuestFactory()
+        submission = SubmissionFactory(quest=old_quest)
+        _verify(submission, Decimal("80"))
+        SubmissionFactory(quest=new_quest)
+
+        submission.quest = new_quest
+        submission.save()
+
+        assert _stats(old_quest) == (0, 0, 0, None)
+        assert _stats(new_quest) == (2, 1, 2, Decimal("80.00"))
+        assert reconcile_quest_stats() == 0
+
+    def test_changing_the_submitter_updates_unique_users(self):
+        quest = QuestFactory()
+        user = UserFactory()
+        SubmissionFactory(quest=quest, user=user)
+        submission = SubmissionFactory(quest=quest)
+
+        submission.user = user
+        submission.save()
+
+        assert _stats(quest) == (2, 0, 1, None)
+
+    def test_deleting_the_submitter_updates_unique_users(self):
+        submission = SubmissionFactory()
+
+        submission.user.delete()
+
+        assert _stats(submission.quest) == (1, 0, 0, None)
+        assert reconcile_quest_stats() == 0
+
+    def test_quest_delete_cascades(self):
+        submission = VerifiedSubmissionFactory()
+        submission.quest.delete()
+        assert not QuestStats.objects.exists()
+
+    def test_completion_rate_reads_no_submissions(self):
+        quest = QuestFactory()
+        SubmissionFactory(quest=quest)
+        _verify(SubmissionFactory(quest=quest), Decimal("75"))
+        quest = Quest.objects.select_related("stats").get(pk=quest.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            rate = quest.get_completion_rate()
+
+        assert rate == 50
+        assert len(queries) == 0
+
+    def test_quest_without_submissions(self):
+        assert QuestFactory().get_completion_rate() == 0
+
+
+@pytest.mark.django_db
+class TestReconcile:
+    def test_repairs_drift(self):
+        quest = QuestFactory()
+        _verify(SubmissionFactory(quest=quest), Decimal("40"))
+        Submission.objects.filter(quest=quest).update(verification_status="pending")
+
+        assert reconcile_quest_stats() == 1
+        assert _stats(quest) == (1, 0, 1, None)
+        assert reconcile_quest_stats() == 0
+
+    def test_command_backfills_missing_rows(self, capsys):
+        submission = SubmissionFactory()
+        QuestStats.objects.all().delete()
+
+        call_command("reconcile_quest_stats", quest=[submission.quest_id])
+
+        assert "1 corrected" in capsys.readouterr().out
+        assert _stats(submission.quest) == (1, 0, 1, None)
+
+    def test_ordering_by_stats(self):
+        popular, quiet = QuestFactory(), QuestFactory()
+        _verify(SubmissionFactory(quest=popular), Decimal("90"))
+
+        assert list(Quest.objects.order_by("-stats__verified_count", "pk"))[0] == popular
+        assert quiet.get_completion_rate() == 0
@@ -0,0 +1,81 @@
+"""
+Tests for the quest recommendation engine.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.quest_catalog import QuestCatalog
+from synnovator.hackathons.recommendations import QuestVectors, recommend_quest_ids, recommend_quests
+from synnovator.hackathons.tests.factories import QuestFactory, SubmissionFactory
+from synnovator.users.tests.factories import UserFactory
+
+
+ROWS = [
+    (1, "intermediate", "technical", 100, ["python", "api", "django"]),
+    (2, "beginner", "technical", 100, ["python"]),
+    (3, "beginner", "commercial", 100, ["pitch"]),
+    (4, "advanced", "technical", 100, ["ml", "python"]),
+]
+
+
+class TestQuestVectors:
+    """Cosine ranking over the catalog's tag matrix."""
+
+    vectors = QuestVectors(QuestCatalog(ROWS))
+
+    def test_ranks_by_similarity(self):
+        assert self.vectors.rank(["Python"]) == [2, 4, 1]
+        assert self.vectors.rank(["python", "ml"]) == [4, 2, 1]
+
+    def test_excludes_completed(self):
+        assert self.vectors.rank(["python"], exclude={2, 4}) == [1]
+
+    def test_falls_back_to_beginner_quests(self):
+        assert self.vectors.rank([]) == [2, 3]
+        assert self.vectors.rank(["cobol"], exclude={2}) == [3]
+
+    def test_limit(self):
+        assert self.vectors.rank(["python"], limit=1) == [2]
+
+
+@pytest.mark.django_db
+class TestRecommendQuests:
+    def test_anonymous_users_get_beginner_quests(self):
+        quest = QuestFactory(difficulty="beginner")
+        QuestFactory(difficulty="advanced")
+
+        assert recommend_quests(AnonymousUser(), locale_id=quest.locale_id) == [quest]
+
+    def test_recommendations_are_cached(self):
+        quest = QuestFactory(tags=["python"])
+        user = UserFactory(skills=["Python"])
+        assert recommend_quest_ids(user, locale_id=quest.locale_id) == [quest.pk]
+
+        with CaptureQueriesContext(connection) as queries:
+            recommend_quest_ids(user, locale_id=quest.locale_id)
+
+        assert not any("hackathons_submission" in q["sql"] for q in queries.captured_queries)
+
+    def test_verification_invalidates(self):
+        python, other = QuestFactory(tags=["python"]), QuestFactory(tags=["python", "api"])
+        user = UserFactory(skills=["python"])
+        assert recommend_quest_ids(user, locale_id=python.locale_id) == [python.pk, other.pk]
+
+        submission = SubmissionFactory(user=user, quest=python)
+        submission.verification_status = "verified"
+        submission.save()
+
+        assert recommend_quest_ids(user, locale_id=python.locale_id) == [other.pk]
+
+    def test_skill_change_invalidates(self):
+        python, pitch = QuestFactory(tags=["python"]), QuestFactory(tags=["pitch"])
+        user = UserFactory(skills=["python"])
+        assert recommend_quest_ids(user, locale_id=python.locale_id) == [python.pk]
+
+        user.skills = ["pitch"]
+        user.save()
+
+        assert recommend_quest_ids(user, locale_id=python.locale_id) == [pitch.pk]
@@ -0,0 +1,137 @@
+"""
+Tests for streaming results export.
+"""
+
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from synnovator.hackathons import results_export
+from synnovator.hackathons.forms import ResultsExportForm
+from synnovator.hackathons.models import ScoreBreakdown
+from synnovator.hackathons.results_export import ExportError, stream_export
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    JudgeScoreFactory,
+    SubmissionFactory,
+    TeamFactory,
+    TeamSubmissionFactory,
+)
+from synnovator.users.tests.factories import AdminUserFactory, UserFactory
+
+
+@pytest.fixture
+def hackathon(db):
+    hackathon = HackathonPageFactory()
+    team = TeamFactory(hackathon=hackathon, name="Alpha")
+    submission = TeamSubmissionFactory(team=team, verification_status="verified")
+    JudgeScoreFactory(submission=submission, judge=UserFactory(username="judy"), feedback="Solid, \"tidy\" work")
+    JudgeScoreFactory(submission=submission)
+    JudgeScoreFactory()  # another hackathon's
+    return hackathon
+
+
+def _export(hackathon, dataset, file_format="csv", **kwargs):
+    return b"".join(stream_export(hackathon, dataset, file_format, **kwargs))
+
+
+@pytest.mark.django_db
+class TestStreamExport:
+    def test_scores_csv(self, hackathon):
+        rows = list(csv.DictReader(io.StringIO(_export(hackathon, "scores").decode())))
+
+        assert len(rows) == 2
+        assert rows[0]["team"] == "Alpha"
+        assert rows[0]["judge"] == "judy"
+        assert rows[0]["feedback"] == 'Solid, "tidy" work'
+        assert Decimal(rows[0]["technical_score"]) == 80
+
+    def test_submissions_jsonl(self, hackathon):
+        SubmissionFactory(hackathon=hackathon, team=None)
+
+        rows = [json.loads(line) for line in _export(hackathon, "submissions", "jsonl").decode().splitlines()]
+
+        assert [row["team"] for row in rows] == ["Alpha", None]
+        assert rows[0]["verification_status"] == "verified"
+
+    def test_rows_are_streamed_in_chunks_from_one_query(self, hackathon):
+        for order in range(25):
+            ScoreBreakdown.objects.create(
+                hackathon=hackathon, category="technical", criterion_name=f"C{order}", order=order
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(stream_export(hackathon, "criteria", "csv", chunk_size=10))
+
+        assert len(queries) == 1
+        assert [chunk.count(b"\n") for chunk in chunks] == [1, 10, 10, 5]
+
+    def test_unknown_dataset_or_format(self, hackathon):
+        with pytest.raises(ExportError):
+            stream_export(hackathon, "passwords")
+        with pytest.raises(ExportError):
+            stream_export(hackathon, "teams", "xlsx")
+
+    def test_parquet_requires_pyarrow(self, hackathon, monkeypatch):
+        monkeypatch.setattr(results_export, "parquet_available", lambda: False)
+
+        with pytest.raises(ExportError):
+            stream_export(hackathon, "teams", "parquet")
+        assert "parquet" not in dict(ResultsExportForm().fields["format"].choices)
+
+    def test_parquet_row_groups(self, hackathon):
+        pq = pytest.importorskip("pyarrow.parquet")
+        for _ in range(4):
+            TeamFactory(hackathon=hackathon)
+
+        table = pq.ParquetFile(io.BytesIO(_export(hackathon, "teams", "parquet", chunk_size=2)))
+
+        assert table.metadata.num_rows == 5
+        assert table.metadata.num_row_groups == 3
+        assert table.read().column("name")[0].as_py() == "Alpha"
+        assert str(table.schema_arrow.field("final_score").type) == "decimal128(6, 2)"
+
+    def test_empty_parquet_has_schema(self, db):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        table = pq.read_table(io.BytesIO(_export(HackathonPageFactory(), "scores", "parquet")))
+
+        assert table.num_rows == 0
+        assert "judge" in table.column_names
+
+
+@pytest.mark.django_db
+class TestExportEntryPoints:
+    def test_admin_download(self, client, hackathon):
+        client.force_login(AdminUserFactory())
+
+        response = client.get(
+            reverse("hackathons_export_results"),
+            {"hackathon": hackathon.pk, "dataset": "scores", "format": "csv"},
+        )
+
+        assert response.streaming
+        assert response["Content-Disposition"] == f'attachment; filename="{hackathon.slug}-scores.csv"'
+        assert b"judy" in b"".join(response.streaming_content)
+
+    def test_admin_requires_permission(self, client, db):
+        client.force_login(UserFactory())
+        response = client.get(reverse("hackathons_export_results"))
+        assert response.status_code in (302, 403)
+
+    def test_command(self, hackathon, tmp_path):
+        out = io.StringIO()
+        call_command("export_results", hackathon.pk, "teams", stdout=out)
+        assert out.getvalue().splitlines()[1].split(",")[1] == "Alpha"
+
+        path = tmp_path / "scores.jsonl"
+        call_command("export_results", hackathon.pk, "scores", "--format", "jsonl", "--output", str(path),
+                     stdout=io.StringIO())
+        assert len(path.read_text().splitlines()) == 2
@@ -0,0 +1,131 @@
+"""
+Tests for the bulk scale-fixture generator.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Page
+
+from synnovator.community.models import TeamMembership, TeamProfilePage
+from synnovator.hackathons.models import (
+    HackathonPage, JudgeAssignment, JudgeScore, LeaderboardEntry, Submission, SubmissionPage, Team, TeamMember,
+)
+from synnovator.hackathons.scale_fixtures import Permutation, ScaleConfig, ScaleFixtureError, generate, spread
+from synnovator.hackathons.tests.factories import SubmissionPageFactory
+
+
+def _config(**kwargs):
+    options = dict(
+        users=60, hackathons=2, teams=12, team_size=(2, 3), submissions_per_team=(1, 2), quests=3,
+        quest_submissions=10, judges=5, judges_per_submission=(2, 2), scored_fraction=0.5, batch_size=5,
+    )
+    options.update(kwargs)
+    return ScaleConfig(**options)
+
+
+def _snapshot():
+    return (
+        sorted(Team.objects.values_list("name", "status")),
+        sorted(Counter(TeamMember.objects.values_list("team__name", flat=True)).items()),
+        sorted(Submission.objects.values_list("submission_url", "verification_status", "score")),
+        JudgeScore.objects.count(),
+    )
+
+
+class TestDistributions:
+    def test_spread(self):
+        assert spread(100, 4, 0) == [25, 25, 25, 25]
+        skewed = spread(100, 4, 1.0)
+        assert sum(skewed) == 100
+        assert skewed == sorted(skewed, reverse=True)
+        assert skewed[0] > 2 * skewed[3]
+
+    def test_permutation_has_no_repeats(self):
+        permutation = Permutation(random.Random(3), 1000)
+
+        drawn = permutation.take(600) + permutation.take(600)
+
+        assert len(drawn) == 1000
+        assert sorted(drawn) == list(range(1000))
+
+
+@pytest.mark.django_db
+class TestGenerate:
+    def test_rows_and_relations(self):
+        counts = generate(_config())
+
+        assert counts["teams"] == Team.objects.count() == 12
+        assert counts["users"] == 60
+        assert HackathonPage.objects.count() == 2
+        # Nobody is on two teams in one hackathon
+        members = TeamMember.objects.values_list("team__hackathon_id", "user_id")
+        assert len(set(members)) == len(members)
+        team_submissions = Submission.objects.filter(team__isnull=False)
+        assert JudgeAssignment.objects.count() == 2 * team_submissions.count()
+        assert Submission.objects.filter(quest__isnull=False).count() == 10
+        assert LeaderboardEntry.objects.exists()
+
+    def test_page_trees_are_valid(self):
+        generate(_config())
+
+        assert all(problems == [] for problems in Page.find_problems())
+        team_page = TeamProfilePage.objects.live().first()
+        assert TeamMembership.objects.filter(team=team_page).count() >= 2
+        submission_page = SubmissionPage.objects.live().get(team_profile=team_page)
+        assert submission_page.hackathons.count() == 1
+        assert [block.block_type for block in submission_page.content] == ["paragraph", "demo_url"]
+        assert submission_page.get_parent().numchild == SubmissionPage.objects.count() == 12
+
+    def test_same_seed_same_data(self):
+        snapshots = []
+        for _ in range(2):
+            with transaction.atomic():
+                generate(_config(seed=7))
+                snapshots.append(_snapshot())
+                transaction.set_rollback(True)
+
+        assert snapshots[0] == snapshots[1]
+
+    def test_seed_cannot_be_generated_twice(self):
+        generate(_config(teams=2, quest_submissions=0))
+
+        with pytest.raises(ScaleFixtureError):
+            generate(_config(teams=2, quest_submissions=0))
+
+    def test_queries_grow_with_batches_not_rows(self):
+        generate(_config(seed=0, teams=1, quest_submissions=0))  # creates the index pages
+        with CaptureQueriesContext(connection) as small:
+            generate(_config(seed=1, users=200, teams=20, batch_size=1000))
+        with CaptureQueriesContext(connection) as large:
+            generate(_config(seed=2, users=200, teams=80, batch_size=1000))
+
+        # 4x the teams; SQLite's parameter limit splits a few large inserts
+        assert len(large) <= len(small) + 10
+
+    def test_clear_removes_pages(self):
+        options = ["--scale", "--seed", "4", "--users", "20", "--hackathons", "1", "--teams", "3",
+                   "--quests", "1", "--quest-submissions", "0", "--judges", "2"]
+        call_command("generate_hackathon_fixtures", *options)
+        other = SubmissionPageFactory(parent=SubmissionPage.objects.first().get_parent(), slug="scale-notes")
+
+        call_command("generate_hackathon_fixtures", "--clear", *options)
+
+        assert TeamProfilePage.objects.count() == SubmissionPage.objects.count() - 1 == 3
+        assert SubmissionPage.objects.filter(pk=other.pk).exists()
+        assert all(problems == [] for problems in Page.find_problems())
+
+    def test_command(self):
+        call_command(
+            "generate_hackathon_fixtures", "--scale", "--seed", "3", "--users", "30", "--hackathons", "1",
+            "--teams", "5", "--team-size", "2-4", "--judges", "3", "--judges-per-submission", "1-2",
+            "--quests", "2", "--quest-submissions", "4", "--page-fraction", "0",
+        )
+
+        assert Team.objects.count() == 5
+        assert not TeamProfilePage.objects.exists()
+        assert Submission.objects.filter(quest__isnull=False).count() == 4
@@ -0,0 +1,160 @@
+"""
+Tests for bulk judge-score import.
+"""
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from synnovator.hackathons.models import JudgeScore, LeaderboardEntry
+from synnovator.hackathons.score_import import (
+    ScoreImportError, import_judge_scores, parse_score_file
+)
+from synnovator.hackathons.tests.factories import JudgeScoreFactory, TeamSubmissionFactory
+from synnovator.users.tests.factories import AdminUserFactory, UserFactory
+
+
+CSV_HEADER = "submission_id,judge,technical_score,commercial_score,operational_score,feedback\n"
+
+
+@pytest.fixture
+def submission(db):
+    return TeamSubmissionFactory(verification_status="verified")
+
+
+@pytest.fixture
+def judges(db):
+    return [UserFactory(), UserFactory()]
+
+
+def _rows(submission, judges, technical=80):
+    return [
+        {
+            "submission_id": submission.pk,
+            "judge": judge.username,
+            "technical_score": technical,
+            "commercial_score": 70,
+            "operational_score": 60,
+        }
+        for judge in judges
+    ]
+
+
+class TestParseScoreFile:
+    """parse_score_file() reads CSV and JSON exports."""
+
+    def test_csv(self):
+        rows = parse_score_file(io.StringIO(CSV_HEADER + "1,alice,80,70,60,Nice\n"), name="scores.csv")
+        assert rows == [{
+            "submission_id": "1", "judge": "alice", "technical_score": "80",
+            "commercial_score": "70", "operational_score": "60", "feedback": "Nice",
+        }]
+
+    def test_csv_missing_columns(self):
+        with pytest.raises(ScoreImportError, match="operational_score"):
+            parse_score_file(io.StringIO("submission_id,judge,technical_score,commercial_score\n"), "csv")
+
+    def test_json_wrapped(self):
+        payload = json.dumps({"scores": [{"submission_id": 1}]}).encode()
+        assert parse_score_file(io.BytesIO(payload), name="scores.json") == [{"submission_id": 1}]
+
+    def test_unsupported_format(self):
+        with pytest.raises(ScoreImportError):
+            parse_score_file(io.StringIO(""), name="scores.xlsx")
+
+
+class TestImportJudgeScores:
+    """import_judge_scores() validates, upserts and recomputes teams once."""
+
+    def test_creates_scores_and_updates_leaderboard(self, submission, judges):
+        result = import_judge_scores(_rows(submission, judges))
+
+        assert result.ok
+        assert (result.created, result.updated) == (2, 0)
+        assert result.team_ids == {submission.team_id}
+        score = JudgeScore.objects.get(submission=submission, judge=judges[0])
+        assert score.overall_score == Decimal("70.00")
+
+        entry = LeaderboardEntry.objects.get(team=submission.team)
+        assert entry.score_count == 2
+        submission.team.refresh_from_db()
+        assert submission.team.final_score == Decimal("70.00")
+
+    def test_upserts_existing_scores(self, submission, judges):
+        JudgeScoreFactory(submission=submission, judge=judges[0], technical_score=10)
+
+        result = import_judge_scores(_rows(submission, judges, technical=100))
+
+        assert (result.created, result.updated) == (1, 1)
+        assert JudgeScore.objects.filter(submission=submission).count() == 2
+        entry = LeaderboardEntry.objects.get(team=submission.team)
+        assert entry.score_count == 2
+        assert entry.technical_score == Decimal("100.00")
+
+    def test_invalid_rows_abort_import(self, submission, judges):
+        rows = _rows(submission, judges)
+        rows.append({**rows[0], "judge": "nobody"})
+        rows.append({**rows[0], "submission_id": 999999})
+        rows.append({**rows[1], "technical_score": "150"})
+
+        result = import_judge_scores(rows)
+
+        assert not result.ok
+        assert [number for number, _message in result.errors] == [3, 4, 5]
+        assert not JudgeScore.objects.exists()
+
+    def test_duplicate_rows_rejected(self, submission, judges):
+        rows = _rows(submission, judges[:1]) * 2
+        result = import_judge_scores(rows)
+        assert result.errors == [(2, f"Duplicate score for submission {submission.pk} by {judges[0].username}")]
+
+    def test_dry_run_writes_nothing(self, submission, judges):
+        result = import_judge_scores(_rows(submission, judges), dry_run=True)
+        assert result.ok and result.created == 2
+        assert not JudgeScore.objects.exists()
+
+
+class TestImportCommand:
+    """The import_judge_scores management command."""
+
+    def test_imports_csv(self, submission, judges, tmp_path):
+        path = tmp_path / "scores.csv"
+        path.write_text(CSV_HEADER + f"{submission.pk},{judges[0].username},90,80,70,Solid\n")
+
+        out = io.StringIO()
+        call_command("import_judge_scores", str(path), stdout=out)
+
+        assert "1 scores created" in out.getvalue()
+        assert JudgeScore.objects.get(judge=judges[0]).feedback == "Solid"
+
+    def test_reports_invalid_rows(self, submission, tmp_path):
+        path = tmp_path / "scores.csv"
+        path.write_text(CSV_HEADER + f"{submission.pk},nobody,90,80,70,\n")
+
+        with pytest.raises(CommandError, match="1 invalid rows"):
+            call_command("import_judge_scores", str(path), stderr=io.StringIO())
+
+
+class TestImportAdminView:
+    """The Wagtail admin upload view."""
+
+    def test_upload(self, client, submission, judges):
+        client.force_login(AdminUserFactory())
+        upload = SimpleUploadedFile(
+            "scores.json", json.dumps(_rows(submission, judges)).encode(), content_type="application/json"
+        )
+
+        response = client.post(reverse("hackathons_import_judge_scores"), {"file": upload})
+
+        assert response.status_code == 302
+        assert JudgeScore.objects.filter(submission=submission).count() == 2
+
+    def test_requires_permission(self, client, db):
+        client.force_login(UserFactory())
+        response = client.get(reverse("hackathons_import_judge_scores"))
+        assert response.status_code in (302, 403)
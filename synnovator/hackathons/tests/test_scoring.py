@@ -0,0 +1,161 @@
+"""
+Tests for the judge-score normalization engine.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from django.core.management import call_command
+
+from synnovator.hackathons.models import LeaderboardEntry, ScoreBreakdown
+from synnovator.hackathons.scoring import (
+    category_weights,
+    competition_ranks,
+    compute_normalized_scores,
+    normalize_by_judge,
+    normalize_hackathon_scores,
+)
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    JudgeScoreFactory,
+    TeamFactory,
+    TeamSubmissionFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+EQUAL_WEIGHTS = np.full(3, 1 / 3)
+
+
+class TestNormalizeByJudge:
+    """normalize_by_judge() removes per-judge leniency."""
+
+    def test_zscore_equalizes_lenient_and_strict_judges(self):
+        judge_index = np.array([0, 0, 1, 1])
+        scores = np.array([[90.0] * 3, [80.0] * 3, [50.0] * 3, [30.0] * 3])
+
+        normalized = normalize_by_judge(judge_index, scores, "zscore")
+
+        np.testing.assert_allclose(normalized[:, 0], [60, 40, 60, 40])
+
+    def test_minmax_scales_to_judge_range(self):
+        judge_index = np.array([0, 0, 0, 1, 1])
+        scores = np.array([[60.0] * 3, [80.0] * 3, [70.0] * 3, [10.0] * 3, [20.0] * 3])
+
+        normalized = normalize_by_judge(judge_index, scores, "minmax")
+
+        np.testing.assert_allclose(normalized[:, 0], [0, 100, 50, 0, 100])
+
+    def test_constant_judge_is_neutral(self):
+        judge_index = np.array([0, 0])
+        scores = np.array([[70.0] * 3, [70.0] * 3])
+
+        assert np.all(normalize_by_judge(judge_index, scores, "zscore") == 50)
+        assert np.all(normalize_by_judge(judge_index, scores, "minmax") == 50)
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            normalize_by_judge(np.array([0]), np.array([[1.0, 2.0, 3.0]]), "median")
+
+
+class TestComputeNormalizedScores:
+    """compute_normalized_scores() aggregates, weights and ranks."""
+
+    def test_competition_ranks(self):
+        ranks = competition_ranks(np.array([70.0, 90.0, 70.0, 10.0]))
+        assert ranks.tolist() == [2, 1, 2, 4]
+
+    def test_strict_judge_does_not_penalize_team(self):
+        # Team 1 was only seen by a harsh judge but topped that judge's list
+        judge_ids = np.array([10, 10, 20, 20])
+        team_ids = np.array([1, 2, 3, 4])
+        scores = np.array([[40.0] * 3, [30.0] * 3, [95.0] * 3, [85.0] * 3])
+
+        result = compute_normalized_scores(judge_ids, team_ids, scores, EQUAL_WEIGHTS)
+
+        ranks = dict(zip(result.team_ids.tolist(), result.ranks.tolist()))
+        assert ranks[1] == ranks[3] == 1
+        assert ranks[2] == ranks[4] == 3
+
+    def test_weights_apply_per_category(self):
+        judge_ids = np.array([1, 1])
+        team_ids = np.array([1, 2])
+        scores = np.array([[100.0, 0.0, 0.0], [0.0, 100.0, 0.0]])
+
+        result = compute_normalized_scores(
+            judge_ids, team_ids, scores, np.array([0.75, 0.25, 0.0]), method="minmax"
+        )
+
+        assert result.final_scores.tolist() == [75.0, 25.0]
+        assert result.ranks.tolist() == [1, 2]
+
+    def test_empty_input(self):
+        result = compute_normalized_scores(
+            np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty((0, 3)), EQUAL_WEIGHTS
+        )
+        assert len(result) == 0
+
+
+@pytest.mark.django_db
+class TestNormalizeHackathonScores:
+    """normalize_hackathon_scores() loads from and writes back to the database."""
+
+    def _score(self, team, judge, value):
+        submission = team.submissions.first() or TeamSubmissionFactory(
+            team=team, verification_status="verified"
+        )
+        JudgeScoreFactory(
+            submission=submission, judge=judge,
+            technical_score=value, commercial_score=value, operational_score=value,
+        )
+
+    def test_category_weights_from_score_breakdown(self):
+        hackathon = HackathonPageFactory()
+        assert category_weights(hackathon).tolist() == pytest.approx([1 / 3] * 3)
+
+        ScoreBreakdown.objects.create(hackathon=hackathon, category="technical", criterion_name="Code", weight=2)
+        ScoreBreakdown.objects.create(hackathon=hackathon, category="technical", criterion_name="Tests", weight=2)
+        assert category_weights(hackathon).tolist() == pytest.approx([4 / 6, 1 / 6, 1 / 6])
+
+    def test_writes_normalized_scores_and_ranks(self):
+        hackathon = HackathonPageFactory()
+        harsh, lenient = UserFactory(), UserFactory()
+        teams = [TeamFactory(hackathon=hackathon) for _ in range(4)]
+        self._score(teams[0], harsh, 40)
+        self._score(teams[1], harsh, 30)
+        self._score(teams[2], lenient, 95)
+        self._score(teams[3], lenient, 85)
+
+        normalize_hackathon_scores(hackathon, method="zscore")
+
+        entries = {e.team_id: e for e in LeaderboardEntry.objects.filter(hackathon=hackathon)}
+        assert entries[teams[0].pk].normalized_rank == 1
+        assert entries[teams[2].pk].normalized_rank == 1
+        assert entries[teams[1].pk].normalized_rank == 3
+        assert entries[teams[0].pk].normalized_score == Decimal("60.00")
+        # Raw averages are untouched
+        assert entries[teams[0].pk].final_score == Decimal("40.00")
+
+    def test_clears_entries_without_scores(self):
+        hackathon = HackathonPageFactory()
+        team = TeamFactory(hackathon=hackathon)
+        self._score(team, UserFactory(), 70)
+        normalize_hackathon_scores(hackathon)
+
+        LeaderboardEntry.objects.filter(team=team).update(score_count=0)
+        team.submissions.update(verification_status="rejected")
+        normalize_hackathon_scores(hackathon)
+
+        entry = LeaderboardEntry.objects.get(team=team)
+        assert entry.normalized_score is None
+        assert entry.normalized_rank is None
+
+    def test_command(self):
+        hackathon = HackathonPageFactory()
+        team = TeamFactory(hackathon=hackathon)
+        self._score(team, UserFactory(), 70)
+
+        call_command("normalize_scores", hackathon=hackathon.pk, method="minmax")
+
+        assert LeaderboardEntry.objects.get(team=team).normalized_rank == 1
@@ -0,0 +1,83 @@
+"""
+Tests for pre-rendered SubmissionPage content.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from wagtail.documents import get_document_model
+
+from synnovator.hackathons import submission_content
+from synnovator.hackathons.tests.factories import SubmissionIndexPageFactory, SubmissionPageFactory
+
+
+@pytest.fixture
+def document(db):
+    return get_document_model().objects.create(title="Pitch deck", file=ContentFile(b"%PDF", name="deck.pdf"))
+
+
+@pytest.fixture
+def page(wagtail_root, document):
+    page = SubmissionPageFactory(parent=SubmissionIndexPageFactory(parent=wagtail_root), live=False)
+    page.content = [
+        ("heading", "Architecture"),
+        ("code_block", {"language": "python", "code": "print('<hi>')"}),
+        ("document", document),
+        ("demo_url", "https://example.com"),
+    ]
+    page.save_revision().publish()
+    page.refresh_from_db()
+    return page
+
+
+def _content_html(page, rf):
+    request = rf.get("/")
+    request.user = AnonymousUser()
+    return page.get_context(request)["content_html"]
+
+
+@pytest.mark.django_db
+class TestSubmissionContentCache:
+    def test_rendered_on_publish_and_served_from_cache(self, page, rf):
+        with CaptureQueriesContext(connection) as queries, translation.override("en"):
+            html = _content_html(page, rf)
+
+        # Assets version and the rendered HTML; no document lookup
+        assert len(queries) == 2
+        assert "<h2>Architecture</h2>" in html
+        assert "&lt;hi&gt;" in html
+        assert "Pitch deck" in html
+
+    def test_prerendered_for_every_language(self, page):
+        version = submission_content._assets_version()
+        keys = [submission_content._key(page, language, version) for language in ("en", "zh-hans")]
+
+        assert len(cache.get_many(keys)) == 2
+
+    def test_new_revision_replaces_content(self, page, rf):
+        page.content = [("heading", "Roadmap")]
+        page.save_revision().publish()
+        page.refresh_from_db()
+
+        html = _content_html(page, rf)
+        assert "Roadmap" in html and "Architecture" not in html
+
+    def test_document_edit_invalidates(self, page, document, rf):
+        _content_html(page, rf)
+        document.title = "Final deck"
+        document.save()
+
+        assert "Final deck" in _content_html(page, rf)
+
+    def test_preview_is_not_cached(self, page, rf):
+        page.content = [("heading", "Draft heading")]
+        request = rf.get("/")
+        request.user = AnonymousUser()
+        request.is_preview = True
+
+        assert "Draft heading" in page.get_context(request)["content_html"]
+        assert "Draft heading" not in _content_html(page, rf)
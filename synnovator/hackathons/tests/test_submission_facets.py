@@ -0,0 +1,120 @@
+"""
+Tests for cached SubmissionIndexPage facets and the facet typeahead.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from synnovator.community.tests.factories import TeamProfilePageFactory
+from synnovator.hackathons import submission_facets
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory,
+    SubmissionIndexPageFactory,
+    SubmissionPageFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def index(wagtail_root):
+    return SubmissionIndexPageFactory(parent=wagtail_root)
+
+
+@pytest.fixture
+def catalog(index):
+    """Two hackathons, three submitters (ada twice), one team submission"""
+    first, second = HackathonPageFactory(title="Alpha Hack"), HackathonPageFactory(title="Beta Hack")
+    ada = UserFactory(username="ada", first_name="Ada", last_name="Lovelace")
+    bob = UserFactory(username="bob", first_name="", last_name="")
+    SubmissionPageFactory(parent=index, submitter=ada, hackathons=[first], verification_status="verified")
+    SubmissionPageFactory(parent=index, submitter=ada, hackathons=[second], verification_status="submitted")
+    SubmissionPageFactory(parent=index, submitter=bob, hackathons=[first], verification_status="submitted")
+    team = TeamProfilePageFactory(title="Rockets")
+    SubmissionPageFactory(parent=index, submitter=None, team_profile=team, hackathons=[first])
+    return {"first": first, "second": second, "ada": ada, "bob": bob, "team": team}
+
+
+def _context(index, rf, **params):
+    request = rf.get("/", params)
+    request.user = AnonymousUser()
+    return index.get_context(request)
+
+
+@pytest.mark.django_db
+class TestSubmissionFacets:
+    def test_counts(self, index, catalog, rf):
+        facets = _context(index, rf)["available_filters"]
+
+        assert [(h["title"], h["count"]) for h in facets["hackathons"]] == [("Alpha Hack", 3), ("Beta Hack", 1)]
+        assert [(s["label"], s["count"]) for s in facets["submitters"]] == [("Ada Lovelace", 2), ("bob", 1)]
+        assert [(t["label"], t["count"]) for t in facets["teams"]] == [("Rockets", 1)]
+        statuses = {value: count for value, _label, count in facets["statuses"]}
+        assert statuses["submitted"] == 2 and statuses["verified"] == 1
+
+    def test_facets_ignore_their_own_filter(self, index, catalog, rf):
+        context = _context(index, rf, hackathon=catalog["second"].pk)
+
+        assert len(context["submissions"]) == 1
+        facets = context["available_filters"]
+        # Other hackathons stay selectable, other facets follow the filter
+        assert [h["count"] for h in facets["hackathons"]] == [3, 1]
+        assert [(s["label"], s["count"]) for s in facets["submitters"]] == [("Ada Lovelace", 1)]
+
+    def test_cached_until_a_submission_is_published(self, index, catalog, rf):
+        _context(index, rf)
+        with CaptureQueriesContext(connection) as queries:
+            facets = submission_facets.get_facets({}, {"hackathon", "status", "team", "submitter"})
+        assert len(queries) == 2  # version key and facet entry
+        assert len(facets["submitters"]) == 2
+
+        page = SubmissionPageFactory(parent=index, submitter=UserFactory(), live=False)
+        page.save_revision().publish()
+
+        assert len(_context(index, rf)["available_filters"]["submitters"]) == 3
+
+    def test_renamed_team_and_user_refresh_labels(self, index, catalog, rf):
+        _context(index, rf)
+
+        catalog["team"].title = "Rocketeers"
+        catalog["team"].save_revision().publish()
+        catalog["ada"].first_name = "Augusta"
+        catalog["ada"].save()
+
+        facets = _context(index, rf)["available_filters"]
+        assert [t["label"] for t in facets["teams"]] == ["Rocketeers"]
+        assert [s["label"] for s in facets["submitters"]] == ["Augusta Lovelace", "bob"]
+
+    def test_logins_keep_facets(self, catalog):
+        submission_facets.get_facets({}, {"submitter"})
+        version = submission_facets._version()
+
+        catalog["bob"].save(update_fields=["last_login"])
+
+        assert submission_facets._version() == version
+
+    def test_selected_value_beyond_top_values_stays_listed(self, index, catalog, rf, monkeypatch):
+        monkeypatch.setattr(submission_facets, "TOP_FACET_VALUES", 1)
+
+        facets = _context(index, rf, submitter=catalog["bob"].pk)["available_filters"]
+
+        assert [s["label"] for s in facets["submitters"]] == ["Ada Lovelace", "bob"]
+
+
+@pytest.mark.django_db
+class TestFacetTypeahead:
+    def test_prefix_search(self, catalog, client):
+        url = reverse("hackathons:submission_facet_search", args=["submitters"])
+
+        results = client.get(url, {"q": "love"}).json()["results"]
+        assert results == [{"id": catalog["ada"].pk, "label": "Ada Lovelace", "count": 2}]
+
+        results = client.get(url, {"q": "ada", "hackathon": catalog["second"].pk}).json()["results"]
+        assert results[0]["count"] == 1
+
+    def test_teams_and_unknown_facet(self, catalog, client):
+        url = reverse("hackathons:submission_facet_search", args=["teams"])
+        assert client.get(url, {"q": "rock"}).json()["results"][0]["label"] == "Rockets"
+        assert client.get(reverse("hackathons:submission_facet_search", args=["users"])).status_code == 404
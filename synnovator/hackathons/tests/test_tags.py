@@ -0,0 +1,121 @@
+"""
+Tests for the normalized tag index.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+
+from synnovator.hackathons.models import Quest, QuestTag
+from synnovator.hackathons.tags import filter_by_tags, normalize_tags, tag_counts
+from synnovator.hackathons.tests.factories import (
+    HackathonIndexPageFactory,
+    HackathonPageFactory,
+    QuestFactory,
+    QuestIndexPageFactory,
+)
+
+
+def _titles(queryset):
+    return set(queryset.values_list("title", flat=True))
+
+
+class TestNormalizeTags:
+    def test_strips_lowercases_and_dedupes(self):
+        assert normalize_tags([" Python", "python", "ML ", "", 42]) == ["python", "ml", "42"]
+
+    def test_non_list_values(self):
+        assert normalize_tags(None) == []
+        assert normalize_tags("python") == []
+
+
+@pytest.mark.django_db
+class TestTagSync:
+    """The index follows the JSON field on save."""
+
+    def test_quest_tags_are_indexed(self):
+        quest = QuestFactory(tags=["Python", "API"])
+        assert set(quest.tag_entries.values_list("name", flat=True)) == {"python", "api"}
+
+        quest.tags = ["api", "rest"]
+        quest.save()
+
+        assert set(quest.tag_entries.values_list("name", flat=True)) == {"api", "rest"}
+
+    def test_hackathon_index_follows_published_tags(self):
+        hackathon = HackathonPageFactory(tags=["ai"])
+
+        hackathon.tags = ["ai", "climate"]
+        hackathon.save_revision()
+        assert set(hackathon.tag_entries.values_list("name", flat=True)) == {"ai"}
+
+        hackathon.get_latest_revision().publish()
+        assert set(hackathon.tag_entries.values_list("name", flat=True)) == {"ai", "climate"}
+
+    def test_rebuild_command(self):
+        quest = QuestFactory(tags=["python"])
+        Quest.objects.filter(pk=quest.pk).update(tags=["go"])
+
+        call_command("rebuild_tag_index")
+
+        assert list(QuestTag.objects.values_list("name", flat=True)) == ["go"]
+
+
+@pytest.mark.django_db
+class TestFilterByTags:
+    """Exact-match filtering with AND/OR semantics."""
+
+    @pytest.fixture
+    def quests(self):
+        QuestFactory(title="Email", tags=["email", "api"])
+        QuestFactory(title="AI", tags=["AI", "python"])
+        QuestFactory(title="AI API", tags=["ai", "api"])
+
+    def test_exact_match_has_no_substring_false_positives(self, quests):
+        assert _titles(filter_by_tags(Quest.objects.all(), ["ai"])) == {"AI", "AI API"}
+
+    def test_all_and_any(self, quests):
+        quests = Quest.objects.all()
+        assert _titles(filter_by_tags(quests, ["ai", "API"])) == {"AI API"}
+        assert _titles(filter_by_tags(quests, ["ai", "api"], match="any")) == {"Email", "AI", "AI API"}
+
+    def test_no_tags_is_a_no_op(self, quests):
+        assert filter_by_tags(Quest.objects.all(), []).count() == 3
+
+    def test_unknown_mode(self, quests):
+        with pytest.raises(ValueError):
+            filter_by_tags(Quest.objects.all(), ["ai"], match="most")
+
+    def test_tag_counts(self, quests):
+        QuestFactory(tags=["ai"], is_active=False)
+
+        counts = tag_counts(Quest.objects.filter(is_active=True))
+
+        assert counts[:2] == [{"name": "ai", "count": 2}, {"name": "api", "count": 2}]
+        assert tag_counts(Quest.objects.all(), limit=1) == [{"name": "ai", "count": 3}]
+
+
+@pytest.mark.django_db
+class TestIndexPages:
+    def test_hackathon_index_by_tag(self, wagtail_root):
+        index = HackathonIndexPageFactory(parent=wagtail_root, filter_mode="by_tag", filter_tag="from_enterprise")
+        HackathonPageFactory(parent=index, title="Enterprise", tags=["from_enterprise"])
+        HackathonPageFactory(parent=index, title="Other", tags=["not_from_enterprise"])
+
+        assert _titles(index.get_filtered_hackathons()) == {"Enterprise"}
+
+    def test_quest_index_tag_filters_and_facets(self, wagtail_root, rf):
+        index = QuestIndexPageFactory(parent=wagtail_root)
+        QuestFactory(title="Email", tags=["email"])
+        QuestFactory(title="AI", tags=["ai"])
+
+        request = rf.get("/", {"tags": ["ai", "email"], "tag_match": "any"})
+        request.user = AnonymousUser()
+        context = index.get_context(request)
+
+        assert {q.title for q in context["quests"]} == {"AI", "Email"}
+        assert {facet["name"] for facet in context["tag_facets"]} == {"ai", "email"}
+
+        request = rf.get("/", {"tags": "ai"})
+        request.user = AnonymousUser()
+        assert [q.title for q in index.get_context(request)["quests"]] == ["AI"]
@@ -0,0 +1,129 @@
+"""
+Tests for the team formation matching engine.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.team_matching import (
+    SeekerIndex, TeamIndex, compatibility, get_seeker_index, get_team_index,
+)
+from synnovator.hackathons.tests.factories import HackathonPageFactory, TeamFactory, TeamMemberFactory
+from synnovator.users.tests.factories import UserFactory
+
+
+ROWS = [
+    (1, True, "hacker", ["Python", "Django"]),
+    (2, True, "hipster", ["Figma", "css"]),
+    (3, False, "hustler", ["Pitch"]),
+    (4, True, "any", ["python", "Pitch"]),
+]
+
+
+class TestSeekerIndex:
+    """Role/skill bitsets over seekers."""
+
+    index = SeekerIndex(ROWS)
+
+    def test_only_seekers_are_indexed(self):
+        assert self.index.ids == [1, 2, 4]
+
+    def test_vocabulary_covers_all_users(self):
+        assert self.index.vocabulary == ["css", "Django", "Figma", "Pitch", "Python"]
+
+    def test_skills_are_ored_roles_anded(self):
+        assert self.index.rank(self.index.search(skills=["PYTHON", "figma"])) == [1, 2, 4]
+        assert self.index.rank(self.index.search(roles=["hacker"], skills=["figma"])) == []
+
+    def test_rank_by_matched_skills(self):
+        bits = self.index.search(skills=["python", "pitch"])
+        assert self.index.rank(bits, skills=["python", "pitch"]) == [4, 1]
+
+    def test_rank_for_team(self):
+        team = (["hipster"], {"python"})
+        assert self.index.rank(self.index.all_bits, team=team, exclude={4}) == [2, 1]
+
+
+class TestTeamIndex:
+    """Needed roles and skills of recruiting teams, newest first."""
+
+    index = TeamIndex(
+        [(10, 1, ["hacker", "hipster"]), (11, 1, ["hacker"]), (12, 2, None)],
+        [
+            (10, 100, "hacker", True, ["Python"]),
+            (11, 101, "hustler", True, ["Pitch"]),
+            (11, 102, "hipster", False, ["Figma"]),
+            (12, 100, "hacker", False, ["Go"]),
+        ],
+    )
+
+    def test_profiles(self):
+        assert self.index.profile(10) == (["hipster"], {"python"})
+        assert self.index.profile(11) == (["hacker"], {"pitch", "figma"})
+        assert self.index.profile(12) == ([], {"go"})
+
+    def test_search_by_hackathon(self):
+        assert self.index.search() == [0, 1, 2]
+        assert self.index.search(1) == [0, 1]
+
+    def test_rank_for_user(self):
+        positions = self.index.search()
+        assert self.index.rank(positions) == [10, 11, 12]
+        assert self.index.rank(positions, role="hacker", skills=["python"]) == [11, 12, 10]
+
+    def test_led_team(self):
+        assert self.index.led_team(self.index.search(), 100) == (["hipster"], {"python"})
+        assert self.index.led_team(self.index.search(2), 100) is None
+
+
+class TestCompatibility:
+    def test_missing_role_and_new_skills(self):
+        assert compatibility("hipster", ["figma"], ["hipster"], set()) == 100
+        assert compatibility("hacker", ["python", "go"], ["hipster"], {"python"}) == 20
+        assert compatibility("any", [], ["hipster"], set()) == 30
+        assert compatibility("hacker", [], [], set()) == 0
+
+
+@pytest.mark.django_db
+class TestSeekerIndexCache:
+    def test_user_changes_rebuild_index(self):
+        user = UserFactory(is_seeking_team=True, skills=["Rust"])
+        assert get_seeker_index().ids == [user.pk]
+
+        with CaptureQueriesContext(connection) as queries:
+            get_seeker_index()
+        assert len(queries) == 1  # version key only
+
+        user.is_seeking_team = False
+        user.save()
+        assert get_seeker_index().ids == []
+        assert get_seeker_index().vocabulary == ["Rust"]
+
+    def test_login_keeps_index(self):
+        user = UserFactory(is_seeking_team=True)
+        index = get_seeker_index()
+        user.save(update_fields=["last_login"])
+        assert get_seeker_index() is index
+
+
+@pytest.mark.django_db
+class TestTeamIndexCache:
+    def test_membership_changes_rebuild_index(self):
+        team = TeamFactory(hackathon=HackathonPageFactory(required_roles=["hacker", "hipster"]))
+        TeamFactory(is_seeking_members=False)
+        assert get_team_index().ids == [team.pk]
+
+        with CaptureQueriesContext(connection) as queries:
+            get_team_index()
+        assert len(queries) == 1  # version key only
+
+        TeamMemberFactory(team=team, role="hacker", user=UserFactory(skills=["Rust"]))
+        assert get_team_index().profile(team.pk) == (["hipster"], {"rust"})
+
+    def test_score_updates_keep_index(self):
+        team = TeamFactory()
+        index = get_team_index()
+        team.final_score = 90
+        team.save(update_fields=["final_score"])
+        assert get_team_index() is index
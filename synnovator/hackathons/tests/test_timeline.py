@@ -0,0 +1,140 @@
+"""
+Tests for the cached phase-timeline resolver.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from synnovator.hackathons.models import HackathonPage, Phase
+from synnovator.hackathons.timeline import PhaseTimeline, get_phase_timeline
+from synnovator.hackathons.tests.factories import (
+    ActivePhaseFactory,
+    FuturePhaseFactory,
+    HackathonPageFactory,
+    PastPhaseFactory,
+    PhaseFactory,
+)
+
+
+def _phase(title, start_days, end_days, order=0):
+    now = timezone.now()
+    return Phase(
+        title=title,
+        start_date=now + timedelta(days=start_days),
+        end_date=now + timedelta(days=end_days),
+        order=order,
+    )
+
+
+class TestPhaseTimeline:
+    """PhaseTimeline answers time queries with a bisect."""
+
+    def test_phase_at_and_next_phase(self):
+        registration = _phase("Registration", -10, -5)
+        hacking = _phase("Hacking", -5, 2)
+        judging = _phase("Judging", 2, 5)
+        timeline = PhaseTimeline([judging, registration, hacking])
+        now = timezone.now()
+
+        assert timeline.phase_at(now) is hacking
+        assert timeline.phase_at(now - timedelta(days=7)) is registration
+        assert timeline.phase_at(now + timedelta(days=10)) is None
+        assert timeline.next_phase(now) is judging
+        assert timeline.next_phase(now + timedelta(days=3)) is None
+
+    def test_gap_between_phases(self):
+        timeline = PhaseTimeline([_phase("A", -10, -5), _phase("B", 5, 10)])
+        assert timeline.phase_at() is None
+
+    def test_overlap_prefers_lowest_order(self):
+        long_phase = _phase("Long", -20, 20, order=1)
+        short_phase = _phase("Short", -1, 1, order=0)
+        timeline = PhaseTimeline([long_phase, short_phase])
+
+        assert timeline.phase_at() is short_phase
+        assert timeline.phase_at(timezone.now() + timedelta(days=5)) is long_phase
+
+    def test_is_submission_open(self):
+        timeline = PhaseTimeline([_phase("Judging", -1, 1)])
+        assert timeline.is_submission_open("in_progress") is False
+        assert PhaseTimeline([_phase("Hacking Period", -1, 1)]).is_submission_open("draft") is True
+        assert PhaseTimeline([]).is_submission_open("in_progress") is True
+
+
+@pytest.mark.django_db
+class TestCachedTimeline:
+    """HackathonPage resolves phases from the cached timeline."""
+
+    def test_repeated_calls_use_no_queries(self):
+        hackathon = HackathonPageFactory(status="in_progress")
+        ActivePhaseFactory(hackathon=hackathon, title="Hacking")
+        hackathon.get_current_phase()
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(10):
+                hackathon.get_current_phase()
+                hackathon.is_submission_open()
+        assert len(queries) == 0
+
+    def test_fresh_instance_reads_cache(self):
+        hackathon = HackathonPageFactory()
+        phase = ActivePhaseFactory(hackathon=hackathon)
+        hackathon.get_current_phase()
+
+        reloaded = HackathonPage.objects.get(pk=hackathon.pk)
+        with CaptureQueriesContext(connection) as queries:
+            assert reloaded.get_current_phase() == phase
+        assert not any("hackathons_phase" in q["sql"] for q in queries.captured_queries)
+
+    def test_phase_save_invalidates(self):
+        hackathon = HackathonPageFactory()
+        assert hackathon.get_current_phase() is None
+
+        phase = ActivePhaseFactory(hackathon=hackathon, title="Building")
+        assert hackathon.get_current_phase() == phase
+
+        phase.end_date = timezone.now() - timedelta(hours=1)
+        phase.save()
+        assert HackathonPage.objects.get(pk=hackathon.pk).get_current_phase() is None
+
+    def test_phase_delete_invalidates(self):
+        hackathon = HackathonPageFactory()
+        phase = ActivePhaseFactory(hackathon=hackathon)
+        assert hackathon.get_current_phase() == phase
+
+        phase.delete()
+        assert hackathon.get_current_phase() is None
+
+    def test_publish_invalidates(self):
+        hackathon = HackathonPageFactory()
+        get_phase_timeline(hackathon)
+        cache_key = f"hackathons:phase_timeline:{hackathon.pk}"
+        assert cache.get(cache_key) is not None
+
+        hackathon.save_revision().publish()
+        assert cache.get(cache_key) is None
+
+    def test_get_next_phase(self):
+        hackathon = HackathonPageFactory()
+        PastPhaseFactory(hackathon=hackathon)
+        future = FuturePhaseFactory(hackathon=hackathon)
+        assert hackathon.get_next_phase() == future
+
+    def test_timeline_api_lists_phases_in_start_order(self, client):
+        hackathon = HackathonPageFactory()
+        later = PhaseFactory(hackathon=hackathon, title="Later", order=0,
+                             start_date=timezone.now() + timedelta(days=5),
+                             end_date=timezone.now() + timedelta(days=6))
+        earlier = PhaseFactory(hackathon=hackathon, title="Earlier", order=1,
+                               start_date=timezone.now() - timedelta(days=1),
+                               end_date=timezone.now() + timedelta(days=1))
+
+        data = client.get(reverse("hackathons:hackathon_timeline", args=[hackathon.pk])).json()
+        assert [p["id"] for p in data["phases"]] == [earlier.pk, later.pk]
+        assert data["current_phase"]["id"] == earlier.pk
@@ -0,0 +1,279 @@
+"""
+Tests for resumable chunked submission uploads.
+"""
+
+import hashlib
+import os
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from synnovator.hackathons import uploads
+from synnovator.hackathons.models import ChunkedUpload, FileBlob, Submission
+from synnovator.hackathons.tests.factories import (
+    HackathonPageFactory, QuestFactory, TeamFactory, TeamMemberFactory,
+)
+from synnovator.users.tests.factories import UserFactory
+
+
+CONTENT = b"0123456789" * 5 + b"tail"
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def user(db, client):
+    user = UserFactory()
+    client.force_login(user)
+    return user
+
+
+@pytest.fixture
+def quest(db):
+    return QuestFactory(is_active=True)
+
+
+@pytest.fixture
+def complete(client, monkeypatch, django_capture_on_commit_callbacks):
+    """POST upload_complete, assembling the file inline once the request commits"""
+    monkeypatch.setattr(uploads, "start_assembly", uploads.assemble_upload)
+
+    def post(upload_id, **data):
+        with django_capture_on_commit_callbacks(execute=True):
+            return client.post(reverse("hackathons:upload_complete", args=[upload_id]), data)
+
+    return post
+
+
+@pytest.fixture
+def team(db, user):
+    """A team of the user's in a hackathon taking team submissions now"""
+    hackathon = HackathonPageFactory(status="in_progress", submission_type="team", require_registration=False)
+    hackathon.save_revision().publish()
+    team = TeamFactory(hackathon=hackathon)
+    TeamMemberFactory(team=team, user=user)
+    return team
+
+
+def _start(client, quest, content=CONTENT, **extra):
+    data = {"filename": "project.zip", "size": len(content), "quest": quest.pk, **extra}
+    return client.post(reverse("hackathons:upload_start"), data)
+
+
+def _put(client, upload_id, offset, chunk, **headers):
+    url = reverse("hackathons:upload_detail", args=[upload_id]) + f"?offset={offset}"
+    return client.put(url, data=chunk, content_type="application/octet-stream", headers=headers)
+
+
+def _send(client, upload_id, content=CONTENT, chunk_size=20):
+    for offset in range(0, len(content), chunk_size):
+        assert _put(client, upload_id, offset, content[offset:offset + chunk_size]).status_code == 200
+
+
+def _upload(client, complete, quest, content=CONTENT, chunk_size=20):
+    upload_id = _start(client, quest, content).json()["id"]
+    _send(client, upload_id, content, chunk_size)
+    assert complete(upload_id, description="v1").status_code == 202
+    return upload_id, client.get(reverse("hackathons:upload_detail", args=[upload_id]))
+
+
+def _stored_files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root) for d, _dirs, files in os.walk(root) for f in files)
+
+
+@pytest.mark.django_db
+class TestChunkedUpload:
+    def test_upload_creates_submission_from_assembled_file(self, client, complete, user, quest, media_root):
+        upload_id, response = _upload(client, complete, quest)
+
+        body = response.json()
+        assert body["status"] == "complete"
+        digest = hashlib.sha256(CONTENT).hexdigest()
+        assert (body["sha256"], body["deduplicated"]) == (digest, False)
+
+        submission = Submission.objects.get(pk=body["submission"])
+        assert (submission.user, submission.quest, submission.description) == (user, quest, "v1")
+        assert submission.file_transfer_confirmed
+        with submission.submission_file.open("rb") as f:
+            assert f.read() == CONTENT
+        # Chunks are gone; only the content-addressed blob remains
+        assert _stored_files(media_root) == [f"submissions/sha256/{digest[:2]}/{digest}/project.zip"]
+
+    def test_resume_and_retries(self, client, user, quest):
+        upload_id = _start(client, quest).json()["id"]
+        _put(client, upload_id, 0, CONTENT[:20])
+
+        # The acknowledgement was lost: resending the same chunk is harmless
+        assert _put(client, upload_id, 0, CONTENT[:20]).json()["received_bytes"] == 20
+        # Skipping ahead is refused with the offset to continue from
+        response = _put(client, upload_id, 40, CONTENT[40:])
+        assert response.status_code == 409
+        assert response.json()["received_bytes"] == 20
+
+        status = client.get(reverse("hackathons:upload_detail", args=[upload_id])).json()
+        assert (status["received_bytes"], status["status"]) == (20, "uploading")
+
+    def test_corrupted_chunk_is_rejected(self, client, user, quest):
+        upload_id = _start(client, quest).json()["id"]
+
+        response = _put(client, upload_id, 0, CONTENT[:20], **{"X-Chunk-SHA256": "0" * 64})
+
+        assert response.status_code == 422
+        assert ChunkedUpload.objects.get(pk=upload_id).received_bytes == 0
+
+    def test_incomplete_upload_cannot_complete(self, client, complete, user, quest):
+        upload_id = _start(client, quest).json()["id"]
+        _put(client, upload_id, 0, CONTENT[:20])
+
+        response = complete(upload_id)
+
+        assert response.status_code == 409
+        assert not Submission.objects.exists()
+
+    def test_assembly_runs_after_the_request(self, client, user, quest, monkeypatch,
+                                             django_capture_on_commit_callbacks):
+        started = []
+        monkeypatch.setattr(uploads, "start_assembly", started.append)
+        upload_id = _start(client, quest).json()["id"]
+        _send(client, upload_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse("hackathons:upload_complete", args=[upload_id]))
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "assembling"
+        assert [str(pk) for pk in started] == [upload_id]
+        assert not Submission.objects.exists()
+
+        uploads.assemble_upload(upload_id)
+        assert client.get(reverse("hackathons:upload_detail", args=[upload_id])).json()["status"] == "complete"
+
+    def test_repeated_complete_returns_existing_submission(self, client, complete, user, quest):
+        upload_id, status = _upload(client, complete, quest)
+
+        response = complete(upload_id, description="v2")
+
+        assert response.status_code == 200
+        assert response.json()["submission"] == status.json()["submission"]
+        assert Submission.objects.get().description == "v1"
+
+    def test_interrupted_assembly_is_picked_up(self, client, user, quest, monkeypatch):
+        monkeypatch.setattr(uploads, "start_assembly", lambda upload_id: None)
+        upload_id = _start(client, quest).json()["id"]
+        _send(client, upload_id)
+        client.post(reverse("hackathons:upload_complete", args=[upload_id]))
+
+        assert uploads.assemble_pending() == 0
+        assert uploads.assemble_pending(now=timezone.now() + uploads.ASSEMBLY_TIMEOUT * 2) == 1
+        assert ChunkedUpload.objects.get(pk=upload_id).submission is not None
+
+    def test_polling_restarts_stalled_assembly(self, client, user, quest, monkeypatch,
+                                               django_capture_on_commit_callbacks):
+        started = []
+        monkeypatch.setattr(uploads, "start_assembly", started.append)
+        upload_id = _start(client, quest).json()["id"]
+        _send(client, upload_id)
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(reverse("hackathons:upload_complete", args=[upload_id]))
+        detail = reverse("hackathons:upload_detail", args=[upload_id])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert client.get(detail).json()["status"] == "assembling"
+        assert len(started) == 1
+
+        stalled = timezone.now() - uploads.ASSEMBLY_TIMEOUT * 2
+        ChunkedUpload.objects.filter(pk=upload_id).update(updated_at=stalled)
+        with django_capture_on_commit_callbacks(execute=True):
+            assert client.get(detail).json()["status"] == "assembling"
+            client.get(detail)
+        assert len(started) == 2
+        assert ChunkedUpload.objects.get(pk=upload_id).assembly_attempts == 2
+
+    def test_repeatedly_stalled_assembly_fails(self, client, user, quest, monkeypatch):
+        monkeypatch.setattr(uploads, "start_assembly", lambda upload_id: None)
+        upload_id = _start(client, quest).json()["id"]
+        _send(client, upload_id)
+        client.post(reverse("hackathons:upload_complete", args=[upload_id]))
+        ChunkedUpload.objects.filter(pk=upload_id).update(
+            assembly_attempts=uploads.MAX_ASSEMBLY_ATTEMPTS,
+            updated_at=timezone.now() - uploads.ASSEMBLY_TIMEOUT * 2,
+        )
+
+        status = client.get(reverse("hackathons:upload_detail", args=[upload_id])).json()
+
+        assert status["status"] == "failed"
+        assert status["error"] == uploads.ASSEMBLY_FAILED
+        assert uploads.assemble_pending(now=timezone.now() + uploads.ASSEMBLY_TIMEOUT * 2) == 0
+        assert not Submission.objects.exists()
+
+    def test_identical_files_are_stored_once(self, client, complete, user, quest, media_root):
+        _upload(client, complete, quest)
+        _upload_id, response = _upload(client, complete, quest, chunk_size=30)
+
+        assert response.json()["deduplicated"] is True
+        assert FileBlob.objects.count() == 1
+        first, second = Submission.objects.order_by("pk")
+        assert first.submission_file.name == second.submission_file.name
+        assert (first.attempt_number, second.attempt_number) == (1, 2)
+        assert len(_stored_files(media_root)) == 1
+
+    def test_announced_checksum_must_match(self, client, complete, user, quest, media_root):
+        upload_id = _start(client, quest, sha256="a" * 64).json()["id"]
+        _put(client, upload_id, 0, CONTENT)
+
+        complete(upload_id)
+
+        status = client.get(reverse("hackathons:upload_detail", args=[upload_id])).json()
+        assert status["status"] == "failed"
+        assert "checksum" in status["error"]
+        assert complete(upload_id).status_code == 409
+        assert _stored_files(media_root) == []
+
+
+@pytest.mark.django_db
+class TestUploadAccess:
+    def test_anonymous(self, client):
+        assert client.post(reverse("hackathons:upload_start")).status_code == 401
+
+    def test_team_upload_requires_membership(self, client, user, team):
+        other = TeamFactory(hackathon=team.hackathon)
+        data = {"filename": "final.zip", "size": 10, "hackathon": team.hackathon.pk}
+
+        assert client.post(reverse("hackathons:upload_start"), {**data, "team": other.pk}).status_code == 403
+        assert client.post(reverse("hackathons:upload_start"), {**data, "team": team.pk}).status_code == 201
+
+    def test_team_upload_follows_submission_window(self, client, complete, user, team):
+        data = {"filename": "final.zip", "size": len(CONTENT), "hackathon": team.hackathon.pk, "team": team.pk}
+        upload_id = client.post(reverse("hackathons:upload_start"), data).json()["id"]
+        _send(client, upload_id)
+
+        # Submissions closed while the file was being sent
+        type(team.hackathon).objects.filter(pk=team.hackathon.pk).update(status="judging")
+        response = complete(upload_id)
+
+        assert response.status_code == 403
+        assert response.json()["error"] == "Submissions are closed"
+        assert ChunkedUpload.objects.get(pk=upload_id).status == "uploading"
+        assert client.post(reverse("hackathons:upload_start"), data).status_code == 403
+
+    def test_other_users_upload_is_hidden(self, client, user, quest):
+        upload = uploads.start_upload(UserFactory(), "a.zip", 10, quest=quest)
+
+        assert client.get(reverse("hackathons:upload_detail", args=[upload.pk])).status_code == 404
+
+
+@pytest.mark.django_db
+def test_purge_stale_uploads(client, user, quest, media_root):
+    upload_id = _start(client, quest).json()["id"]
+    _put(client, upload_id, 0, CONTENT[:20])
+    ChunkedUpload.objects.filter(pk=upload_id).update(updated_at=timezone.now() - timedelta(days=2))
+
+    assert uploads.purge_stale_uploads() == 1
+    assert not ChunkedUpload.objects.exists()
+    assert _stored_files(media_root) == []
@@ -0,0 +1,97 @@
+"""
+Cached phase-timeline resolver for HackathonPage.
+
+A hackathon's phases are loaded once into a PhaseTimeline (phases sorted by
+start date plus parallel start/end lists) and kept in the cache until the page
+is published or one of its phases changes. "Current phase", "next phase" and
+"is submission open" at any instant are then answered with a bisect and no
+phase queries. HackathonPage also memoizes the timeline on the instance, so
+loops such as submit_project's per-team can_submit() resolve it once.
+"""
+from bisect import bisect_right
+
+from django.core.cache import cache
+from django.utils import timezone
+
+
+PHASE_TIMELINE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Phase titles containing any of these accept submissions
+SUBMISSION_PHASE_KEYWORDS = ('submission', 'hacking', 'development', 'building')
+
+
+def _cache_key(hackathon_id):
+    return f'hackathons:phase_timeline:{hackathon_id}'
+
+
+class PhaseTimeline:
+    """
+    Sorted interval index over a hackathon's phases.
+
+    Overlapping phases are allowed; when several are active at once the one
+    that sorts first by (order, start_date) wins, matching Phase.Meta.ordering.
+    """
+
+    def __init__(self, phases):
+        self.phases = sorted(phases, key=lambda p: (p.start_date, p.order, p.pk or 0))
+        self.starts = [phase.start_date for phase in self.phases]
+        self.ends = [phase.end_date for phase in self.phases]
+        # Running max of end dates lets phase_at() stop scanning early
+        self._max_ends = []
+        latest = None
+        for end in self.ends:
+            latest = end if latest is None or end > latest else latest
+            self._max_ends.append(latest)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def phase_at(self, at=None):
+        """Phase active at the given time (default: now), or None"""
+        at = at or timezone.now()
+        active = None
+        index = bisect_right(self.starts, at) - 1
+        while index >= 0 and self._max_ends[index] >= at:
+            phase = self.phases[index]
+            if phase.end_date >= at and (
+                active is None or (phase.order, phase.start_date) <= (active.order, active.start_date)
+            ):
+                active = phase
+            index -= 1
+        return active
+
+    def next_phase(self, at=None):
+        """First phase starting after the given time, or None"""
+        at = at or timezone.now()
+        index = bisect_right(self.starts, at)
+        return self.phases[index] if index < len(self.phases) else None
+
+    def is_submission_open(self, status, at=None):
+        """
+        Whether submissions are accepted at the given time.
+
+        Falls back to the hackathon status when no phase is active.
+        """
+        phase = self.phase_at(at)
+        if phase is None:
+            return status == 'in_progress'
+        title = phase.title.lower()
+        return any(keyword in title for keyword in SUBMISSION_PHASE_KEYWORDS)
+
+
+def get_phase_timeline(hackathon):
+    """Return the cached PhaseTimeline for a hackathon, building it on a miss"""
+    from synnovator.hackathons.models import Phase
+
+    key = _cache_key(hackathon.pk)
+    timeline = cache.get(key)
+    if timeline is None:
+        # Read saved phases, not any unsaved in-memory children (e.g. previews)
+        timeline = PhaseTimeline(Phase.objects.filter(hackathon_id=hackathon.pk))
+        cache.set(key, timeline, PHASE_TIMELINE_CACHE_TIMEOUT)
+    return timeline
+
+
+def invalidate_phase_timeline(hackathon_id):
+    """Drop the cached timeline; the next lookup rebuilds it"""
+    cache.delete(_cache_key(hackathon_id))
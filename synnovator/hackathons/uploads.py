@@ -0,0 +1,437 @@
+"""
+Resumable, chunked submission file uploads.
+
+A single multipart POST holds a gunicorn worker for as long as the client
+takes to send the file, and a dropped connection loses all of it. Clients
+instead start an upload, send the file in chunks at increasing offsets and
+complete it:
+
+    POST   /api/uploads/                      start (filename, size, sha256, target)
+    PUT    /api/uploads/<id>/?offset=N        one chunk as the raw request body
+    GET    /api/uploads/<id>/                 received_bytes, to resume after a failure
+    POST   /api/uploads/<id>/complete/        queue the file's assembly into a Submission
+
+Each chunk is hashed while it is streamed into the default storage (the local
+filesystem or S3), so no request buffers more than a chunk, and an optional
+X-Chunk-SHA256 header lets the client detect a corrupted chunk and resend it.
+
+Hackathon uploads must pass the hackathon's submission rules (see
+SubmissionEligibility.check_team) when they start and again when they
+complete. Completing moves the upload from uploading to assembling under a
+row lock, so a retried request changes nothing, and assembly runs on a
+background thread once that commits: a gigabyte file cannot be read twice
+within the worker timeout. Clients poll GET /api/uploads/<id>/ until the
+status is complete (with the submission) or failed (with the error).
+
+Assembly reads the chunks back once to compute the file's SHA-256 and check
+the digest announced at the start. A file whose digest is already known is
+linked to the existing FileBlob instead of being stored again; otherwise the
+chunks are streamed into a content-addressed blob. The Submission row is only
+created once the blob exists.
+
+Gunicorn recycles workers (max_requests), which kills an assembly in
+progress. An upload left assembling for ASSEMBLY_TIMEOUT is assembled again
+by resume_assembly() when its client polls, or by assemble_pending() from
+the assemble_uploads command; after MAX_ASSEMBLY_ATTEMPTS it is failed so
+the client starts it again. Uploads left unfinished for
+UPLOAD_EXPIRY are removed by purge_stale_uploads(), with their stored chunks.
+"""
+import hashlib
+import io
+import logging
+import os
+import threading
+from datetime import timedelta
+
+from django.core.files import File
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from synnovator.hackathons.eligibility import SubmissionEligibility
+from synnovator.hackathons.models import ChunkedUpload, FileBlob, Submission, TeamMember
+
+
+logger = logging.getLogger(__name__)
+
+
+# Suggested to clients; small enough to arrive well within the worker timeout
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_SIZE = 1024 * 1024 * 1024
+
+UPLOAD_EXPIRY = timedelta(days=1)
+
+# An upload assembling for this long lost its background thread
+ASSEMBLY_TIMEOUT = timedelta(minutes=30)
+
+MAX_ASSEMBLY_ATTEMPTS = 3
+
+ASSEMBLY_FAILED = 'The file could not be assembled; start the upload again'
+
+CHUNK_PREFIX = 'uploads/chunks'
+
+READ_SIZE = 64 * 1024
+
+
+class UploadError(ValueError):
+    """Raised when an upload request cannot be honoured; `status` is the HTTP status to answer with"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class _HashingReader(io.RawIOBase):
+    """Reads at most `limit` bytes from `stream`, hashing and counting them."""
+
+    def __init__(self, stream, limit=None):
+        self.stream = stream
+        self.remaining = limit
+        self.digest = hashlib.sha256()
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = len(buffer) if self.remaining is None else min(len(buffer), self.remaining)
+        data = self.stream.read(size) if size else b''
+        n = len(data)
+        buffer[:n] = data
+        self.digest.update(data)
+        self.count += n
+        if self.remaining is not None:
+            self.remaining -= n
+        return n
+
+
+class _PartsReader(io.RawIOBase):
+    """The upload's stored chunks as one sequential stream."""
+
+    def __init__(self, storage, names):
+        self.storage = storage
+        self.names = list(names)
+        self.current = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while True:
+            if self.current is None:
+                if not self.names:
+                    return 0
+                self.current = self.storage.open(self.names.pop(0), 'rb')
+            data = self.current.read(len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+            self.current.close()
+            self.current = None
+
+    def close(self):
+        if self.current is not None:
+            self.current.close()
+        super().close()
+
+
+def _stream_file(raw, name, size=None):
+    content = File(io.BufferedReader(raw, READ_SIZE), name=name)
+    if size is not None:
+        content.size = size
+    return content
+
+
+def _storage():
+    return Submission._meta.get_field('submission_file').storage
+
+
+def _check_eligibility(hackathon, team):
+    allowed, reason = SubmissionEligibility(hackathon).check_team(team)
+    if not allowed:
+        raise UploadError(str(reason), status=403)
+
+
+def start_upload(user, filename, size, sha256='', quest=None, hackathon=None, team=None):
+    """
+    Start an upload of `size` bytes to be submitted to `quest` (by the user)
+    or to `hackathon` (by `team`, which the user must belong to).
+    """
+    filename = get_valid_filename(os.path.basename(filename or ''))[-100:]
+    if not filename:
+        raise UploadError('A file name is required')
+    if not 0 < size <= MAX_UPLOAD_SIZE:
+        raise UploadError(f'File size must be between 1 and {MAX_UPLOAD_SIZE} bytes')
+    sha256 = (sha256 or '').lower()
+    if sha256 and (len(sha256) != 64 or set(sha256) - set('0123456789abcdef')):
+        raise UploadError('sha256 must be 64 hex digits')
+    if bool(quest) == bool(hackathon):
+        raise UploadError('Upload to either a quest or a hackathon')
+    if hackathon:
+        if team is None or team.hackathon_id != hackathon.pk:
+            raise UploadError('A team registered for the hackathon is required')
+        if not TeamMember.objects.filter(team=team, user=user).exists():
+            raise UploadError('You are not a member of this team', status=403)
+        _check_eligibility(hackathon, team)
+
+    return ChunkedUpload.objects.create(
+        user=user,
+        filename=filename,
+        size=size,
+        expected_sha256=sha256,
+        quest=quest,
+        hackathon=hackathon,
+        team=team if hackathon else None,
+    )
+
+
+def receive_chunk(upload, offset, stream, length, checksum=''):
+    """
+    Store `length` bytes read from `stream` at `offset`; returns the bytes received so far.
+
+    Offsets must follow on from what has been received. A chunk resent after
+    its acknowledgement was lost (offset below received_bytes) is ignored, so
+    retries are safe.
+    """
+    if upload.status != 'uploading':
+        raise UploadError('Upload is no longer accepting data', status=409)
+    if offset < upload.received_bytes:
+        return upload.received_bytes
+    if offset > upload.received_bytes:
+        raise UploadError(f'Expected offset {upload.received_bytes}', status=409)
+    if not 0 < length <= MAX_CHUNK_SIZE:
+        raise UploadError(f'Chunks must be between 1 and {MAX_CHUNK_SIZE} bytes', status=413)
+    if offset + length > upload.size:
+        raise UploadError('Chunk runs past the announced file size', status=413)
+
+    storage = _storage()
+    reader = _HashingReader(stream, limit=length)
+    name = storage.save(f'{CHUNK_PREFIX}/{upload.pk}/{offset:012d}', _stream_file(reader, 'chunk', length))
+
+    if reader.count != length:
+        storage.delete(name)
+        raise UploadError('Chunk body is shorter than its Content-Length')
+    if checksum and checksum.lower() != reader.digest.hexdigest():
+        storage.delete(name)
+        raise UploadError('Chunk checksum mismatch; resend the chunk', status=422)
+
+    with transaction.atomic():
+        locked = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+        if locked.status != 'uploading' or locked.received_bytes != offset:
+            # A concurrent request stored this range first
+            storage.delete(name)
+            return locked.received_bytes
+        locked.parts = [*locked.parts, [offset, name, length]]
+        locked.received_bytes = offset + length
+        locked.save(update_fields=['parts', 'received_bytes', 'updated_at'])
+
+    upload.parts, upload.received_bytes = locked.parts, locked.received_bytes
+    return upload.received_bytes
+
+
+def _delete_parts(storage, upload):
+    for _offset, name, _size in upload.parts:
+        storage.delete(name)
+
+
+def _store_blob(storage, upload, digest):
+    """The FileBlob for `digest`, streaming the upload's chunks into storage if it is new; (blob, created)"""
+    blob = FileBlob.objects.filter(sha256=digest).first()
+    if blob is not None:
+        return blob, False
+
+    blob = FileBlob(sha256=digest, size=upload.size)
+    raw = _PartsReader(storage, [name for _offset, name, _size in upload.parts])
+    try:
+        blob.file.save(upload.filename, _stream_file(raw, upload.filename, upload.size), save=False)
+    finally:
+        raw.close()
+    try:
+        with transaction.atomic():
+            blob.save()
+    except IntegrityError:
+        # Another upload of the same content finished first
+        storage.delete(blob.file.name)
+        return FileBlob.objects.get(sha256=digest), False
+    return blob, True
+
+
+def complete_upload(upload, description='', submission_url='', copyright_declaration=False):
+    """
+    Queue a fully received upload for assembly into a Submission.
+
+    Returns the upload as it now stands: assembling, or complete when a
+    repeated request finds the Submission already created.
+    """
+    with transaction.atomic():
+        locked = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+        if locked.status in ('assembling', 'complete'):
+            return locked
+        if locked.status != 'uploading':
+            raise UploadError(locked.error or 'Upload has failed', status=409)
+        if not locked.is_complete:
+            raise UploadError(f'Only {locked.received_bytes} of {locked.size} bytes received', status=409)
+        if locked.hackathon_id:
+            _check_eligibility(locked.hackathon, locked.team)
+
+        locked.status = 'assembling'
+        locked.assembly_attempts = 1
+        locked.submission_details = {
+            'description': description,
+            'submission_url': submission_url,
+            'copyright_declaration': copyright_declaration,
+        }
+        locked.save(update_fields=['status', 'assembly_attempts', 'submission_details', 'updated_at'])
+        upload_id = locked.pk
+        transaction.on_commit(lambda: start_assembly(upload_id))
+    return locked
+
+
+def _fail(upload_id, error):
+    ChunkedUpload.objects.filter(pk=upload_id, status='assembling').update(
+        status='failed', error=error, updated_at=timezone.now()
+    )
+
+
+def assemble_upload(upload_id):
+    """
+    Hash an assembling upload's chunks, store its blob and create its Submission.
+
+    Returns the Submission, or None when the upload was not assembling or
+    its checksum did not match.
+    """
+    upload = ChunkedUpload.objects.filter(pk=upload_id, status='assembling').first()
+    if upload is None:
+        return None
+
+    storage = _storage()
+    reader = _HashingReader(_PartsReader(storage, [name for _offset, name, _size in upload.parts]))
+    try:
+        while reader.read(READ_SIZE):
+            pass
+    finally:
+        reader.stream.close()
+    digest = reader.digest.hexdigest()
+
+    if upload.expected_sha256 and upload.expected_sha256 != digest:
+        _fail(upload.pk, 'File checksum mismatch; start the upload again')
+        _delete_parts(storage, upload)
+        return None
+
+    blob, created = _store_blob(storage, upload, digest)
+
+    with transaction.atomic():
+        locked = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+        if locked.status != 'assembling':
+            # Assembled by another run in the meantime
+            return locked.submission
+        details = locked.submission_details
+        previous_attempts = Submission.objects.filter(
+            user=None if locked.hackathon_id else locked.user,
+            team=locked.team,
+            quest=locked.quest,
+            hackathon=locked.hackathon,
+        ).count()
+        submission = Submission.objects.create(
+            user=None if locked.hackathon_id else locked.user,
+            team=locked.team,
+            quest=locked.quest,
+            hackathon=locked.hackathon,
+            submission_file=blob.file.name,
+            file_blob=blob,
+            submission_url=details.get('submission_url', ''),
+            description=details.get('description', ''),
+            copyright_declaration=details.get('copyright_declaration', False),
+            file_transfer_confirmed=True,
+            attempt_number=previous_attempts + 1,
+        )
+        locked.status = 'complete'
+        locked.blob = blob
+        locked.submission = submission
+        locked.deduplicated = not created
+        locked.save(update_fields=['status', 'blob', 'submission', 'deduplicated', 'updated_at'])
+
+    _delete_parts(storage, locked)
+    return submission
+
+
+def _assemble_or_fail(upload_id):
+    try:
+        assemble_upload(upload_id)
+    except Exception:
+        logger.exception('Assembling upload %s failed', upload_id)
+        _fail(upload_id, ASSEMBLY_FAILED)
+
+
+def _assemble_in_background(upload_id):
+    try:
+        _assemble_or_fail(upload_id)
+    finally:
+        connections.close_all()
+
+
+def start_assembly(upload_id):
+    threading.Thread(target=_assemble_in_background, args=(upload_id,), daemon=True).start()
+
+
+def _claim_stalled(upload_id, now):
+    """
+    Take over an upload left assembling for longer than ASSEMBLY_TIMEOUT.
+
+    Returns True when the caller should assemble it again. Only one of
+    several concurrent callers wins; after MAX_ASSEMBLY_ATTEMPTS the upload
+    is failed instead.
+    """
+    stalled = ChunkedUpload.objects.filter(
+        pk=upload_id, status='assembling', updated_at__lt=now - ASSEMBLY_TIMEOUT
+    )
+    if stalled.filter(assembly_attempts__gte=MAX_ASSEMBLY_ATTEMPTS).update(
+        status='failed', error=ASSEMBLY_FAILED, updated_at=now
+    ):
+        return False
+    return bool(stalled.update(assembly_attempts=F('assembly_attempts') + 1, updated_at=now))
+
+
+def resume_assembly(upload, now=None):
+    """
+    Restart the background assembly of `upload` if its worker died mid-way.
+
+    Called when the client polls, so a stalled upload does not depend on
+    the assemble_uploads command running. Returns the upload as it now stands.
+    """
+    if upload.status != 'assembling':
+        return upload
+    if _claim_stalled(upload.pk, now or timezone.now()):
+        upload_id = upload.pk
+        transaction.on_commit(lambda: start_assembly(upload_id))
+    upload.refresh_from_db()
+    return upload
+
+
+def assemble_pending(now=None):
+    """Assemble uploads left assembling for longer than ASSEMBLY_TIMEOUT; returns how many"""
+    now = now or timezone.now()
+    upload_ids = list(
+        ChunkedUpload.objects.filter(
+            status='assembling', updated_at__lt=now - ASSEMBLY_TIMEOUT
+        ).values_list('pk', flat=True)
+    )
+    assembled = 0
+    for upload_id in upload_ids:
+        if _claim_stalled(upload_id, now):
+            _assemble_or_fail(upload_id)
+            assembled += 1
+    return assembled
+
+
+def purge_stale_uploads(now=None):
+    """Delete unfinished uploads idle for longer than UPLOAD_EXPIRY, and their chunks; returns how many"""
+    cutoff = (now or timezone.now()) - UPLOAD_EXPIRY
+    storage = _storage()
+    stale = list(ChunkedUpload.objects.exclude(status='complete').filter(updated_at__lt=cutoff))
+    for upload in stale:
+        _delete_parts(storage, upload)
+    ChunkedUpload.objects.filter(pk__in=[upload.pk for upload in stale]).delete()
+    return len(stale)
@@ -33,5 +33,14 @@ urlpatterns = [
 
     # P2: Calendar API
     path('api/calendar/events/', views.calendar_events_api, name='calendar_events'),
+    path('api/calendar/hackathons.ics', views.calendar_feed, name='calendar_feed'),
+    path('api/hackathon/<int:hackathon_id>/calendar.ics', views.hackathon_calendar_feed, name='hackathon_calendar_feed'),
     path('api/hackathon/<int:hackathon_id>/timeline/', views.hackathon_timeline_api, name='hackathon_timeline'),
+    path('api/hackathon/<int:hackathon_id>/leaderboard/', views.hackathon_leaderboard_api, name='hackathon_leaderboard'),
+    path('api/submissions/facets/<str:facet>/', views.submission_facet_search, name='submission_facet_search'),
+
+    # Resumable submission file uploads
+    path('api/uploads/', views.upload_start, name='upload_start'),
+    path('api/uploads/<uuid:upload_id>/', views.upload_detail, name='upload_detail'),
+    path('api/uploads/<uuid:upload_id>/complete/', views.upload_complete, name='upload_complete'),
 ]
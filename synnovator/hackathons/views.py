@@ -1,23 +1,34 @@
+from datetime import datetime, time
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import get_user_model
 from django.contrib import messages
-from django.http import JsonResponse
-from django.utils.text import slugify
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.utils.translation import gettext as _, get_language
-from django.views.decorators.http import require_GET, require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET, require_http_methods, require_POST
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date, parse_datetime
 from django.core.paginator import Paginator
-from django.db.models import Count, Q, Prefetch
+from django.db.models import Count, F, Prefetch
 
 from .models import (
-    HackathonPage, HackathonIndexPage, Team, Quest, Phase, TeamMember,
-    Submission, SubmissionPage, SubmissionIndexPage, QuestIndexPage, TeamRegistration
+    HackathonPage, HackathonIndexPage, Team, Quest, TeamMember,
+    Submission, SubmissionPage, SubmissionIndexPage, QuestIndexPage, TeamRegistration, ChunkedUpload
 )
 from synnovator.community.models import TeamProfilePage
+from synnovator.utils.slugs import add_child_with_unique_slug
+from . import activity, calendar_events, ics, leaderboard, submission_facets, team_matching, uploads
+from .eligibility import SubmissionEligibility
+from .tags import normalize_tags
 
 User = get_user_model()
 
+SEEKERS_PER_PAGE = 24
+TEAMS_PER_PAGE = 24
+
 
 def hackathon_index(request):
     """Redirect to main HackathonIndexPage (filter_mode='all')"""
@@ -137,26 +148,12 @@ def team_detail(request, slug):
     # Get submissions
     submissions = team.submissions.select_related('quest', 'hackathon').order_by('-submitted_at')
 
-    # Build activity log from submissions and membership changes
-    activity_log = []
-    for submission in submissions[:10]:
-        target = submission.quest.title if submission.quest else (
-            submission.hackathon.title if submission.hackathon else "Unknown"
-        )
-        activity_log.append({
-            'timestamp': submission.submitted_at,
-            'action': f"submitted to {target}",
-            'user': submission.user or (submission.team.get_leader().user if submission.team and submission.team.get_leader() else None)
-        })
-
-    for membership in members:
-        activity_log.append({
-            'timestamp': membership.joined_at,
-            'action': f"joined the team as {membership.get_role_display()}",
-            'user': membership.user
-        })
-
-    activity_log.sort(key=lambda x: x['timestamp'], reverse=True)
+    # One page of the team's activity feed, newest first
+    events, next_activity_cursor = activity.feed(team=team, cursor=request.GET.get('activity_cursor'))
+    activity_log = [
+        {'timestamp': event.created_at, 'action': event.team_action, 'user': event.actor}
+        for event in events
+    ]
 
     # Calculate stats
     stats = {
@@ -200,6 +197,7 @@ def team_detail(request, slug):
         'members': members,
         'submissions': submissions,
         'activity_log': activity_log,
+        'next_activity_cursor': next_activity_cursor,
         'stats': stats,
         'user_can_join': user_can_join,
     }
@@ -233,7 +231,8 @@ def team_formation(request):
     Team formation page view.
 
     Provides full context for templates/pages/team_formation_page.html
-    Shows users seeking teams and teams seeking members.
+    Shows users seeking teams and teams seeking members, ranked by
+    team_matching.compatibility() where there is a team or user to match.
     """
     # Parse filters
     clear = request.GET.get('clear')
@@ -243,58 +242,50 @@ def team_formation(request):
     filter_roles = request.GET.getlist('roles')
     filter_skills = request.GET.getlist('skills')
     hackathon_id = request.GET.get('hackathon')
+    if hackathon_id and not hackathon_id.isdigit():
+        hackathon_id = None
 
-    # Get users seeking teams
-    seeking_users = User.objects.filter(is_seeking_team=True)
-
-    if filter_roles:
-        seeking_users = seeking_users.filter(preferred_role__in=filter_roles)
-
-    if filter_skills:
-        # Filter users who have any of the selected skills in their skills JSON
-        skill_q = Q()
-        for skill in filter_skills:
-            skill_q |= Q(skills__icontains=skill)
-        seeking_users = seeking_users.filter(skill_q)
-
-    # Get teams seeking members
-    recruiting_teams = Team.objects.filter(
-        is_seeking_members=True,
-        status='forming'
-    ).select_related('hackathon').prefetch_related(
-        Prefetch('membership', queryset=TeamMember.objects.select_related('user'))
-    ).annotate(
-        members_count=Count('membership')
-    )
-
-    if hackathon_id:
-        recruiting_teams = recruiting_teams.filter(hackathon_id=hackathon_id)
+    index = team_matching.get_seeker_index()
+    team_index = team_matching.get_team_index()
 
     # Get active hackathons for filter
     hackathons = HackathonPage.objects.filter(
         status__in=['upcoming', 'registration_open', 'in_progress']
     ).values('id', 'title')
 
-    # Get available skills from users
-    all_skills = set()
-    for user in User.objects.exclude(skills=[]).values_list('skills', flat=True):
-        if isinstance(user, list):
-            all_skills.update(user)
-    available_skills = sorted(all_skills)
+    user = request.user if request.user.is_authenticated else None
+    user_skills = normalize_tags(user.skills) if user else []
+
+    # Rank teams seeking members from the index; only the displayed page is loaded
+    team_positions = team_index.search(int(hackathon_id) if hackathon_id else None)
+    team_ids = team_index.rank(
+        team_positions, role=user.preferred_role if user else None, skills=user_skills if user else None
+    )
+    led_team = team_index.led_team(team_positions, user.pk) if user else None
+
+    # Leaders of a recruiting team see the seekers who fit it best
+    seeker_ids = index.rank(
+        index.search(roles=filter_roles, skills=filter_skills),
+        skills=filter_skills,
+        team=led_team,
+        exclude={user.pk} if user else (),
+    )
+    users_page = Paginator(seeker_ids, SEEKERS_PER_PAGE).get_page(request.GET.get('page'))
+    teams_page = Paginator(team_ids, TEAMS_PER_PAGE).get_page(request.GET.get('teams_page'))
 
     # Calculate stats
     stats = {
-        'seeking_count': seeking_users.count(),
-        'recruiting_count': recruiting_teams.count(),
+        'seeking_count': len(seeker_ids),
+        'recruiting_count': len(team_ids),
     }
 
     # Build current user profile if authenticated
     current_user_profile = None
-    if request.user.is_authenticated:
+    if user:
         current_user_profile = {
-            'role': request.user.preferred_role,
-            'skills': request.user.skills or [],
-            'is_seeking': request.user.is_seeking_team,
+            'role': user.preferred_role,
+            'skills': user.skills or [],
+            'is_seeking': user.is_seeking_team,
         }
 
     # Build filters context
@@ -304,36 +295,51 @@ def team_formation(request):
         'hackathon_id': int(hackathon_id) if hackathon_id else None,
     }
 
-    # Add computed fields to users for template
+    # Load and decorate only the displayed page of users
+    role_names = dict(User._meta.get_field('preferred_role').choices)
+    users_by_id = User.objects.in_bulk(list(users_page.object_list))
     seeking_users_with_profile = []
-    for user in seeking_users:
-        user.role = user.preferred_role
-        user.xp = user.xp_points
-        user.reputation = float(user.reputation_score)
-        user.profile_url = f'/users/{user.username}/'
-        user.get_role_display = lambda u=user: dict(User._meta.get_field('preferred_role').choices).get(u.preferred_role, u.preferred_role)
-        seeking_users_with_profile.append(user)
-
-    # Add computed fields to teams for template
-    recruiting_teams_with_data = []
-    for team in recruiting_teams:
-        team.members_count = team.members_count
-        team.max_members = team.hackathon.max_team_size if hasattr(team.hackathon, 'max_team_size') else None
-        # Determine needed roles based on hackathon requirements
-        team.needed_roles = []
-        if hasattr(team.hackathon, 'required_roles') and team.hackathon.required_roles:
-            current_roles = set(team.membership.values_list('role', flat=True))
-            team.needed_roles = [r for r in team.hackathon.required_roles if r not in current_roles]
-        recruiting_teams_with_data.append(team)
+    for pk in users_page.object_list:
+        seeker = users_by_id.get(pk)
+        if seeker is None:
+            continue
+        seeker.role = seeker.preferred_role
+        seeker.xp = seeker.xp_points
+        seeker.reputation = float(seeker.reputation_score)
+        seeker.profile_url = f'/users/{seeker.username}/'
+        seeker.get_role_display = lambda u=seeker: role_names.get(u.preferred_role, u.preferred_role)
+        seeking_users_with_profile.append(seeker)
+
+    # Load and decorate only the displayed page of teams
+    teams_by_id = Team.objects.select_related('hackathon').prefetch_related(
+        Prefetch('membership', queryset=TeamMember.objects.select_related('user'))
+    ).annotate(
+        members_count=Count('membership')
+    ).in_bulk(list(teams_page.object_list))
+    recruiting_teams = []
+    for pk in teams_page.object_list:
+        team = teams_by_id.get(pk)
+        if team is None:
+            continue
+        team.max_members = team.hackathon.max_team_size
+        team.needed_roles, team_skills = team_index.profile(pk)
+        team.match_score = None
+        if user:
+            team.match_score = team_matching.compatibility(
+                user.preferred_role, user_skills, team.needed_roles, team_skills
+            )
+        recruiting_teams.append(team)
 
     return render(request, 'pages/team_formation_page.html', {
         'seeking_users': seeking_users_with_profile,
-        'recruiting_teams': recruiting_teams_with_data,
+        'recruiting_teams': recruiting_teams,
+        'users_page': users_page,
+        'teams_page': teams_page,
         'current_user_profile': current_user_profile,
         'filters': filters,
         'stats': stats,
         'hackathons': hackathons,
-        'available_skills': available_skills,
+        'available_skills': index.vocabulary,
     })
 
 
@@ -373,7 +379,7 @@ def quest_detail(request, slug):
 
     Provides full context for quest detail template.
     """
-    quest = get_object_or_404(Quest, slug=slug)
+    quest = get_object_or_404(Quest.objects.select_related('stats'), slug=slug)
 
     # Get submissions for leaderboard
     submissions = Submission.objects.filter(
@@ -389,24 +395,24 @@ def quest_detail(request, slug):
             quest=quest
         ).order_by('-submitted_at').first()
 
-    # Calculate completion stats
-    total_attempts = quest.submissions.count()
-    completed = quest.submissions.filter(verification_status='verified').count()
-    completion_rate = quest.get_completion_rate()
+    # Completion stats are denormalized onto QuestStats
+    stats = quest.completion_stats
 
     context = {
         'quest': quest,
         'submissions': submissions,
         'user_submission': user_submission,
         'stats': {
-            'total_attempts': total_attempts,
-            'completed': completed,
-            'completion_rate': completion_rate,
+            'total_attempts': stats.attempt_count,
+            'completed': stats.verified_count,
+            'completion_rate': stats.completion_rate,
+            'unique_users': stats.unique_user_count,
+            'median_score': stats.median_score,
         },
         'related_quests': Quest.objects.filter(
             is_active=True,
             quest_type=quest.quest_type
-        ).exclude(id=quest.id)[:3]
+        ).exclude(id=quest.id).order_by(F('stats__verified_count').desc(nulls_last=True), '-created_at')[:3]
     }
 
     return render(request, 'pages/quest_detail_page.html', context)
@@ -596,26 +602,16 @@ def submit_project(request, slug):
                 )
                 return redirect(hackathon.url)
 
-        # Generate slug
-        project_slug = slugify(project_title)
-        # Ensure unique slug
-        base_slug = project_slug
-        counter = 1
-        while SubmissionPage.objects.filter(slug=project_slug).exists():
-            project_slug = f"{base_slug}-{counter}"
-            counter += 1
-
         # Create submission page under SubmissionIndexPage
         submission = SubmissionPage(
             title=project_title,
-            slug=project_slug,
             team_profile=team,
             submitter=submitter,
             tagline=tagline,
         )
 
-        # Add as child of submission index
-        submission_index.add_child(instance=submission)
+        # Add as child of submission index with a free slug (one prefix-scan query)
+        add_child_with_unique_slug(submission_index, submission)
 
         # Associate with hackathon (M2M)
         submission.hackathons.add(hackathon)
@@ -630,18 +626,20 @@ def submit_project(request, slug):
         )
         return redirect(submission.url)
 
-    # Check validation before showing form
+    # Check validation before showing form (all teams in a fixed number of queries)
+    eligibility = SubmissionEligibility(hackathon)
     if can_submit_individual:
-        can_submit_ind, reason_ind = hackathon.can_submit(user=request.user)
+        can_submit_ind, reason_ind = eligibility.check(user=request.user)
     else:
         can_submit_ind, reason_ind = False, _("Individual submissions not allowed")
 
     teams_with_status = []
     can_submit_team_any = False
-    if can_submit_team and user_teams and user_teams.exists():
-        # Check for at least one team that can submit
-        for team in user_teams:
-            can, reason = hackathon.can_submit(team_profile=team)
+    if can_submit_team and user_teams:
+        teams = list(user_teams)
+        results = eligibility.for_teams(teams)
+        for team in teams:
+            can, reason = results[team.pk]
             teams_with_status.append({
                 'team': team,
                 'can_submit': can,
@@ -661,54 +659,103 @@ def submit_project(request, slug):
     })
 
 
+def _parse_calendar_bound(value):
+    """Parse a start/end query parameter (ISO date or datetime) to an aware datetime"""
+    if not value:
+        return None
+    # A literal '+' in an unencoded query string arrives as a space
+    value = value.strip().replace(' ', '+')
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _calendar_events_etag(request):
+    return calendar_events.calendar_etag(
+        request.GET.get('start'), request.GET.get('end'), request.GET.get('hackathon_id')
+    )
+
+
+def _calendar_events_last_modified(request):
+    return calendar_events.calendar_last_modified()
+
+
 # P2: Calendar API
 @require_GET
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_calendar_events_etag, last_modified_func=_calendar_events_last_modified)
 def calendar_events_api(request):
     """
     Calendar API endpoint returning all hackathon phases as events.
     Returns JSON in format compatible with common calendar libraries (FullCalendar, etc.)
 
+    Events come from a cached, pre-encoded document; clients revalidate with
+    If-None-Match / If-Modified-Since and get a 304 until a hackathon or
+    phase changes. Large ranges are streamed.
+
     Query parameters:
     - start: Filter events after this date (ISO format)
     - end: Filter events before this date (ISO format)
     - hackathon_id: Filter events for specific hackathon
     """
-    # Parse query parameters
-    start_date = request.GET.get('start')
-    end_date = request.GET.get('end')
     hackathon_id = request.GET.get('hackathon_id')
+    try:
+        start = _parse_calendar_bound(request.GET.get('start'))
+        end = _parse_calendar_bound(request.GET.get('end'))
+        hackathon_id = int(hackathon_id) if hackathon_id else None
+    except ValueError:
+        return JsonResponse({'error': 'Invalid start, end or hackathon_id'}, status=400)
 
-    # Base queryset
-    phases = Phase.objects.select_related('hackathon').all()
+    events = calendar_events.get_calendar_events(hackathon_id, start, end)
 
-    # Apply filters
-    if start_date:
-        phases = phases.filter(end_date__gte=start_date)
-    if end_date:
-        phases = phases.filter(start_date__lte=end_date)
-    if hackathon_id:
-        phases = phases.filter(hackathon_id=hackathon_id)
+    if len(events) > calendar_events.STREAMING_THRESHOLD:
+        return StreamingHttpResponse(
+            calendar_events.stream_json_array(events), content_type='application/json'
+        )
+    return HttpResponse(
+        b''.join(calendar_events.stream_json_array(events)), content_type='application/json'
+    )
+
+
+def _ics_response(request, name, filename, fragments):
+    """Conditional, optionally streamed text/calendar response"""
+    etag = ics.feed_etag(name, fragments)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        if ics.feed_size(name, fragments) > ics.ICS_STREAMING_THRESHOLD:
+            response = StreamingHttpResponse(ics.stream_feed(name, fragments))
+        else:
+            response = HttpResponse(b''.join(ics.stream_feed(name, fragments)))
+        response['Content-Type'] = 'text/calendar; charset=utf-8'
+        response['Content-Disposition'] = f'inline; filename="{filename}"'
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
 
-    # Convert to calendar events format
-    events = []
-    for phase in phases:
-        events.append({
-            'id': f'phase-{phase.id}',
-            'title': f'{phase.hackathon.title}: {phase.title}',
-            'start': phase.start_date.isoformat(),
-            'end': phase.end_date.isoformat(),
-            'description': phase.description,
-            'url': phase.hackathon.url,
-            'extendedProps': {
-                'hackathon_id': phase.hackathon.id,
-                'hackathon_title': phase.hackathon.title,
-                'phase_id': phase.id,
-                'phase_title': phase.title,
-                'requirements': phase.requirements,
-            }
-        })
 
-    return JsonResponse(events, safe=False)
+@require_GET
+def calendar_feed(request):
+    """Subscribable iCalendar feed of every live hackathon's phases."""
+    fragments = ics.get_feed_fragments(ics.get_feed_hackathon_ids())
+    return _ics_response(request, 'Synnovator Hackathons', 'hackathons.ics', fragments)
+
+
+@require_GET
+def hackathon_calendar_feed(request, hackathon_id):
+    """Subscribable iCalendar feed of one hackathon's phases."""
+    try:
+        hackathon = HackathonPage.objects.live().only('id', 'title').get(id=hackathon_id)
+    except HackathonPage.DoesNotExist:
+        return JsonResponse({'error': 'Hackathon not found'}, status=404)
+
+    fragments = ics.get_feed_fragments([hackathon.id])
+    return _ics_response(request, hackathon.title, f'hackathon-{hackathon.id}.ics', fragments)
 
 
 @require_GET
@@ -723,7 +770,7 @@ def hackathon_timeline_api(request, hackathon_id):
         return JsonResponse({'error': 'Hackathon not found'}, status=404)
 
     now = timezone.now()
-    phases = hackathon.phases.all().order_by('start_date')
+    phases = hackathon.phase_timeline.phases
 
     timeline = {
         'hackathon': {
@@ -754,3 +801,188 @@ def hackathon_timeline_api(request, hackathon_id):
             timeline['current_phase'] = phase_data
 
     return JsonResponse(timeline)
+
+
+@require_GET
+def hackathon_leaderboard_api(request, hackathon_id):
+    """
+    Get ranked teams for a hackathon from the materialized leaderboard.
+    Supports ?limit= (max 100) and ?offset= for paging.
+    """
+    try:
+        hackathon = HackathonPage.objects.get(id=hackathon_id)
+    except HackathonPage.DoesNotExist:
+        return JsonResponse({'error': 'Hackathon not found'}, status=404)
+
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 100)
+        offset = max(int(request.GET.get('offset', 0)), 0)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid limit or offset'}, status=400)
+
+    entries = leaderboard.get_ranked_entries(hackathon, limit=limit, offset=offset)
+
+    return JsonResponse({
+        'hackathon': {
+            'id': hackathon.id,
+            'title': hackathon.title,
+        },
+        'entries': [
+            {
+                'rank': entry.rank,
+                'team': {
+                    'id': entry.team_id,
+                    'name': entry.team.name,
+                    'status': entry.team.status,
+                },
+                'score_count': entry.score_count,
+                'technical_score': float(entry.technical_score),
+                'commercial_score': float(entry.commercial_score),
+                'operational_score': float(entry.operational_score),
+                'final_score': float(entry.final_score),
+                'normalized_score': (
+                    float(entry.normalized_score) if entry.normalized_score is not None else None
+                ),
+                'normalized_rank': entry.normalized_rank,
+            }
+            for entry in entries
+        ],
+    })
+
+
+@require_GET
+def submission_facet_search(request, facet):
+    """
+    Typeahead for the submission listing's submitter and team filters.
+    ?q= is matched against name prefixes; other filter params narrow the counts.
+    """
+    if facet not in submission_facets.TYPEAHEAD_FACETS:
+        return JsonResponse({'error': 'Unknown facet'}, status=404)
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'results': []})
+    filters = {
+        param: request.GET[param]
+        for param in submission_facets.FILTER_PARAMS
+        if request.GET.get(param) and (param not in ('hackathon', 'submitter', 'team') or request.GET[param].isdigit())
+    }
+    return JsonResponse({'results': submission_facets.search(facet, query, filters)})
+
+
+def _upload_json(upload):
+    data = {
+        'id': str(upload.pk),
+        'filename': upload.filename,
+        'size': upload.size,
+        'received_bytes': upload.received_bytes,
+        'status': upload.status,
+        'chunk_size': uploads.UPLOAD_CHUNK_SIZE,
+        'max_chunk_size': uploads.MAX_CHUNK_SIZE,
+    }
+    if upload.status == 'complete':
+        data.update(
+            submission=upload.submission_id,
+            sha256=upload.blob.sha256 if upload.blob_id else '',
+            deduplicated=upload.deduplicated,
+        )
+    elif upload.status == 'failed':
+        data['error'] = upload.error or 'Upload has failed'
+    return data
+
+
+def _user_upload(request, upload_id):
+    return ChunkedUpload.objects.filter(pk=upload_id, user=request.user).first()
+
+
+@require_POST
+def upload_start(request):
+    """
+    Start a resumable submission file upload (see synnovator.hackathons.uploads).
+    Form fields: filename, size, optional sha256, and quest, or hackathon and team.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+
+    try:
+        size = int(request.POST.get('size', ''))
+        quest_id, hackathon_id, team_id = (
+            int(request.POST[key]) if request.POST.get(key) else None for key in ('quest', 'hackathon', 'team')
+        )
+    except ValueError:
+        return JsonResponse({'error': 'Invalid size or target'}, status=400)
+
+    quest = hackathon = team = None
+    if quest_id is not None:
+        quest = Quest.objects.filter(pk=quest_id, is_active=True).first()
+        if quest is None:
+            return JsonResponse({'error': 'Quest not found'}, status=404)
+    if hackathon_id is not None:
+        hackathon = HackathonPage.objects.live().filter(pk=hackathon_id).first()
+        if hackathon is None:
+            return JsonResponse({'error': 'Hackathon not found'}, status=404)
+        if team_id is not None:
+            team = Team.objects.filter(pk=team_id).first()
+
+    try:
+        upload = uploads.start_upload(
+            request.user, request.POST.get('filename', ''), size, sha256=request.POST.get('sha256', ''),
+            quest=quest, hackathon=hackathon, team=team,
+        )
+    except uploads.UploadError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
+    return JsonResponse(_upload_json(upload), status=201)
+
+
+@require_http_methods(['GET', 'HEAD', 'PUT'])
+def upload_detail(request, upload_id):
+    """
+    GET: how much of the upload has been received, to resume from there,
+    and after completing whether the file has been assembled. An assembly
+    whose worker was restarted is started again here.
+    PUT ?offset=N: append the request body as the chunk starting at byte N.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+    upload = _user_upload(request, upload_id)
+    if upload is None:
+        return JsonResponse({'error': 'Upload not found'}, status=404)
+    if request.method != 'PUT':
+        return JsonResponse(_upload_json(uploads.resume_assembly(upload)))
+
+    try:
+        offset = int(request.GET.get('offset', ''))
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid offset or Content-Length'}, status=400)
+    try:
+        uploads.receive_chunk(upload, offset, request, length, checksum=request.headers.get('X-Chunk-SHA256', ''))
+    except uploads.UploadError as e:
+        return JsonResponse({**_upload_json(upload), 'error': str(e)}, status=e.status)
+    return JsonResponse(_upload_json(upload))
+
+
+@require_POST
+def upload_complete(request, upload_id):
+    """
+    Queue a fully received upload for assembly into a Submission.
+
+    Answers 202 while the file is assembled in the background; poll
+    upload_detail until its status is complete or failed. Repeating the
+    request is harmless.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+    upload = _user_upload(request, upload_id)
+    if upload is None:
+        return JsonResponse({'error': 'Upload not found'}, status=404)
+
+    try:
+        upload = uploads.complete_upload(
+            upload,
+            description=request.POST.get('description', '').strip(),
+            submission_url=request.POST.get('submission_url', '').strip(),
+            copyright_declaration=request.POST.get('copyright_declaration') in ('1', 'true', 'on'),
+        )
+    except uploads.UploadError as e:
+        return JsonResponse({**_upload_json(upload), 'error': str(e)}, status=e.status)
+    return JsonResponse(_upload_json(upload), status=200 if upload.status == 'complete' else 202)
@@ -0,0 +1,52 @@
+from django.urls import path, reverse
+from django.utils.translation import gettext_lazy as _
+from wagtail import hooks
+from wagtail.admin.menu import MenuItem
+
+from .admin_views import export_results_view, import_judge_scores_view
+
+
+@hooks.register("register_admin_urls")
+def register_hackathon_admin_urls():
+    return [
+        path(
+            "hackathons/import-judge-scores/",
+            import_judge_scores_view,
+            name="hackathons_import_judge_scores",
+        ),
+        path(
+            "hackathons/export-results/",
+            export_results_view,
+            name="hackathons_export_results",
+        ),
+    ]
+
+
+class JudgeScoreImportMenuItem(MenuItem):
+    def is_shown(self, request):
+        return request.user.has_perm("hackathons.add_judgescore")
+
+
+@hooks.register("register_settings_menu_item")
+def register_judge_score_import_menu_item():
+    return JudgeScoreImportMenuItem(
+        _("Import judge scores"),
+        reverse("hackathons_import_judge_scores"),
+        icon_name="upload",
+        order=900,
+    )
+
+
+class ResultsExportMenuItem(MenuItem):
+    def is_shown(self, request):
+        return request.user.has_perm("hackathons.view_judgescore")
+
+
+@hooks.register("register_settings_menu_item")
+def register_results_export_menu_item():
+    return ResultsExportMenuItem(
+        _("Export results"),
+        reverse("hackathons_export_results"),
+        icon_name="download",
+        order=910,
+    )
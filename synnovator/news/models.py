@@ -1,13 +1,12 @@
-from django.conf import settings
 from django.db import models
 from django.db.models.functions import Coalesce
-from django.core.paginator import Paginator
 from wagtail.admin.panels import FieldPanel, HelpPanel, InlinePanel, MultiFieldPanel
 from wagtail.fields import RichTextField
 from wagtail.search import index
 
 from wagtail.fields import StreamField
 from synnovator.utils.models import BasePage, ArticleTopic
+from synnovator.utils.pagination import paginate_queryset
 from synnovator.utils.blocks import CaptionedImageBlock, StoryBlock, FeaturedArticleBlock
 
 
@@ -98,16 +97,8 @@ class NewsIndexPage(BasePage):
     )
 
     def paginate_queryset(self, queryset, request):
-        """Paginate the queryset."""
-        page_number = request.GET.get("page", 1)
-        paginator = Paginator(queryset, settings.DEFAULT_PER_PAGE)
-        try:
-            page = paginator.page(page_number)
-        except PageNotAnInteger:
-            page = paginator.page(1)
-        except EmptyPage:
-            page = paginator.page(paginator.num_pages)
-        return (paginator, page, page.object_list, page.has_other_pages())
+        """Paginate the queryset by keyset, so deep pages cost as much as the first."""
+        return paginate_queryset(queryset, request)
 
 
     def get_context(self, request, *args, **kwargs):
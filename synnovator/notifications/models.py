@@ -224,27 +224,34 @@ class Notification(models.Model):
                 }
             )
 
+    @classmethod
+    def build_advancement_notification(cls, team, advancement_log, recipient):
+        """Unsaved advancement notification, e.g. for bulk_create"""
+        if advancement_log.decision == 'advanced':
+            title = _("Congratulations! Your Team Advanced")
+            message = _("Your team '{}' has advanced to the next round").format(team.name)
+        else:
+            title = _("Team Eliminated")
+            message = _("Your team '{}' has been eliminated").format(team.name)
+
+        return cls(
+            recipient=recipient,
+            notification_type='advancement_result',
+            title=title,
+            message=message,
+            link_url=f"/admin/snippets/hackathons/advancementlog/edit/{advancement_log.id}/",
+            metadata={
+                'team_id': team.id,
+                'advancement_log_id': advancement_log.id,
+                'decision': advancement_log.decision,
+            }
+        )
+
     @classmethod
     def create_advancement_notification(cls, team, advancement_log):
         """Create notification for advancement decision"""
         leader = team.get_leader()
         if leader:
-            if advancement_log.decision == 'advanced':
-                title = _("Congratulations! Your Team Advanced")
-                message = _("Your team '{}' has advanced to the next round").format(team.name)
-            else:
-                title = _("Team Eliminated")
-                message = _("Your team '{}' has been eliminated").format(team.name)
-
-            return cls.objects.create(
-                recipient=leader.user,
-                notification_type='advancement_result',
-                title=title,
-                message=message,
-                link_url=f"/admin/snippets/hackathons/advancementlog/edit/{advancement_log.id}/",
-                metadata={
-                    'team_id': team.id,
-                    'advancement_log_id': advancement_log.id,
-                    'decision': advancement_log.decision,
-                }
-            )
+            notification = cls.build_advancement_notification(team, advancement_log, leader.user)
+            notification.save()
+            return notification
@@ -5,6 +5,7 @@ from django.db.models import Count, Sum, Q
 from django.shortcuts import render, get_object_or_404, redirect
 from django.utils.translation import gettext_lazy as _
 
+from synnovator.hackathons import activity
 from synnovator.hackathons.models import Team, Submission
 from synnovator.notifications.models import NOTIFICATION_TYPES
 
@@ -67,22 +68,11 @@ def user_profile(request, username):
                 'is_verified': True
             })
 
-    # Build activity history from submissions and team memberships
-    activity_history = []
-    for submission in recent_submissions:
-        target = submission.quest.title if submission.quest else (
-            submission.hackathon.title if submission.hackathon else "Unknown"
-        )
-        activity_history.append({
-            'action': f"Submitted to {target}",
-            'date': submission.submitted_at
-        })
-    for membership in memberships.order_by('-joined_at')[:5]:
-        activity_history.append({
-            'action': f"Joined team {membership.team.name}",
-            'date': membership.joined_at
-        })
-    activity_history.sort(key=lambda x: x['date'], reverse=True)
+    # One page of the user's activity feed, newest first
+    events, next_activity_cursor = activity.feed(
+        actor=profile_user, cursor=request.GET.get('activity_cursor'), limit=10
+    )
+    activity_history = [{'action': event.user_action, 'date': event.created_at} for event in events]
 
     # Build projects from hackathon submissions
     projects = []
@@ -111,7 +101,8 @@ def user_profile(request, username):
         'past_teams': past_teams,
         'recent_submissions': recent_submissions,
         'skills': skills,
-        'activity_history': activity_history[:10],
+        'activity_history': activity_history,
+        'next_activity_cursor': next_activity_cursor,
         'projects': projects,
         'stats': {
             'hackathons_participated': hackathons_participated,
@@ -132,7 +123,7 @@ def user_profile(request, username):
     profile_user.current_teams = current_teams
     profile_user.past_teams = past_teams
     profile_user.recent_submissions = recent_submissions
-    profile_user.activity_history = activity_history[:10]
+    profile_user.activity_history = activity_history
     profile_user.projects = projects
 
     return render(request, 'pages/user_profile_page.html', context)
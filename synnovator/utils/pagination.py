@@ -0,0 +1,235 @@
+"""
+Keyset (cursor) pagination for listing pages.
+
+Django's Paginator issues COUNT(*) over the filtered queryset and then an
+OFFSET query, which gets slower the deeper a visitor pages. CursorPaginator
+instead remembers the ordering values of the last row shown and asks for the
+rows after it, e.g. for ('-first_published_at', '-pk'):
+
+    WHERE first_published_at < t OR (first_published_at = t AND id < n)
+    ORDER BY first_published_at DESC, id DESC LIMIT per_page + 1
+
+which an index on the ordering columns answers at any depth. Cursors are
+opaque URL-safe tokens. Counting is optional and can be capped, so a listing
+never has to count every matching row.
+
+paginate_queryset() is a drop-in for the index pages' paginate_queryset()
+methods and returns the same (paginator, page, object_list, is_paginated)
+tuple; components/pagination.html renders a CursorPage as previous/next links.
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+
+
+CURSOR_PARAM = 'cursor'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _empty():
+    return Q(pk__in=[])
+
+
+def _json_default(value):
+    # Unlike DjangoJSONEncoder, keep microseconds: cursors compare for equality
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
+
+
+class CursorPage(Sequence):
+    """One page of a CursorPaginator; quacks like django.core.paginator.Page where it can."""
+
+    is_cursor_page = True
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<CursorPage of {len(self.object_list)} items>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginate `queryset` by keyset over `ordering`.
+
+    `ordering` is a sequence of field or annotation names on the queryset's
+    model, each optionally prefixed with '-'; it defaults to the queryset's
+    own ordering. The primary key is appended as a tie-breaker when missing,
+    so every row has a distinct position. NULLs sort last.
+
+    `count_limit` caps `count`: at most count_limit + 1 rows are counted and
+    `count_is_exact` tells whether the cap was reached.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None, count_limit=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.count_limit = count_limit
+        ordering = list(ordering or queryset.query.order_by or queryset.model._meta.ordering or ['-pk'])
+        if not all(isinstance(name, str) for name in ordering):
+            raise ValueError('CursorPaginator orders by field or annotation names only')
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        if self.fields[-1][0] not in ('pk', queryset.model._meta.pk.name):
+            self.fields.append(('pk', self.fields[-1][1]))
+
+    def _field(self, name):
+        if name in self.queryset.query.annotations:
+            return self.queryset.query.annotations[name].output_field
+        opts = self.queryset.model._meta
+        return opts.pk if name == 'pk' else opts.get_field(name)
+
+    @cached_property
+    def _counted(self):
+        if self.count_limit is None:
+            return self.queryset.count()
+        return self.queryset[:self.count_limit + 1].count()
+
+    @property
+    def count(self):
+        if self.count_limit is None:
+            return self._counted
+        return min(self._counted, self.count_limit)
+
+    @property
+    def count_is_exact(self):
+        return self.count_limit is None or self._counted <= self.count_limit
+
+    # Cursor tokens -------------------------------------------------------
+
+    def _values(self, obj):
+        return [getattr(obj, name) for name, _descending in self.fields]
+
+    def encode_cursor(self, obj, backwards=False):
+        payload = json.dumps({'v': self._values(obj), 'b': backwards}, default=_json_default, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """(values, backwards) from a token; raises InvalidCursor"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            raw, backwards = payload['v'], bool(payload['b'])
+            if len(raw) != len(self.fields):
+                raise InvalidCursor(cursor)
+            values = [
+                None if value is None else self._field(name).to_python(value)
+                for (name, _descending), value in zip(self.fields, raw)
+            ]
+        except InvalidCursor:
+            raise
+        except Exception as error:
+            raise InvalidCursor(cursor) from error
+        return values, backwards
+
+    # Queries ----------------------------------------------------------------
+
+    def _after(self, values):
+        """Rows that follow `values` in the forward ordering"""
+        condition = _empty()
+        equal = Q()
+        for (name, descending), value in zip(self.fields, values):
+            if value is None:
+                # NULLs sort last: nothing follows a NULL but other NULLs
+                step = _empty()
+                same = Q(**{f'{name}__isnull': True})
+            else:
+                step = Q(**{f'{name}__{"lt" if descending else "gt"}': value})
+                if getattr(self._field(name), 'null', True):
+                    step |= Q(**{f'{name}__isnull': True})
+                same = Q(**{name: value})
+            condition |= equal & step
+            equal &= same
+        return condition
+
+    def _before(self, values):
+        """Rows that precede `values` in the forward ordering"""
+        condition = _empty()
+        equal = Q()
+        for (name, descending), value in zip(self.fields, values):
+            if value is None:
+                step = Q(**{f'{name}__isnull': False})
+                same = Q(**{f'{name}__isnull': True})
+            else:
+                step = Q(**{f'{name}__{"gt" if descending else "lt"}': value})
+                same = Q(**{name: value})
+            condition |= equal & step
+            equal &= same
+        return condition
+
+    def _order_by(self, backwards=False):
+        nulls = {'nulls_first': True} if backwards else {'nulls_last': True}
+        return [
+            F(name).desc(**nulls) if descending != backwards else F(name).asc(**nulls)
+            for name, descending in self.fields
+        ]
+
+    def page(self, cursor=None):
+        """The page after (or, for a backwards cursor, before) `cursor`; the first page without one"""
+        values, backwards = self.decode_cursor(cursor) if cursor else (None, False)
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._before(values) if backwards else self._after(values))
+        rows = list(queryset.order_by(*self._order_by(backwards))[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = values is not None, has_more
+
+        return CursorPage(
+            rows,
+            self,
+            next_cursor=self.encode_cursor(rows[-1]) if rows and has_next else None,
+            previous_cursor=self.encode_cursor(rows[0], backwards=True) if rows and has_previous else None,
+        )
+
+
+def paginate_queryset(queryset, request, per_page=None, ordering=None, count_limit=None, param=CURSOR_PARAM):
+    """
+    Keyset-paginate `queryset` for `request`.
+
+    Drop-in for the index pages' paginate_queryset(): returns
+    (paginator, page, object_list, is_paginated). A malformed or stale
+    cursor falls back to the first page.
+    """
+    paginator = CursorPaginator(
+        queryset, per_page or settings.DEFAULT_PER_PAGE, ordering=ordering, count_limit=count_limit
+    )
+    try:
+        page = paginator.page(request.GET.get(param))
+    except InvalidCursor:
+        page = paginator.page()
+    return (paginator, page, page.object_list, page.has_other_pages())
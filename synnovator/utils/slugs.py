@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils.text import slugify
+from wagtail.models import Page
+
+
+DEFAULT_MAX_LENGTH = 255
+
+# Bases per prefix-scan query when allocating large batches
+PREFIX_BATCH_SIZE = 200
+
+
+def slugify_title(text, max_length=DEFAULT_MAX_LENGTH):
+    """
+    The slug a page titled `text` would get, or "" if it has no word characters.
+
+    Titles with ASCII letters slugify to ASCII ("Café Bot" -> "cafe-bot"). Titles
+    with none (e.g. all-CJK) keep their Unicode characters, as Wagtail's own
+    auto-slug does unless WAGTAIL_ALLOW_UNICODE_SLUGS is off.
+    """
+    slug = slugify(text) or slugify(
+        text, allow_unicode=getattr(settings, "WAGTAIL_ALLOW_UNICODE_SLUGS", True)
+    )
+    return slug[:max_length].strip("-")
+
+
+def _base_slug(text, max_length, fallback):
+    return slugify_title(text, max_length) or fallback
+
+
+def _first_free(base, taken, max_length):
+    """`base`, or `base-N` with the smallest N >= 1 that is not taken"""
+    if base not in taken:
+        return base
+    counter = 1
+    while True:
+        suffix = f"-{counter}"
+        candidate = base[:max_length - len(suffix)].rstrip("-") + suffix
+        if candidate not in taken:
+            return candidate
+        counter += 1
+
+
+def _taken_slugs(queryset: QuerySet, bases, field):
+    """Existing slugs starting with any of `bases`, one query per batch"""
+    taken = set()
+    bases = sorted(set(bases))
+    for start in range(0, len(bases), PREFIX_BATCH_SIZE):
+        condition = Q()
+        for base in bases[start:start + PREFIX_BATCH_SIZE]:
+            condition |= Q(**{f"{field}__startswith": base})
+        taken.update(queryset.filter(condition).values_list(field, flat=True))
+    return taken
+
+
+def allocate_slugs(
+    queryset: QuerySet,
+    texts,
+    field="slug",
+    max_length=DEFAULT_MAX_LENGTH,
+    fallback="item",
+):
+    """
+    Return one unused slug per entry in `texts`, in order.
+
+    Existing slugs are read with a single prefix scan (per PREFIX_BATCH_SIZE
+    distinct bases) rather than one query per collision. Slugs handed out
+    earlier in the same batch count as taken, so duplicate titles within an
+    import get `name`, `name-1`, `name-2`... Scope uniqueness by passing a
+    filtered `queryset`, e.g. `SubmissionPage.objects.all()`.
+    """
+    bases = [_base_slug(text, max_length, fallback) for text in texts]
+    # Suffixes may truncate the base, so scan on a prefix short enough to cover them
+    scan_prefixes = [base[:max(1, max_length - 8)] for base in bases]
+    taken = _taken_slugs(queryset, scan_prefixes, field) if bases else set()
+
+    slugs = []
+    for base in bases:
+        slug = _first_free(base, taken, max_length)
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def allocate_slug(queryset: QuerySet, text, **kwargs):
+    """Single-slug form of `allocate_slugs`"""
+    return allocate_slugs(queryset, [text], **kwargs)[0]
+
+
+def add_child_with_unique_slug(parent: Page, instance: Page, queryset: QuerySet = None, text=None):
+    """
+    Allocate a free slug for `instance` and add it under `parent`.
+
+    The parent page row is locked for the duration, so concurrent requests
+    creating children of the same parent allocate one after another instead
+    of both picking the same "next free" slug (treebeard serialises on the
+    parent for the child path anyway). `queryset` defaults to all objects of
+    the instance's type.
+    """
+    if queryset is None:
+        queryset = type(instance)._default_manager.all()
+    max_length = instance._meta.get_field("slug").max_length
+
+    with transaction.atomic():
+        Page.objects.select_for_update().filter(pk=parent.pk).first()
+        instance.slug = allocate_slug(queryset, text or instance.title, max_length=max_length)
+        parent.add_child(instance=instance)
+    return instance
@@ -178,6 +178,15 @@ def querystring_modify(
     return f"?{querydict.urlencode()}"
 
 
+@register.simple_tag(takes_context=True)
+def page_querystring(context, number, param="page"):
+    """
+    Querystring for page ``number`` of a paginator whose page is in the ``param`` query parameter, so
+    that a template with two paginated lists can link to pages of each one.
+    """
+    return querystring_modify(context, **{param or "page": number})
+
+
 def get_base_querydict(context, base):
     if base is None and "request" in context:
         return context["request"].GET.copy()
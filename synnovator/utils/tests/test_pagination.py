@@ -0,0 +1,116 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from synnovator.hackathons.tests.factories import HackathonIndexPageFactory, HackathonPageFactory
+from synnovator.users.tests.factories import UserFactory
+from synnovator.utils.pagination import CursorPaginator, InvalidCursor, paginate_queryset
+
+
+User = get_user_model()
+
+
+@pytest.fixture
+def users(db):
+    """Ten users; last_login has ties and NULLs"""
+    now = timezone.now()
+    created = []
+    for i in range(10):
+        user = UserFactory()
+        user.last_login = None if i % 4 == 3 else now - timedelta(days=i // 2)
+        user.save(update_fields=["last_login"])
+        created.append(user)
+    return created
+
+
+def _walk(paginator):
+    """Follow next cursors from the first page; returns the pages' pks"""
+    pages, cursor = [], None
+    while True:
+        page = paginator.page(cursor)
+        pages.append([obj.pk for obj in page])
+        if not page.has_next():
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+class TestCursorPaginator:
+    def test_forward_matches_offset_ordering_with_ties_and_nulls(self, users):
+        queryset = User.objects.order_by("-last_login")
+        expected = [user.pk for user in sorted(
+            users, key=lambda u: (u.last_login is None, -(u.last_login.timestamp() if u.last_login else 0), -u.pk)
+        )]
+
+        pages = _walk(CursorPaginator(queryset, 3))
+
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert sum(pages, []) == expected
+
+    def test_backwards_returns_the_previous_page(self, users):
+        paginator = CursorPaginator(User.objects.order_by("-last_login"), 3)
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+
+        back = paginator.page(third.previous_cursor)
+        assert list(back) == list(second)
+        assert back.has_next() and back.has_previous()
+
+        start = paginator.page(back.previous_cursor)
+        assert list(start) == list(first)
+        assert not start.has_previous()
+
+    def test_each_page_is_one_query(self, users):
+        paginator = CursorPaginator(User.objects.order_by("username"), 4)
+        cursor = paginator.page().next_cursor
+
+        with CaptureQueriesContext(connection) as queries:
+            paginator.page(cursor)
+
+        assert len(queries) == 1
+        assert "OFFSET" not in queries[0]["sql"].upper()
+
+    def test_capped_count(self, users):
+        paginator = CursorPaginator(User.objects.all(), 3, count_limit=5)
+        assert (paginator.count, paginator.count_is_exact) == (5, False)
+        assert CursorPaginator(User.objects.all(), 3, count_limit=50).count == 10
+
+    def test_bad_cursor(self, users):
+        paginator = CursorPaginator(User.objects.all(), 3)
+        with pytest.raises(InvalidCursor):
+            paginator.page("not-a-cursor")
+
+
+@pytest.mark.django_db
+class TestPaginateQueryset:
+    def test_drop_in_tuple_and_fallback(self, users, rf):
+        paginator, page, object_list, is_paginated = paginate_queryset(
+            User.objects.order_by("pk"), rf.get("/", {"cursor": "garbage"}), per_page=4
+        )
+        assert object_list == users[:4]
+        assert is_paginated and page.has_next()
+
+    def test_hackathon_index_pages_by_cursor(self, wagtail_root, rf):
+        index = HackathonIndexPageFactory(parent=wagtail_root)
+        for i in range(10):
+            HackathonPageFactory(parent=index, title=f"Hackathon {i}")
+
+        request = rf.get("/")
+        request.user = AnonymousUser()
+        first = index.get_context(request)
+        request = rf.get("/", {"cursor": first["paginator_page"].next_cursor})
+        request.user = AnonymousUser()
+        second = index.get_context(request)
+
+        titles = [h.title for h in first["hackathons"]] + [h.title for h in second["hackathons"]]
+        assert len(first["hackathons"]) == 8
+        assert sorted(titles) == sorted(f"Hackathon {i}" for i in range(10))
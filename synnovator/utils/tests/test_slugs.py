@@ -0,0 +1,77 @@
+"""
+Tests for the bulk slug allocator.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from synnovator.hackathons.models import SubmissionPage
+from synnovator.hackathons.tests.factories import SubmissionIndexPageFactory, SubmissionPageFactory
+from synnovator.users.tests.factories import UserFactory
+from synnovator.utils.slugs import add_child_with_unique_slug, allocate_slug, allocate_slugs
+
+
+@pytest.fixture
+def submission_index(wagtail_root):
+    return SubmissionIndexPageFactory(parent=wagtail_root)
+
+
+@pytest.mark.django_db
+class TestAllocateSlugs:
+    def test_free_slug_is_used_as_is(self, submission_index):
+        assert allocate_slug(SubmissionPage.objects.all(), "My Demo") == "my-demo"
+
+    def test_next_free_suffix_in_one_query(self, submission_index):
+        for slug in ("demo", "demo-1", "demo-2", "demo-day"):
+            SubmissionPageFactory(parent=submission_index, slug=slug)
+
+        with CaptureQueriesContext(connection) as queries:
+            slug = allocate_slug(SubmissionPage.objects.all(), "Demo")
+
+        assert slug == "demo-3"
+        assert len(queries) == 1
+
+    def test_fills_gaps(self, submission_index):
+        for slug in ("demo", "demo-2"):
+            SubmissionPageFactory(parent=submission_index, slug=slug)
+        assert allocate_slug(SubmissionPage.objects.all(), "demo") == "demo-1"
+
+    def test_batch_allocates_distinct_slugs(self, submission_index):
+        SubmissionPageFactory(parent=submission_index, slug="demo")
+
+        with CaptureQueriesContext(connection) as queries:
+            slugs = allocate_slugs(SubmissionPage.objects.all(), ["Demo", "Demo", "Other", "demo!"])
+
+        assert slugs == ["demo-1", "demo-2", "other", "demo-3"]
+        assert len(queries) == 1
+
+    def test_respects_max_length(self, submission_index):
+        SubmissionPageFactory(parent=submission_index, slug="a" * 10)
+
+        slug = allocate_slug(SubmissionPage.objects.all(), "a" * 20, max_length=10)
+
+        assert slug == "a" * 8 + "-1"
+
+    def test_slugs_stay_ascii(self, submission_index):
+        slugs = allocate_slugs(
+            SubmissionPage.objects.all(), ["智能 助手", "Café Bot", "!!!", "智能"], fallback="submission"
+        )
+        assert slugs == ["智能-助手", "cafe-bot", "submission", "智能"]
+
+    def test_ascii_only_when_unicode_slugs_disabled(self, submission_index, settings):
+        settings.WAGTAIL_ALLOW_UNICODE_SLUGS = False
+        slugs = allocate_slugs(SubmissionPage.objects.all(), ["智能 助手", "智能"], fallback="submission")
+        assert slugs == ["submission", "submission-1"]
+
+
+@pytest.mark.django_db
+class TestAddChildWithUniqueSlug:
+    def test_assigns_free_slug(self, submission_index):
+        SubmissionPageFactory(parent=submission_index, slug="rocket")
+        page = SubmissionPage(title="Rocket", tagline="", submitter=UserFactory())
+
+        add_child_with_unique_slug(submission_index, page)
+
+        page.refresh_from_db()
+        assert page.slug == "rocket-1"
+        assert page.get_parent().pk == submission_index.pk